@@ -2,16 +2,21 @@
 from fastapi import FastAPI
 from auth_service.app.routers import super_admin_router
 from shared.core.database import AuthBase, auth_engine
+from shared.core.migrations import sync_columns, sync_indexes
 from fastapi.middleware.cors import CORSMiddleware
 
 from shared.helpers.exception_handler import setup_exception_handlers
 from shared.wrappers.response_wrapper import JsonResponseMiddleware
 from .routers import authrouter, userrouter
-from shared.models import users, user_login_session, refresh_token
+from shared.models import users, user_login_session, refresh_token, org_membership_change
+from shared.workers.org_membership_sync import install_org_membership_triggers
 from .models import roles, rolepolicy, user_org_role_association, user_otps,  otp_verifications, user_organizations, associations
 
 # Create tables
 AuthBase.metadata.create_all(bind=auth_engine)
+sync_columns(auth_engine, AuthBase.metadata)
+sync_indexes(auth_engine, AuthBase.metadata)
+install_org_membership_triggers(auth_engine)
 
 # This MUST exist for uvicorn
 app = FastAPI(title="Unified Auth (Google + Mobile)")
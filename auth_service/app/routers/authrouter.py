@@ -54,6 +54,23 @@ def login(
     return authservices.verify_user_credentials(api_request, db, facility_db, request)
 
 
+@router.post("/set-password")
+def set_password(
+        request: authschema.SetPasswordRequest,
+        api_request: Request,
+        db: Session = Depends(get_db),
+        current_user: UserToken = Depends(auth.validate_current_token)):
+    return authservices.set_password(api_request, db, current_user.user_id, request)
+
+
+@router.post("/reset-password")
+def reset_password(
+        request: authschema.ResetPasswordRequest,
+        api_request: Request,
+        db: Session = Depends(get_db)):
+    return authservices.reset_password(api_request, db, request)
+
+
 @router.post("/refresh", response_model=authschema.TokenSuccessResponse)
 def refresh_token(
         refresh_token: str,
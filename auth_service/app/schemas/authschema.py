@@ -32,6 +32,20 @@ class UserAuthRequest(BaseModel):
     password: str
 
 
+# bcrypt only reads the first 72 bytes
+class SetPasswordRequest(BaseModel):
+    username: str = Field(..., min_length=3, max_length=100)
+    password: str = Field(..., min_length=8, max_length=72)
+    # Required when the account already has a password
+    current_password: Optional[str] = None
+
+
+class ResetPasswordRequest(BaseModel):
+    email: EmailStr
+    otp: str
+    password: str = Field(..., min_length=8, max_length=72)
+
+
 class SwitchUserAccountRequest(BaseModel):
     user_org_id: str
     account_type: str
@@ -18,6 +18,8 @@ from google.oauth2 import id_token
 from shared.core.database import get_auth_db as get_db
 from shared.core import auth
 from shared.helpers.json_response_helper import error_response, success_response
+from shared.helpers.password_hasher import password_hasher
+from shared.helpers.throttle import login_throttle
 from shared.models.users import Users
 from ..schemas import authschema
 from ..services import userservices
@@ -117,7 +119,8 @@ def send_otp(background_tasks: BackgroundTasks, db: Session, facility_db: Sessio
             )
             db.add(otp_entry)
             db.commit()
-            send_otp_email(background_tasks, facility_db, otp, request.email)
+            send_otp_email(facility_db, otp, request.email)
+            facility_db.commit()
             message = "OTP sent to your email."
         else:
             return error_response(
@@ -141,6 +144,9 @@ def verify_otp(
         db: Session,
         facility_db: Session,
         request: authschema.OTPVerify):
+    # A 6-digit OTP is brute-forceable without a per-recipient cap
+    login_throttle.check(api_request, request.email or request.mobile)
+
     user = None
     if request.mobile and request.mobile.strip():
         try:
@@ -167,25 +173,7 @@ def verify_otp(
         user = db.query(Users).filter(
             Users.phone == request.mobile, Users.is_deleted == False).first()
     elif request.email:
-        record = (
-            db.query(OtpVerification)
-            .filter(OtpVerification.email == request.email, OtpVerification.is_verified == False)
-            .order_by(OtpVerification.created_at.desc())
-            .first()
-        )
-        if not record:
-            return error_response(message="OTP not found", status_code=AppStatusCode.INVALID_INPUT)
-
-        if record.is_expired:
-            return error_response(message="OTP expired", status_code=AppStatusCode.AUTHENTICATION_USER_OTP_EXPIRED)
-
-        if record.otp != request.otp:
-            return error_response(message="Invalid OTP", status_code=AppStatusCode.INVALID_INPUT)
-
-        # mark verified
-        record.is_verified = True
-        db.commit()
-
+        consume_email_otp(db, request.email, request.otp)
         user = db.query(Users).filter(Users.email == request.email).first()
     else:
         return error_response(
@@ -204,22 +192,130 @@ def verify_otp(
     return userservices.get_user_token(api_request, db, facility_db, user)
 
 
+def consume_email_otp(db: Session, email: str, otp: str):
+    record = (
+        db.query(OtpVerification)
+        .filter(OtpVerification.email == email, OtpVerification.is_verified == False)
+        .order_by(OtpVerification.created_at.desc())
+        .first()
+    )
+    if not record:
+        return error_response(message="OTP not found", status_code=AppStatusCode.INVALID_INPUT)
+
+    if record.is_expired:
+        return error_response(message="OTP expired", status_code=AppStatusCode.AUTHENTICATION_USER_OTP_EXPIRED)
+
+    if record.otp != otp:
+        return error_response(message="Invalid OTP", status_code=AppStatusCode.INVALID_INPUT)
+
+    # mark verified
+    record.is_verified = True
+    db.commit()
+
+
 def verify_user_credentials(
         api_request: Request,
         db: Session,
         facility_db: Session,
         request: authschema.UserAuthRequest):
-    user = db.query(Users).filter(
+    login_throttle.check(api_request, request.username)
+
+    account = db.query(Users.id, Users.password_hash).filter(
         Users.username == request.username,
         Users.is_deleted == False
     ).first()
 
-    if not user or not user.verify_password(request.password):
+    # Release the auth-DB connection before the ~250ms bcrypt check
+    db.rollback()
+
+    valid, new_hash = password_hasher.verify(
+        request.password, account.password_hash if account else None)
+    if not account or not valid:
         return error_response(message="Invalid credentials")
 
+    user = db.query(Users).filter(Users.id == account.id).first()
+
+    # Cost parameters changed since this hash was made
+    if new_hash:
+        user.password_hash = new_hash
+        db.commit()
+
     return userservices.get_user_token(api_request, db, facility_db, user)
 
 
+def set_password(
+        api_request: Request,
+        db: Session,
+        user_id: str,
+        request: authschema.SetPasswordRequest):
+    """Set the signed-in user's username and password for /login."""
+    login_throttle.check(api_request, str(user_id))
+
+    user = db.query(Users).filter(
+        Users.id == user_id,
+        Users.is_deleted == False
+    ).first()
+    if not user:
+        return error_response(
+            message="User not found",
+            status_code=str(AppStatusCode.AUTHENTICATION_USER_INVALID),
+            http_status=status.HTTP_404_NOT_FOUND
+        )
+
+    taken = db.query(Users.id).filter(
+        Users.username == request.username,
+        Users.is_deleted == False,
+        Users.id != user.id
+    ).first()
+    if taken:
+        return error_response(message="Username already taken")
+
+    current_hash = user.password_hash
+    # Release the auth-DB connection during the bcrypt work
+    db.rollback()
+
+    if current_hash:
+        valid, _ = password_hasher.verify(request.current_password or "", current_hash)
+        if not valid:
+            return error_response(message="Current password is incorrect")
+
+    password_hash = password_hasher.hash(request.password)
+    db.query(Users).filter(Users.id == user_id).update({
+        Users.username: request.username,
+        Users.password_hash: password_hash,
+    })
+    db.commit()
+    return {"message": "Password updated"}
+
+
+def reset_password(
+        api_request: Request,
+        db: Session,
+        request: authschema.ResetPasswordRequest):
+    """Forgotten password: replace it after verifying an email OTP."""
+    login_throttle.check(api_request, request.email)
+
+    consume_email_otp(db, request.email, request.otp)
+    user = db.query(Users.id).filter(
+        Users.email == request.email,
+        Users.is_deleted == False
+    ).first()
+    if not user:
+        return error_response(
+            message="User not found",
+            status_code=str(AppStatusCode.AUTHENTICATION_USER_INVALID),
+            http_status=status.HTTP_404_NOT_FOUND
+        )
+    db.rollback()
+
+    password_hash = password_hasher.hash(request.password)
+    db.query(Users).filter(Users.id == user.id).update({
+        Users.password_hash: password_hash,
+    })
+    db.commit()
+    return {"message": "Password updated"}
+
+
 def refresh_access_token(db: Session, refresh_token_str: str):
     token = (
         db.query(RefreshToken)
@@ -330,11 +426,10 @@ def logout_user(db: Session, user_id: str, refresh_token_str: str = None):
         return {"message": "Mobile session(s) logged out successfully"}
 
 
-def send_otp_email(background_tasks, db, otp, email):
+def send_otp_email(db, otp, email):
     email_helper = EmailHelper()
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="otp_send",
         recipients=[email],
@@ -421,7 +516,8 @@ def resend_otp(background_tasks: BackgroundTasks, db: Session, facility_db: Sess
             db.commit()
 
             # Send OTP email
-            send_otp_email(background_tasks, facility_db, otp, request.email)
+            send_otp_email(facility_db, otp, request.email)
+            facility_db.commit()
             message = "OTP resent to your email."
 
         else:
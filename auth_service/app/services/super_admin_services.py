@@ -206,18 +206,18 @@ def approve_org(background_tasks: BackgroundTasks, org_id: str, facility_db: Ses
 
     # ------------------------------------------------
 
-    facility_db.commit()
-    auth_db.commit()
-
-    # Send approval email to org admin
+    # Send approval email to org admin; queued with the facility changes
     context = {
         "organization_name": org.name,
         "organization_email": org.billing_email,
         "approval_date": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")}
 
-    send_approval_email(background_tasks, db=auth_db,
+    send_approval_email(db=facility_db,
                         email=org.billing_email, context=context)
 
+    facility_db.commit()
+    auth_db.commit()
+
     return {"message": f"Organization '{org.name}' approved"}
 
 
@@ -242,19 +242,19 @@ def reject_org(
         UserOrganization.account_type == UserAccountType.ORGANIZATION
     ).update({"status": "rejected"}, synchronize_session=False)
 
-    facility_db.commit()
-    auth_db.commit()
-
-    # Send rejection email to org admin
+    # Send rejection email to org admin; queued with the facility changes
     context = {
         "organization_name": org.name,
         "organization_email": org.billing_email,
         "rejection_reason": request.rejection_reason
         }
 
-    send_rejection_email(background_tasks, db=auth_db,
+    send_rejection_email(db=facility_db,
                          email=org.billing_email, context=context)
 
+    facility_db.commit()
+    auth_db.commit()
+
     return {"message": f"Organization '{org.name}' rejected"}
 
 
@@ -270,11 +270,10 @@ def super_admin_stats(db: Session, facility_db: Session):
     }
 
 
-def send_approval_email(background_tasks, db, email, context):
+def send_approval_email(db, email, context):
     email_helper = EmailHelper()
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="org_approved",
         recipients=[email],
@@ -283,11 +282,10 @@ def send_approval_email(background_tasks, db, email, context):
     )
 
 
-def send_rejection_email(background_tasks, db, email, context):
+def send_rejection_email(db, email, context):
     email_helper = EmailHelper()
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="org_rejected",
         recipients=[email],
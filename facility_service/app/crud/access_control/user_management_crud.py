@@ -4,7 +4,7 @@ from datetime import datetime, date
 
 from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import Enum, func, or_
+from sqlalchemy import Enum, func
 from typing import Dict, List, Optional
 
 from auth_service.app.models import roles
@@ -32,6 +32,7 @@ from ...models.space_sites.buildings import Building
 from ...models.space_sites.sites import Site
 from ...models.space_sites.spaces import Space
 from shared.helpers.json_response_helper import error_response
+from shared.helpers.search_helper import apply_search
 from shared.utils.app_status_code import AppStatusCode
 from ...schemas.access_control.role_management_schemas import RoleOut
 from shared.core.schemas import Lookup
@@ -66,14 +67,8 @@ def get_users(db: Session, facility_db: Session, org_id: str, params: UserReques
     if params.status and params.status != "all":
         user_query = user_query.filter(Users.status == params.status)
 
-    if params.search:
-        search_term = f"%{params.search}%"
-        user_query = user_query.filter(
-            or_(
-                Users.full_name.ilike(search_term),
-                Users.email.ilike(search_term)
-            )
-        )
+    user_query = apply_search(
+        user_query, params.search, Users.full_name, Users.email)
 
     total = user_query.with_entities(func.count(Users.id.distinct())).scalar()
     users = (
@@ -146,7 +141,7 @@ def get_user_by_id(db: Session, user_id: str, org_id: str):
 # email template function
 
 
-def send_user_credentials_email(background_tasks, db, email, username, password, full_name):
+def send_user_credentials_email(db, email, username, password, full_name):
     """Send email with user credentials"""
     email_helper = EmailHelper()
 
@@ -156,8 +151,7 @@ def send_user_credentials_email(background_tasks, db, email, username, password,
         "full_name": full_name
     }
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="user_credentials",
         recipients=[email],
@@ -227,7 +221,7 @@ def create_user(
         )
 
 
-def send_password_update_email(background_tasks, db, email, username, password, full_name):
+def send_password_update_email(db, email, username, password, full_name):
     """Send email when password is updated"""
     from shared.helpers.email_helper import EmailHelper
 
@@ -239,8 +233,7 @@ def send_password_update_email(background_tasks, db, email, username, password,
         "full_name": full_name
     }
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="password_updated",  # You'll need to create this template
         recipients=[email],
@@ -753,15 +746,11 @@ def search_user(db: Session, org_id: UUID, search_users: Optional[str] = None) -
         )
     )
 
-    if search_users:
-        search_users = search_users.strip()
-        user_query = user_query.filter(
-            or_(
-                Users.full_name.ilike(f"%{search_users}%"),
-                Users.email.ilike(f"%{search_users}%"),
-                Users.phone.ilike(f"%{search_users}%")
-            )
-        )
+    user_query = apply_search(
+        user_query, search_users,
+        Users.full_name, Users.email, Users.phone,
+        ranked=True
+    )
 
     users = user_query.order_by(Users.full_name.asc()).all()
     if not users:
@@ -793,15 +782,11 @@ def search_tenant_owner_user(db: Session, org_id: UUID, search_users: Optional[s
         )
     )
 
-    if search_users:
-        search_users = search_users.strip()
-        user_query = user_query.filter(
-            or_(
-                Users.full_name.ilike(f"%{search_users}%"),
-                Users.email.ilike(f"%{search_users}%"),
-                Users.phone.ilike(f"%{search_users}%")
-            )
-        )
+    user_query = apply_search(
+        user_query, search_users,
+        Users.full_name, Users.email, Users.phone,
+        ranked=True
+    )
 
     users = user_query.order_by(Users.full_name.asc()).all()
     if not users:
@@ -832,15 +817,11 @@ def search_vendor_user(db: Session, org_id: UUID, search_users: Optional[str] =
         )
     )
 
-    if search_users:
-        search_users = search_users.strip()
-        user_query = user_query.filter(
-            or_(
-                Users.full_name.ilike(f"%{search_users}%"),
-                Users.email.ilike(f"%{search_users}%"),
-                Users.phone.ilike(f"%{search_users}%")
-            )
-        )
+    user_query = apply_search(
+        user_query, search_users,
+        Users.full_name, Users.email, Users.phone,
+        ranked=True
+    )
 
     users = user_query.order_by(Users.full_name.asc()).all()
     if not users:
@@ -871,15 +852,11 @@ def search_staff_user(db: Session, org_id: UUID, search_users: Optional[str] = N
         )
     )
 
-    if search_users:
-        search_users = search_users.strip()
-        user_query = user_query.filter(
-            or_(
-                Users.full_name.ilike(f"%{search_users}%"),
-                Users.email.ilike(f"%{search_users}%"),
-                Users.phone.ilike(f"%{search_users}%")
-            )
-        )
+    user_query = apply_search(
+        user_query, search_users,
+        Users.full_name, Users.email, Users.phone,
+        ranked=True
+    )
 
     users = user_query.order_by(Users.full_name.asc()).all()
     if not users:
@@ -0,0 +1,345 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import String, cast, delete, event, func, literal, null, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from shared.core.schemas import UserToken
+from shared.helpers.property_helper import allowed_space_ids_query
+from shared.helpers.search_helper import normalize_search, search_filter
+from shared.utils.enums import UserAccountType
+
+from ...enum.module_enum import ModuleName
+from ...models.common.search_documents import SearchDocument
+from ...models.financials.invoices import Invoice
+from ...models.leasing_tenants.leases import Lease
+from ...models.leasing_tenants.tenant_spaces import TenantSpace
+from ...models.leasing_tenants.tenants import Tenant
+from ...models.procurement.vendors import Vendor
+from ...models.service_ticket.tickets import Ticket
+from ...models.space_sites.sites import Site
+from ...models.space_sites.spaces import Space
+from ...schemas.common.search_schemas import GlobalSearchRequest, GlobalSearchResponse, SearchGroupOut, SearchResultOut
+
+DOCUMENT_COLUMNS = [
+    "module", "entity_id", "org_id", "site_id", "space_id",
+    "title", "subtitle", "body", "status"
+]
+
+# Modules a tenant / owner may see, restricted to their own spaces
+SPACE_SCOPED_MODULES = [
+    ModuleName.tickets.value,
+    ModuleName.spaces.value,
+    ModuleName.leases.value,
+    ModuleName.invoices.value,
+]
+
+
+# ----------------------------------------------------------------------
+# DOCUMENT SOURCES
+# Each source returns a SELECT producing one search document per entity,
+# in DOCUMENT_COLUMNS order. The same SELECT feeds the per-row hooks and
+# the full reindex.
+# ----------------------------------------------------------------------
+
+def _ticket_documents():
+    return select(
+        literal(ModuleName.tickets.value),
+        Ticket.id,
+        Ticket.org_id,
+        Ticket.site_id,
+        Ticket.space_id,
+        Ticket.title,
+        Ticket.ticket_no,
+        Ticket.description,
+        cast(Ticket.status, String),
+    ).where(Ticket.org_id.isnot(None))
+
+
+def _space_documents():
+    return select(
+        literal(ModuleName.spaces.value),
+        Space.id,
+        Space.org_id,
+        Space.site_id,
+        Space.id.label("space_id"),
+        func.coalesce(Space.name, ""),
+        Space.kind,
+        Site.name,
+        Space.status,
+    ).join(Site, Site.id == Space.site_id).where(
+        Space.org_id.isnot(None),
+        Space.is_deleted == False
+    )
+
+
+def _tenant_documents():
+    # Tenants carry no org_id; scope them by their latest space link
+    return select(
+        literal(ModuleName.tenants.value),
+        Tenant.id,
+        Site.org_id,
+        TenantSpace.site_id,
+        TenantSpace.space_id,
+        Tenant.name,
+        Tenant.legal_name,
+        func.concat_ws(" ", Tenant.email, Tenant.phone),
+        Tenant.status,
+    ).join(
+        TenantSpace,
+        (TenantSpace.tenant_id == Tenant.id) & (TenantSpace.is_deleted == False)
+    ).join(
+        Site, Site.id == TenantSpace.site_id
+    ).where(
+        Tenant.is_deleted == False
+    ).distinct(Tenant.id).order_by(Tenant.id, TenantSpace.created_at.desc())
+
+
+def _lease_documents():
+    return select(
+        literal(ModuleName.leases.value),
+        Lease.id,
+        Lease.org_id,
+        Lease.site_id,
+        Lease.space_id,
+        func.coalesce(Lease.lease_number, ""),
+        Tenant.name,
+        Space.name,
+        Lease.status,
+    ).outerjoin(
+        Tenant, Tenant.id == Lease.tenant_id
+    ).outerjoin(
+        Space, Space.id == Lease.space_id
+    ).where(Lease.is_deleted == False)
+
+
+def _invoice_documents():
+    return select(
+        literal(ModuleName.invoices.value),
+        Invoice.id,
+        Invoice.org_id,
+        Invoice.site_id,
+        Invoice.space_id,
+        Invoice.invoice_no,
+        Space.name,
+        null(),
+        Invoice.status,
+    ).outerjoin(
+        Space, Space.id == Invoice.space_id
+    ).where(Invoice.is_deleted == False)
+
+
+def _vendor_documents():
+    return select(
+        literal(ModuleName.vendors.value),
+        Vendor.id,
+        Vendor.org_id,
+        null(),
+        null(),
+        Vendor.name,
+        Vendor.gst_vat_id,
+        cast(Vendor.contact, String),
+        Vendor.status,
+    ).where(Vendor.is_deleted == False)
+
+
+SEARCH_SOURCES = {
+    ModuleName.tickets.value: (Ticket, _ticket_documents),
+    ModuleName.spaces.value: (Space, _space_documents),
+    ModuleName.tenants.value: (Tenant, _tenant_documents),
+    ModuleName.leases.value: (Lease, _lease_documents),
+    ModuleName.invoices.value: (Invoice, _invoice_documents),
+    ModuleName.vendors.value: (Vendor, _vendor_documents),
+}
+
+
+def upsert_search_documents(conn, module: str, entity_ids: Optional[Iterable[UUID]] = None, org_id: Optional[UUID] = None):
+    """
+    (Re)build search documents of one module in place: upsert on
+    (module, entity_id), then drop the documents of entities that no longer
+    qualify (soft deleted, unlinked tenant, ...).
+    """
+    model, source = SEARCH_SOURCES[module]
+    documents = source()
+    stale = delete(SearchDocument).where(SearchDocument.module == module)
+
+    if entity_ids is not None:
+        entity_ids = list(entity_ids)
+        if not entity_ids:
+            return
+        documents = documents.where(model.id.in_(entity_ids))
+        stale = stale.where(SearchDocument.entity_id.in_(entity_ids))
+
+    if org_id is not None:
+        documents = documents.where(
+            documents.selected_columns[2] == org_id)
+        stale = stale.where(SearchDocument.org_id == org_id)
+
+    # The id default is Python-side and would render once for the whole
+    # SELECT; every row needs its own
+    stmt = insert(SearchDocument).from_select(
+        DOCUMENT_COLUMNS + ["id"], documents.add_columns(func.gen_random_uuid()))
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_search_document_module_entity",
+        set_={
+            column: getattr(stmt.excluded, column)
+            for column in DOCUMENT_COLUMNS
+            if column not in ("module", "entity_id")
+        } | {"updated_at": func.now()}
+    )
+    conn.execute(stmt)
+
+    current = documents.subquery()
+    conn.execute(stale.where(
+        SearchDocument.entity_id.not_in(select(list(current.c)[1]))))
+
+
+def reindex_search_documents(db: Session, org_id: Optional[UUID] = None):
+    """Full rebuild, for backfilling and for changes made with bulk UPDATEs."""
+    conn = db.connection()
+    for module in SEARCH_SOURCES:
+        upsert_search_documents(conn, module, org_id=org_id)
+    db.commit()
+
+    counts = (
+        db.query(SearchDocument.module, func.count(SearchDocument.id))
+        .filter(*([SearchDocument.org_id == org_id] if org_id else []))
+        .group_by(SearchDocument.module)
+        .all()
+    )
+    return {module: count for module, count in counts}
+
+
+# ----------------------------------------------------------------------
+# SYNC HOOKS
+# ----------------------------------------------------------------------
+
+def _register_sync(module: str, model):
+    def sync_document(mapper, connection, target):
+        upsert_search_documents(connection, module, [target.id])
+
+    def drop_document(mapper, connection, target):
+        connection.execute(
+            delete(SearchDocument).where(
+                SearchDocument.module == module,
+                SearchDocument.entity_id == target.id
+            )
+        )
+
+    event.listen(model, "after_insert", sync_document)
+    event.listen(model, "after_update", sync_document)
+    event.listen(model, "after_delete", drop_document)
+
+
+for _module, (_model, _source) in SEARCH_SOURCES.items():
+    _register_sync(_module, _model)
+
+
+def _sync_tenant_scope(mapper, connection, target):
+    # A tenant's org / site comes from its space links
+    if target.tenant_id:
+        upsert_search_documents(
+            connection, ModuleName.tenants.value, [target.tenant_id])
+
+
+event.listen(TenantSpace, "after_insert", _sync_tenant_scope)
+event.listen(TenantSpace, "after_update", _sync_tenant_scope)
+
+
+# ----------------------------------------------------------------------
+# SEARCH
+# ----------------------------------------------------------------------
+
+def global_search(db: Session, user: UserToken, params: GlobalSearchRequest) -> GlobalSearchResponse:
+    term = normalize_search(params.search)
+    if not term:
+        return GlobalSearchResponse(search="", groups=[])
+
+    filters = [SearchDocument.org_id == user.org_id]
+
+    modules = [
+        m.strip().lower() for m in (params.modules or "").split(",")
+        if m.strip().lower() in SEARCH_SOURCES
+    ] or list(SEARCH_SOURCES.keys())
+    if user.account_type.lower() in (UserAccountType.TENANT.value, UserAccountType.FLAT_OWNER.value):
+        allowed_space_ids = allowed_space_ids_query(user)
+
+        modules = [m for m in modules if m in SPACE_SCOPED_MODULES]
+        filters.append(SearchDocument.space_id.in_(allowed_space_ids))
+
+    filters.append(SearchDocument.module.in_(modules))
+
+    if params.site_id and params.site_id.lower() != "all":
+        filters.append(SearchDocument.site_id == params.site_id)
+
+    ts_query = func.websearch_to_tsquery("simple", term)
+    filters.append(
+        or_(
+            SearchDocument.search_vector.op("@@")(ts_query),
+            search_filter(term, SearchDocument.title,
+                          SearchDocument.subtitle)
+        )
+    )
+
+    rank = func.greatest(
+        func.ts_rank(SearchDocument.search_vector, ts_query),
+        func.similarity(SearchDocument.title, term),
+    )
+    row_no = func.row_number().over(
+        partition_by=SearchDocument.module,
+        order_by=(rank.desc(), SearchDocument.updated_at.desc())
+    )
+
+    ranked = (
+        select(
+            SearchDocument.module,
+            SearchDocument.entity_id,
+            SearchDocument.site_id,
+            SearchDocument.space_id,
+            SearchDocument.title,
+            SearchDocument.subtitle,
+            SearchDocument.status,
+            rank.label("rank"),
+            row_no.label("row_no"),
+        )
+        .where(*filters)
+        .subquery()
+    )
+
+    # One extra row per module tells whether the group was capped
+    rows = db.execute(
+        select(ranked)
+        .where(ranked.c.row_no <= params.limit_per_type + 1)
+        .order_by(ranked.c.module, ranked.c.row_no)
+    ).all()
+
+    grouped: Dict[str, List] = defaultdict(list)
+    for row in rows:
+        grouped[row.module].append(row)
+
+    groups = []
+    for module in modules:
+        module_rows = grouped.get(module)
+        if not module_rows:
+            continue
+
+        groups.append(SearchGroupOut(
+            module=module,
+            has_more=len(module_rows) > params.limit_per_type,
+            results=[
+                SearchResultOut(
+                    id=row.entity_id,
+                    title=row.title,
+                    subtitle=row.subtitle,
+                    status=row.status,
+                    site_id=row.site_id,
+                    space_id=row.space_id,
+                    rank=float(row.rank or 0),
+                )
+                for row in module_rows[:params.limit_per_type]
+            ]
+        ))
+
+    return GlobalSearchResponse(search=term, groups=groups)
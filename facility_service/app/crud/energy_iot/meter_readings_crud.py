@@ -1,9 +1,11 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, distinct, func, or_, cast, Date
+from sqlalchemy import and_, distinct, func, cast, Date
 from uuid import UUID
 
+from shared.helpers.bulk_import import BulkImport, ProgressCallback, nan_to_none
 from shared.helpers.json_response_helper import error_response
+from shared.helpers.search_helper import apply_search
 from shared.utils.app_status_code import AppStatusCode
 
 from ...schemas.energy_iot.meters_schemas import BulkUploadError, MeterRequest
@@ -15,6 +17,7 @@ from ...schemas.energy_iot.meter_readings_schemas import (
 )
 from ...models.space_sites.sites import Site
 from ...models.space_sites.spaces import Space
+from shared.helpers.reference_cache import cached_reference, invalidate_on_change
 
 
 def get_meter_readings_overview(db: Session, org_id: UUID):
@@ -80,14 +83,7 @@ def get_list(db: Session, org_id: UUID, params: MeterRequest, is_export: bool =
         )
     )
 
-    if params.search:
-        search_term = f"%{params.search}%"
-        q = q.filter(  # Note: you need to assign back to q
-            or_(
-                Meter.code.ilike(search_term),
-                Meter.kind.ilike(search_term)
-            )
-        )
+    q = apply_search(q, params.search, Meter.code, Meter.kind)
 
     total = None
     if not is_export:
@@ -217,6 +213,11 @@ def delete(db: Session, meter_reading_id: UUID) -> Optional[MeterReading]:
     return obj
 
 
+invalidate_on_change(Meter, "meters")
+invalidate_on_change(Site, "meters")
+
+
+@cached_reference("meters")
 def meter_reading_lookup(db: Session, org_id: str):
     rows = (
         db.query(
@@ -234,50 +235,89 @@ def meter_reading_lookup(db: Session, org_id: str):
     return [{"id": str(r.id), "name": r.name} for r in rows]
 
 
-def bulk_update_readings(db: Session, request: BulkMeterReadingRequest):
-    inserted, updated = 0, 0
-    rowHeaderIndex = 2
-    bulk_error_list = []
-    for m in request.readings:
-        errors = []
-        meter_id = db.query(Meter.id).filter(
-            Meter.code == m.meterCode, Meter.is_deleted == False).scalar()
-
-        if not meter_id:
-            errors.append("Meter code doesn't exist in the system")
-
-        if not errors:
-
-            obj = (
-                db.query(MeterReading)
-                .filter(
-                    MeterReading.meter_id == meter_id,
-                    cast(MeterReading.ts, Date) == m.timestamp.date(),
-                    MeterReading.is_deleted == False
-                ).first()
-            )
-
-            if not obj:
-                # insert reading
-                data = m.model_dump(exclude={"meterCode"})
-                data["ts"] = data.pop("timestamp")  # ✅ rename key
-                data.pop("meter_id", None)
-
-                reading_data = MeterReading(**data, meter_id=meter_id)
-                db.add(reading_data)
-                inserted += 1
-
-            else:
-                # update reading
-                data = m.model_dump(exclude_unset=True, exclude={"meterCode"})
-                for k, v in data.items():
-                    setattr(obj, k, v)
-                updated += 1
+def bulk_update_readings(
+    db: Session,
+    request: BulkMeterReadingRequest,
+    org_id: Optional[UUID] = None,
+    progress: Optional[ProgressCallback] = None,
+    commit: bool = True
+):
+    """
+    One reading per meter and day: rows matching an existing reading of
+    that day update it, the rest are inserted. Set-based, see BulkImport.
+    With commit=False the caller commits.
+    """
+    if not request.readings:
+        return {"inserted": 0, "updated": 0, "validations": []}
+
+    job = BulkImport(db, request.readings, "meter readings", progress)
+
+    meter_filters = [Meter.is_deleted == False]
+    if org_id:
+        meter_filters.append(Meter.org_id == org_id)
+    meters = job.lookup(
+        [Meter.code.label("meterCode"), Meter.id.label("resolved_meter_id")],
+        [Meter.code],
+        job.frame[["meterCode"]],
+        *meter_filters
+    )
+    ambiguous = meters.loc[meters.duplicated("meterCode", keep=False), "meterCode"]
+    job.attach(meters.drop_duplicates("meterCode"), on=["meterCode"])
+    job.fail(job.frame["resolved_meter_id"].isna(),
+             "Meter code doesn't exist in the system")
+    job.fail(job.frame["meterCode"].isin(ambiguous),
+             "Meter code matches more than one meter")
+
+    valid = job.valid().copy()
+    valid["day"] = valid["idx"].map(lambda i: job.records[i].timestamp.date())
+    # Several rows for the same meter and day collapse into the last one
+    valid = valid.drop_duplicates(["resolved_meter_id", "day"], keep="last")
+
+    reading_day = cast(MeterReading.ts, Date)
+    existing = job.lookup(
+        [
+            MeterReading.id.label("reading_id"),
+            MeterReading.meter_id.label("resolved_meter_id"),
+            reading_day.label("day"),
+        ],
+        [MeterReading.meter_id, reading_day],
+        valid[["resolved_meter_id", "day"]],
+        MeterReading.is_deleted == False
+    ).drop_duplicates(["resolved_meter_id", "day"])
+    valid = valid.merge(existing, on=["resolved_meter_id", "day"], how="left")
+
+    updates, inserts = [], []
+    for idx, meter_id, reading_id in zip(valid["idx"], valid["resolved_meter_id"], valid["reading_id"]):
+        m = job.records[idx]
+        reading_id = nan_to_none(reading_id)
+        if reading_id:
+            data = {"id": reading_id, "reading": m.reading}
+            if "source" in m.model_fields_set:
+                data["source"] = m.source
+            updates.append(data)
         else:
-            row_error = BulkUploadError(row=rowHeaderIndex, errors=errors)
-            bulk_error_list.append(row_error)
-
-        rowHeaderIndex += 1
+            inserts.append({
+                "meter_id": meter_id,
+                "ts": m.timestamp,
+                "reading": m.reading,
+                "source": m.source,
+                "is_deleted": False,
+            })
+
+    total = len(valid)
+    updated = job.update_by_id(MeterReading, updates, total)
+    # A soft-deleted reading at the exact same timestamp is revived
+    inserted, revived = job.upsert(
+        MeterReading, inserts,
+        conflict_columns=["meter_id", "ts"],
+        update_columns=["reading", "source", "is_deleted", "updated_at"],
+        total=total
+    )
 
-    db.commit()
-    return {"inserted": inserted, "validations": bulk_error_list}
\ No newline at end of file
+    if commit:
+        db.commit()
+    return {
+        "inserted": inserted,
+        "updated": updated + revived,
+        "validations": job.errors(BulkUploadError)
+    }
\ No newline at end of file
@@ -4,6 +4,7 @@ from sqlalchemy import func, and_, or_
 from uuid import UUID
 from datetime import datetime
 
+from shared.helpers.bulk_import import BulkImport, ProgressCallback
 from shared.utils.app_status_code import AppStatusCode
 from shared.helpers.json_response_helper import error_response
 
@@ -121,53 +122,72 @@ def get_by_id(db: Session, meter_id: UUID) -> Optional[MeterOut]:
     )
 
 
-def bulk_update_meters(db: Session, request: BulkMeterRequest):
-    inserted, updated = 0, 0
-    rowHeaderIndex = 2
-    bulk_error_list = []
-    for m in request.meters:
-        errors = []
-        obj = db.query(Meter).filter(Meter.code == m.code,
-                                     Meter.is_deleted == False).first()
-
-        site_id = db.query(Site.id).filter(
-            Site.name == m.siteName).scalar()
-        space_id = db.query(Space.id).filter(
-            Space.name == m.spaceName).scalar()
-
-        if not site_id:
-            errors.append("Site doesn't exist in the system")
-
-        if not space_id:
-            errors.append("Space doesn't exist in the system")
-
-        if not errors:
-            m.site_id = site_id
-            m.space_id = space_id
-
-            if not obj:
-                # create meter
-                meter_data = Meter(
-                    **m.model_dump(exclude={"siteName", "spaceName"}))
-                db.add(meter_data)
-                inserted += 1
-
-            else:
-                # update meter
-                data = m.model_dump(exclude_unset=True, exclude={
-                                    "siteName", "spaceName"})
-                for k, v in data.items():
-                    setattr(obj, k, v)
-
-                updated += 1
-        else:
-            row_error = BulkUploadError(row=rowHeaderIndex, errors=errors)
-            bulk_error_list.append(row_error)
-
-        rowHeaderIndex += 1
+def bulk_update_meters(
+    db: Session,
+    request: BulkMeterRequest,
+    org_id: Optional[UUID] = None,
+    progress: Optional[ProgressCallback] = None,
+    commit: bool = True
+):
+    """
+    Meters are matched by (org, site, code): existing ones are updated, the
+    rest inserted. Set-based, see BulkImport. With commit=False the caller
+    commits, together with whatever else it writes.
+    """
+    if not request.meters:
+        return {"inserted": 0, "updated": 0, "validations": []}
+
+    org_id = org_id or request.meters[0].org_id
+    job = BulkImport(db, request.meters, "meters", progress)
+
+    sites = job.lookup(
+        [Site.name.label("siteName"), Site.id.label("resolved_site_id")],
+        [Site.name],
+        job.frame[["siteName"]],
+        Site.org_id == org_id,
+        Site.is_deleted == False
+    ).drop_duplicates("siteName")
+    job.attach(sites, on=["siteName"])
+
+    spaces = job.lookup(
+        [Space.site_id.label("resolved_site_id"), Space.name.label("spaceName"),
+         Space.id.label("resolved_space_id")],
+        [Space.site_id, Space.name],
+        job.frame.loc[job.frame["resolved_site_id"].notna(), ["resolved_site_id", "spaceName"]],
+        Space.is_deleted == False
+    ).drop_duplicates(["resolved_site_id", "spaceName"])
+    job.attach(spaces, on=["resolved_site_id", "spaceName"])
+
+    frame = job.frame
+    job.fail(frame["resolved_site_id"].isna(), "Site doesn't exist in the system")
+    job.fail(frame["resolved_space_id"].isna(), "Space doesn't exist in the system")
+
+    # A code repeated within the sheet keeps its last row
+    valid = job.valid().drop_duplicates(["resolved_site_id", "code"], keep="last")
+    rows = []
+    for idx, site_id, space_id in zip(valid["idx"], valid["resolved_site_id"], valid["resolved_space_id"]):
+        m = job.records[idx]
+        rows.append({
+            "org_id": org_id,
+            "site_id": site_id,
+            "space_id": space_id,
+            "code": m.code,
+            "kind": m.kind,
+            "unit": m.unit,
+            "multiplier": m.multiplier,
+            "is_deleted": False,
+        })
+
+    # Also revives a soft-deleted meter with the same code on the site
+    inserted, updated = job.upsert(
+        Meter, rows,
+        conflict_columns=["org_id", "site_id", "code"],
+        update_columns=["space_id", "kind", "unit", "multiplier", "is_deleted"],
+    )
 
-    db.commit()
-    return {"inserted": inserted, "validations": bulk_error_list}
+    if commit:
+        db.commit()
+    return {"inserted": inserted, "updated": updated, "validations": job.errors(BulkUploadError)}
 
 
 def create(db: Session, payload: MeterCreate) -> Meter:
@@ -0,0 +1,463 @@
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import func, insert, literal, select, union_all, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from shared.core.database import FacilitySessionLocal
+from shared.core.schemas import UserToken
+from shared.helpers.json_response_helper import error_response
+from shared.helpers.user_helper import get_users_bulk
+from shared.utils.app_status_code import AppStatusCode
+
+from ...enum.revenue_enum import BillingRunStatus, InvoiceType
+from ...models.financials.billing_runs import BillingRun
+from ...models.financials.customer_advances import AdvanceAdjustment, CustomerAdvance
+from ...models.financials.invoices import Invoice, InvoiceLine, PaymentAR
+from ...models.leasing_tenants.lease_charges import LeaseCharge
+from ...models.leasing_tenants.leases import Lease
+from ...models.parking_access.parking_pass import ParkingPass
+from ...models.service_ticket.tickets import Ticket
+from ...models.service_ticket.tickets_work_order import TicketWorkOrder
+from ...models.space_sites.owner_maintenances import OwnerMaintenanceCharge
+from ...models.space_sites.sites import Site
+from ...models.space_sites.space_owners import SpaceOwner
+from ...models.space_sites.spaces import Space
+from ...models.system.notifications import Notification, NotificationType, PriorityType
+from ...schemas.financials.invoices_schemas import AutoInvoiceResponse
+from ..system.system_settings_crud import get_system_currency
+from .invoice_email_service import InvoiceEmailService
+from .invoices_crud import MODEL_MAP, allocate_invoice_numbers
+
+AR_TAX_PCT = Decimal(5)
+CHUNK_SIZE = 500
+# A running run whose progress has not moved for this long is taken over
+STALE_AFTER = timedelta(minutes=15)
+
+
+def _stage_charges(db: Session, org_id: UUID, period_start: date, period_end: date):
+    """
+    Every uninvoiced charge of the window in one query, rent first, then
+    owner maintenance, work orders and parking passes. user_id, site_id or
+    space_id is null where the charge cannot be billed.
+    """
+    rent = (
+        select(
+            literal(0).label("source_order"),
+            literal(InvoiceType.rent.value).label("code"),
+            LeaseCharge.id.label("item_id"),
+            Lease.tenant_id.label("user_id"),
+            Site.id.label("site_id"),
+            Lease.space_id.label("space_id"),
+            LeaseCharge.amount.label("amount"),
+            literal("Monthly Rent").label("description"),
+        )
+        .join(Lease, Lease.id == LeaseCharge.lease_id)
+        .outerjoin(Site, Site.id == Lease.site_id)
+        .where(
+            LeaseCharge.period_start >= period_start,
+            LeaseCharge.period_start <= period_end,
+            LeaseCharge.charge_code == InvoiceType.rent.value,
+            LeaseCharge.invoice_id.is_(None),
+            LeaseCharge.is_deleted == False,
+            Lease.org_id == org_id,
+            Lease.is_deleted == False,
+            Lease.status == "active",
+        )
+    )
+
+    maintenance = (
+        select(
+            literal(1),
+            literal(InvoiceType.owner_maintenance.value),
+            OwnerMaintenanceCharge.id,
+            SpaceOwner.owner_user_id,
+            Site.id,
+            OwnerMaintenanceCharge.space_id,
+            OwnerMaintenanceCharge.amount,
+            literal("Owner Maintenance"),
+        )
+        .outerjoin(SpaceOwner, SpaceOwner.id == OwnerMaintenanceCharge.space_owner_id)
+        .outerjoin(Space, Space.id == OwnerMaintenanceCharge.space_id)
+        .outerjoin(Site, Site.id == Space.site_id)
+        .where(
+            OwnerMaintenanceCharge.period_start >= period_start,
+            OwnerMaintenanceCharge.period_start <= period_end,
+            OwnerMaintenanceCharge.invoice_id.is_(None),
+            OwnerMaintenanceCharge.org_id == org_id,
+            OwnerMaintenanceCharge.is_deleted == False,
+        )
+    )
+
+    work_orders = (
+        select(
+            literal(2),
+            literal(InvoiceType.work_order.value),
+            TicketWorkOrder.id,
+            TicketWorkOrder.bill_to_id,
+            Site.id,
+            Ticket.space_id,
+            TicketWorkOrder.total_amount,
+            func.concat("Work Order #", TicketWorkOrder.wo_no),
+        )
+        .outerjoin(Ticket, Ticket.id == TicketWorkOrder.ticket_id)
+        .outerjoin(Site, Site.id == Ticket.site_id)
+        .where(
+            TicketWorkOrder.created_at >= period_start,
+            TicketWorkOrder.created_at <= period_end,
+            TicketWorkOrder.invoice_id.is_(None),
+            TicketWorkOrder.org_id == org_id,
+            TicketWorkOrder.bill_to_type.in_(["tenant", "owner"]),
+        )
+    )
+
+    parking = (
+        select(
+            literal(3),
+            literal(InvoiceType.parking_pass.value),
+            ParkingPass.id,
+            ParkingPass.partner_id,
+            Site.id,
+            ParkingPass.space_id,
+            ParkingPass.charge_amount,
+            literal("Parking Pass"),
+        )
+        .outerjoin(Site, Site.id == ParkingPass.site_id)
+        .where(
+            ParkingPass.valid_from >= period_start,
+            ParkingPass.valid_from <= period_end,
+            ParkingPass.invoice_id.is_(None),
+            ParkingPass.org_id == org_id,
+        )
+    )
+
+    staged = union_all(rent, maintenance, work_orders, parking).subquery()
+    return db.execute(
+        select(staged).order_by(staged.c.source_order, staged.c.item_id)
+    ).all()
+
+
+def _apply_advances(db: Session, org_id: UUID, invoices: list):
+    """
+    apply_advance_to_invoice for a chunk of new invoices: each customer's
+    advances, oldest first, go to their invoices in order. Sets the invoices'
+    status and returns the adjustment, payment and balance rows to write.
+    """
+    advances = defaultdict(list)
+    for advance in (
+        db.query(CustomerAdvance.id, CustomerAdvance.user_id, CustomerAdvance.balance)
+        .filter(
+            CustomerAdvance.org_id == org_id,
+            CustomerAdvance.user_id.in_({i["user_id"] for i in invoices}),
+            CustomerAdvance.balance > 0,
+        )
+        .order_by(CustomerAdvance.created_at.asc())
+        .with_for_update()
+    ):
+        advances[advance.user_id].append([advance.id, Decimal(str(advance.balance))])
+
+    adjustments, payments, balances = [], [], {}
+    for invoice in invoices:
+        invoice_amount = Decimal(str(invoice["totals"]["grand"]))
+        remaining = invoice_amount
+        if remaining <= 0:
+            continue
+
+        for advance in advances.get(invoice["user_id"], []):
+            if remaining <= 0:
+                break
+            use_amount = min(advance[1], remaining)
+            if use_amount <= 0:
+                continue
+
+            adjustments.append({
+                "advance_id": advance[0],
+                "invoice_id": invoice["id"],
+                "amount": use_amount,
+            })
+            payments.append({
+                "org_id": org_id,
+                "invoice_id": invoice["id"],
+                "method": "advance",
+                "ref_no": f"ADV-{advance[0]}",
+                "amount": use_amount,
+            })
+            advance[1] -= use_amount
+            balances[advance[0]] = advance[1]
+            remaining -= use_amount
+
+        if remaining <= 0:
+            invoice["status"] = "paid"
+            invoice["is_paid"] = True
+        elif remaining < invoice_amount:
+            invoice["status"] = "partial"
+
+    return adjustments, payments, [
+        {"id": advance_id, "balance": balance} for advance_id, balance in balances.items()
+    ]
+
+
+def _bill_chunk(db: Session, run_id: UUID, org_id: UUID, rows: list,
+                currency, issue_date: date, due_date: date):
+    """
+    One invoice per charge with a single line, written in bulk: numbers in
+    one block, invoices, lines, advance adjustments and charge back-links
+    as one statement each. The caller commits.
+    """
+    # Charges invoiced since staging, by hand or by another run, are left alone
+    open_ids = set()
+    for code, model in MODEL_MAP.items():
+        ids = [row.item_id for row in rows if row.code == code]
+        if ids:
+            open_ids.update(db.execute(
+                select(model.id)
+                .where(model.id.in_(ids), model.invoice_id.is_(None))
+                .with_for_update(skip_locked=True)
+            ).scalars())
+    rows = [row for row in rows if row.item_id in open_ids]
+    if not rows:
+        return [], 0
+
+    invoices, lines, links = [], [], defaultdict(list)
+    for row, invoice_no in zip(rows, allocate_invoice_numbers(db, org_id, len(rows))):
+        sub = Decimal(row.amount)
+        tax = (sub * AR_TAX_PCT) / Decimal(100)
+        invoice_id = uuid.uuid4()
+        invoices.append({
+            "id": invoice_id,
+            "org_id": org_id,
+            "site_id": row.site_id,
+            "space_id": row.space_id,
+            "user_id": row.user_id,
+            "invoice_no": invoice_no,
+            "date": issue_date,
+            "due_date": due_date,
+            "status": "issued",
+            "is_paid": False,
+            "currency": currency,
+            "totals": {
+                "sub": float(round(sub, 2)),
+                "tax": float(round(tax, 2)),
+                "grand": float(round(sub + tax, 2)),
+            },
+            "billing_run_id": run_id,
+        })
+        lines.append({
+            "invoice_id": invoice_id,
+            "code": row.code,
+            "item_id": row.item_id,
+            "description": row.description,
+            "amount": row.amount,
+            "tax_pct": AR_TAX_PCT,
+        })
+        links[row.code].append({"id": row.item_id, "invoice_id": invoice_id})
+
+    adjustments, payments, balances = _apply_advances(db, org_id, invoices)
+
+    db.execute(insert(Invoice), invoices)
+    db.execute(insert(InvoiceLine), lines)
+    if adjustments:
+        db.execute(insert(AdvanceAdjustment), adjustments)
+        db.execute(insert(PaymentAR), payments)
+        db.execute(update(CustomerAdvance), balances)
+    for code, values in links.items():
+        db.execute(update(MODEL_MAP[code]), values)
+
+    return invoices, len(adjustments)
+
+
+def _claim_run(db: Session, org_id: UUID, period_start: date, period_end: date, user_id: UUID):
+    """
+    The window's run row, created on first use and marked running. None
+    when another run of the window is in progress.
+    """
+    now = datetime.now(timezone.utc)
+    db.execute(
+        pg_insert(BillingRun)
+        .values(org_id=org_id, period_start=period_start, period_end=period_end,
+                created_by=user_id)
+        .on_conflict_do_nothing(index_elements=["org_id", "period_start"])
+    )
+    run = (
+        db.query(BillingRun)
+        .filter(BillingRun.org_id == org_id, BillingRun.period_start == period_start)
+        .with_for_update()
+        .populate_existing()
+        .one()
+    )
+    if (run.status == BillingRunStatus.running.value
+            and run.locked_at and run.locked_at > now - STALE_AFTER):
+        db.rollback()
+        return None
+
+    run.status = BillingRunStatus.running.value
+    run.attempts += 1
+    run.period_end = period_end
+    run.locked_at = now
+    run.started_at = func.now()
+    run.finished_at = None
+    run.last_error = None
+    db.commit()
+    return run
+
+
+def run_billing(
+    db: Session,
+    org_id: UUID,
+    period_start: date,
+    period_end: date,
+    due_date: date,
+    current_user: UserToken
+) -> AutoInvoiceResponse:
+    """
+    Invoice every uninvoiced rent, owner maintenance, work order and parking
+    pass charge of the window. Charges are staged with one query and billed
+    CHUNK_SIZE at a time, committing after each chunk; a failed run is
+    resumed by running the same window again.
+    """
+    run = _claim_run(db, org_id, period_start, period_end, current_user.user_id)
+    if run is None:
+        return error_response(
+            message="A billing run for this period is already in progress",
+            status_code=str(AppStatusCode.OPERATION_FAILED),
+            http_status=409
+        )
+    run_id = run.id
+
+    created, amount, advances_applied = 0, Decimal(0), 0
+    try:
+        staged = _stage_charges(db, org_id, period_start, period_end)
+        billable = [row for row in staged if row.user_id and row.site_id and row.space_id]
+        skipped = len(staged) - len(billable)
+        db.query(BillingRun).filter(BillingRun.id == run_id).update({
+            "charges_staged": len(staged),
+            "charges_skipped": skipped,
+        })
+        db.commit()
+
+        currency = get_system_currency(db, org_id)
+        issue_date = date.today()
+        for start in range(0, len(billable), CHUNK_SIZE):
+            invoices, applied = _bill_chunk(
+                db, run_id, org_id, billable[start:start + CHUNK_SIZE],
+                currency, issue_date, due_date
+            )
+            chunk_amount = sum((Decimal(str(i["totals"]["grand"])) for i in invoices), Decimal(0))
+            db.query(BillingRun).filter(BillingRun.id == run_id).update({
+                "invoices_created": BillingRun.invoices_created + len(invoices),
+                "amount_invoiced": BillingRun.amount_invoiced + chunk_amount,
+                "advances_applied": BillingRun.advances_applied + applied,
+                "locked_at": func.now(),
+            })
+            db.commit()
+            created += len(invoices)
+            amount += chunk_amount
+            advances_applied += applied
+
+        db.query(BillingRun).filter(BillingRun.id == run_id).update({
+            "status": BillingRunStatus.completed.value,
+            "locked_at": None,
+            "finished_at": func.now(),
+        })
+        if created:
+            db.add(Notification(
+                user_id=current_user.user_id,
+                type=NotificationType.alert,
+                title="Invoices Generated",
+                message=f"{created} invoices generated for {period_start} to {period_end}. Amount: {amount}",
+                posted_date=datetime.utcnow(),
+                priority=PriorityType.medium,
+                read=False,
+                is_deleted=False,
+                is_email=False
+            ))
+        db.commit()
+
+    except Exception as e:
+        db.rollback()
+        db.query(BillingRun).filter(BillingRun.id == run_id).update({
+            "status": BillingRunStatus.failed.value,
+            "last_error": str(e),
+            "locked_at": None,
+            "finished_at": func.now(),
+        })
+        db.commit()
+        raise
+
+    return AutoInvoiceResponse(
+        total_invoice_created=created,
+        billing_run_id=run_id,
+        status=BillingRunStatus.completed.value,
+        charges_staged=len(staged),
+        charges_skipped=skipped,
+        advances_applied=advances_applied,
+        amount_invoiced=float(amount),
+    )
+
+
+def queue_billing_run_emails(run_id: UUID):
+    """
+    Background task after a run: write the email of every invoice of the
+    run not emailed yet to the outbox, CHUNK_SIZE invoices per customer
+    lookup. Each invoice commits on its own; one that fails is recorded on
+    the run and left for the next pass. Runs in its own session.
+    """
+    db = FacilitySessionLocal()
+    try:
+        service = InvoiceEmailService()
+        queued, failed, last_error = 0, 0, None
+        last_id = None
+        while True:
+            query = db.query(Invoice).filter(
+                Invoice.billing_run_id == run_id,
+                Invoice.emailed_at.is_(None),
+                Invoice.is_deleted == False,
+            )
+            if last_id is not None:
+                query = query.filter(Invoice.id > last_id)
+            invoices = query.order_by(Invoice.id).limit(CHUNK_SIZE).all()
+            if not invoices:
+                break
+            last_id = invoices[-1].id
+
+            users = get_users_bulk({invoice.user_id for invoice in invoices})
+            for invoice in invoices:
+                invoice_no = invoice.invoice_no
+                customer = users.get(invoice.user_id)
+                try:
+                    if not (customer and customer.email):
+                        raise ValueError("customer has no email address")
+                    service.send_invoice_to_customer(
+                        db=db, invoice=invoice, customer_email=customer.email,
+                        user=customer)
+                    queued += 1
+                except Exception as e:
+                    db.rollback()
+                    failed += 1
+                    last_error = f"{invoice_no}: {getattr(e, 'detail', None) or e}"
+
+        db.query(BillingRun).filter(BillingRun.id == run_id).update({
+            "emails_queued": BillingRun.emails_queued + queued,
+            "emails_failed": failed,
+            "last_email_error": last_error,
+        })
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"Billing run {run_id} emails failed: {e}")
+    finally:
+        db.close()
+
+
+def get_billing_runs(db: Session, org_id: UUID, limit: int = 50):
+    return (
+        db.query(BillingRun)
+        .filter(BillingRun.org_id == org_id)
+        .order_by(BillingRun.period_start.desc())
+        .limit(limit)
+        .all()
+    )
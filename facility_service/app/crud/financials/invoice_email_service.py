@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from decimal import Decimal
 from uuid import UUID
 from sqlalchemy.orm import Session
@@ -25,8 +26,13 @@ class InvoiceEmailService:
         self,
         db: Session,
         invoice: Invoice,
-        customer_email: str
+        customer_email: str,
+        user=None
     ):
+        """
+        Queue the invoice email with its PDF and mark the invoice emailed.
+        `user` is the invoice's auth user when the caller already loaded it.
+        """
         # -----------------------------
         # Validate Status
         # -----------------------------
@@ -54,11 +60,12 @@ class InvoiceEmailService:
         invoice_code = invoice.lines[0].code if invoice.lines else InvoiceType.rent.value
 
         if invoice_code == InvoiceType.owner_maintenance.value:
-            customer = get_user_detail(invoice.user_id)
+            customer = user or get_user_detail(invoice.user_id)
             customer_detail = InvoiceCustomerDetail(
                 customer_name=customer.full_name if customer else "Customer",
                 space_name=invoice.space.name,
-                customer_phone=customer.phone,
+                customer_phone=(customer.phone if customer else None) or "",
+                customer_address="",
             )
         else:
             customer = get_tenant_detail(db, invoice.user_id)
@@ -66,8 +73,8 @@ class InvoiceEmailService:
             customer_detail = InvoiceCustomerDetail(
                 customer_name=customer.name if customer else "Customer",
                 space_name=invoice.space.name,
-                customer_phone=customer.phone,
-                customer_address=format_address(customer.address)
+                customer_phone=(customer.phone if customer else None) or "",
+                customer_address=format_address(customer.address if customer else None)
             )
 
         # -----------------------------
@@ -130,7 +137,7 @@ class InvoiceEmailService:
         # Email Context
         # -----------------------------
         context = {
-            "customer_name": customer.name,
+            "customer_name": customer_detail.customer_name,
             "invoice_no": invoice.invoice_no,
             "organization_name": organization.name,
             "invoice_total": float(invoice_total),
@@ -143,12 +150,10 @@ class InvoiceEmailService:
 
         subject = f"Invoice {invoice.invoice_no} from {organization.name}"
 
-        print("Sending email...")
-
         # -----------------------------
-        # Send Email
+        # Queue Email
         # -----------------------------
-        return self.email_helper.send_email(
+        self.email_helper.queue_email(
             db=db,
             template_code=template_code,
             recipients=[customer_email],
@@ -156,6 +161,9 @@ class InvoiceEmailService:
             context=context,
             attachments=[pdf_path],
         )
+        invoice.emailed_at = datetime.now(timezone.utc)
+        db.commit()
+        return True
 
     def _decide_template(self, balance, advance_used):
         """
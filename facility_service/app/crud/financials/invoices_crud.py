@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 from fastapi import BackgroundTasks, HTTPException, UploadFile
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import Date, and_, func, cast, literal, or_, case, Numeric, text
+from sqlalchemy import Date, and_, func, cast, literal, or_, case, Numeric, select, text
 from sqlalchemy.dialects.postgresql import JSONB
 from facility_service.app.crud.common.attachment_crud import AttachmentService
 from facility_service.app.crud.financials.invoice_email_service import InvoiceEmailService, format_address, get_tenant_detail
@@ -1506,7 +1506,18 @@ def save_invoice_payment_detail(
         raise e
 
 
-def generate_invoice_number(db: Session, org_id: UUID):
+def allocate_invoice_numbers(db: Session, org_id: UUID, count: int) -> List[str]:
+    """
+    A block of consecutive invoice numbers for the org. Allocations are
+    serialised per org until the caller's transaction ends, so two callers
+    cannot hand out the same numbers.
+    """
+    if count <= 0:
+        return []
+
+    db.execute(select(func.pg_advisory_xact_lock(
+        func.hashtext(f"invoice_no:{org_id}"))))
+
     # Get the maximum existing number
     last_number = (
         db.query(
@@ -1516,18 +1527,17 @@ def generate_invoice_number(db: Session, org_id: UUID):
         )
         .filter(Invoice.org_id == org_id)
         .scalar()
-    )
-
-    # Start from 1 if no invoices exist
-    next_number = (last_number or 0) + 1
+    ) or 0
 
     # Zero-pad only up to 4 digits
-    if next_number <= 9999:
-        invoice_no = f"INV-{next_number:04d}"
-    else:
-        invoice_no = f"INV-{next_number}"
+    return [
+        f"INV-{number:04d}" if number <= 9999 else f"INV-{number}"
+        for number in range(last_number + 1, last_number + 1 + count)
+    ]
+
 
-    return invoice_no
+def generate_invoice_number(db: Session, org_id: UUID):
+    return allocate_invoice_numbers(db, org_id, 1)[0]
 
 
 def apply_advance_to_invoice(
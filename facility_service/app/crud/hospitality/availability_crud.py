@@ -0,0 +1,175 @@
+from collections import defaultdict
+from datetime import timedelta
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from shared.helpers.json_response_helper import error_response
+from shared.utils.app_status_code import AppStatusCode
+from ...models.hospitality.rate_plans import RatePlan
+from ...models.hospitality.rates import Rate
+from ...models.hospitality.room_inventory import RoomInventory
+from ...models.space_sites.space_group_members import SpaceGroupMember
+from ...models.space_sites.space_groups import SpaceGroup
+from ...models.space_sites.spaces import Space
+from ...schemas.hospitality.availability_schemas import AvailabilityRequest
+
+MAX_SEARCH_NIGHTS = 90
+
+
+def _max_occupancy(specs):
+    value = specs.get("max_occupancy") if isinstance(specs, dict) else None
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _plan_availability(plan, rates, nights, check_out, free_rooms):
+    """
+    A plan is sellable for the stay when it has a rate for every night, the
+    arrival night's restrictions (closed to arrival, min / max stay) allow
+    the stay length and the departure day is not closed to departure.
+    """
+    if any(night not in rates for night in nights):
+        return None
+    arrival, departure = rates[nights[0]], rates.get(check_out)
+    if arrival.closed_to_arrival or (departure is not None and departure.closed_to_departure):
+        return None
+    if (arrival.min_stay and len(nights) < arrival.min_stay) or \
+            (arrival.max_stay and len(nights) > arrival.max_stay):
+        return None
+
+    nightly = []
+    for night in nights:
+        rate = rates[night]
+        available = free_rooms[night]
+        if rate.allotment is not None:
+            available = min(available, rate.allotment)
+        nightly.append({"date": night, "price": float(rate.price), "available": max(available, 0)})
+
+    available = min(n["available"] for n in nightly)
+    if available <= 0:
+        return None
+    return {
+        "rate_plan_id": plan.id,
+        "name": plan.name,
+        "meal_plan": plan.meal_plan,
+        "total_price": float(sum(rates[night].price for night in nights)),
+        "min_stay": arrival.min_stay,
+        "max_stay": arrival.max_stay,
+        "available": available,
+        "nights": nightly,
+    }
+
+
+def search_availability(db: Session, org_id: UUID, params: AvailabilityRequest):
+    """
+    Sellable space groups of a site for a stay: rooms left per night come
+    from room_inventory (sold) against the group's rooms in service, prices
+    and restrictions from each active rate plan's nightly rates. Allotment
+    caps the rooms a plan offers on a night.
+    """
+    stay_length = (params.check_out - params.check_in).days
+    if stay_length <= 0:
+        error_response(
+            message="Check-out must be after check-in",
+            status_code=str(AppStatusCode.INVALID_INPUT)
+        )
+    if stay_length > MAX_SEARCH_NIGHTS:
+        error_response(
+            message=f"Stays longer than {MAX_SEARCH_NIGHTS} nights cannot be searched",
+            status_code=str(AppStatusCode.INVALID_INPUT)
+        )
+    nights = [params.check_in + timedelta(days=i) for i in range(stay_length)]
+    guests = params.adults + params.children
+
+    groups = (
+        db.query(
+            SpaceGroup.id, SpaceGroup.name, SpaceGroup.kind, SpaceGroup.specs,
+            func.count(Space.id).label("total_rooms")
+        )
+        .join(SpaceGroupMember, SpaceGroupMember.group_id == SpaceGroup.id)
+        .join(Space, Space.id == SpaceGroupMember.space_id)
+        .filter(
+            SpaceGroup.org_id == org_id,
+            SpaceGroup.site_id == params.site_id,
+            SpaceGroup.is_deleted == False,
+            Space.kind == "room",
+            Space.is_deleted == False,
+            Space.status != "out_of_service",
+        )
+        .group_by(SpaceGroup.id)
+        .all()
+    )
+    groups = [
+        g for g in groups
+        if _max_occupancy(g.specs) is None or _max_occupancy(g.specs) >= guests
+    ]
+    if not groups:
+        return {"check_in": params.check_in, "check_out": params.check_out,
+                "nights": stay_length, "space_groups": []}
+    group_ids = [g.id for g in groups]
+
+    sold = defaultdict(dict)
+    for row in db.query(RoomInventory.space_group_id, RoomInventory.date, RoomInventory.sold).filter(
+        RoomInventory.space_group_id.in_(group_ids),
+        RoomInventory.date >= params.check_in,
+        RoomInventory.date < params.check_out,
+    ):
+        sold[row.space_group_id][row.date] = row.sold
+
+    plan_filters = [
+        RatePlan.org_id == org_id,
+        RatePlan.site_id == params.site_id,
+        func.lower(RatePlan.status) == "active",
+    ]
+    if params.rate_plan_id:
+        plan_filters.append(RatePlan.id == params.rate_plan_id)
+
+    plans = {
+        plan.id: plan for plan in
+        db.query(RatePlan.id, RatePlan.name, RatePlan.meal_plan).filter(*plan_filters)
+    }
+    rates = defaultdict(dict)
+    # Plain rows rather than entities: a month for a large hotel is
+    # thousands of rates. Through check-out, whose rate carries
+    # closed_to_departure.
+    for rate in db.query(
+        Rate.rate_plan_id, Rate.space_group_id, Rate.date, Rate.price, Rate.allotment,
+        Rate.min_stay, Rate.max_stay, Rate.closed_to_arrival, Rate.closed_to_departure
+    ).filter(
+        Rate.rate_plan_id.in_(list(plans)),
+        Rate.space_group_id.in_(group_ids),
+        Rate.date >= params.check_in,
+        Rate.date <= params.check_out,
+    ):
+        rates[(rate.space_group_id, rate.rate_plan_id)][rate.date] = rate
+
+    results = []
+    for group in groups:
+        free_rooms = {night: group.total_rooms - sold[group.id].get(night, 0) for night in nights}
+        offers = [
+            offer for offer in (
+                _plan_availability(plan, rates[(group.id, plan_id)], nights, params.check_out, free_rooms)
+                for plan_id, plan in plans.items()
+                if (group.id, plan_id) in rates
+            )
+            if offer is not None
+        ]
+        if not offers:
+            continue
+        results.append({
+            "space_group_id": group.id,
+            "name": group.name,
+            "kind": group.kind,
+            "max_occupancy": _max_occupancy(group.specs),
+            "total_rooms": group.total_rooms,
+            "available_rooms": max(min(free_rooms.values()), 0),
+            "rate_plans": sorted(offers, key=lambda o: o["total_price"]),
+        })
+
+    results.sort(key=lambda g: g["rate_plans"][0]["total_price"])
+    return {"check_in": params.check_in, "check_out": params.check_out,
+            "nights": stay_length, "space_groups": results}
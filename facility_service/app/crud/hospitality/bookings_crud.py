@@ -10,6 +10,7 @@ from ...models.hospitality.folios import Folio
 from ...models.hospitality.folios_charges import FolioCharge
 from sqlalchemy.dialects.postgresql import UUID
 from ...schemas.hospitality.bookings_schemas import BookingCreate, BookingUpdate, BookingRequest, BookingListResponse, BookingOut
+from shared.helpers.reference_cache import cached_reference, invalidate_on_change
 
 
 def get_booking_overview(
@@ -76,6 +77,10 @@ def get_booking_overview(
     }
 
 
+invalidate_on_change(Booking, "booking_statuses")
+
+
+@cached_reference("booking_statuses")
 def booking_filter_status_lookup(db: Session, org_id: str) -> List[Dict]:
     query = (
         db.query(
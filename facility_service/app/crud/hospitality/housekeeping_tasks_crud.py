@@ -17,6 +17,7 @@ from ...schemas.hospitality.housekeeping_tasks_schemas import (
 )
 
 from ...enum.hospitality_enum import HousekeepingTaskPriority
+from shared.helpers.reference_cache import cached_reference, invalidate_on_change
 
 # ----------------- Overview Calculation -----------------
 
@@ -178,6 +179,10 @@ def delete_housekeeping_task(db: Session, task_id: UUID, org_id: UUID) -> bool:
 # -----------filter status----------------
 
 
+invalidate_on_change(HousekeepingTask, "housekeeping_statuses")
+
+
+@cached_reference("housekeeping_statuses")
 def housekeeping_tasks_filter_status_lookup(db: Session, org_id: str) -> List[Dict]:
     query = (
         db.query(
@@ -16,6 +16,7 @@ from ...enum.hospitality_enum import RatePlansMealPlan, RatePlanStatus
 from sqlalchemy import and_, func
 from shared.utils.app_status_code import AppStatusCode
 from shared.helpers.json_response_helper import error_response
+from shared.helpers.reference_cache import cached_reference, invalidate_on_change
 
 
 # ----------------- Overview Calculation -----------------
@@ -77,6 +78,10 @@ def get_rate_plan_overview(
     }
 
 
+invalidate_on_change(RatePlan, "rate_plan_statuses")
+
+
+@cached_reference("rate_plan_statuses")
 def rate_plan_filter_status_lookup(db: Session, org_id: str) -> List[Dict]:
     query = (
         db.query(
@@ -5,11 +5,11 @@ from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime, date, timedelta
 from fastapi import HTTPException
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import String, and_, func, extract, or_, cast, Date
+from sqlalchemy import String, and_, exists, func, extract, or_, cast, Date
 from sqlalchemy import desc
 from decimal import Decimal, ROUND_HALF_UP
 
-from facility_service.app.crud.leasing_tenants.leases_crud import sync_rent_charges
+from facility_service.app.crud.leasing_tenants.leases_crud import sync_rent_charges_bulk
 from facility_service.app.enum.leasing_tenants_enum import LeaseChargeCodes
 from facility_service.app.enum.revenue_enum import InvoiceType
 from facility_service.app.models.financials.invoices import Invoice, InvoiceLine
@@ -17,7 +17,7 @@ from facility_service.app.models.space_sites.buildings import Building
 
 from ...models.system.notifications import Notification, NotificationType, PriorityType
 from shared.helpers.json_response_helper import error_response
-from shared.helpers.property_helper import get_allowed_spaces
+from shared.helpers.property_helper import allowed_space_ids_query
 from shared.utils.enums import UserAccountType
 
 from ...models.leasing_tenants.lease_charge_code import LeaseChargeCode
@@ -30,10 +30,12 @@ from shared.core.schemas import Lookup, UserToken
 from ...models.leasing_tenants.lease_charges import LeaseCharge
 
 from ...models.leasing_tenants.leases import Lease, RentPeriod
+from ...models.leasing_tenants.lease_payment_term import LeasePaymentTerm
 from ...schemas.leasing_tenants.lease_charges_schemas import LeaseChargeCreate, LeaseChargeOut, LeaseChargeUpdate, LeaseChargeRequest
 from uuid import UUID
 from decimal import Decimal
 from ...models.financials.tax_codes import TaxCode
+from shared.helpers.reference_cache import cached_reference, invalidate_on_change
 
 
 def build_lease_charge_filters(org_id: UUID, params: LeaseChargeRequest):
@@ -78,16 +80,7 @@ def get_lease_charges_overview(db: Session, user: UserToken):
     today = date.today()
     allowed_spaces_ids = None
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_spaces = get_allowed_spaces(db, user)
-        allowed_spaces_ids = [s["space_id"] for s in allowed_spaces]
-
-        if not allowed_spaces_ids:
-            return {
-                "total_charges": 0.0,
-                "tax_amount": 0.0,
-                "this_month": 0,
-                "avg_charge": 0.0,
-            }
+        allowed_spaces_ids = allowed_space_ids_query(user)
 
     base = (
         db.query(LeaseCharge)
@@ -142,14 +135,8 @@ def get_lease_charges(db: Session, user: UserToken, params: LeaseChargeRequest):
 
     )
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_spaces = get_allowed_spaces(db, user)
-        allowed_space_ids = [s["space_id"] for s in allowed_spaces]
-
-        if allowed_space_ids:
-            base_query = base_query.filter(
-                Lease.space_id.in_(allowed_space_ids))
-        else:
-            return {"items": [], "total": 0}
+        base_query = base_query.filter(
+            Lease.space_id.in_(allowed_space_ids_query(user)))
 
     total = base_query.with_entities(func.count(LeaseCharge.id)).scalar()
 
@@ -505,6 +492,10 @@ def lease_charge_month_lookup(
     # return query.all()
 
 
+invalidate_on_change(LeaseChargeCode, "lease_charge_codes")
+
+
+@cached_reference("lease_charge_codes")
 def lease_charge_code_lookup(db: Session, org_id: UUID):
     query = (
         db.query(
@@ -520,6 +511,10 @@ def lease_charge_code_lookup(db: Session, org_id: UUID):
     return query.all()
 
 
+invalidate_on_change(TaxCode, "tax_codes")
+
+
+@cached_reference("tax_codes")
 def tax_code_lookup(db: Session, org_id: UUID):
     query = (
         db.query(
@@ -638,38 +633,50 @@ def auto_generate_lease_rent_charges(
     db: Session,
     auth_db: Session,
     input_date: date,
-    current_user: UserToken
+    current_user: UserToken,
+    incremental: bool = False
 ) -> Dict[str, Any]:
     """
     Auto-generate RENT lease charges for all active leases for a billing month
-    using LeasePaymentTerms (installments).
+    using LeasePaymentTerms (installments), in one bulk sync. With incremental
+    only leases never synced, or whose lease or terms changed since their
+    last sync, are synced.
     """
 
-    # 🔹 Fetch active leases
-    leases = db.query(Lease).filter(
+    # 🔹 Active leases with rent and a tenant
+    query = db.query(Lease.id, Lease.end_date, Lease.tenant_id).filter(
         Lease.org_id == current_user.org_id,
         Lease.status == "active",
-        Lease.is_deleted == False
-    ).all()
-
-    if not leases:
-        raise HTTPException(status_code=404, detail="No active leases found")
-
-    created_count = 0
+        Lease.is_deleted == False,
+        Lease.rent_amount > 0,
+        Lease.tenant_id.isnot(None)
+    )
 
-    for lease in leases:
+    if incremental:
+        terms_changed = exists().where(
+            LeasePaymentTerm.lease_id == Lease.id,
+            func.greatest(LeasePaymentTerm.created_at,
+                          LeasePaymentTerm.updated_at) > Lease.rent_synced_at
+        )
+        query = query.filter(or_(
+            Lease.rent_synced_at.is_(None),
+            Lease.updated_at > Lease.rent_synced_at,
+            terms_changed
+        ))
 
-        # Skip leases without rent or without a tenant
-        if not lease.rent_amount or lease.rent_amount <= 0 or not lease.tenant_id:
-            continue
+    leases = query.all()
 
-        # 🔹 Synchronize charges based on LeasePaymentTerms
-        sync_rent_charges(db, lease)
-        created_count += 1
+    if not leases and not incremental:
+        raise HTTPException(status_code=404, detail="No active leases found")
 
+    # 🔹 Synchronize charges based on LeasePaymentTerms
+    changes = sync_rent_charges_bulk(db, leases)
     db.commit()
 
     return {
         "total_leases_processed": len(leases),
-        "total_charge_created": created_count
+        "total_charge_created": sum(c["created"] for c in changes),
+        "total_charge_updated": sum(c["updated"] for c in changes),
+        "total_charge_deleted": sum(c["deleted"] for c in changes),
+        "changes": changes
     }
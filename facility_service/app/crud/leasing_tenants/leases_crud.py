@@ -1,9 +1,11 @@
+from collections import defaultdict
 from decimal import Decimal
 from typing import List, Optional, Dict
 from datetime import date, datetime, timedelta, timezone
 from fastapi import UploadFile
 from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import Integer, func, or_, NUMERIC, and_, cast
+from sqlalchemy import Integer, func, insert, or_, NUMERIC, and_, cast
+from sqlalchemy import update as sql_update  # update() is the lease update below
 from sqlalchemy.dialects.postgresql import UUID
 
 from facility_service.app.crud.common.attachment_crud import AttachmentService
@@ -19,7 +21,7 @@ from facility_service.app.models.system.notifications import Notification, Notif
 from facility_service.app.schemas.space_sites.space_occupany_schemas import MoveInRequest
 from ...models.leasing_tenants.tenant_spaces import TenantSpace
 from ...models.space_sites.buildings import Building
-from shared.helpers.property_helper import get_allowed_spaces
+from shared.helpers.property_helper import allowed_space_ids_query
 from shared.utils.enums import OwnershipStatus, UserAccountType
 from ...models.financials.invoices import Invoice, InvoiceLine
 
@@ -40,6 +42,8 @@ from ...schemas.leasing_tenants.leases_schemas import (
 from uuid import UUID
 from dateutil.relativedelta import relativedelta
 
+RENT_SYNC_CHUNK_SIZE = 1000
+
 
 # ----------------------------------------------------
 # ✅ Build filters (includes search across tenant, partner, and site)
@@ -74,16 +78,7 @@ def build_filters(org_id: UUID, params: LeaseRequest):
 def get_overview(db: Session, user: UserToken, params: LeaseRequest):
     allowed_space_ids = None
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_spaces = get_allowed_spaces(db, user)
-        allowed_space_ids = [s["space_id"] for s in allowed_spaces]
-
-        if not allowed_space_ids:
-            return {
-                "activeLeases": 0,
-                "monthlyRentValue": 0.0,
-                "expiringSoon": 0,
-                "avgLeaseTermMonths": 0.0,
-            }
+        allowed_space_ids = allowed_space_ids_query(user)
 
     base = (
         db.query(Lease)
@@ -146,11 +141,7 @@ def get_list(db: Session, user: UserToken, params: LeaseRequest) -> LeaseListRes
     allowed_space_ids = None
 
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_spaces = get_allowed_spaces(db, user)
-        allowed_space_ids = [s["space_id"] for s in allowed_spaces]
-
-        if not allowed_space_ids:
-            return {"leases": [], "total": 0}
+        allowed_space_ids = allowed_space_ids_query(user)
 
     q = (
         db.query(Lease).options(
@@ -1402,12 +1393,13 @@ def validate_no_overlapping_lease(
     end_date: datetime,
     exclude_lease_id: UUID | None = None,
 ):
+    # Same test as the excl_leases_space_period constraint, checked up
+    # front for a friendly error; the constraint settles concurrent writes
     query = db.query(Lease).filter(
         Lease.space_id == space_id,
         Lease.is_deleted == False,
         Lease.status.notin_(["expired", "terminated", "inactive"]),
-        Lease.start_date <= end_date,
-        Lease.end_date >= start_date,
+        Lease.period.overlaps(func.daterange(start_date, end_date, "[]")),
     )
 
     # useful for update API
@@ -1703,26 +1695,18 @@ def complete_termination(db, lease_id):
 
 
 def sync_rent_charges(db: Session, lease: Lease):
+    sync_rent_charges_bulk(db, [lease])
 
-    terms = (
-        db.query(LeasePaymentTerm)
-        .filter(LeasePaymentTerm.lease_id == lease.id)
-        .order_by(LeasePaymentTerm.due_date.asc())
-        .all()
-    )
-
-    existing_charges = (
-        db.query(LeaseCharge)
-        .filter(
-            LeaseCharge.lease_id == lease.id,
-            LeaseCharge.charge_code == LeaseChargeCodes.rent.value,
-            LeaseCharge.is_deleted == False
-        )
-        .all()
-    )
 
+def _diff_rent_charges(lease, terms, existing_charges):
+    """
+    Rent charges of one lease against its payment terms: one charge per
+    term from its due date to the day before the next term (the last one
+    to the lease end). Returns the rows to insert, update and soft-delete.
+    """
     existing_by_start = {c.period_start: c for c in existing_charges}
     used_charge_ids = set()
+    inserts, updates = [], []
 
     for i, term in enumerate(terms):
 
@@ -1731,39 +1715,109 @@ def sync_rent_charges(db: Session, lease: Lease):
 
         # PERIOD END
         if i < len(terms) - 1:
-            next_term = terms[i + 1]
-            end = next_term.due_date - timedelta(days=1)
+            end = terms[i + 1].due_date - timedelta(days=1)
         else:
             end = lease.end_date
 
         existing = existing_by_start.get(start)
 
         if existing:
-            # UPDATE
-            existing.period_start = start
-            existing.period_end = end
-            existing.amount = term.amount
-            existing.total_amount = term.amount
-
             used_charge_ids.add(existing.id)
-
+            if (existing.period_end, existing.amount, existing.total_amount) != (end, term.amount, term.amount):
+                updates.append({
+                    "id": existing.id,
+                    "period_end": end,
+                    "amount": term.amount,
+                    "total_amount": term.amount,
+                })
         else:
-            # CREATE
-            db.add(
-                LeaseCharge(
-                    lease_id=lease.id,
-                    charge_code=LeaseChargeCodes.rent.value,
-                    period_start=start,
-                    period_end=end,
-                    amount=term.amount,
-                    total_amount=term.amount,
-                    payer_id=lease.tenant_id,
-                )
-            )
+            inserts.append({
+                "lease_id": lease.id,
+                "charge_code": LeaseChargeCodes.rent.value,
+                "period_start": start,
+                "period_end": end,
+                "amount": term.amount,
+                "total_amount": term.amount,
+                "payer_id": lease.tenant_id,
+            })
 
     # SOFT DELETE REMOVED TERMS
-    for charge in existing_charges:
-        if charge.id not in used_charge_ids:
-            charge.is_deleted = True
+    deletes = [c.id for c in existing_charges if c.id not in used_charge_ids]
+    return inserts, updates, deletes
+
 
+def sync_rent_charges_bulk(db: Session, leases) -> List[Dict]:
+    """
+    Sync the rent charges of many leases with their payment terms: terms
+    and existing charges are loaded with one query each, diffed in memory
+    and written with bulk statements in chunks. `leases` needs id, end_date
+    and tenant_id. Marks the leases synced; the caller commits. Returns the
+    changes per lease, for leases that changed.
+    """
+    # Terms the caller just added must be visible to the queries below
     db.flush()
+    leases = {lease.id: lease for lease in leases}
+    if not leases:
+        return []
+
+    terms = defaultdict(list)
+    for term in (
+        db.query(LeasePaymentTerm.lease_id, LeasePaymentTerm.due_date, LeasePaymentTerm.amount)
+        .filter(LeasePaymentTerm.lease_id.in_(leases))
+        .order_by(LeasePaymentTerm.lease_id, LeasePaymentTerm.due_date.asc())
+    ):
+        terms[term.lease_id].append(term)
+
+    existing_charges = defaultdict(list)
+    for charge in (
+        db.query(
+            LeaseCharge.id, LeaseCharge.lease_id, LeaseCharge.period_start,
+            LeaseCharge.period_end, LeaseCharge.amount, LeaseCharge.total_amount
+        )
+        .filter(
+            LeaseCharge.lease_id.in_(leases),
+            LeaseCharge.charge_code == LeaseChargeCodes.rent.value,
+            LeaseCharge.is_deleted == False
+        )
+        .order_by(LeaseCharge.lease_id, LeaseCharge.created_at, LeaseCharge.id)
+    ):
+        existing_charges[charge.lease_id].append(charge)
+
+    inserts, updates, deletes, changes = [], [], [], []
+    for lease_id, lease in leases.items():
+        lease_inserts, lease_updates, lease_deletes = _diff_rent_charges(
+            lease, terms[lease_id], existing_charges[lease_id])
+        inserts.extend(lease_inserts)
+        updates.extend(lease_updates)
+        deletes.extend(lease_deletes)
+        if lease_inserts or lease_updates or lease_deletes:
+            changes.append({
+                "lease_id": lease_id,
+                "created": len(lease_inserts),
+                "updated": len(lease_updates),
+                "deleted": len(lease_deletes),
+            })
+
+    for start in range(0, len(inserts), RENT_SYNC_CHUNK_SIZE):
+        db.execute(insert(LeaseCharge), inserts[start:start + RENT_SYNC_CHUNK_SIZE])
+    for start in range(0, len(updates), RENT_SYNC_CHUNK_SIZE):
+        db.execute(sql_update(LeaseCharge), updates[start:start + RENT_SYNC_CHUNK_SIZE])
+    for start in range(0, len(deletes), RENT_SYNC_CHUNK_SIZE):
+        db.execute(
+            sql_update(LeaseCharge)
+            .where(LeaseCharge.id.in_(deletes[start:start + RENT_SYNC_CHUNK_SIZE]))
+            .values(is_deleted=True)
+            .execution_options(synchronize_session=False)
+        )
+
+    # updated_at is kept, so the sync itself does not count as a change
+    lease_ids = list(leases)
+    for start in range(0, len(lease_ids), RENT_SYNC_CHUNK_SIZE):
+        db.execute(
+            sql_update(Lease)
+            .where(Lease.id.in_(lease_ids[start:start + RENT_SYNC_CHUNK_SIZE]))
+            .values(rent_synced_at=func.now(), updated_at=Lease.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+    return changes
@@ -24,7 +24,9 @@ from ...models.space_sites.user_sites import UserSite
 from ...models.leasing_tenants.tenant_spaces import TenantSpace
 from shared.helpers.email_helper import EmailHelper
 from shared.helpers.password_generator import generate_secure_password
-from shared.helpers.property_helper import get_allowed_spaces
+from shared.helpers.property_helper import allowed_space_ids_query
+from shared.helpers.search_helper import apply_search
+from shared.models.org_membership import OrgMembership
 from shared.models.users import Users
 from ...models.space_sites.space_owners import SpaceOwner
 
@@ -65,16 +67,7 @@ def get_tenants_overview(db: Session, user: UserToken) -> dict:
     allowed_space_ids = None
 
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_spaces = get_allowed_spaces(db, user)
-        allowed_space_ids = [s["space_id"] for s in allowed_spaces]
-
-        if not allowed_space_ids:
-            return {
-                "totalTenants": 0,
-                "activeTenants": 0,
-                "commercialTenants": 0,
-                "individualTenants": 0
-            }
+        allowed_space_ids = allowed_space_ids_query(user)
 
     query = (
         db.query(
@@ -130,19 +123,7 @@ def get_all_tenants(db: Session, auth_db: Session, user: UserToken, params: Tena
     allowed_space_ids = None
 
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_spaces = get_allowed_spaces(db, user)
-        allowed_space_ids = [s["space_id"] for s in allowed_spaces]
-
-        if not allowed_space_ids:
-            return {"tenants": [], "total": 0}
-
-    tenant_user_ids = auth_db.query(UserOrganization.user_id).filter(
-        UserOrganization.org_id == user.org_id,
-        UserOrganization.account_type == UserAccountType.TENANT.value,
-        UserOrganization.is_deleted == False
-    ).all()
-
-    tenant_user_ids = [r[0] for r in tenant_user_ids]
+        allowed_space_ids = allowed_space_ids_query(user)
 
     # ------------------ Residential Query ------------------
     tenant_query = (
@@ -178,6 +159,16 @@ def get_all_tenants(db: Session, auth_db: Session, user: UserToken, params: Tena
             ).label("tenant_spaces")
         )
         .select_from(Tenant)
+        # Tenant accounts of this org, from the org_membership projection
+        .join(
+            OrgMembership,
+            and_(
+                OrgMembership.user_id == Tenant.user_id,
+                OrgMembership.org_id == user.org_id,
+                OrgMembership.account_type == UserAccountType.TENANT.value,
+                OrgMembership.is_deleted.is_(False)
+            )
+        )
         .outerjoin(
             TenantSpace,
             and_(
@@ -195,8 +186,7 @@ def get_all_tenants(db: Session, auth_db: Session, user: UserToken, params: Tena
         .outerjoin(Space, Space.id == TenantSpace.space_id)
         .outerjoin(Building, Building.id == Space.building_block_id)
         .filter(
-            Tenant.is_deleted.is_(False),
-            Tenant.user_id.in_(tenant_user_ids)
+            Tenant.is_deleted.is_(False)
         )
         .group_by(
             Tenant.id,
@@ -223,17 +213,10 @@ def get_all_tenants(db: Session, auth_db: Session, user: UserToken, params: Tena
         tenant_query = tenant_query.filter(
             func.lower(Tenant.status) == params.status.lower())
 
-    if params.search:
-        s = f"%{params.search}%"
-        tenant_query = tenant_query.filter(
-            or_(
-                Tenant.name.ilike(s),
-                Tenant.email.ilike(s),
-                Tenant.phone.ilike(s),
-                Tenant.legal_name.ilike(s),
-                Space.name.ilike(s),
-            )
-        )
+    tenant_query = apply_search(
+        tenant_query, params.search,
+        Tenant.name, Tenant.email, Tenant.phone, Tenant.legal_name, Space.name
+    )
 
     # COUNT QUERY
     subq = tenant_query.subquery()
@@ -1318,15 +1301,7 @@ def get_tenant_approvals(
         query = query.filter(TenantSpace.status == status)
 
     # Search filter
-    if search:
-        term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Tenant.name.ilike(term),
-                Tenant.email.ilike(term),
-                Space.name.ilike(term)
-            )
-        )
+    query = apply_search(query, search, Tenant.name, Tenant.email, Space.name)
 
     total = query.count()
 
@@ -19,6 +19,7 @@ from ...models.maintenance_assets.assets import Asset
 from ...schemas.maintenance_assets.assets_schemas import AssetCreate, AssetOut, AssetUpdate, AssetsRequest, AssetsResponse
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
+from shared.helpers.reference_cache import cached_reference, invalidate_on_change
 
 
 # ----------------------------------------------------------------------
@@ -333,6 +334,10 @@ def delete_asset(db: Session, asset_id: str, org_id: str) -> bool:
     return True
 
 
+invalidate_on_change(Asset, "assets")
+
+
+@cached_reference("assets")
 def asset_lookup(db: Session, org_id: UUID):
     assets = (
         db.query(
@@ -346,6 +351,10 @@ def asset_lookup(db: Session, org_id: UUID):
     return assets
 
 
+invalidate_on_change(Asset, "asset_statuses")
+
+
+@cached_reference("asset_statuses")
 def asset_filter_status_lookup(db: Session, org_id: UUID):
     statuses = (
         db.query(
@@ -367,6 +376,11 @@ def asset_status_lookup(org_id: UUID, db: Session):
     ]
 
 
+invalidate_on_change(AssetCategory, "asset_categories")
+invalidate_on_change(Asset, "asset_categories")
+
+
+@cached_reference("asset_categories")
 def assets_category_lookup(db: Session, org_id: UUID) -> List[Dict]:
     query = (
         db.query(
@@ -0,0 +1,420 @@
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, and_, case, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from shared.helpers.json_response_helper import error_response
+from shared.utils.app_status_code import AppStatusCode
+from ...enum.maintenance_assets_enum import InventoryMovementType
+from ...models.maintenance_assets.inventory_items import InventoryItem
+from ...models.maintenance_assets.inventory_movements import InventoryMovement
+from ...models.maintenance_assets.inventory_stock_snapshots import InventoryStockSnapshot
+from ...models.maintenance_assets.inventory_stocks import InventoryStock
+from ...models.maintenance_assets.work_order import WorkOrder
+from ...models.purchase_order_lines import PurchaseOrderLine
+from ...models.purchase_orders import PurchaseOrder
+from ...schemas.maintenance_assets.inventory_movements_schemas import (
+    InventoryMovementCreate,
+    InventoryMovementRequest,
+    InventoryTransferCreate,
+    StockAsOfRequest,
+)
+
+
+def _end_of_day(day: date) -> datetime:
+    """Ledger days are UTC days; a day ends where the next one starts."""
+    return datetime.combine(day + timedelta(days=1), time.min, tzinfo=timezone.utc)
+
+
+def _after_snapshot(snapshot_date):
+    """Start of the UTC day after a snapshot; the epoch when there is none."""
+    return func.coalesce(
+        func.timezone("UTC", func.cast(snapshot_date + 1, DateTime)),
+        literal(datetime(1970, 1, 1, tzinfo=timezone.utc))
+    )
+
+
+def apply_movement(
+    db: Session,
+    org_id: UUID,
+    stock_id: UUID,
+    qty,
+    movement_type: InventoryMovementType,
+    unit_cost=None,
+    user_id: Optional[UUID] = None,
+    **refs
+) -> InventoryMovement:
+    """
+    Move `qty` (signed) in or out of a stock and append it to the ledger.
+    The on-hand quantity and the moving average cost change in a single
+    UPDATE ... RETURNING, so concurrent movements cannot lose each other;
+    a movement that would take the stock below zero matches no row.
+    The caller commits.
+    """
+    qty = Decimal(str(qty))
+    if unit_cost is not None:
+        unit_cost = Decimal(str(unit_cost))
+    current = func.coalesce(InventoryStock.qty_on_hand, 0)
+    values = {"qty_on_hand": current + qty}
+    if qty > 0 and unit_cost is not None:
+        # Receipts at a known cost move the average. Stock without a known
+        # cost counts at zero, as it does in the ledger's value
+        values["avg_cost"] = case(
+            (current + qty > 0,
+             (func.greatest(current, 0) * func.coalesce(InventoryStock.avg_cost, 0) + qty * unit_cost)
+             / (func.greatest(current, 0) + qty)),
+            else_=unit_cost
+        )
+
+    filters = [
+        InventoryStock.id == stock_id,
+        InventoryStock.org_id == org_id,
+        InventoryStock.is_deleted == False,
+    ]
+    if qty < 0:
+        filters.append(current + qty >= 0)
+
+    row = db.execute(
+        update(InventoryStock)
+        .where(*filters)
+        .values(**values)
+        .returning(InventoryStock.item_id, InventoryStock.site_id,
+                   InventoryStock.qty_on_hand, InventoryStock.avg_cost)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+    if row is None:
+        stock = db.query(InventoryStock.qty_on_hand).filter(*filters[:3]).first()
+        if stock is None:
+            error_response(
+                message="Inventory stock not found",
+                status_code=str(AppStatusCode.INVALID_INPUT),
+                http_status=404
+            )
+        error_response(
+            message=f"Insufficient stock: {float(stock.qty_on_hand or 0)} on hand, {float(-qty)} requested",
+            status_code=str(AppStatusCode.INVALID_INPUT)
+        )
+
+    movement = InventoryMovement(
+        org_id=org_id,
+        site_id=row.site_id,
+        item_id=row.item_id,
+        stock_id=stock_id,
+        movement_type=movement_type.value,
+        qty=qty,
+        qty_after=row.qty_on_hand,
+        # Outgoing stock leaves at the average cost
+        unit_cost=unit_cost if qty > 0 and unit_cost is not None else row.avg_cost,
+        created_by=user_id,
+        **refs
+    )
+    db.add(movement)
+    return movement
+
+
+def _validate_refs(db: Session, org_id: UUID, work_order_id, po_line_id):
+    if work_order_id and not db.query(WorkOrder.id).filter(
+        WorkOrder.id == work_order_id,
+        WorkOrder.org_id == org_id,
+        WorkOrder.is_deleted == False
+    ).first():
+        error_response(
+            message="Work order not found",
+            status_code=str(AppStatusCode.INVALID_INPUT)
+        )
+
+    if po_line_id:
+        line = db.query(PurchaseOrderLine.price).join(
+            PurchaseOrder, PurchaseOrder.id == PurchaseOrderLine.po_id
+        ).filter(
+            PurchaseOrderLine.id == po_line_id,
+            PurchaseOrder.org_id == org_id
+        ).first()
+        if not line:
+            error_response(
+                message="Purchase order line not found",
+                status_code=str(AppStatusCode.INVALID_INPUT)
+            )
+        return line.price
+    return None
+
+
+def record_movement(db: Session, org_id: UUID, user_id: UUID, movement: InventoryMovementCreate):
+    """Receipts, issues and adjustments; transfers go through transfer_stock."""
+    if movement.movement_type == InventoryMovementType.transfer:
+        error_response(
+            message="Use the transfer endpoint to move stock between locations",
+            status_code=str(AppStatusCode.INVALID_INPUT)
+        )
+    if movement.qty == 0 or (
+        movement.movement_type != InventoryMovementType.adjustment and movement.qty < 0
+    ):
+        error_response(
+            message="Quantity must be positive (adjustments: non-zero)",
+            status_code=str(AppStatusCode.INVALID_INPUT)
+        )
+
+    po_price = _validate_refs(db, org_id, movement.work_order_id, movement.po_line_id)
+    unit_cost = movement.unit_cost
+    if unit_cost is None and movement.movement_type == InventoryMovementType.receipt:
+        unit_cost = po_price
+
+    qty = -movement.qty if movement.movement_type == InventoryMovementType.issue else movement.qty
+    db_movement = apply_movement(
+        db, org_id, movement.stock_id, qty, movement.movement_type,
+        unit_cost=unit_cost, user_id=user_id,
+        work_order_id=movement.work_order_id,
+        po_line_id=movement.po_line_id,
+        notes=movement.notes,
+    )
+    db.commit()
+    db.refresh(db_movement)
+    return db_movement
+
+
+def transfer_stock(db: Session, org_id: UUID, user_id: UUID, transfer: InventoryTransferCreate):
+    """Both legs in one transaction; the destination receives at the source's average cost."""
+    if transfer.from_stock_id == transfer.to_stock_id:
+        error_response(
+            message="Source and destination stock must differ",
+            status_code=str(AppStatusCode.INVALID_INPUT)
+        )
+    items = dict(db.query(InventoryStock.id, InventoryStock.item_id).filter(
+        InventoryStock.id.in_([transfer.from_stock_id, transfer.to_stock_id]),
+        InventoryStock.org_id == org_id,
+        InventoryStock.is_deleted == False
+    ).all())
+    if len(items) != 2:
+        error_response(
+            message="Inventory stock not found",
+            status_code=str(AppStatusCode.INVALID_INPUT),
+            http_status=404
+        )
+    if items[transfer.from_stock_id] != items[transfer.to_stock_id]:
+        error_response(
+            message="Stock can only be transferred between locations of the same item",
+            status_code=str(AppStatusCode.INVALID_INPUT)
+        )
+    _validate_refs(db, org_id, transfer.work_order_id, None)
+
+    transfer_id = uuid.uuid4()
+    refs = {"work_order_id": transfer.work_order_id, "transfer_id": transfer_id, "notes": transfer.notes}
+    qty = transfer.qty
+
+    # Take the row locks in id order, so opposite transfers cannot deadlock
+    if str(transfer.to_stock_id) < str(transfer.from_stock_id):
+        db.query(InventoryStock.id).filter(
+            InventoryStock.id == transfer.to_stock_id).with_for_update().first()
+    outgoing = apply_movement(db, org_id, transfer.from_stock_id, -qty,
+                              InventoryMovementType.transfer, user_id=user_id, **refs)
+    incoming = apply_movement(db, org_id, transfer.to_stock_id, qty,
+                              InventoryMovementType.transfer, unit_cost=outgoing.unit_cost,
+                              user_id=user_id, **refs)
+    db.commit()
+    db.refresh(outgoing)
+    db.refresh(incoming)
+    return [outgoing, incoming]
+
+
+def adjust_to_quantity(db: Session, org_id: UUID, stock_id: UUID, qty_on_hand, user_id=None, notes=None):
+    """Stock edits that set an absolute quantity become adjustment movements."""
+    current = db.query(InventoryStock.qty_on_hand).filter(
+        InventoryStock.id == stock_id,
+        InventoryStock.org_id == org_id
+    ).with_for_update().scalar()
+    delta = Decimal(str(qty_on_hand)) - (current or 0)
+    if delta:
+        return apply_movement(db, org_id, stock_id, delta, InventoryMovementType.adjustment,
+                              user_id=user_id, notes=notes)
+    return None
+
+
+def get_movements(db: Session, org_id: UUID, params: InventoryMovementRequest):
+    filters = [InventoryMovement.org_id == org_id]
+    if params.stock_id:
+        filters.append(InventoryMovement.stock_id == params.stock_id)
+    if params.item_id:
+        filters.append(InventoryMovement.item_id == params.item_id)
+    if params.work_order_id:
+        filters.append(InventoryMovement.work_order_id == params.work_order_id)
+    if params.movement_type and params.movement_type.lower() != "all":
+        filters.append(InventoryMovement.movement_type == params.movement_type.lower())
+
+    query = db.query(InventoryMovement).filter(*filters)
+    total = query.with_entities(func.count(InventoryMovement.id)).scalar()
+    movements = (
+        query.order_by(InventoryMovement.created_at.desc())
+        .offset(params.skip)
+        .limit(params.limit or 100)
+        .all()
+    )
+    return {"movements": movements, "total": total}
+
+
+def get_stock_as_of(db: Session, org_id: UUID, params: StockAsOfRequest):
+    """
+    Quantity and value per stock at the end of `as_of`: the latest snapshot
+    on or before that day plus the movements after it.
+    """
+    latest = (
+        select(
+            InventoryStockSnapshot.stock_id,
+            InventoryStockSnapshot.snapshot_date,
+            InventoryStockSnapshot.qty_on_hand,
+            InventoryStockSnapshot.value,
+        )
+        .where(
+            InventoryStockSnapshot.org_id == org_id,
+            InventoryStockSnapshot.snapshot_date <= params.as_of,
+        )
+        .distinct(InventoryStockSnapshot.stock_id)
+        .order_by(InventoryStockSnapshot.stock_id, InventoryStockSnapshot.snapshot_date.desc())
+        .subquery()
+    )
+    since = _after_snapshot(latest.c.snapshot_date)
+    moved = (
+        select(
+            InventoryMovement.stock_id,
+            func.sum(InventoryMovement.qty).label("qty"),
+            func.sum(InventoryMovement.qty * func.coalesce(InventoryMovement.unit_cost, 0)).label("value"),
+        )
+        .outerjoin(latest, latest.c.stock_id == InventoryMovement.stock_id)
+        .where(
+            InventoryMovement.org_id == org_id,
+            InventoryMovement.created_at >= since,
+            InventoryMovement.created_at < _end_of_day(params.as_of),
+        )
+        .group_by(InventoryMovement.stock_id)
+        .subquery()
+    )
+
+    filters = [InventoryStock.org_id == org_id, InventoryStock.is_deleted == False]
+    if params.site_id:
+        filters.append(InventoryStock.site_id == params.site_id)
+    if params.item_id:
+        filters.append(InventoryStock.item_id == params.item_id)
+
+    rows = (
+        db.query(
+            InventoryStock.id, InventoryStock.item_id, InventoryStock.site_id,
+            (func.coalesce(latest.c.qty_on_hand, 0) + func.coalesce(moved.c.qty, 0)).label("qty"),
+            (func.coalesce(latest.c.value, 0) + func.coalesce(moved.c.value, 0)).label("value"),
+        )
+        .outerjoin(latest, latest.c.stock_id == InventoryStock.id)
+        .outerjoin(moved, moved.c.stock_id == InventoryStock.id)
+        .filter(*filters)
+        .all()
+    )
+    return [
+        {"stock_id": r.id, "item_id": r.item_id, "site_id": r.site_id,
+         "qty_on_hand": float(r.qty), "value": float(r.value)}
+        for r in rows
+    ]
+
+
+def get_reorder_alerts(db: Session, org_id: UUID, site_id: Optional[UUID] = None):
+    """
+    Items at or below their reorder level per site, from one grouped query.
+    Items with no stock at all (or none at `site_id`) are reported with
+    qty_on_hand 0 and a null site (or `site_id`).
+    """
+    stock_on = [
+        InventoryStock.item_id == InventoryItem.id,
+        InventoryStock.is_deleted == False,
+    ]
+    if site_id:
+        stock_on.append(InventoryStock.site_id == site_id)
+
+    on_hand = func.coalesce(func.sum(InventoryStock.qty_on_hand), 0)
+    rows = (
+        db.query(
+            InventoryItem.id, InventoryItem.sku, InventoryItem.name, InventoryItem.reorder_level,
+            InventoryStock.site_id, on_hand.label("qty_on_hand")
+        )
+        .outerjoin(InventoryStock, and_(*stock_on))
+        .filter(
+            InventoryItem.org_id == org_id,
+            InventoryItem.is_deleted == False,
+            InventoryItem.reorder_level.isnot(None),
+        )
+        .group_by(InventoryItem.id, InventoryStock.site_id)
+        .having(on_hand <= InventoryItem.reorder_level)
+        .order_by((InventoryItem.reorder_level - on_hand).desc())
+        .all()
+    )
+    return [
+        {"item_id": r.id, "sku": r.sku, "name": r.name, "site_id": r.site_id or site_id,
+         "qty_on_hand": float(r.qty_on_hand), "reorder_level": float(r.reorder_level),
+         "shortfall": float(r.reorder_level - r.qty_on_hand)}
+        for r in rows
+    ]
+
+
+def snapshot_inventory_stocks(db: Session, snapshot_date: Optional[date] = None):
+    """
+    Write every stock's quantity and value at the end of `snapshot_date`
+    (default yesterday): its previous snapshot plus the movements since.
+    Re-running a day overwrites it. Commits.
+    """
+    snapshot_date = snapshot_date or (datetime.now(timezone.utc).date() - timedelta(days=1))
+
+    previous = (
+        select(
+            InventoryStockSnapshot.stock_id,
+            InventoryStockSnapshot.snapshot_date,
+            InventoryStockSnapshot.qty_on_hand,
+            InventoryStockSnapshot.value,
+        )
+        .where(InventoryStockSnapshot.snapshot_date < snapshot_date)
+        .distinct(InventoryStockSnapshot.stock_id)
+        .order_by(InventoryStockSnapshot.stock_id, InventoryStockSnapshot.snapshot_date.desc())
+        .subquery()
+    )
+    since = _after_snapshot(previous.c.snapshot_date)
+    moved = (
+        select(
+            InventoryMovement.stock_id,
+            func.sum(InventoryMovement.qty).label("qty"),
+            func.sum(InventoryMovement.qty * func.coalesce(InventoryMovement.unit_cost, 0)).label("value"),
+        )
+        .outerjoin(previous, previous.c.stock_id == InventoryMovement.stock_id)
+        .where(
+            InventoryMovement.created_at >= since,
+            InventoryMovement.created_at < _end_of_day(snapshot_date),
+        )
+        .group_by(InventoryMovement.stock_id)
+        .subquery()
+    )
+
+    rows = (
+        select(
+            InventoryStock.id,
+            literal(snapshot_date),
+            InventoryStock.org_id,
+            InventoryStock.item_id,
+            InventoryStock.site_id,
+            func.coalesce(previous.c.qty_on_hand, 0) + func.coalesce(moved.c.qty, 0),
+            func.coalesce(previous.c.value, 0) + func.coalesce(moved.c.value, 0),
+        )
+        .outerjoin(previous, previous.c.stock_id == InventoryStock.id)
+        .outerjoin(moved, moved.c.stock_id == InventoryStock.id)
+        .where(InventoryStock.is_deleted == False)
+    )
+    stmt = insert(InventoryStockSnapshot).from_select(
+        ["stock_id", "snapshot_date", "org_id", "item_id", "site_id", "qty_on_hand", "value"],
+        rows
+    )
+    written = db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["stock_id", "snapshot_date"],
+            set_={"qty_on_hand": stmt.excluded.qty_on_hand, "value": stmt.excluded.value}
+        )
+    ).rowcount
+    db.commit()
+    return written
@@ -3,7 +3,9 @@ from uuid import UUID
 from typing import List, Optional
 from sqlalchemy import func
 from sqlalchemy.orm import Session
+from ...enum.maintenance_assets_enum import InventoryMovementType
 from ...models.maintenance_assets.inventory_stocks import InventoryStock
+from .inventory_movements_crud import adjust_to_quantity, apply_movement
 from ...schemas.maintenance_assets.inventory_stocks_schemas import InventoryStockCreate, InventoryStockUpdate
 
 
@@ -28,8 +30,14 @@ def create_inventory_stock(db: Session, stock: InventoryStockCreate, org_id: UUI
     # ✅ Use org_id from token instead of request body
     stock_data = stock.dict()
     stock_data['org_id'] = org_id  # Override with token org_id
-    db_stock = InventoryStock(**stock_data)
+    # Opening quantity goes in through the ledger
+    opening_qty = stock_data.pop('qty_on_hand', 0) or 0
+    db_stock = InventoryStock(**stock_data, qty_on_hand=0)
     db.add(db_stock)
+    db.flush()
+    if opening_qty:
+        apply_movement(db, org_id, db_stock.id, opening_qty,
+                       InventoryMovementType.adjustment, notes="Opening balance")
     db.commit()
     db.refresh(db_stock)
     return db_stock
@@ -46,9 +54,15 @@ def update_inventory_stock(db: Session, stock: InventoryStockUpdate, org_id: UUI
     if not db_stock:
         return None
 
-    # Update only the fields that are provided
-    for k, v in stock.dict(exclude_unset=True, exclude={'id'}).items():
+    # Update only the fields that are provided; a new quantity is recorded
+    # as an adjustment against the locked row
+    changes = stock.dict(exclude_unset=True, exclude={'id'})
+    qty_on_hand = changes.pop('qty_on_hand', None)
+    for k, v in changes.items():
         setattr(db_stock, k, v)
+    db.flush()
+    if qty_on_hand is not None:
+        adjust_to_quantity(db, org_id, db_stock.id, qty_on_hand, notes="Stock edited")
 
     db.commit()
     db.refresh(db_stock)
@@ -0,0 +1,315 @@
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ...models.energy_iot.meter_readings import MeterReading
+from ...models.energy_iot.meters import Meter
+from ...models.maintenance_assets.assets import Asset
+from ...models.maintenance_assets.pm_meter_progress import PMMeterProgress
+from ...models.maintenance_assets.pm_template import PMTemplate, next_due_after
+from ...models.maintenance_assets.work_order import WorkOrder, pm_work_order_seq
+
+PM_WORK_ORDER_TYPE = "pm"
+
+
+def _active_templates(org_id: Optional[UUID]):
+    filters = [
+        func.lower(PMTemplate.status) == "active",
+        PMTemplate.is_deleted == False,
+    ]
+    if org_id:
+        filters.append(PMTemplate.org_id == org_id)
+    return filters
+
+
+def _allocate_wo_numbers(db: Session, count: int):
+    if not count:
+        return []
+    numbers = db.execute(
+        select(pm_work_order_seq.next_value()).select_from(func.generate_series(1, count))
+    ).scalars().all()
+    return [f"PM-{number:06}" for number in numbers]
+
+
+def _insert_work_orders(db: Session, rows: list) -> list:
+    """
+    Insert generated work orders, skipping (template, asset, due date)
+    combinations that already have one. Returns the rows inserted.
+    """
+    if not rows:
+        return []
+
+    existing = set(
+        db.query(WorkOrder.pm_template_id, WorkOrder.asset_id, WorkOrder.pm_due_date)
+        .filter(
+            WorkOrder.pm_template_id.in_({r["pm_template_id"] for r in rows}),
+            WorkOrder.pm_due_date.in_({r["pm_due_date"] for r in rows}),
+        )
+    )
+    rows = [r for r in rows
+            if (r["pm_template_id"], r["asset_id"], r["pm_due_date"]) not in existing]
+
+    for row, wo_no in zip(rows, _allocate_wo_numbers(db, len(rows))):
+        row["wo_no"] = wo_no
+
+    inserted = set()
+    for start in range(0, len(rows), 1000):
+        inserted.update(db.execute(
+            insert(WorkOrder)
+            .values(rows[start:start + 1000])
+            .on_conflict_do_nothing(
+                index_elements=["pm_template_id", "asset_id", "pm_due_date"],
+                index_where=WorkOrder.pm_template_id.isnot(None)
+            )
+            .returning(WorkOrder.wo_no)
+        ).scalars())
+    return [r for r in rows if r["wo_no"] in inserted]
+
+
+def _work_order_row(template, asset, due: date, due_at: datetime):
+    return {
+        "org_id": template.org_id,
+        "site_id": asset.site_id,
+        "asset_id": asset.id,
+        "space_id": asset.space_id,
+        "title": template.name,
+        "description": f"Preventive maintenance {template.pm_no}",
+        "priority": "medium",
+        "type": PM_WORK_ORDER_TYPE,
+        "status": "open",
+        "due_at": due_at,
+        "sla": template.sla,
+        "pm_template_id": template.id,
+        "pm_due_date": due,
+    }
+
+
+def _backfill_next_due(db: Session, org_id: Optional[UUID]):
+    """Templates saved before next_due_date existed start from start_date + frequency."""
+    templates = db.query(PMTemplate.id, PMTemplate.start_date, PMTemplate.frequency).filter(
+        *_active_templates(org_id),
+        PMTemplate.next_due_date.is_(None),
+        PMTemplate.start_date.isnot(None),
+        PMTemplate.frequency.isnot(None),
+    ).all()
+    values = [
+        {"id": t.id, "next_due_date": next_due_after(t.start_date, t.frequency)}
+        for t in templates
+    ]
+    values = [v for v in values if v["next_due_date"]]
+    if values:
+        db.execute(update(PMTemplate), values)
+
+
+def _generate_calendar(db: Session, org_id: Optional[UUID], today: date, now: datetime):
+    _backfill_next_due(db, org_id)
+
+    # Due templates only, straight from the next_due_date index; a
+    # concurrent run skips the ones this run holds
+    templates = (
+        db.query(PMTemplate)
+        .filter(
+            *_active_templates(org_id),
+            PMTemplate.next_due_date <= today,
+        )
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    report = {"templates_due": len(templates), "templates_without_assets": 0,
+              "work_orders_created": 0}
+    if not templates:
+        return report, []
+
+    assets = defaultdict(list)
+    for asset in db.query(Asset.id, Asset.org_id, Asset.category_id, Asset.site_id, Asset.space_id).filter(
+        Asset.category_id.in_({t.category_id for t in templates if t.category_id}),
+        Asset.is_deleted == False,
+        func.lower(Asset.status) == "active",
+    ):
+        assets[(asset.org_id, asset.category_id)].append(asset)
+
+    rows = []
+    advanced = []
+    for template in templates:
+        targets = assets.get((template.org_id, template.category_id), [])
+        if not targets:
+            report["templates_without_assets"] += 1
+        due = template.next_due_date
+        due_at = datetime.combine(due, datetime.min.time(), tzinfo=timezone.utc)
+        rows.extend(_work_order_row(template, asset, due, due_at) for asset in targets)
+
+        # Missed periods are not back-filled: one work order per asset for
+        # the oldest due date, then the schedule moves past today
+        next_due = next_due_after(due, template.frequency)
+        while next_due and next_due <= today:
+            next_due = next_due_after(next_due, template.frequency)
+        advanced.append({"id": template.id, "next_due_date": next_due,
+                         "last_generated_at": now})
+
+    created = _insert_work_orders(db, rows)
+    db.execute(update(PMTemplate), advanced)
+    report["work_orders_created"] = len(created)
+    return report, created
+
+
+def _generate_meter(db: Session, org_id: Optional[UUID], today: date, now: datetime):
+    templates = {
+        t.id: t for t in db.query(PMTemplate).filter(
+            *_active_templates(org_id),
+            PMTemplate.meter_metric.isnot(None),
+            PMTemplate.threshold > 0,
+        ).with_for_update(skip_locked=True)
+    }
+    report = {"templates_evaluated": len(templates), "meters_evaluated": 0,
+              "thresholds_crossed": 0, "work_orders_created": 0}
+    if not templates:
+        return report, []
+
+    # Meters on assets of the template's category whose kind or unit is the
+    # template's metric
+    pairs = (
+        db.query(
+            PMTemplate.id.label("template_id"), Meter.id.label("meter_id"),
+            func.coalesce(Meter.multiplier, 1).label("multiplier"),
+            Asset.id, Asset.site_id, Asset.space_id,
+            PMMeterProgress.usage, PMMeterProgress.last_reading,
+            PMMeterProgress.last_reading_at
+        )
+        .join(Meter, and_(
+            Meter.org_id == PMTemplate.org_id,
+            or_(func.lower(Meter.kind) == func.lower(PMTemplate.meter_metric),
+                func.lower(Meter.unit) == func.lower(PMTemplate.meter_metric)),
+            Meter.is_deleted == False,
+        ))
+        .join(Asset, and_(
+            Asset.id == Meter.asset_id,
+            or_(PMTemplate.category_id.is_(None), Asset.category_id == PMTemplate.category_id),
+            Asset.is_deleted == False,
+        ))
+        .outerjoin(PMMeterProgress, and_(
+            PMMeterProgress.template_id == PMTemplate.id,
+            PMMeterProgress.meter_id == Meter.id,
+        ))
+        .filter(PMTemplate.id.in_(list(templates)))
+        .all()
+    )
+    report["meters_evaluated"] = len(pairs)
+
+    # New pairs start counting from the meter's current value; history
+    # before the template existed does not trigger work orders
+    new_ids = {p.meter_id for p in pairs if p.last_reading_at is None}
+    if new_ids:
+        current = dict(
+            db.query(MeterReading.meter_id, MeterReading.reading)
+            .filter(MeterReading.meter_id.in_(new_ids), MeterReading.is_deleted == False)
+            .distinct(MeterReading.meter_id)
+            .order_by(MeterReading.meter_id, MeterReading.ts.desc())
+        )
+        db.execute(insert(PMMeterProgress).values([
+            {"template_id": p.template_id, "meter_id": p.meter_id, "usage": 0,
+             "last_reading": current.get(p.meter_id), "last_reading_at": now}
+            for p in pairs if p.last_reading_at is None
+        ]).on_conflict_do_nothing())
+
+    tracked = [p for p in pairs if p.last_reading_at is not None]
+    if not tracked:
+        return report, []
+
+    # Per pair, the latest reading received since its watermark (and the
+    # earliest, as the baseline when none was counted yet), one query
+    window = (PMMeterProgress.template_id, PMMeterProgress.meter_id)
+    received = {
+        (r.template_id, r.meter_id): r for r in db.query(
+            PMMeterProgress.template_id, PMMeterProgress.meter_id,
+            MeterReading.reading,
+            func.first_value(MeterReading.reading).over(
+                partition_by=window, order_by=MeterReading.ts).label("first_reading"),
+            func.max(MeterReading.created_at).over(
+                partition_by=window).label("last_reading_at"),
+        ).join(MeterReading, and_(
+            MeterReading.meter_id == PMMeterProgress.meter_id,
+            MeterReading.created_at > PMMeterProgress.last_reading_at,
+            MeterReading.is_deleted == False,
+        )).filter(
+            PMMeterProgress.template_id.in_({p.template_id for p in tracked})
+        ).distinct(*window)
+        .order_by(*window, MeterReading.ts.desc())
+    }
+
+    rows, progress = [], []
+    for pair in tracked:
+        reading = received.get((pair.template_id, pair.meter_id))
+        if reading is None:
+            continue
+        template = templates[pair.template_id]
+        threshold = Decimal(template.threshold)
+        baseline = pair.last_reading if pair.last_reading is not None else reading.first_reading
+        # A reading below the baseline is a meter reset or replacement:
+        # count nothing and carry on from the new value
+        advanced = max(Decimal(reading.reading) - Decimal(baseline), Decimal(0))
+        usage = Decimal(pair.usage or 0) + advanced * Decimal(pair.multiplier)
+        row = None
+        if usage >= threshold:
+            report["thresholds_crossed"] += 1
+            row = _work_order_row(template, pair, today, now)
+            rows.append(row)
+        progress.append((row, threshold, {
+            "template_id": pair.template_id, "meter_id": pair.meter_id,
+            "usage": usage, "last_reading": reading.reading,
+            "last_reading_at": reading.last_reading_at,
+        }))
+
+    created = _insert_work_orders(db, rows)
+    # The interval restarts only where a work order was actually created; a
+    # crossing whose work order already existed keeps its usage for the next run
+    inserted = {row["wo_no"] for row in created}
+    for row, threshold, values in progress:
+        if row is not None and row.get("wo_no") in inserted:
+            values["usage"] %= threshold
+    progress = [values for _, _, values in progress]
+    if progress:
+        db.execute(update(PMMeterProgress), progress)
+    if created:
+        db.execute(update(PMTemplate), [
+            {"id": template_id, "last_generated_at": now}
+            for template_id in {r["pm_template_id"] for r in created}
+        ])
+    report["work_orders_created"] = len(created)
+    return report, created
+
+
+def generate_pm_work_orders(db: Session, org_id: Optional[UUID] = None, today: Optional[date] = None):
+    """
+    PM engine run: work orders for calendar templates whose next_due_date
+    has come and for meter templates whose meters crossed the threshold,
+    one per template and asset. Idempotent per (template, asset, due date);
+    templates locked by another run are skipped. Commits.
+    """
+    today = today or date.today()
+    now = datetime.now(timezone.utc)
+
+    calendar, calendar_created = _generate_calendar(db, org_id, today, now)
+    meter, meter_created = _generate_meter(db, org_id, today, now)
+    db.commit()
+
+    return {
+        "run_at": now,
+        "calendar": calendar,
+        "meter": meter,
+        "work_orders": [
+            {
+                "wo_no": row["wo_no"],
+                "pm_template_id": row["pm_template_id"],
+                "asset_id": row["asset_id"],
+                "site_id": row["site_id"],
+                "due_date": row["pm_due_date"],
+            }
+            for row in calendar_created + meter_created
+        ],
+    }
@@ -6,7 +6,7 @@ from shared.core.schemas import Lookup
 from sqlalchemy import func, literal, or_
 from sqlalchemy.orm import Session ,joinedload
 from typing import List, Dict
-from ...models.maintenance_assets.pm_template import PMTemplate
+from ...models.maintenance_assets.pm_template import PMTemplate, next_due_after
 from ...models.maintenance_assets.asset_category import AssetCategory
 from ...schemas.maintenance_assets.pm_templates_schemas import (
     PMTemplateCreate,
@@ -39,17 +39,11 @@ def get_pm_templates_overview(db: Session, org_id: UUID, params: PMTemplateReque
     ).count()
 
     # Due this week with filters (exclude deleted)
-    all_templates = db.query(PMTemplate).filter(
+    due_this_week = db.query(func.count(PMTemplate.id)).filter(
         *filters,
-        PMTemplate.is_deleted == False
-    ).all()
-    
-    # Count those with next_due_calculated in current week
-    due_this_week = 0
-    for template in all_templates:
-        next_due = template.next_due
-        if next_due and start_of_week <= next_due <= end_of_week:
-            due_this_week += 1
+        PMTemplate.is_deleted == False,
+        PMTemplate.next_due_date.between(start_of_week, end_of_week)
+    ).scalar()
 
     # Completed count with filters (exclude deleted)
     completed_count = db.query(PMTemplate).filter(
@@ -224,6 +218,8 @@ def create_pm_template(db: Session, template: PMTemplateCreate):
             exclude={"asset_category", "next_due"}
         )
     )
+    db_template.next_due_date = next_due_after(
+        db_template.start_date, db_template.frequency)
     db.add(db_template)
     db.commit()
     db.refresh(db_template)
@@ -236,8 +232,13 @@ def update_pm_template(db: Session, template: PMTemplateUpdate) -> Optional[PMTe
     db_template = get_pm_template_by_id(db, template.id)
     if not db_template:
         return None
-    for k, v in template.dict(exclude_unset=True).items():
+    changes = template.dict(exclude_unset=True)
+    for k, v in changes.items():
         setattr(db_template, k, v)
+    # A new schedule restarts from start_date
+    if "start_date" in changes or "frequency" in changes:
+        db_template.next_due_date = next_due_after(
+            db_template.start_date, db_template.frequency)
     db.commit()
     db.refresh(db_template)
     db_template = (
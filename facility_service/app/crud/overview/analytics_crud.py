@@ -31,6 +31,7 @@ from ...models.maintenance_assets.work_order import WorkOrder
 from ...models.space_sites.spaces import Space
 from ...schemas.overview.analytics_schema import AnalyticsRequest
 from ...models.space_sites.sites import Site
+from shared.helpers.reference_cache import cached_reference, invalidate_on_change
 
 
 def site_open_month_lookup(db: Session, org_id: UUID):
@@ -51,6 +52,10 @@ def site_open_month_lookup(db: Session, org_id: UUID):
     return [{"id": r.id, "name": r.name} for r in query.all()]
 
 
+invalidate_on_change(Site, "site_names")
+
+
+@cached_reference("site_names")
 def site_name_filter_lookup(db: Session, org_id: str) -> List[Dict]:
     """
     Returns distinct site names for a given organization.
@@ -779,9 +784,7 @@ def get_space_type_performance(db: Session, org_id: UUID, params: AnalyticsReque
                     Space.org_id == org_id,
                     Space.kind == 'room',
                     *filters,
-                    Booking.check_in <= today,
-                    Booking.check_out > today,
-                    Booking.status.in_(['reserved', 'in_house', 'checked_in'])
+                    BookingRoom.stay.contains(today)
             )\
                 .scalar() or 0
 
@@ -800,8 +803,7 @@ def get_space_type_performance(db: Session, org_id: UUID, params: AnalyticsReque
                     .filter(
                         Lease.org_id == org_id,
                         *filters,
-                        Lease.start_date <= today,
-                        Lease.end_date >= today,
+                        Lease.period.contains(today),
                         Lease.status == 'active',
                         Space.kind == space_kind
                 )\
@@ -815,8 +817,7 @@ def get_space_type_performance(db: Session, org_id: UUID, params: AnalyticsReque
                     .filter(
                         Lease.org_id == org_id,
                         *filters,
-                        Lease.start_date <= today,
-                        Lease.end_date >= today,
+                        Lease.period.contains(today),
                         Lease.status == 'active',
                         Space.kind == space_kind
                 )\
@@ -899,9 +900,7 @@ def get_portfolio_distribution(db: Session, org_id: UUID, params: AnalyticsReque
                     Space.org_id == org_id,
                     Space.kind == 'room',
                     *filters,
-                    Booking.check_in <= today,
-                    Booking.check_out > today,
-                    Booking.status.in_(['reserved', 'in_house', 'checked_in'])
+                    BookingRoom.stay.contains(today)
             )\
                 .scalar() or 0
 
@@ -914,8 +913,7 @@ def get_portfolio_distribution(db: Session, org_id: UUID, params: AnalyticsReque
                 .filter(
                     Lease.org_id == org_id,
                     *filters,
-                    Lease.start_date <= today,
-                    Lease.end_date >= today,
+                    Lease.period.contains(today),
                     Lease.status == 'active',
                     Space.kind == space_kind
             )\
@@ -1013,9 +1011,7 @@ def get_yoy_performance(db: Session, org_id: UUID, params: AnalyticsRequest):
             Site.org_id == org_id,
             Space.kind == 'room',
             *filters,
-            Booking.check_in <= datetime.now().date(),
-            Booking.check_out > datetime.now().date(),
-            Booking.status.in_(['reserved', 'in_house', 'checked_in'])
+            BookingRoom.stay.contains(datetime.now().date())
     )\
         .scalar() or 0
 
@@ -1026,8 +1022,7 @@ def get_yoy_performance(db: Session, org_id: UUID, params: AnalyticsRequest):
         .filter(
             Site.org_id == org_id,
             *filters,
-            Lease.start_date <= datetime.now().date(),
-            Lease.end_date >= datetime.now().date(),
+            Lease.period.contains(datetime.now().date()),
             Lease.status == 'active'
     )\
         .scalar() or 0
@@ -1047,9 +1042,7 @@ def get_yoy_performance(db: Session, org_id: UUID, params: AnalyticsRequest):
             Site.org_id == org_id,
             Space.kind == 'room',
             *filters,
-            Booking.check_in <= prev_year_date,
-            Booking.check_out > prev_year_date,
-            Booking.status.in_(['reserved', 'in_house', 'checked_in'])
+            BookingRoom.stay.contains(prev_year_date)
     )\
         .scalar() or 0
 
@@ -1059,8 +1052,7 @@ def get_yoy_performance(db: Session, org_id: UUID, params: AnalyticsRequest):
         .filter(
             Site.org_id == org_id,
             *filters,
-            Lease.start_date <= prev_year_date,
-            Lease.end_date >= prev_year_date,
+            Lease.period.contains(prev_year_date),
             Lease.status == 'active'
     )\
         .scalar() or 0
@@ -1171,9 +1163,7 @@ def get_site_comparison(db: Session, org_id: UUID, params: AnalyticsRequest):
                 Space.org_id == org_id,
                 Space.site_id == site.id,
                 Space.kind == 'room',
-                Booking.check_in <= datetime.now().date(),
-                Booking.check_out > datetime.now().date(),
-                Booking.status.in_(['reserved', 'in_house', 'checked_in'])
+                BookingRoom.stay.contains(datetime.now().date())
         )\
             .scalar() or 0
 
@@ -1183,8 +1173,7 @@ def get_site_comparison(db: Session, org_id: UUID, params: AnalyticsRequest):
             .filter(
                 Lease.org_id == org_id,
                 Lease.site_id == site.id,
-                Lease.start_date <= datetime.now().date(),
-                Lease.end_date >= datetime.now().date(),
+                Lease.period.contains(datetime.now().date()),
                 Lease.status == 'active'
         )\
             .scalar() or 0
@@ -1638,8 +1627,7 @@ def get_tenant_retention(db: Session, org_id: UUID, params: AnalyticsRequest):
                         Lease.org_id == org_id,
                         Lease.space_id == lease.space_id,
                         Lease.status == 'active',
-                        Lease.start_date <= datetime.now().date(),
-                        Lease.end_date >= datetime.now().date(),
+                        Lease.period.contains(datetime.now().date()),
                         *filters
                 ).first()
 
@@ -1804,9 +1792,7 @@ def get_portfolio_heatmap(db: Session, org_id: UUID, params: AnalyticsRequest):
         .join(Site, Booking.site_id == Site.id)\
         .filter(
             Booking.org_id == org_id,
-            Booking.check_in <= datetime.now().date(),
-            Booking.check_out > datetime.now().date(),
-            Booking.status.in_(['reserved', 'in_house', 'checked_in']),
+            BookingRoom.stay.contains(datetime.now().date()),
             *filters
     ).all()
     active_booking_space_ids = {
@@ -1817,8 +1803,7 @@ def get_portfolio_heatmap(db: Session, org_id: UUID, params: AnalyticsRequest):
         .join(Site, Lease.site_id == Site.id)\
         .filter(
             Lease.org_id == org_id,
-            Lease.start_date <= datetime.now().date(),
-            Lease.end_date >= datetime.now().date(),
+            Lease.period.contains(datetime.now().date()),
             Lease.status == 'active',
             *filters
     ).all()
@@ -1909,9 +1894,7 @@ def get_performance_summary(db: Session, org_id: UUID, params: AnalyticsRequest)
             Space.org_id == org_id,
             Space.kind == 'room',
             *filters,
-            Booking.check_in <= datetime.now().date(),
-            Booking.check_out > datetime.now().date(),
-            Booking.status.in_(['reserved', 'in_house', 'checked_in'])
+            BookingRoom.stay.contains(datetime.now().date())
     ).scalar() or 0
 
     # Leased spaces occupancy
@@ -1921,8 +1904,7 @@ def get_performance_summary(db: Session, org_id: UUID, params: AnalyticsRequest)
         .filter(
             Lease.org_id == org_id,
             *filters,
-            Lease.start_date <= datetime.now().date(),
-            Lease.end_date >= datetime.now().date(),
+            Lease.period.contains(datetime.now().date()),
             Lease.status == 'active'
     ).scalar() or 0
 
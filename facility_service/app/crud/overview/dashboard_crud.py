@@ -1,6 +1,6 @@
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from sqlalchemy import Integer, and_, extract, func, case, literal_column, or_
+from sqlalchemy import Integer, and_, func, case, select, true
 from datetime import date, datetime, timedelta
 
 from facility_service.app.models.parking_access.parking_slots import ParkingSlot
@@ -25,6 +25,7 @@ from ...models.parking_access.parking_pass import ParkingPass
 from ...models.parking_access.parking_zones import ParkingZone
 from ...models.parking_access.visitors import Visitor
 from ...models.space_sites.spaces import Space
+from ...models.space_sites.space_occupancy_state import SpaceOccupancyState
 from ...models.leasing_tenants.leases import Lease
 from ...models.leasing_tenants.lease_charges import LeaseCharge
 from ...models.maintenance_assets.pm_template import PMTemplate
@@ -42,90 +43,111 @@ from dateutil.relativedelta import relativedelta
 from datetime import timedelta
 
 
+def _month_bounds(day: date):
+    """Half-open [first of month, first of next month) range for `day`."""
+    month_start = day.replace(day=1)
+    return month_start, month_start + relativedelta(months=1)
+
+
+def _combine(*ctes):
+    """SELECT every column of single-row CTEs as one row in one round trip."""
+    from_clause = ctes[0]
+    for cte in ctes[1:]:
+        from_clause = from_clause.join(cte, true())
+    return select(*[column for cte in ctes for column in cte.c]).select_from(from_clause)
+
+
 def get_overview_data(db: Session, org_id: UUID) -> Dict[str, Any]:
     today = date.today()
+    month_start, next_month_start = _month_bounds(today)
 
     # ------------------- Total Properties -------------------
-    total_properties = db.query(func.count(Site.id))\
-        .filter(Site.org_id == org_id, Site.status == "active")\
-        .scalar() or 0
+    sites = select(
+        func.count(Site.id).label("total_properties")
+    ).where(
+        Site.org_id == org_id, Site.status == "active"
+    ).cte("sites")
 
     # ------------------- Occupancy Rate -------------------
-    occupied_count = db.query(func.count(Space.id))\
-        .filter(Space.org_id == org_id, Space.status == "occupied")\
-        .scalar() or 0
-    total_spaces = db.query(func.count(Space.id))\
-        .filter(Space.org_id == org_id)\
-        .scalar() or 1
-    occupancy_rate = round((occupied_count / total_spaces) * 100, 2)
+    spaces = select(
+        func.count(Space.id).filter(
+            Space.status == "occupied").label("occupied_count"),
+        func.count(Space.id).label("total_spaces")
+    ).where(Space.org_id == org_id).cte("spaces")
 
     # ------------------- Monthly Revenue -------------------
-    total_charges = (
-        db.query(func.coalesce(func.sum(FolioCharge.amount +
-                 (FolioCharge.amount * FolioCharge.tax_pct / 100)), 0))
-        .join(Folio, Folio.id == FolioCharge.folio_id)
-        .join(Booking, Booking.id == Folio.booking_id)
-        .filter(
-            Booking.org_id == org_id,
-            extract("month", FolioCharge.date) == today.month,
-            extract("year", FolioCharge.date) == today.year
-        )
-        .scalar()
-    ) or 0.0
-
-    total_refunds = (
-        db.query(func.coalesce(func.sum(BookingCancellation.refund_amount), 0))
-        .join(Booking, Booking.id == BookingCancellation.booking_id)
-        .filter(
-            Booking.org_id == org_id,
-            extract("month", BookingCancellation.cancelled_at) == today.month,
-            extract("year", BookingCancellation.cancelled_at) == today.year,
-            BookingCancellation.refund_processed == True
-        )
-        .scalar()
-    ) or 0.0
-
-    monthly_revenue = total_charges - total_refunds
+    charges = select(
+        func.coalesce(func.sum(FolioCharge.amount +
+                      (FolioCharge.amount * FolioCharge.tax_pct / 100)), 0).label("total_charges")
+    ).select_from(FolioCharge).join(
+        Folio, Folio.id == FolioCharge.folio_id
+    ).join(
+        Booking, Booking.id == Folio.booking_id
+    ).where(
+        Booking.org_id == org_id,
+        FolioCharge.date >= month_start,
+        FolioCharge.date < next_month_start
+    ).cte("charges")
+
+    refunds = select(
+        func.coalesce(func.sum(BookingCancellation.refund_amount),
+                      0).label("total_refunds")
+    ).select_from(BookingCancellation).join(
+        Booking, Booking.id == BookingCancellation.booking_id
+    ).where(
+        Booking.org_id == org_id,
+        BookingCancellation.cancelled_at >= month_start,
+        BookingCancellation.cancelled_at < next_month_start,
+        BookingCancellation.refund_processed == True
+    ).cte("refunds")
 
     # ------------------- Work Orders -------------------
-    total_work_orders = (
-        db.query(func.count(TicketWorkOrder.id))
-        .filter(
-            TicketWorkOrder.ticket_id == Ticket.id,
-            Ticket.status == "open",
-            Ticket.org_id == org_id
-        )
-        .scalar()
-        or 0
-    )
+    work_orders = select(
+        func.count(TicketWorkOrder.id).label("total_work_orders")
+    ).select_from(TicketWorkOrder).join(
+        Ticket, Ticket.id == TicketWorkOrder.ticket_id
+    ).where(
+        Ticket.status == "open",
+        Ticket.org_id == org_id
+    ).cte("work_orders")
 
     # ------------------- Rent Collections -------------------
-    rent_collections = (
-        db.query(func.coalesce(func.sum(FolioPayment.amount), 0))
-        .join(Folio, Folio.id == FolioPayment.folio_id)
-        .join(Booking, Booking.id == Folio.booking_id)
-        .filter(
-            Booking.org_id == org_id,
-            extract("month", FolioPayment.paid_at) == today.month,
-            extract("year", FolioPayment.paid_at) == today.year
-        )
-        .scalar() or 0.0
-    )
+    collections = select(
+        func.coalesce(func.sum(FolioPayment.amount),
+                      0).label("rent_collections")
+    ).select_from(FolioPayment).join(
+        Folio, Folio.id == FolioPayment.folio_id
+    ).join(
+        Booking, Booking.id == Folio.booking_id
+    ).where(
+        Booking.org_id == org_id,
+        FolioPayment.paid_at >= month_start,
+        FolioPayment.paid_at < next_month_start
+    ).cte("collections")
 
     # ------------------- Energy Usage -------------------
-    energy_usage = (
-        db.query(func.coalesce(func.sum(MeterReading.delta), 0))
-        .join(Meter, MeterReading.meter_id == Meter.id)
-        .filter(
-            Meter.org_id == org_id,
-            Meter.kind == "electricity",
-            MeterReading.ts >= func.date_trunc("month", func.current_date()),
-            MeterReading.ts < func.date_trunc(
-                "month", func.current_date()) + literal_column("INTERVAL '1 month'"),
-        )
-        .scalar()
-        or 0.0
-    )
+    energy = select(
+        func.coalesce(func.sum(MeterReading.delta), 0).label("energy_usage")
+    ).select_from(MeterReading).join(
+        Meter, MeterReading.meter_id == Meter.id
+    ).where(
+        Meter.org_id == org_id,
+        Meter.kind == "electricity",
+        MeterReading.ts >= month_start,
+        MeterReading.ts < next_month_start
+    ).cte("energy")
+
+    row = db.execute(_combine(
+        sites, spaces, charges, refunds, work_orders, collections, energy
+    )).one()
+
+    total_properties = row.total_properties or 0
+    occupancy_rate = round(
+        ((row.occupied_count or 0) / (row.total_spaces or 1)) * 100, 2)
+    monthly_revenue = (row.total_charges or 0.0) - (row.total_refunds or 0.0)
+    total_work_orders = row.total_work_orders or 0
+    rent_collections = row.rent_collections or 0.0
+    energy_usage = row.energy_usage or 0.0
 
     # Format values as strings for consistent frontend display
     stats_list = [
@@ -185,73 +207,60 @@ def get_overview_data(db: Session, org_id: UUID) -> Dict[str, Any]:
 def get_leasing_overview(db: Session, org_id: UUID):
     today = date.today()
 
-    renewals = db.query(
-        func.sum(
-            case(
-                ((Lease.end_date >= today) &
-                 (Lease.end_date <= today + timedelta(days=30)) &
-                 (func.lower(Lease.status) == "active") &
-                 (Lease.org_id == org_id), 1),
-                else_=0
-            )
-        ).label("renewals_30_days"),
-        func.sum(
-            case(
-                ((Lease.end_date >= today) &
-                 (Lease.end_date <= today + timedelta(days=60)) &
-                 (func.lower(Lease.status) == "active") &
-                 (Lease.org_id == org_id), 1),
-                else_=0
-            )
-        ).label("renewals_60_days"),
-        func.sum(
-            case(
-                ((Lease.end_date >= today) &
-                 (Lease.end_date <= today + timedelta(days=90)) &
-                 (func.lower(Lease.status) == "active") &
-                 (Lease.org_id == org_id), 1),
-                else_=0
-            )
-        ).label("renewals_90_days")
-    ).first()
+    active_lease = and_(
+        Lease.org_id == org_id,
+        func.lower(Lease.status) == "active"
+    )
+
+    renewals = select(
+        func.count(Lease.id).filter(
+            Lease.end_date <= today + timedelta(days=30)).label("renewals_30_days"),
+        func.count(Lease.id).filter(
+            Lease.end_date <= today + timedelta(days=60)).label("renewals_60_days"),
+        func.count(Lease.id).label("renewals_90_days")
+    ).where(
+        active_lease,
+        Lease.end_date >= today,
+        Lease.end_date <= today + timedelta(days=90)
+    ).cte("renewals")
 
     # ------------------- Total Billed -------------------
-    total_billed = (
-        db.query(
-            func.coalesce(
-                func.sum(LeaseCharge.amount +
-                         (LeaseCharge.amount * TaxCode.rate / 100)), 0
-            )
-        )
-        .join(Lease, Lease.id == LeaseCharge.lease_id)
-        .join(TaxCode, TaxCode.id == LeaseCharge.tax_code_id)
-        .filter(
-            Lease.org_id == org_id,
-            Lease.status == "active"  # Optional: sum only active leases
-        )
-        .scalar()
-    )
+    billed = select(
+        func.coalesce(
+            func.sum(LeaseCharge.amount +
+                     (LeaseCharge.amount * TaxCode.rate / 100)), 0
+        ).label("total_billed")
+    ).select_from(LeaseCharge).join(
+        Lease, Lease.id == LeaseCharge.lease_id
+    ).join(
+        TaxCode, TaxCode.id == LeaseCharge.tax_code_id
+    ).where(
+        Lease.org_id == org_id,
+        Lease.status == "active"  # Optional: sum only active leases
+    ).cte("billed")
 
     # ------------------- Total Collected -------------------
-    total_collected = (
-        db.query(func.coalesce(func.sum(PaymentAR.amount), 0))
-        .join(Invoice, Invoice.id == PaymentAR.invoice_id)
-        .filter(Invoice.org_id == org_id)
-        .scalar()
-    )
+    collected = select(
+        func.coalesce(func.sum(PaymentAR.amount), 0).label("total_collected")
+    ).select_from(PaymentAR).join(
+        Invoice, Invoice.id == PaymentAR.invoice_id
+    ).where(Invoice.org_id == org_id).cte("collected")
+
+    row = db.execute(_combine(renewals, billed, collected)).one()
 
     # ------------------- Collection Rate -------------------
+    total_billed = row.total_billed or 0
     collection_rate_pct = round(
-        (float(total_collected) / float(total_billed)
+        (float(row.total_collected or 0) / float(total_billed)
          * 100) if total_billed > 0 else 0,
         2
     )
 
     # ------------------- Return Overview -------------------
     return {
-        "renewals_30_days": int(renewals.renewals_30_days or 0),
-        "renewals_60_days": int(renewals.renewals_60_days or 0),
-        "renewals_90_days": int(renewals.renewals_90_days or 0),
+        "renewals_30_days": int(row.renewals_30_days or 0),
+        "renewals_60_days": int(row.renewals_60_days or 0),
+        "renewals_90_days": int(row.renewals_90_days or 0),
         "collection_rate_pct": collection_rate_pct,
     }
 
@@ -261,49 +270,42 @@ def get_leasing_overview(db: Session, org_id: UUID):
 def get_maintenance_status(db: Session, org_id: UUID):
     today = date.today()
 
-    # Open Tickets
-    open_tickets = db.query(func.count(Ticket.id))\
-        .filter(Ticket.org_id == org_id,
-                func.lower(Ticket.status) == 'open')\
-        .scalar() or 0
-
-    # Closed Tickets
-    closed_tickets = db.query(func.count(Ticket.id))\
-        .filter(Ticket.org_id == org_id,
-                func.lower(Ticket.status) == 'closed')\
-        .scalar() or 0
+    ticket_status = func.lower(Ticket.status)
+    tickets = select(
+        func.count(Ticket.id).filter(ticket_status == "open").label("open"),
+        func.count(Ticket.id).filter(ticket_status == "closed").label("closed")
+    ).where(
+        Ticket.org_id == org_id,
+        ticket_status.in_(["open", "closed"])
+    ).cte("tickets")
 
     # Upcoming PM -
-    upcoming_pm = db.query(func.count(PMTemplate.id))\
-        .filter(PMTemplate.org_id == org_id,
-                func.lower(PMTemplate.status) == "active")\
-        .scalar() or 0
-
-    service_requests = db.query(func.count(Ticket.id))\
-        .filter(Ticket.org_id == org_id,
-                func.lower(Ticket.status) == 'open')\
-        .scalar() or 0
-
-    asset_at_risk = db.query(
-        func.sum(
-            case(
-                (and_(
-                    Asset.warranty_expiry.isnot(None),
-                    Asset.warranty_expiry < today,
-                    Asset.is_deleted == False
-                ), 1),
-                else_=0
-            )
-        )
-    ).filter(Asset.org_id == org_id,
-             func.lower(Asset.status) == "active",).scalar() or 0
+    pm = select(
+        func.count(PMTemplate.id).label("upcoming_pm")
+    ).where(
+        PMTemplate.org_id == org_id,
+        func.lower(PMTemplate.status) == "active"
+    ).cte("pm")
+
+    assets = select(
+        func.count(Asset.id).label("asset_at_risk")
+    ).where(
+        Asset.org_id == org_id,
+        func.lower(Asset.status) == "active",
+        Asset.is_deleted == False,
+        Asset.warranty_expiry.isnot(None),
+        Asset.warranty_expiry < today
+    ).cte("assets")
+
+    row = db.execute(_combine(tickets, pm, assets)).one()
 
     return {
-        "open": open_tickets,
-        "closed": closed_tickets,
-        "upcoming_pm": upcoming_pm,
-        "service_requests": service_requests,
-        "asset_at_risk": asset_at_risk
+        "open": row.open or 0,
+        "closed": row.closed or 0,
+        "upcoming_pm": row.upcoming_pm or 0,
+        # Service requests are the open tickets
+        "service_requests": row.open or 0,
+        "asset_at_risk": row.asset_at_risk or 0
     }
 
 # -----------------access and parking -------------------
@@ -313,53 +315,53 @@ def get_access_and_parking(db: Session, org_id: UUID):
     today = date.today()
 
     # Today's Visitors
-    today_visitors = db.query(func.count()).filter(
+    visitors = select(
+        func.count(Visitor.id).label("today_visitors")
+    ).where(
         Visitor.org_id == org_id,
-        func.date(Visitor.entry_time) == today
-    ).scalar()
+        Visitor.entry_time >= today,
+        Visitor.entry_time < today + timedelta(days=1)
+    ).cte("visitors")
 
     # Total capacity
-    result = (
-        db.query(
-            func.count(ParkingSlot.id).label("total_capacity"),
-        )
-        .select_from(ParkingZone)
-        .outerjoin(
-            ParkingSlot,
-            (ParkingSlot.zone_id == ParkingZone.id) &
-            (ParkingSlot.is_deleted == False)
-        )
-        .filter(
-            ParkingZone.org_id == org_id,
-            ParkingZone.is_deleted == False
-        )
-        .one()
-    )
-
-    total_capacity = result.total_capacity or 0
+    capacity = select(
+        func.count(ParkingSlot.id).label("total_capacity")
+    ).select_from(ParkingZone).outerjoin(
+        ParkingSlot,
+        (ParkingSlot.zone_id == ParkingZone.id) &
+        (ParkingSlot.is_deleted == False)
+    ).where(
+        ParkingZone.org_id == org_id,
+        ParkingZone.is_deleted == False
+    ).cte("capacity")
 
     # Total occupied
-    total_occupied = db.query(func.count(ParkingPass.id)).filter(
+    passes = select(
+        func.count(ParkingPass.id).label("total_occupied")
+    ).where(
         ParkingPass.org_id == org_id,
         ParkingPass.status == 'ACTIVE',
         ParkingPass.valid_from <= today,
         ParkingPass.valid_to >= today
-    ).scalar()
-
-    # Occupancy %
-    parking_occupancy_pct = round(
-        (total_occupied / total_capacity * 100) if total_capacity else 0, 2)
+    ).cte("passes")
 
     # Spaces
-    total_spaces = db.query(func.count()).filter(
+    spaces = select(
+        func.count(Space.id).filter(
+            Space.status == 'available').label("total_spaces"),
+        func.count(Space.id).filter(
+            Space.status == 'occupied').label("occupied_spaces")
+    ).where(
         Space.org_id == org_id,
-        Space.status == 'available'
-    ).scalar()
+        Space.status.in_(['available', 'occupied'])
+    ).cte("spaces")
 
-    occupied_spaces = db.query(func.count()).filter(
-        Space.org_id == org_id,
-        Space.status == 'occupied'
-    ).scalar()
+    row = db.execute(_combine(visitors, capacity, passes, spaces)).one()
+
+    # Occupancy %
+    total_capacity = row.total_capacity or 0
+    parking_occupancy_pct = round(
+        (row.total_occupied / total_capacity * 100) if total_capacity else 0, 2)
 
     # Recent Access Events (latest 5)
     recent_access_events = (
@@ -372,15 +374,15 @@ def get_access_and_parking(db: Session, org_id: UUID):
 
     formatted_events = [
         {"time": ae.ts.strftime(
-            "%H:%M"), "event": "Entry" if ae.direction == "in" else "Exit", "location": ae.gate}
+            "%H:%M"), "event": "Entry" if ae.direction == "in" else "Exit", "location": ae.gate or ""}
         for ae in recent_access_events
     ]
 
     return {
-        "today_visitors": today_visitors,
+        "today_visitors": row.today_visitors,
         "parking_occupancy_pct": parking_occupancy_pct,
-        "total_spaces": total_spaces,
-        "occupied_spaces": occupied_spaces,
+        "total_spaces": row.total_spaces,
+        "occupied_spaces": row.occupied_spaces,
         "recent_access_events": formatted_events
     }
 
@@ -388,170 +390,112 @@ def get_access_and_parking(db: Session, org_id: UUID):
 # ------------------------ Financial Summary ------------------------
 def get_financial_summary(db: Session, org_id: UUID):
     today = date.today()
-
-    # ------------------- Monthly Income -------------------
-    monthly_income = (
-        db.query(
-            func.coalesce(
-                func.sum(LeaseCharge.amount +
-                         LeaseCharge.amount * TaxCode.rate / 100),
-                0
-            )
-        )
-        .join(Lease, Lease.id == LeaseCharge.lease_id)
-        .join(TaxCode, TaxCode.id == LeaseCharge.tax_code_id)
-        .filter(
-            Lease.org_id == org_id,
-            or_(
-                LeaseCharge.period_start <= (
-                    func.date_trunc("month", func.current_date()) +
-                    literal_column("INTERVAL '1 month - 1 day'")
-                ),
-                LeaseCharge.period_end >= func.date_trunc(
-                    "month", func.current_date())
-            )
-        )
-        .scalar()
-        or 0.0
-    )
-
-    # ------------------- Overdue -------------------
-    overdue = (
-        db.query(
-            func.coalesce(
-                func.sum(LeaseCharge.amount + LeaseCharge.amount *
-                         TaxCode.rate / 100), 0
-            )
-        )
-        .join(Lease, Lease.id == LeaseCharge.lease_id)
-        .join(TaxCode, TaxCode.id == LeaseCharge.tax_code_id)
-        .filter(
-            Lease.org_id == org_id,
+    month_start, next_month_start = _month_bounds(today)
+
+    taxed_amount = LeaseCharge.amount + LeaseCharge.amount * TaxCode.rate / 100
+    is_cam = func.lower(LeaseChargeCode.code).like("cam%")
+
+    # Monthly income, overdue and outstanding CAM share one pass over the
+    # org's lease charges. Charges without a tax code only count towards CAM.
+    lease_charges = select(
+        # ------------------- Monthly Income -------------------
+        func.coalesce(func.sum(taxed_amount).filter(
+            TaxCode.id.isnot(None),
+            LeaseCharge.period_start < next_month_start,
+            LeaseCharge.period_end >= month_start
+        ), 0).label("monthly_income"),
+        # ------------------- Overdue -------------------
+        func.coalesce(func.sum(taxed_amount).filter(
+            TaxCode.id.isnot(None),
             LeaseCharge.period_end < today
-        )
-        .scalar()
-        or 0.0
-    )
+        ), 0).label("overdue"),
+        # ------------------- Outstanding CAM -------------------
+        func.coalesce(func.sum(LeaseCharge.amount).filter(
+            is_cam,
+            LeaseCharge.period_end < today
+        ), 0).label("outstanding_cam")
+    ).select_from(LeaseCharge).join(
+        Lease, Lease.id == LeaseCharge.lease_id
+    ).outerjoin(
+        TaxCode, TaxCode.id == LeaseCharge.tax_code_id
+    ).outerjoin(
+        LeaseChargeCode, LeaseChargeCode.id == LeaseCharge.charge_code_id
+    ).where(Lease.org_id == org_id).cte("lease_charges")
 
     # ------------------- Pending Invoices -------------------
-    pending_invoices_count = (
-        db.query(func.count(Invoice.id))
-        .filter(
-            Invoice.org_id == org_id,
-            func.lower(Invoice.status).in_(
-                ["draft", "pending", "unpaid", "partially"]
-            )
+    invoices = select(
+        func.count(Invoice.id).label("pending_invoices")
+    ).where(
+        Invoice.org_id == org_id,
+        func.lower(Invoice.status).in_(
+            ["draft", "pending", "unpaid", "partially"]
         )
-        .scalar()
-        or 0
-    )
+    ).cte("invoices")
 
     # ------------------- Recent Payments -------------------
-    recent_payments_amount = (
-        db.query(func.coalesce(func.sum(PaymentAR.amount), 0))
-        .outerjoin(Invoice, Invoice.id == PaymentAR.invoice_id)
-        .filter(
-            Invoice.org_id == org_id,
-            PaymentAR.paid_at != None,
-            PaymentAR.paid_at >= func.date_trunc("month", func.current_date())
-        )
-        .scalar()
-        or 0.0
-    )
+    payments = select(
+        func.coalesce(func.sum(PaymentAR.amount), 0).label(
+            "recent_payments_total")
+    ).where(
+        PaymentAR.org_id == org_id,
+        PaymentAR.paid_at >= month_start
+    ).cte("payments")
 
-    # ------------------- Outstanding CAM -------------------
-    outstanding_cam = (
-        db.query(func.coalesce(func.sum(LeaseCharge.amount), 0))
-        .join(Lease, Lease.id == LeaseCharge.lease_id)
-        .join(LeaseChargeCode, LeaseChargeCode.id == LeaseCharge.charge_code_id)
-        .filter(
-            Lease.org_id == org_id,
-            func.lower(LeaseChargeCode.code).like("cam%"),
-            LeaseCharge.period_end < today,
-        )
-        .scalar()
-        or 0.0
-    )
+    row = db.execute(_combine(lease_charges, invoices, payments)).one()
 
     return {
-        "monthly_income": float(monthly_income),
-        "overdue": float(overdue),
-        "pending_invoices": int(pending_invoices_count),
-        "recent_payments_total": float(recent_payments_amount),
-        "outstanding_cam": float(outstanding_cam),
+        "monthly_income": float(row.monthly_income or 0.0),
+        "overdue": float(row.overdue or 0.0),
+        "pending_invoices": int(row.pending_invoices or 0),
+        "recent_payments_total": float(row.recent_payments_total or 0.0),
+        "outstanding_cam": float(row.outstanding_cam or 0.0),
     }
 
 
 # -------------------------------monthly revenue-----------------------
 def monthly_revenue_trend(db: Session, org_id: UUID):
-    # Get the current date and calculate the last 4 months
-    today = date.today()
-    current_month_start = today.replace(day=1)
-
-    # Generate the last 4 months including current month
-    months = []
-    for i in range(3, -1, -1):  # Last 3 months + current month
-        month_date = current_month_start - relativedelta(months=i)
-        months.append({
-            "date": month_date,
-            "label": month_date.strftime("%b")
-        })
+    # Last 3 months + current month, as half-open ranges
+    current_month_start, _ = _month_bounds(date.today())
+    months = [current_month_start - relativedelta(months=i)
+              for i in range(3, -1, -1)]
+    window_end = current_month_start + relativedelta(months=1)
+
+    taxed_amount = LeaseCharge.amount + LeaseCharge.amount * TaxCode.rate / 100
+    is_cam = func.lower(LeaseChargeCode.code).like("cam%")
+
+    columns = []
+    for i, month_start in enumerate(months):
+        overlaps = and_(
+            LeaseCharge.period_start < month_start + relativedelta(months=1),
+            LeaseCharge.period_end >= month_start
+        )
+        columns.append(func.coalesce(func.sum(taxed_amount).filter(
+            overlaps, ~is_cam), 0).label(f"rental_{i}"))
+        columns.append(func.coalesce(func.sum(taxed_amount).filter(
+            overlaps, is_cam), 0).label(f"cam_{i}"))
+
+    row = db.execute(
+        select(*columns)
+        .select_from(LeaseCharge)
+        .join(Lease, Lease.id == LeaseCharge.lease_id)
+        .join(TaxCode, TaxCode.id == LeaseCharge.tax_code_id)
+        .join(LeaseChargeCode, LeaseChargeCode.id == LeaseCharge.charge_code_id)
+        .where(
+            Lease.org_id == org_id,
+            LeaseCharge.period_start < window_end,
+            LeaseCharge.period_end >= months[0]
+        )
+    ).one()
 
     monthly_data = []
-
-    for month_info in months:
-        month_start = month_info["date"]
-        month_end = (month_start + relativedelta(months=1)) - timedelta(days=1)
-
-        # Calculate rental revenue for the month
-        rental_revenue = float((
-            db.query(
-                func.coalesce(
-                    func.sum(LeaseCharge.amount +
-                             LeaseCharge.amount * TaxCode.rate / 100),
-                    0
-                )
-            )
-            .join(Lease, Lease.id == LeaseCharge.lease_id)
-            .join(TaxCode, TaxCode.id == LeaseCharge.tax_code_id)
-            .join(LeaseChargeCode, LeaseChargeCode.id == LeaseCharge.charge_code_id)
-            .filter(
-                Lease.org_id == org_id,
-                LeaseCharge.period_start <= month_end,
-                LeaseCharge.period_end >= month_start,
-                ~func.lower(LeaseChargeCode.code).like("cam%")
-            )
-            .scalar() or 0.0
-        ))
-
-        # Calculate CAM revenue for the month
-        cam_revenue = float((
-            db.query(
-                func.coalesce(
-                    func.sum(LeaseCharge.amount +
-                             LeaseCharge.amount * TaxCode.rate / 100),
-                    0
-                )
-            )
-            .join(Lease, Lease.id == LeaseCharge.lease_id)
-            .join(TaxCode, TaxCode.id == LeaseCharge.tax_code_id)
-            .join(LeaseChargeCode, LeaseChargeCode.id == LeaseCharge.charge_code_id)
-            .filter(
-                Lease.org_id == org_id,
-                LeaseCharge.period_start <= month_end,
-                LeaseCharge.period_end >= month_start,
-                func.lower(LeaseChargeCode.code).like("cam%")
-            )
-            .scalar() or 0.0
-        ))
-
+    for i, month_start in enumerate(months):
         # Round all values to 2 decimal places
-        rental_revenue = round(rental_revenue, 2)
-        cam_revenue = round(cam_revenue, 2)
+        rental_revenue = round(float(row._mapping[f"rental_{i}"] or 0.0), 2)
+        cam_revenue = round(float(row._mapping[f"cam_{i}"] or 0.0), 2)
         total_revenue = round(rental_revenue + cam_revenue, 2)
 
         monthly_data.append({
-            "month": month_info["label"],
+            "month": month_start.strftime("%b"),
             "rental": rental_revenue,
             "cam": cam_revenue,
             "total": total_revenue
@@ -560,49 +504,38 @@ def monthly_revenue_trend(db: Session, org_id: UUID):
     return monthly_data
 
 
+# Moved out but not yet through handover, inspection, maintenance and settlement
+TURNOVER_STATUSES = (
+    "handover_pending", "handover_in_progress", "inspection_pending",
+    "inspection_scheduled", "maintenance_pending", "settlement_pending",
+)
+
+
 def space_occupancy(db: Session, org_id: UUID):
-    # Count total spaces (excluding deleted ones)
-    total_spaces = (
-        db.query(func.count(Space.id))
-        .filter(
+    space_status = func.lower(Space.status)
+    counts = db.execute(
+        select(
+            func.count(Space.id).label("total"),
+            func.count(Space.id).filter(
+                space_status == "occupied").label("occupied"),
+            func.count(Space.id).filter(
+                space_status == "available").label("available"),
+            func.count(Space.id).filter(
+                space_status == "out_of_service").label("out_of_service"),
+            func.count(Space.id).filter(
+                SpaceOccupancyState.status == "move_out_scheduled").label("move_out_scheduled"),
+            func.count(Space.id).filter(
+                SpaceOccupancyState.status.in_(TURNOVER_STATUSES)).label("in_turnover")
+        ).select_from(Space).outerjoin(
+            SpaceOccupancyState, SpaceOccupancyState.space_id == Space.id
+        ).where(
             Space.org_id == org_id,
             Space.is_deleted == False
         )
-        .scalar() or 0
-    )
-
-    # Count occupied spaces
-    occupied_spaces = (
-        db.query(func.count(Space.id))
-        .filter(
-            Space.org_id == org_id,
-            Space.is_deleted == False,
-            func.lower(Space.status) == "occupied"
-        )
-        .scalar() or 0
-    )
+    ).one()
 
-    # Count available spaces
-    available_spaces = (
-        db.query(func.count(Space.id))
-        .filter(
-            Space.org_id == org_id,
-            Space.is_deleted == False,
-            func.lower(Space.status) == "available"
-        )
-        .scalar() or 0
-    )
-
-    # Count out of service spaces
-    out_of_service_spaces = (
-        db.query(func.count(Space.id))
-        .filter(
-            Space.org_id == org_id,
-            Space.is_deleted == False,
-            func.lower(Space.status) == "out_of_service"
-        )
-        .scalar() or 0
-    )
+    total_spaces = counts.total or 0
+    occupied_spaces = counts.occupied or 0
 
     # Calculate occupancy rate (percentage)
     occupancy_rate = 0.0
@@ -612,8 +545,10 @@ def space_occupancy(db: Session, org_id: UUID):
     return {
         "total": total_spaces,
         "occupied": occupied_spaces,
-        "available": available_spaces,
-        "outOfService": out_of_service_spaces,
+        "available": counts.available or 0,
+        "outOfService": counts.out_of_service or 0,
+        "moveOutScheduled": counts.move_out_scheduled or 0,
+        "inTurnover": counts.in_turnover or 0,
         "occupancyRate": occupancy_rate,
     }
 
@@ -653,74 +588,43 @@ def work_orders_priority(db: Session, org_id: UUID) -> List[Dict]:
 
 
 def get_energy_consumption_trend(db: Session, org_id: UUID):
-    # Get the current date and calculate the last 4 months
-    today = date.today()
-
-    current_month_start = today.replace(day=1)
-
-    # Generate the last 4 months including current month
-    months = []
-    for i in range(3, -1, -1):  # Last 3 months + current month: Aug, Sep, Oct, Nov
-        month_date = current_month_start - relativedelta(months=i)
-        months.append({
-            "date": month_date,
-            "label": month_date.strftime("%b")
-        })
-
-    monthly_data = []
-
-    for month_info in months:
-        month_start = month_info["date"]
-        month_end = (month_start + relativedelta(months=1)) - timedelta(days=1)
-
-        # Use between() for cleaner date range filtering
-        electricity_consumption = float((
-            db.query(
-                func.coalesce(func.sum(MeterReading.delta), 0)
-            )
-            .join(Meter, Meter.id == MeterReading.meter_id)
-            .filter(
-                Meter.org_id == org_id,
-                Meter.kind == "electricity",
-                func.date(MeterReading.ts).between(month_start, month_end)
-            )
-            .scalar() or 0.0
-        ))
-
-        water_consumption = float((
-            db.query(
-                func.coalesce(func.sum(MeterReading.delta), 0)
-            )
-            .join(Meter, Meter.id == MeterReading.meter_id)
-            .filter(
-                Meter.org_id == org_id,
-                Meter.kind == "water",
-                func.date(MeterReading.ts).between(month_start, month_end)
-            )
-            .scalar() or 0.0
-        ))
-
-        gas_consumption = float((
-            db.query(
-                func.coalesce(func.sum(MeterReading.delta), 0)
-            )
-            .join(Meter, Meter.id == MeterReading.meter_id)
-            .filter(
-                Meter.org_id == org_id,
-                Meter.kind == "gas",
-                func.date(MeterReading.ts).between(month_start, month_end)
-            )
-            .scalar() or 0.0
-        ))
+    # Last 3 months + current month, as half-open ranges
+    current_month_start, window_end = _month_bounds(date.today())
+    months = [current_month_start - relativedelta(months=i)
+              for i in range(3, -1, -1)]
+
+    month = func.date_trunc("month", MeterReading.ts).label("month")
+    rows = db.execute(
+        select(
+            month,
+            Meter.kind,
+            func.coalesce(func.sum(MeterReading.delta), 0).label("consumption")
+        )
+        .select_from(MeterReading)
+        .join(Meter, Meter.id == MeterReading.meter_id)
+        .where(
+            Meter.org_id == org_id,
+            Meter.kind.in_(["electricity", "water", "gas"]),
+            MeterReading.ts >= months[0],
+            MeterReading.ts < window_end
+        )
+        .group_by(month, Meter.kind)
+    ).all()
 
-        monthly_data.append({
-            "month": month_info["label"],
-            "electricity": round(electricity_consumption, 2),
-            "water": round(water_consumption, 2),
-            "gas": round(gas_consumption, 2)
-        })
+    consumption = {
+        (row.month.date(), row.kind): float(row.consumption or 0.0)
+        for row in rows
+    }
 
-    return monthly_data
+    return [
+        {
+            "month": month_start.strftime("%b"),
+            "electricity": round(consumption.get((month_start, "electricity"), 0.0), 2),
+            "water": round(consumption.get((month_start, "water"), 0.0), 2),
+            "gas": round(consumption.get((month_start, "gas"), 0.0), 2)
+        }
+        for month_start in months
+    ]
 
 
 def get_occupancy_by_floor(db: Session, org_id: UUID) -> List[OccupancyByFloorResponse]:
@@ -828,3 +732,28 @@ def get_energy_status(db: Session, org_id: UUID):
         "totalConsumption": int(total_consumption),
         "alerts": alerts
     }
+
+
+def get_dashboard_all(db: Session, org_id: UUID) -> Dict[str, Any]:
+    """
+    Every dashboard widget from one connection. The read-only repeatable
+    read transaction gives all widgets the same snapshot.
+    """
+    db.connection(execution_options={
+        "isolation_level": "REPEATABLE READ",
+        "postgresql_readonly": True,
+    })
+
+    return {
+        "overview": get_overview_data(db, org_id),
+        "leasing_overview": get_leasing_overview(db, org_id),
+        "maintenance_status": get_maintenance_status(db, org_id),
+        "access_and_parking": get_access_and_parking(db, org_id),
+        "financial_summary": get_financial_summary(db, org_id),
+        "monthly_revenue_trend": monthly_revenue_trend(db, org_id),
+        "space_occupancy": space_occupancy(db, org_id),
+        "work_orders_priority": work_orders_priority(db, org_id),
+        "energy_consumption_trend": get_energy_consumption_trend(db, org_id),
+        "occupancy_by_floor": get_occupancy_by_floor(db, org_id),
+        "energy_status": get_energy_status(db, org_id),
+    }
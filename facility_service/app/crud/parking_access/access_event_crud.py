@@ -1,15 +1,23 @@
 import uuid
+from collections import defaultdict
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import Date, func, cast, or_, case, literal, Numeric, and_
+from sqlalchemy import func, or_, case, literal, Numeric, and_
 from dateutil.relativedelta import relativedelta
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, insert as pg_insert
+
+from shared.helpers.json_response_helper import error_response
+from shared.utils.app_status_code import AppStatusCode
 
 from ...models.space_sites.sites import Site
 
+from ...models.parking_access.access_event_rollups import AccessEventDaily, AccessEventIdentity
 from ...models.parking_access.access_events import AccessEvent
-from ...schemas.parking_access.access_event_schemas import AccessEventOut, AccessEventRequest, AccessEventsResponse
+from ...schemas.parking_access.access_event_schemas import AccessEventIngest, AccessEventOut, AccessEventRequest, AccessEventsResponse
+
+# Rows per INSERT statement; a batch may hold several
+INGEST_CHUNK_SIZE = 1000
 
 
 def build_access_event_filters(org_id: UUID, params: AccessEventRequest):
@@ -36,37 +44,23 @@ def get_access_event_query(db: Session, org_id: UUID, params: AccessEventRequest
 
 
 def get_access_event_overview(db: Session, org_id: UUID):
-    today = datetime.now().date()
-    event_fields = db.query(
-        func.sum(
-            case((func.lower(AccessEvent.direction) == "in", 1), else_=0)
-        ).label("total_entries"),
-        func.sum(
-            case((func.lower(AccessEvent.direction) == "out", 1), else_=0)
-        ).label("total_exits"),
-    ).filter(AccessEvent.org_id == org_id).one()
-
-    todays_event = db.query(func.count()).filter(
-        AccessEvent.org_id == org_id,
-        cast(AccessEvent.ts, Date) == today
+    """Overview cards from the daily rollups; days are UTC."""
+    today = datetime.now(timezone.utc).date()
+    totals = db.query(
+        func.sum(case((AccessEventDaily.day == today, AccessEventDaily.events), else_=0))
+        .label("today_events"),
+        func.sum(AccessEventDaily.entries).label("total_entries"),
+        func.sum(AccessEventDaily.exits).label("total_exits"),
+    ).filter(AccessEventDaily.org_id == org_id).one()
+
+    total_unique_ids = db.query(func.count()).filter(
+        AccessEventIdentity.org_id == org_id
     ).scalar()
 
-    total_unique_ids = db.query(
-        func.count(
-            func.distinct(
-                func.concat(
-                    func.coalesce(AccessEvent.vehicle_no, ''),
-                    '-',
-                    func.coalesce(AccessEvent.card_id, '')
-                )
-            )
-        )
-    ).filter(AccessEvent.org_id == org_id).scalar() or 0
-
     return {
-        "todayEvents": int(todays_event or 0),
-        "totalEntries": int(event_fields.total_entries or 0),
-        "totalExits": int(event_fields.total_exits or 0),
+        "todayEvents": int(totals.today_events or 0),
+        "totalEntries": int(totals.total_entries or 0),
+        "totalExits": int(totals.total_exits or 0),
         "totalUniqueIDs": int(total_unique_ids or 0),
     }
 
@@ -77,22 +71,118 @@ def get_access_events(db: Session, org_id: UUID, params: AccessEventRequest) ->
 
     results = (
         base_query
+        .join(Site, Site.id == AccessEvent.site_id)
+        .with_entities(AccessEvent, Site.name.label("site_name"))
         .order_by(AccessEvent.ts.desc())
         .offset(params.skip)
         .limit(params.limit)
         .all()
     )
 
-    events = []
-    for event in results:
-        site_name = (
-            db.query(Site.name)
-            .filter(Site.id == event.site_id)
-            .scalar()
-        )
-        events.append(AccessEventOut.model_validate({
-            **event.__dict__,
-            "site_name": site_name
-        }))
+    events = [
+        AccessEventOut.model_validate({**event.__dict__, "site_name": site_name})
+        for event, site_name in results
+    ]
 
     return {"events": events, "total": total}
+
+
+def _identity(vehicle_no: Optional[str], card_id: Optional[str]) -> str:
+    return f"{vehicle_no or ''}-{card_id or ''}"
+
+
+def ingest_access_events(db: Session, org_id: UUID, events: List[AccessEventIngest]):
+    """
+    Batched write for gate controllers: the events, then the rollup rows
+    they touch, in one transaction. Events carrying an id and ts already
+    stored are skipped, so a controller can resend a batch after a timeout.
+    """
+    site_ids = {event.site_id for event in events}
+    known_sites = {
+        row.id for row in db.query(Site.id).filter(
+            Site.id.in_(site_ids),
+            Site.org_id == org_id,
+            Site.is_deleted == False,
+        )
+    }
+    unknown = site_ids - known_sites
+    if unknown:
+        return error_response(
+            message=f"Unknown site(s): {', '.join(sorted(str(s) for s in unknown))}",
+            status_code=str(AppStatusCode.INVALID_INPUT),
+            http_status=400
+        )
+
+    now = datetime.now(timezone.utc)
+    rows = {}
+    for event in events:
+        ts = event.ts or now
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        event_id = event.id or uuid.uuid4()
+        rows[(event_id, ts)] = {
+            "id": event_id,
+            "org_id": org_id,
+            "site_id": event.site_id,
+            "gate": event.gate,
+            "vehicle_no": event.vehicle_no,
+            "card_id": event.card_id,
+            "ts": ts,
+            "direction": event.direction,
+        }
+    rows = list(rows.values())
+
+    inserted = set()
+    for start in range(0, len(rows), INGEST_CHUNK_SIZE):
+        inserted.update(db.execute(
+            pg_insert(AccessEvent)
+            .values(rows[start:start + INGEST_CHUNK_SIZE])
+            .on_conflict_do_nothing(index_elements=["id", "ts"])
+            .returning(AccessEvent.id, AccessEvent.ts)
+        ).all())
+    rows = [r for r in rows if (r["id"], r["ts"]) in inserted]
+
+    daily = defaultdict(lambda: {"events": 0, "entries": 0, "exits": 0})
+    identities = {}
+    for row in rows:
+        counts = daily[(row["site_id"], row["ts"].astimezone(timezone.utc).date())]
+        counts["events"] += 1
+        direction = (row["direction"] or "").lower()
+        if direction == "in":
+            counts["entries"] += 1
+        elif direction == "out":
+            counts["exits"] += 1
+        identity = _identity(row["vehicle_no"], row["card_id"])
+        identities[identity] = min(row["ts"], identities.get(identity, row["ts"]))
+
+    # Fixed order, so concurrent batches for the same sites cannot deadlock
+    if daily:
+        stmt = pg_insert(AccessEventDaily).values([
+            {"org_id": org_id, "site_id": site_id, "day": day, **counts}
+            for (site_id, day), counts in sorted(daily.items())
+        ])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["org_id", "site_id", "day"],
+            set_={
+                "events": AccessEventDaily.events + stmt.excluded.events,
+                "entries": AccessEventDaily.entries + stmt.excluded.entries,
+                "exits": AccessEventDaily.exits + stmt.excluded.exits,
+            }
+        ))
+    if identities:
+        stmt = pg_insert(AccessEventIdentity).values([
+            {"org_id": org_id, "identity": identity, "first_seen_at": first_seen_at}
+            for identity, first_seen_at in sorted(identities.items())
+        ])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["org_id", "identity"],
+            set_={"first_seen_at": stmt.excluded.first_seen_at},
+            where=stmt.excluded.first_seen_at < AccessEventIdentity.first_seen_at
+        ))
+
+    db.commit()
+    return {
+        "received": len(events),
+        "inserted": len(rows),
+        "duplicates": len(events) - len(rows),
+    }
@@ -1,3 +1,4 @@
+from typing import Optional
 from uuid import UUID
 from facility_service.app.models.parking_access.parking_slots import ParkingSlot
 from sqlalchemy import func, case, literal, or_
@@ -9,6 +10,7 @@ from facility_service.app.schemas.parking_access.parking_slot_schemas import(
     AssignParkingSlotsRequest, BulkParkingSlotRequest, BulkUploadError,
     ParkingSlotCreate, ParkingSlotOut, ParkingSlotUpdate)
 from shared.core.schemas import Lookup, UserToken
+from shared.helpers.bulk_import import BulkImport, ProgressCallback, nan_to_none, present
 from shared.helpers.json_response_helper import error_response, success_response
 from shared.utils.app_status_code import AppStatusCode
 
@@ -186,59 +188,101 @@ def delete_parking_slot(db: Session, org_id: UUID, slot_id: UUID):
 
     return {"success": True}
 
-def bulk_update_parking_slots(db: Session, request: BulkParkingSlotRequest, org_id: UUID):
-    inserted = updated = 0
-    validations = []
-    
-    # 1. Cache dictionaries prevent asking the DB for the same IDs repeatedly
-    cache = {"site": {}, "zone": {}, "space": {}}
-
-    def fetch_id(model, cache_dict, name, parent_site_id=None):
-        if not name: return None
-        key = (name, parent_site_id)
-        if key not in cache_dict:
-            q = db.query(model.id).filter(model.name == name, model.is_deleted == False)
-            if parent_site_id: 
-                q = q.filter(model.site_id == parent_site_id)
-            cache_dict[key] = q.scalar()
-        return cache_dict[key]
-
-    # 2. Process rows using enumerate to automatically track the row number
-    for i, s in enumerate(request.slots, start=2):
-        errors = []
-        
-        site_id = fetch_id(Site, cache["site"], s.siteName)
-        if not site_id: errors.append(f"Site '{s.siteName}' not found")
-        
-        zone_id = fetch_id(ParkingZone, cache["zone"], s.zoneName, site_id)
-        if s.zoneName and not zone_id: errors.append(f"Zone '{s.zoneName}' not found")
-        
-        space_id = fetch_id(Space, cache["space"], s.spaceName, site_id)
-        if s.spaceName and not space_id: errors.append(f"Space '{s.spaceName}' not found")
-
-        if errors:
-            validations.append(BulkUploadError(row=i, errors=errors))
-            continue
-
-        # 3. Upsert Logic (Update if exists, Insert if new)
-        existing = db.query(ParkingSlot).filter_by(
-            slot_no=s.slot_no, site_id=site_id, zone_id=zone_id, is_deleted=False
-        ).first()
-
-        slot_data = {
-            "org_id": org_id, "site_id": site_id, "zone_id": zone_id, 
-            "space_id": space_id, "slot_type": s.slot_type
+def bulk_update_parking_slots(
+    db: Session,
+    request: BulkParkingSlotRequest,
+    org_id: UUID,
+    progress: Optional[ProgressCallback] = None,
+    commit: bool = True
+):
+    """
+    Slots are matched by (site, zone, slot_no): existing ones are updated,
+    the rest inserted. Set-based, see BulkImport.
+    With commit=False the caller commits.
+    """
+    if not request.slots:
+        return {"inserted": 0, "updated": 0, "validations": []}
+
+    job = BulkImport(db, request.slots, "parking slots", progress)
+
+    # 1. Resolve site, zone and space names, one query each
+    sites = job.lookup(
+        [Site.name.label("siteName"), Site.id.label("site_id")],
+        [Site.name],
+        job.frame[["siteName"]],
+        Site.org_id == org_id,
+        Site.is_deleted == False
+    ).drop_duplicates("siteName")
+    job.attach(sites, on=["siteName"])
+
+    wants_zone = present(job.frame["zoneName"]) & job.frame["site_id"].notna()
+    zones = job.lookup(
+        [ParkingZone.site_id.label("site_id"), ParkingZone.name.label("zoneName"), ParkingZone.id.label("zone_id")],
+        [ParkingZone.site_id, ParkingZone.name],
+        job.frame.loc[wants_zone, ["site_id", "zoneName"]],
+        ParkingZone.is_deleted == False
+    ).drop_duplicates(["site_id", "zoneName"])
+    job.attach(zones, on=["site_id", "zoneName"])
+
+    wants_space = present(job.frame["spaceName"]) & job.frame["site_id"].notna()
+    spaces = job.lookup(
+        [Space.site_id.label("site_id"), Space.name.label("spaceName"), Space.id.label("space_id")],
+        [Space.site_id, Space.name],
+        job.frame.loc[wants_space, ["site_id", "spaceName"]],
+        Space.is_deleted == False
+    ).drop_duplicates(["site_id", "spaceName"])
+    job.attach(spaces, on=["site_id", "spaceName"])
+
+    frame = job.frame
+    job.fail(frame["site_id"].isna(), frame["siteName"].map(lambda name: f"Site '{name}' not found"))
+    job.fail(wants_zone & frame["zone_id"].isna(), frame["zoneName"].map(lambda name: f"Zone '{name}' not found"))
+    job.fail(wants_space & frame["space_id"].isna(), frame["spaceName"].map(lambda name: f"Space '{name}' not found"))
+
+    # 2. Slots without a zone have no unique key, match them up front;
+    # zoned slots go through ON CONFLICT (zone_id, slot_no)
+    valid = job.valid().drop_duplicates(["site_id", "zone_id", "slot_no"], keep="last")
+    unzoned = valid[valid["zone_id"].isna()]
+    existing = job.lookup(
+        [ParkingSlot.site_id.label("site_id"), ParkingSlot.slot_no.label("slot_no"), ParkingSlot.id.label("slot_id")],
+        [ParkingSlot.site_id, ParkingSlot.slot_no],
+        unzoned[["site_id", "slot_no"]],
+        ParkingSlot.zone_id.is_(None),
+        ParkingSlot.is_deleted == False
+    ).drop_duplicates(["site_id", "slot_no"])
+    unzoned = unzoned.merge(existing, on=["site_id", "slot_no"], how="left")
+
+    def slot_data(row):
+        return {
+            "org_id": org_id,
+            "site_id": row.site_id,
+            "zone_id": nan_to_none(row.zone_id),
+            "space_id": nan_to_none(row.space_id),
+            "slot_type": job.records[row.idx].slot_type,
         }
 
-        if existing:
-            for k, v in slot_data.items(): setattr(existing, k, v)
-            updated += 1
-        else:
-            db.add(ParkingSlot(slot_no=s.slot_no, **slot_data))
-            inserted += 1
+    updates = [
+        {"id": row.slot_id, **slot_data(row)}
+        for row in unzoned[unzoned["slot_id"].notna()].itertuples(index=False)
+    ]
+    inserts = [
+        {"slot_no": row.slot_no, **slot_data(row), "is_deleted": False}
+        for frame_part in (unzoned[unzoned["slot_id"].isna()], valid[valid["zone_id"].notna()])
+        for row in frame_part.itertuples(index=False)
+    ]
+
+    total = len(valid)
+    updated = job.update_by_id(ParkingSlot, updates, total)
+    # Also revives a soft-deleted slot with the same number in the zone
+    inserted, upserted = job.upsert(
+        ParkingSlot, inserts,
+        conflict_columns=["zone_id", "slot_no"],
+        update_columns=["org_id", "site_id", "space_id", "slot_type", "is_deleted", "updated_at"],
+        total=total
+    )
 
-    db.commit()
-    return {"inserted": inserted, "updated": updated, "validations": validations}
+    if commit:
+        db.commit()
+    return {"inserted": inserted, "updated": updated + upserted, "validations": job.errors(BulkUploadError)}
 
 def available_parking_slot_lookup(
     db: Session,
@@ -15,6 +15,7 @@ from ...models.space_sites.sites import Site
 from ...models.parking_access.parking_zones import ParkingZone
 from ...schemas.parking_access.parking_zone_schemas import ParkingZoneCreate, ParkingZoneOut, ParkingZoneRequest, ParkingZoneUpdate, ParkingZonesResponse
 from sqlalchemy import and_
+from shared.helpers.reference_cache import cached_reference, invalidate_on_change
 
 # ----------------------------------------------------------------------
 # CRUD OPERATIONS
@@ -244,6 +245,10 @@ def delete_parking_zone(db: Session, zone_id: str):
     return True
 
 
+invalidate_on_change(ParkingZone, "parking_zones")
+
+
+@cached_reference("parking_zones")
 def parking_zone_lookup(db: Session, org_id: str, site_id: str) -> List[Lookup]:
     query = (
         db.query(
@@ -17,6 +17,7 @@ from shared.utils.enums import UserAccountType
 
 from ...models.procurement.contracts import Contract
 from shared.helpers.json_response_helper import error_response
+from shared.helpers.search_helper import search_filter
 from shared.utils.app_status_code import AppStatusCode
 from ...models.maintenance_assets.asset_category import AssetCategory
 from ...models.procurement.vendors import Vendor
@@ -40,15 +41,11 @@ def build_vendor_filters(org_id: uuid.UUID, params: VendorRequest):
         filters.append(func.jsonb_contains(
             Vendor.categories, f'"{params.category}"'))
 
-    if params.search:
-        search_term = f"%{params.search}%"
-        filters.append(
-            or_(
-                Vendor.name.ilike(search_term),
-                func.cast(Vendor.id, String).ilike(search_term),
-                Vendor.gst_vat_id.ilike(search_term)
-            )
-        )
+    # The id match can't use an index; the org filter keeps it to one org's vendors
+    search_condition = search_filter(
+        params.search, Vendor.name, Vendor.gst_vat_id, func.cast(Vendor.id, String))
+    if search_condition is not None:
+        filters.append(search_condition)
 
     return filters
 
@@ -1,8 +1,10 @@
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
-from sqlalchemy import func
+from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
+from facility_service.app.crud.maintenance_assets.inventory_movements_crud import snapshot_inventory_stocks
+from facility_service.app.crud.maintenance_assets.pm_generation_crud import generate_pm_work_orders
 from facility_service.app.crud.space_sites.space_occupancy_crud import start_handover_process
 from facility_service.app.models.leasing_tenants.lease_termination_request import LeaseTerminationRequest
 from facility_service.app.models.leasing_tenants.leases import Lease
@@ -12,6 +14,10 @@ from facility_service.app.models.space_sites.space_occupancies import OccupancyS
 from facility_service.app.models.space_sites.space_occupancy_events import OccupancyEventType
 from facility_service.app.models.space_sites.spaces import Space
 from facility_service.app.models.system.notifications import Notification, NotificationType
+from facility_service.app.utils.access_event_partitions import (
+    drop_expired_access_event_partitions, ensure_access_event_partitions, rebuild_access_event_rollups)
+from facility_service.app.utils.occupancy_state import refresh_occupancy_state, stale_occupancy_state
+from shared.core.config import settings
 from shared.utils.enums import OwnershipStatus
 
 
@@ -119,6 +125,12 @@ def process_scheduled_occupancies(db: Session):
 
             print(f"Move-out completed: {occ.id}")
 
+        # Snapshot rows of the spaces changed above, plus scheduled
+        # move-outs whose date has come
+        refresh_occupancy_state(
+            db,
+            [occ.space_id for occ in move_ins + move_outs] + stale_occupancy_state(db)
+        )
         db.commit()
 
     except Exception as e:
@@ -262,6 +274,7 @@ def process_scheduled_terminations(db: Session):
             )
 
             db.add(move_out_request)
+            refresh_occupancy_state(db, [move_in.space_id])
 
             # notify tenant
             db.add(Notification(
@@ -273,3 +286,113 @@ def process_scheduled_terminations(db: Session):
             ))
 
     db.commit()
+
+
+def pm_work_order_job(db: Session):
+    """Daily PM run for all orgs: calendar templates due and meter thresholds crossed."""
+    try:
+        report = generate_pm_work_orders(db)
+        print(
+            f"PM work orders generated: {len(report['work_orders'])} "
+            f"({report['calendar']['templates_due']} templates due, "
+            f"{report['meter']['thresholds_crossed']} meter thresholds crossed)"
+        )
+        return report
+
+    except Exception as e:
+        db.rollback()
+        print("PM generation error:", e)
+
+    finally:
+        db.close()
+
+
+def inventory_snapshot_job(db: Session):
+    """Nightly: close yesterday's stock quantities and values from the ledger."""
+    try:
+        written = snapshot_inventory_stocks(db)
+        print(f"Inventory snapshot written for {written} stocks")
+        return written
+
+    except Exception as e:
+        db.rollback()
+        print("Inventory snapshot error:", e)
+
+    finally:
+        db.close()
+
+
+def access_event_maintenance_job(db: Session):
+    """
+    Nightly: create the coming months' access event partitions, drop the
+    ones past ACCESS_EVENT_RETENTION_MONTHS and reconcile yesterday's and
+    today's rollups with the events.
+    """
+    try:
+        created = ensure_access_event_partitions(db)
+        dropped = drop_expired_access_event_partitions(db)
+        rebuild_access_event_rollups(
+            db, datetime.now(timezone.utc).date() - timedelta(days=1))
+        print(f"Access event partitions created: {created}, dropped: {dropped}")
+        return {"created": created, "dropped": dropped}
+
+    except Exception as e:
+        db.rollback()
+        print("Access event maintenance error:", e)
+
+    finally:
+        db.close()
+
+
+def archive_old_notifications(db: Session):
+    """
+    Move read / deleted notifications older than NOTIFICATION_RETENTION_DAYS
+    into notifications_archive, one batch per transaction. Neither kind
+    counts as unread, so the counters are not touched.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS)
+    archived = 0
+
+    try:
+        while True:
+            moved = db.execute(text("""
+                WITH moved AS (
+                    DELETE FROM notifications
+                    WHERE id IN (
+                        SELECT id FROM notifications
+                        WHERE (read = true OR is_deleted = true)
+                          AND posted_date < :cutoff
+                        ORDER BY posted_date
+                        LIMIT :batch_size
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING id, user_id, type, title, message, posted_date,
+                              read, priority, is_deleted, is_email
+                )
+                INSERT INTO notifications_archive (
+                    id, user_id, type, title, message, posted_date,
+                    read, priority, is_deleted, is_email, archived_at
+                )
+                SELECT id, user_id, type, title, message, posted_date,
+                       read, priority, is_deleted, is_email, now()
+                FROM moved
+                ON CONFLICT (id) DO NOTHING
+            """), {
+                "cutoff": cutoff,
+                "batch_size": settings.NOTIFICATION_ARCHIVE_BATCH_SIZE,
+            }).rowcount
+            db.commit()
+
+            archived += moved
+            if moved < settings.NOTIFICATION_ARCHIVE_BATCH_SIZE:
+                break
+
+        print(f"Archived {archived} notifications older than {cutoff:%Y-%m-%d}")
+        return archived
+
+    except Exception as e:
+        db.rollback()
+        print("Notification archive error:", e)
+
+    finally:
+        db.close()
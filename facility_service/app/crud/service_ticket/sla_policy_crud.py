@@ -5,9 +5,8 @@ from uuid import UUID
 from typing import List, Optional
 from datetime import datetime
 
-from auth_service.app.models.user_organizations import UserOrganization
-from auth_service.app.models.user_organizations import UserOrganization
 from facility_service.app.models.space_sites.orgs import Org
+from shared.models.org_membership import OrgMembership
 from shared.models.users import Users
 from shared.helpers.json_response_helper import error_response
 from shared.utils.app_status_code import AppStatusCode
@@ -372,58 +371,43 @@ def contact_lookup(db: Session, auth_db: Session, org_id: UUID, site_id: Optiona
     if not site_id or not site_id.strip() or site_id.strip().lower() == "all":
         return []
 
-    # Step 1: Fetch staff users with roles for this site
+    # Step 1: Active staff of this site with roles, named from org_membership
     staff_sites = (
-        db.query(StaffSite.user_id, StaffSite.staff_role)
+        db.query(StaffSite.user_id, StaffSite.staff_role, OrgMembership.full_name)
+        .join(
+            OrgMembership,
+            and_(
+                OrgMembership.user_id == StaffSite.user_id,
+                OrgMembership.org_id == org_id
+            )
+        )
         .filter(
             StaffSite.org_id == org_id,
             StaffSite.site_id == site_id,
-            StaffSite.is_deleted == False
+            StaffSite.is_deleted == False,
+            OrgMembership.user_is_deleted.is_(False),
+            OrgMembership.user_status == "active"
         )
         .all()
     )
 
-    staff_user_ids = [s.user_id for s in staff_sites if s.user_id]
-    unique_staff_user_ids = list(set(staff_user_ids))
-    # Step 2: Fetch staff user names from auth_db
-    staff_users = []
-    if unique_staff_user_ids:
-        users = (
-            auth_db.query(Users.id, Users.full_name)
-            .filter(
-                Users.id.in_(unique_staff_user_ids),
-                Users.is_deleted == False,
-                Users.status == "active"
-            )
-            .all()
-        )
-
-        # Map user_id -> full_name
-        user_map = {u.id: u.full_name for u in users}
-
-        # Map user_id -> role
-        role_map = {s.user_id: s.staff_role for s in staff_sites}
+    # One entry per user (the last role wins, as before)
+    role_map = {s.user_id: s.staff_role for s in staff_sites}
+    name_map = {s.user_id: s.full_name for s in staff_sites}
+    staff_users = [
+        Lookup(id=user_id, name=f"{name_map[user_id]} ({role})")
+        for user_id, role in role_map.items()
+    ]
 
-        # Combine full name with role
-        staff_users = [
-            Lookup(
-                id=user_id,
-                name=f"{user_map.get(user_id, 'Unknown')} ({role_map.get(user_id, 'No Role')})"
-            )
-            for user_id in unique_staff_user_ids
-            if user_id in user_map
-        ]
-    # Step 3:
-    # Fetch all organization users with status='active'
+    # Step 2: All active organization accounts of the org
     org_users = (
-        auth_db.query(Users.id, Users.full_name)
-        .join(UserOrganization, UserOrganization.user_id == Users.id)
+        db.query(OrgMembership.user_id.label("id"), OrgMembership.full_name)
         .filter(
-            UserOrganization.org_id == org_id,
-            UserOrganization.account_type == UserAccountType.ORGANIZATION.value,  # ✅ Use enum value
-            UserOrganization.status == "active",
-            Users.status == "active",
-            Users.is_deleted == False
+            OrgMembership.org_id == org_id,
+            OrgMembership.account_type == UserAccountType.ORGANIZATION.value,
+            OrgMembership.status == "active",
+            OrgMembership.user_status == "active",
+            OrgMembership.user_is_deleted.is_(False)
         )
         .all()
     )
@@ -3,9 +3,8 @@ from sqlalchemy import func, case, and_
 from typing import List, Optional
 from sqlalchemy.orm import joinedload
 
-from auth_service.app.models.user_organizations import UserOrganization
 from shared.core.schemas import Lookup
-from shared.models.users import Users
+from shared.models.org_membership import OrgMembership
 from shared.utils.enums import UserAccountType
 from ...enum.ticket_service_enum import TicketStatus
 from ...models.service_ticket.tickets import Ticket
@@ -32,9 +31,7 @@ def get_team_workload_management(
     Get complete team workload management data - ONLY for staff assigned to this site
     """
     try:
-        from shared.models.users import Users
-
-        # 1. Get Available Technicians for this site (from StaffSite + Users)
+        # 1. Get Available Technicians for this site (from StaffSite + org_membership)
         available_technicians = get_available_technicians_for_site(
             db, auth_db, site_id, org_id)
         staff_user_ids = [tech.user_id for tech in available_technicians]
@@ -46,9 +43,17 @@ def get_team_workload_management(
             Ticket.status != TicketStatus.CLOSED  # Exclude closed tickets
         ]
 
+        # Assignee is a member of this org that is NOT an ORGANIZATION account
+        assignee_member = and_(
+            OrgMembership.user_id == Ticket.assigned_to,
+            OrgMembership.org_id == org_id,
+            OrgMembership.account_type != UserAccountType.ORGANIZATION.value
+        )
+
         # 2. Get Technician Workload Summary - ONLY NON-ADMIN/NON-ORGANIZATION site staff
         workload_query = db.query(
             Ticket.assigned_to,
+            OrgMembership.full_name,
             func.count(Ticket.id).label('total_tickets'),
             func.sum(case((Ticket.status == TicketStatus.OPEN, 1), else_=0)).label(
                 'open_tickets'),
@@ -56,42 +61,30 @@ def get_team_workload_management(
                 'in_progress_tickets'),
             func.sum(case((Ticket.status == TicketStatus.ESCALATED, 1), else_=0)).label(
                 'escalated_tickets')
+        ).join(
+            OrgMembership, assignee_member
         ).filter(
             *base_filter,
             Ticket.assigned_to.isnot(None),
             Ticket.assigned_to.in_(staff_user_ids)  # ✅ ONLY site staff
-        ).group_by(Ticket.assigned_to)
+        ).group_by(Ticket.assigned_to, OrgMembership.full_name)
 
         technicians_workload = []
         for workload in workload_query.all():
-            # Get technician name from auth database
-            user = auth_db.query(Users).join(
-                UserOrganization, UserOrganization.user_id == Users.id
-            ).filter(
-                Users.id == workload.assigned_to,
-                # ✅ Ensure user belongs to the correct organization
-                UserOrganization.org_id == org_id,
-                # ✅ Exclude ORGANIZATION and ADMIN users
-                UserOrganization.account_type.notin_(
-                    [UserAccountType.ORGANIZATION])
-            ).first()
-
-            # ✅ ONLY count if assignee is NOT ORGANIZATION and NOT ADMIN
-            if user:
-                technician_name = user.full_name if user else f"User {workload.assigned_to}"
-
-                technicians_workload.append(TechnicianWorkloadSummary(
-                    technician_id=workload.assigned_to,
-                    technician_name=technician_name,
-                    total_tickets=workload.total_tickets or 0,
-                    open_tickets=workload.open_tickets or 0,
-                    in_progress_tickets=workload.in_progress_tickets or 0,
-                    escalated_tickets=workload.escalated_tickets or 0
-                ))
+            technicians_workload.append(TechnicianWorkloadSummary(
+                technician_id=workload.assigned_to,
+                technician_name=workload.full_name or f"User {workload.assigned_to}",
+                total_tickets=workload.total_tickets or 0,
+                open_tickets=workload.open_tickets or 0,
+                in_progress_tickets=workload.in_progress_tickets or 0,
+                escalated_tickets=workload.escalated_tickets or 0
+            ))
 
         # 3. Get All Assigned Tickets - ONLY assigned to NON-ADMIN/NON-ORGANIZATION site staff
-        assigned_tickets_query = db.query(Ticket).options(
+        assigned_tickets_query = db.query(Ticket, OrgMembership.full_name).options(
             joinedload(Ticket.category)
+        ).join(
+            OrgMembership, assignee_member
         ).filter(
             *base_filter,
             Ticket.assigned_to.isnot(None),
@@ -100,85 +93,72 @@ def get_team_workload_management(
         ).order_by(Ticket.created_at.desc())
 
         assigned_tickets = []
-        for ticket in assigned_tickets_query.all():
-            # Get technician name from auth database
-            user = auth_db.query(Users).join(
-                UserOrganization, UserOrganization.user_id == Users.id
-            ).filter(
-                Users.id == ticket.assigned_to,
-                UserOrganization.org_id == org_id,
-                UserOrganization.account_type.notin_(
-                    [UserAccountType.ORGANIZATION])
-            ).first()
-
-            # ✅ ONLY include if assignee is NOT ORGANIZATION and NOT ADMIN type
-            if user:
-                technician_name = user.full_name if user else f"User {ticket.assigned_to}"
-
-                assigned_tickets.append(AssignedTicketOut(
-                    id=ticket.id,
-                    ticket_no=ticket.ticket_no,
-                    title=ticket.title,
-                    category=ticket.category.category_name if ticket.category else "Unknown",
-                    assigned_to=ticket.assigned_to,
-                    technician_name=technician_name,
-                    status=ticket.status.value if hasattr(
-                        ticket.status, 'value') else ticket.status,
-                    priority=ticket.priority,
-                    created_at=ticket.created_at,
-                    is_overdue=ticket.is_overdue,
-                    can_escalate=ticket.can_escalate
-                ))
+        for ticket, technician_name in assigned_tickets_query.all():
+            assigned_tickets.append(AssignedTicketOut(
+                id=ticket.id,
+                ticket_no=ticket.ticket_no,
+                title=ticket.title,
+                category=ticket.category.category_name if ticket.category else "Unknown",
+                assigned_to=ticket.assigned_to,
+                technician_name=technician_name or f"User {ticket.assigned_to}",
+                status=ticket.status.value if hasattr(
+                    ticket.status, 'value') else ticket.status,
+                priority=ticket.priority,
+                created_at=ticket.created_at,
+                is_overdue=ticket.is_overdue,
+                can_escalate=ticket.can_escalate
+            ))
 
         # 4. Get All "Unassigned" Tickets - Actually assigned to ADMIN/ORGANIZATION users
         # ✅ Since assigned_to is never NULL, "unassigned" means assigned to ADMIN/ORGANIZATION
         unassigned_tickets_query = db.query(Ticket).options(
             joinedload(Ticket.category).joinedload(TicketCategory.sla_policy)
+        ).join(
+            OrgMembership, assignee_member
         ).filter(
             *base_filter,
             Ticket.status == TicketStatus.OPEN,  # Typically "unassigned" tickets are OPEN
             Ticket.assigned_to.isnot(None)  # All tickets have assignee
         ).order_by(Ticket.created_at.desc())
+        unassigned = unassigned_tickets_query.all()
+
+        # Default contact names from SLA, one lookup for the whole list
+        default_contacts = {
+            ticket.category.sla_policy.default_contact
+            for ticket in unassigned
+            if ticket.category and ticket.category.sla_policy
+            and ticket.category.sla_policy.default_contact
+        }
+        contact_names = {}
+        if default_contacts:
+            contact_names = dict(
+                db.query(OrgMembership.user_id, OrgMembership.full_name)
+                .filter(
+                    OrgMembership.user_id.in_(default_contacts),
+                    OrgMembership.org_id == org_id
+                )
+                .all()
+            )
 
         unassigned_tickets = []
-        for ticket in unassigned_tickets_query.all():
-            # Get the assigned user
-            assigned_user = auth_db.query(Users).join(
-                UserOrganization, UserOrganization.user_id == Users.id
-            ).filter(
-                Users.id == ticket.assigned_to,
-                UserOrganization.org_id == org_id,
-                UserOrganization.account_type.notin_(
-                    # Exclude ORGANIZATION users
-                    [UserAccountType.ORGANIZATION])
-            ).first()
-
-            # ✅ CORRECTED: Only include tickets assigned to organization/admin users
-            if assigned_user:
-                # Get default contact from SLA
-                default_contact = None
-                default_contact_name = None
-                if ticket.category and ticket.category.sla_policy:
-                    default_contact = ticket.category.sla_policy.default_contact
-                    if default_contact:
-                        default_user = auth_db.query(Users).filter(
-                            Users.id == default_contact
-                        ).first()
-                        default_contact_name = default_user.full_name if default_user else None
-
-                unassigned_tickets.append(UnassignedTicketOut(
-                    id=ticket.id,
-                    ticket_no=ticket.ticket_no,
-                    title=ticket.title,
-                    category=ticket.category.category_name if ticket.category else "Unknown",
-                    status=ticket.status.value if hasattr(
-                        ticket.status, 'value') else ticket.status,
-                    priority=ticket.priority,
-                    created_at=ticket.created_at,
-                    is_overdue=ticket.is_overdue,
-                    default_contact=default_contact,
-                    default_contact_name=default_contact_name
-                ))
+        for ticket in unassigned:
+            default_contact = None
+            if ticket.category and ticket.category.sla_policy:
+                default_contact = ticket.category.sla_policy.default_contact
+
+            unassigned_tickets.append(UnassignedTicketOut(
+                id=ticket.id,
+                ticket_no=ticket.ticket_no,
+                title=ticket.title,
+                category=ticket.category.category_name if ticket.category else "Unknown",
+                status=ticket.status.value if hasattr(
+                    ticket.status, 'value') else ticket.status,
+                priority=ticket.priority,
+                created_at=ticket.created_at,
+                is_overdue=ticket.is_overdue,
+                default_contact=default_contact,
+                default_contact_name=contact_names.get(default_contact)
+            ))
         return TeamWorkloadManagementResponse(
             technicians_workload=technicians_workload,
             assigned_tickets=assigned_tickets,
@@ -204,41 +184,37 @@ def get_available_technicians_for_site(
     """
     try:
 
-        # Step 1: Get all user_ids from staff_sites for this site_id and org_id
-        staff_sites = (
-            db.query(StaffSite)
-            .filter(
+        # Site staff joined with their org membership for the contact details
+        users = (
+            db.query(
+                OrgMembership.user_id,
+                OrgMembership.full_name,
+                OrgMembership.email,
+                OrgMembership.phone
+            )
+            .join(
+                StaffSite,
                 and_(
+                    StaffSite.user_id == OrgMembership.user_id,
                     StaffSite.site_id == site_id,
                     StaffSite.org_id == org_id,
                     StaffSite.is_deleted == False
                 )
             )
+            .filter(OrgMembership.org_id == org_id)
+            .distinct()
             .all()
         )
 
-        if not staff_sites:
-            return []  # No staff assigned to this site
-
-        # Step 2: Extract user_ids
-        user_ids = [staff.user_id for staff in staff_sites]
-
-        # Step 3: Fetch all user details from auth db
-        users = (
-            auth_db.query(Users.id, Users.full_name, Users.email, Users.phone)
-            .filter(Users.id.in_(user_ids))
-            .all()
-        )
-
-        # Step 4: Return as TechnicianOut objects
-        available_technicians = []
-        for user in users:
-            available_technicians.append(TechnicianOut(
-                user_id=user.id,
+        available_technicians = [
+            TechnicianOut(
+                user_id=user.user_id,
                 full_name=user.full_name,
                 email=user.email,
                 phone=user.phone
-            ))
+            )
+            for user in users
+        ]
 
         return available_technicians
 
@@ -251,37 +227,26 @@ def workload_assigned_to_lookup(db: Session, auth_db: Session, site_id: Optional
     if not site_id or not site_id.strip() or site_id.strip().lower() == "all":
         return []
 
+    # Active site staff with their names from the org_membership projection
     staff_sites = (
-        db.query(StaffSite.user_id, StaffSite.staff_role)
+        db.query(StaffSite.user_id, StaffSite.staff_role, OrgMembership.full_name)
+        .join(
+            OrgMembership,
+            and_(
+                OrgMembership.user_id == StaffSite.user_id,
+                OrgMembership.org_id == StaffSite.org_id
+            )
+        )
         .filter(
             StaffSite.site_id == site_id,
-            StaffSite.is_deleted == False
+            StaffSite.is_deleted == False,
+            OrgMembership.user_is_deleted.is_(False),
+            OrgMembership.user_status == "active"
         )
         .all()
     )
 
-    staff_user_ids = [s.user_id for s in staff_sites if s.user_id]
-    staff_users = []
-    if staff_user_ids:
-        users = (
-            auth_db.query(Users.id, Users.full_name)
-            .filter(
-                Users.id.in_(staff_user_ids),
-                Users.is_deleted == False,
-                Users.status == "active"
-            )
-            .all()
-        )
-
-        user_map = {u.id: u.full_name for u in users}
-        role_map = {s.user_id: s.staff_role for s in staff_sites}
-        staff_users = [
-            Lookup(
-                id=user_id,
-                name=f"{user_map.get(user_id, 'Unknown')} ({role_map.get(user_id, 'No Role')})"
-            )
-            for user_id in staff_user_ids
-            if user_id in user_map
-        ]
-
-    return staff_users
+    return [
+        Lookup(id=s.user_id, name=f"{s.full_name} ({s.staff_role})")
+        for s in staff_sites
+    ]
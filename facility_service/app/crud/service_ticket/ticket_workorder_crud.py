@@ -3,12 +3,12 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
 from uuid import UUID
 from typing import List, Optional, Dict, Any
-from datetime import datetime
 
 from facility_service.app.crud.service_ticket.tickets_crud import fetch_role_admin
 from facility_service.app.models.financials.tax_codes import TaxCode
 from facility_service.app.models.maintenance_assets import work_order
-from facility_service.app.models.system.notifications import Notification, NotificationType, PriorityType
+from facility_service.app.crud.system.notification_service import NotificationService
+from facility_service.app.models.system.notifications import NotificationType, PriorityType
 from shared.helpers.user_helper import get_user_name
 
 from ...models.procurement.vendors import Vendor
@@ -306,21 +306,13 @@ def create_ticket_work_order(
     recipient_ids = list(set(recipient_ids))
 
     # Create notifications
-    notifications = []
-    for recipient_id in recipient_ids:
-        notification = Notification(
-            user_id=recipient_id,
-            type=NotificationType.alert,
-            title="Work Order Created",
-            message=f"Work order created for Ticket {ticket.ticket_no} by {action_by_name}",
-            posted_date=datetime.utcnow(),
-            priority=PriorityType(ticket.priority),
-            read=False,
-            is_deleted=False
-        )
-        notifications.append(notification)
+    NotificationService.bulk_publish(db, recipient_ids, {
+        "type": NotificationType.alert,
+        "title": "Work Order Created",
+        "message": f"Work order created for Ticket {ticket.ticket_no} by {action_by_name}",
+        "priority": PriorityType(ticket.priority),
+    })
 
-    db.add_all(notifications)
     db.commit()
 
     # ---------------- END NOTIFICATION LOGIC ---------------- #
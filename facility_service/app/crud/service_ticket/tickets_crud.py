@@ -20,6 +20,7 @@ from shared.helpers.email_helper import EmailHelper
 from shared.utils.enums import UserAccountType
 from ...schemas.system.notifications_schemas import NotificationType, PriorityType
 from ...models.system.notifications import Notification
+from ..system.notification_service import NotificationService
 from ...enum.ticket_service_enum import TicketStatus
 from ...models.leasing_tenants.tenants import Tenant
 from ...models.service_ticket.tickets_category import TicketCategory
@@ -37,8 +38,10 @@ from ...models.service_ticket.tickets import Ticket
 from ...models.service_ticket.tickets_workflow import TicketWorkflow
 from shared.utils.app_status_code import AppStatusCode
 from shared.helpers.json_response_helper import error_response, success_response
+from shared.helpers.search_helper import search_filter
 from ...schemas.service_ticket.tickets_schemas import AddCommentRequest, AddFeedbackRequest, AddReactionRequest, PossibleStatusesResponse, StatusOption, TicketActionRequest, TicketAdminRoleRequest, TicketAssignedToRequest, TicketCommentOut, TicketCommentRequest, TicketCreate, TicketDetailsResponse,  TicketFilterRequest, TicketOut, TicketReactionRequest, TicketUpdateRequest, TicketVendorRequest, TicketWorkFlowOut
 from sqlalchemy import or_, and_
+from shared.helpers.reference_cache import cached_reference, invalidate_on_change
 
 def build_ticket_filters(
     db: Session,
@@ -80,14 +83,10 @@ def build_ticket_filters(
     # -------------------------------------------------
     # FILTER: SEARCH (ticket no, title, description)
     # -------------------------------------------------
-    if params.search:
-        search_term = f"%{params.search.lower()}%"
-        filters.append(
-            or_(
-                func.lower(Ticket.ticket_no).like(search_term),
-                func.lower(Ticket.title).like(search_term),
-            )
-        )
+    search_condition = search_filter(
+        params.search, Ticket.ticket_no, Ticket.title)
+    if search_condition is not None:
+        filters.append(search_condition)
 
     # -------------------------------------------------
     # FILTER: PRIORITY
@@ -594,6 +593,11 @@ async def create_ticket(
     )
     session.add(workflow_log)
 
+    # email
+    if assigned_to_user:
+        send_ticket_created_email(
+            session, new_ticket, created_by_user, assigned_to_user)
+
     session.commit()
     session.refresh(new_ticket)
 
@@ -620,11 +624,6 @@ async def create_ticket(
         )
         if vendor:
             vendor_name = vendor.name or ""  # Replace with actual vendor name field
-    # email
-    if assigned_to_user:
-        send_ticket_created_email(
-            background_tasks, session, new_ticket, created_by_user, assigned_to_user)
-
     return TicketOut.model_validate(
         {
             **new_ticket.__dict__,
@@ -735,19 +734,12 @@ def escalate_ticket(
     recipient_ids = list(set(recipient_ids))
 
     # Create notifications for all recipients (instead of just one)
-    notifications = []
-    for recipient_id in recipient_ids:
-        notification = Notification(
-            user_id=recipient_id,
-            type=NotificationType.alert,
-            title="Ticket Escalated",
-            message=f"Ticket {ticket.ticket_no} have been escalated & assigned to {assigned_to_user} by {action_by_name}",
-            posted_date=datetime.utcnow(),
-            priority=PriorityType(ticket.priority),
-            read=False,
-            is_deleted=False
-        )
-        notifications.append(notification)
+    NotificationService.bulk_publish(db, recipient_ids, {
+        "type": NotificationType.alert,
+        "title": "Ticket Escalated",
+        "message": f"Ticket {ticket.ticket_no} have been escalated & assigned to {assigned_to_user} by {action_by_name}",
+        "priority": PriorityType(ticket.priority),
+    })
 
     # Workflow Log
     workflow_log = TicketWorkflow(
@@ -758,7 +750,7 @@ def escalate_ticket(
         action_taken=f"Ticket {ticket.ticket_no} escalated & assigned to {assigned_to_user}"
     )
 
-    objects_to_add = [assignment_log, workflow_log] + notifications
+    objects_to_add = [assignment_log, workflow_log]
 
     # Comment Log
     if data.comment:
@@ -769,8 +761,6 @@ def escalate_ticket(
         ))
 
     db.add_all(objects_to_add)
-    db.commit()
-    db.refresh(ticket)
 
     # email
     emails = (
@@ -779,8 +769,9 @@ def escalate_ticket(
         .all()
     )
     email_list = [e[0] for e in emails]
-    send_ticket_escalated_email(
-        background_tasks, db, ticket, assigned_to_user, email_list)
+    send_ticket_escalated_email(db, ticket, assigned_to_user, email_list)
+    db.commit()
+    db.refresh(ticket)
 
     updated_ticket = TicketOut.model_validate(
         {
@@ -890,22 +881,15 @@ async def resolve_ticket(
     recipient_ids = list(set(recipient_ids))
 
     # Create notifications for all recipients (instead of just one)
-    notifications = []
-    for recipient_id in recipient_ids:
-        notification = Notification(
-            user_id=recipient_id,
-            type=NotificationType.alert,
-            title="Ticket Closed",
-            message=f"Ticket {ticket.ticket_no} closed by {action_by_user.full_name}",
-            posted_date=datetime.utcnow(),
-            priority=PriorityType(ticket.priority),
-            read=False,
-            is_deleted=False
-        )
-        notifications.append(notification)
+    NotificationService.bulk_publish(db, recipient_ids, {
+        "type": NotificationType.alert,
+        "title": "Ticket Closed",
+        "message": f"Ticket {ticket.ticket_no} closed by {action_by_user.full_name}",
+        "priority": PriorityType(ticket.priority),
+    })
 
      # Prepare all objects to add
-    objects_to_add = [workflow_log] + notifications
+    objects_to_add = [workflow_log]
 
     # Comment Log
     if data.comment:
@@ -916,8 +900,6 @@ async def resolve_ticket(
         ))
 
     db.add_all(objects_to_add)
-    db.commit()
-    db.refresh(ticket)
 
     # email
     emails = (
@@ -933,7 +915,9 @@ async def resolve_ticket(
         "feedback": data.comment if data.comment else 'NA'
     }
 
-    send_ticket_closed_email(background_tasks, db, context, email_list)
+    send_ticket_closed_email(db, context, email_list)
+    db.commit()
+    db.refresh(ticket)
 
     updated_ticket = TicketOut.model_validate(
         {
@@ -1017,21 +1001,14 @@ def reopen_ticket(
     recipient_ids = list(set(recipient_ids))
 
     # Create notifications for all recipients
-    notifications = []
-    for recipient_id in recipient_ids:
-        notification = Notification(
-            user_id=recipient_id,
-            type=NotificationType.alert,
-            title="Ticket Reopened",
-            message=f"Ticket {ticket.ticket_no} reopened by {action_by_user.full_name}",
-            posted_date=datetime.utcnow(),
-            priority=PriorityType(ticket.priority),
-            read=False,
-            is_deleted=False
-        )
-        notifications.append(notification)
+    NotificationService.bulk_publish(db, recipient_ids, {
+        "type": NotificationType.alert,
+        "title": "Ticket Reopened",
+        "message": f"Ticket {ticket.ticket_no} reopened by {action_by_user.full_name}",
+        "priority": PriorityType(ticket.priority),
+    })
 
-    objects_to_add = [workflow_log] + notifications
+    objects_to_add = [workflow_log]
 
     if data.comment:
         objects_to_add.append(TicketComment(
@@ -1041,8 +1018,6 @@ def reopen_ticket(
         ))
 
     db.add_all(objects_to_add)
-    db.commit()
-    db.refresh(ticket)
 
     # Email
     emails = (
@@ -1058,7 +1033,9 @@ def reopen_ticket(
         "ticket_no": ticket.ticket_no
     }
 
-    send_ticket_reopened_email(background_tasks, db, context, email_list)
+    send_ticket_reopened_email(db, context, email_list)
+    db.commit()
+    db.refresh(ticket)
 
     updated_ticket = TicketOut.model_validate(
         {
@@ -1142,21 +1119,14 @@ def on_hold_ticket(
     recipient_ids = list(set(recipient_ids))
 
     # Create notifications for all recipients
-    notifications = []
-    for recipient_id in recipient_ids:
-        notification = Notification(
-            user_id=recipient_id,
-            type=NotificationType.alert,
-            title="Ticket On hold",
-            message=f"Ticket {ticket.ticket_no} put on hold by {action_by_user.full_name}",
-            posted_date=datetime.utcnow(),
-            priority=PriorityType(ticket.priority),
-            read=False,
-            is_deleted=False
-        )
-        notifications.append(notification)
+    NotificationService.bulk_publish(db, recipient_ids, {
+        "type": NotificationType.alert,
+        "title": "Ticket On hold",
+        "message": f"Ticket {ticket.ticket_no} put on hold by {action_by_user.full_name}",
+        "priority": PriorityType(ticket.priority),
+    })
 
-    objects_to_add = [workflow_log] + notifications
+    objects_to_add = [workflow_log]
 
     if data.comment:
         objects_to_add.append(TicketComment(
@@ -1166,8 +1136,6 @@ def on_hold_ticket(
         ))
 
     db.add_all(objects_to_add)
-    db.commit()
-    db.refresh(ticket)
 
     # Email
     emails = (
@@ -1183,7 +1151,9 @@ def on_hold_ticket(
         "ticket_no": ticket.ticket_no
     }
 
-    send_ticket_onhold_email(background_tasks, db, context, email_list)
+    send_ticket_onhold_email(db, context, email_list)
+    db.commit()
+    db.refresh(ticket)
 
     updated_ticket = TicketOut.model_validate(
         {
@@ -1266,21 +1236,14 @@ def return_ticket(background_tasks: BackgroundTasks, db: Session, auth_db: Sessi
     recipient_ids = list(set(recipient_ids))
 
     # Create notifications for all recipients
-    notifications = []
-    for recipient_id in recipient_ids:
-        notification = Notification(
-            user_id=recipient_id,
-            type=NotificationType.alert,
-            title="Ticket Returned",
-            message=f"Ticket {ticket.ticket_no} put on returned by {action_by_user.full_name}",
-            posted_date=datetime.utcnow(),
-            priority=PriorityType(ticket.priority),
-            read=False,
-            is_deleted=False
-        )
-        notifications.append(notification)
+    NotificationService.bulk_publish(db, recipient_ids, {
+        "type": NotificationType.alert,
+        "title": "Ticket Returned",
+        "message": f"Ticket {ticket.ticket_no} put on returned by {action_by_user.full_name}",
+        "priority": PriorityType(ticket.priority),
+    })
 
-    objects_to_add = [workflow, assignment] + notifications
+    objects_to_add = [workflow, assignment]
 
     if data.comment:
         objects_to_add.append(TicketComment(
@@ -1290,8 +1253,6 @@ def return_ticket(background_tasks: BackgroundTasks, db: Session, auth_db: Sessi
         ))
 
     db.add_all(objects_to_add)
-    db.commit()
-    db.refresh(ticket)
 
     # Email
     emails = (
@@ -1307,7 +1268,9 @@ def return_ticket(background_tasks: BackgroundTasks, db: Session, auth_db: Sessi
         "ticket_no": ticket.ticket_no
     }
 
-    send_ticket_return_email(background_tasks, db, context, email_list)
+    send_ticket_return_email(db, context, email_list)
+    db.commit()
+    db.refresh(ticket)
 
     updated_ticket = TicketOut.model_validate(
         {
@@ -1377,7 +1340,7 @@ def add_feedback(payload: AddFeedbackRequest, db: Session):
     return {"message": "Feedback recorded", "feedback_id": feedback.id}
 
 
-def send_ticket_created_email(background_tasks, db, new_ticket, created_by_user, assigned_to_user):
+def send_ticket_created_email(db, new_ticket, created_by_user, assigned_to_user):
     email_helper = EmailHelper()
 
     recipients = [created_by_user.email, assigned_to_user.email]
@@ -1389,8 +1352,7 @@ def send_ticket_created_email(background_tasks, db, new_ticket, created_by_user,
         "created_by_name": created_by_user.full_name,
     }
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="ticket_created",
         recipients=recipients,
@@ -1399,7 +1361,7 @@ def send_ticket_created_email(background_tasks, db, new_ticket, created_by_user,
     )
 
 
-def send_ticket_escalated_email(background_tasks, db, ticket, assigned_to_name, recipients):
+def send_ticket_escalated_email(db, ticket, assigned_to_name, recipients):
     email_helper = EmailHelper()
 
     context = {
@@ -1408,8 +1370,7 @@ def send_ticket_escalated_email(background_tasks, db, ticket, assigned_to_name,
         "ticket_no": ticket.ticket_no
     }
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="ticket_escalated",
         recipients=recipients,
@@ -1418,11 +1379,10 @@ def send_ticket_escalated_email(background_tasks, db, ticket, assigned_to_name,
     )
 
 
-def send_ticket_closed_email(background_tasks, db, data, recipients):
+def send_ticket_closed_email(db, data, recipients):
     email_helper = EmailHelper()
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="ticket_closed",
         recipients=recipients,
@@ -1431,11 +1391,10 @@ def send_ticket_closed_email(background_tasks, db, data, recipients):
     )
 
 
-def send_ticket_reopened_email(background_tasks, db, data, recipients):
+def send_ticket_reopened_email(db, data, recipients):
     email_helper = EmailHelper()
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="ticket_reopened",
         recipients=recipients,
@@ -1444,11 +1403,10 @@ def send_ticket_reopened_email(background_tasks, db, data, recipients):
     )
 
 
-def send_ticket_onhold_email(background_tasks, db, data, recipients):
+def send_ticket_onhold_email(db, data, recipients):
     email_helper = EmailHelper()
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="ticket_on_hold",
         recipients=recipients,
@@ -1457,11 +1415,10 @@ def send_ticket_onhold_email(background_tasks, db, data, recipients):
     )
 
 
-def send_ticket_return_email(background_tasks, db, data, recipients):
+def send_ticket_return_email(db, data, recipients):
     email_helper = EmailHelper()
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="ticket_return",
         recipients=recipients,
@@ -1470,11 +1427,10 @@ def send_ticket_return_email(background_tasks, db, data, recipients):
     )
 
 
-def send_ticket_update_status_email(background_tasks, db, data, recipients):
+def send_ticket_update_status_email(db, data, recipients):
     email_helper = EmailHelper()
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="ticket_update_status",
         recipients=recipients,
@@ -1483,11 +1439,10 @@ def send_ticket_update_status_email(background_tasks, db, data, recipients):
     )
 
 
-def send_ticket_update_assigned_to_email(background_tasks, db, data, recipients):
+def send_ticket_update_assigned_to_email(db, data, recipients):
     email_helper = EmailHelper()
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="ticket_update_assigned_to",
         recipients=recipients,
@@ -1496,11 +1451,10 @@ def send_ticket_update_assigned_to_email(background_tasks, db, data, recipients)
     )
 
 
-def send_ticket_post_comment_email(background_tasks, db, data, recipients):
+def send_ticket_post_comment_email(db, data, recipients):
     email_helper = EmailHelper()
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="ticket_post_comment",
         recipients=recipients,
@@ -1769,27 +1723,16 @@ def update_ticket_status(
 
     recipient_ids = list(set(recipient_ids))
 
-    notifications = []
-    for recipient_id in recipient_ids:
-        notification = Notification(
-            user_id=recipient_id,
-            type=NotificationType.alert,
-            title=f"Ticket {data.new_status.value.capitalize()}",
-            message=f"Ticket {ticket.ticket_no} marked as {data.new_status.value} by {action_by_name}",
-            posted_date=datetime.utcnow(),
-            priority=PriorityType(ticket.priority),
-            read=False,
-            is_deleted=False
-        )
-        notifications.append(notification)
+    NotificationService.bulk_publish(db, recipient_ids, {
+        "type": NotificationType.alert,
+        "title": f"Ticket {data.new_status.value.capitalize()}",
+        "message": f"Ticket {ticket.ticket_no} marked as {data.new_status.value} by {action_by_name}",
+        "priority": PriorityType(ticket.priority),
+    })
 
-    objects_to_add = [workflow_log] + notifications
+    objects_to_add = [workflow_log]
 
     db.add_all(objects_to_add)
-    db.commit()
-    db.refresh(ticket)
- # ✅ ADDED: Refresh workflow log to get ID
-    db.refresh(workflow_log)
     action_by_name = action_by_user.full_name if action_by_user else "System User"
 
     # Email
@@ -1807,7 +1750,11 @@ def update_ticket_status(
         "new_status": data.new_status.value,
     }
 
-    send_ticket_update_status_email(background_tasks, db, context, email_list)
+    send_ticket_update_status_email(db, context, email_list)
+    db.commit()
+    db.refresh(ticket)
+    # ✅ ADDED: Refresh workflow log to get ID
+    db.refresh(workflow_log)
     # Response
     updated_ticket = TicketOut.model_validate(
         {
@@ -1959,20 +1906,12 @@ def update_ticket_assigned_to(
 
     recipient_ids = list(set(recipient_ids))
 
-    notifications = []
-
-    for recipient_id in recipient_ids:
-        notification = Notification(
-            user_id=recipient_id,
-            type=NotificationType.alert,
-            title="Ticket Assigned",
-            message=f"You have been assigned ticket {ticket.ticket_no}: {ticket.title}",
-            posted_date=datetime.utcnow(),
-            priority=PriorityType(ticket.priority),
-            read=False,
-            is_deleted=False
-        )
-        notifications.append(notification)
+    NotificationService.bulk_publish(session, recipient_ids, {
+        "type": NotificationType.alert,
+        "title": "Ticket Assigned",
+        "message": f"You have been assigned ticket {ticket.ticket_no}: {ticket.title}",
+        "priority": PriorityType(ticket.priority),
+    })
 
     # Workflow Log
     workflow_log = TicketWorkflow(
@@ -1984,13 +1923,9 @@ def update_ticket_assigned_to(
         action_taken=f"Ticket assigned to {assigned_to_user.full_name} by {action_by_user.full_name if action_by_user else 'Unknown User'}"
     )
 
-    objects_to_add = [workflow_log, assignment_log] + notifications
+    objects_to_add = [workflow_log, assignment_log]
 
     session.add_all(objects_to_add)
-    session.commit()
-    session.refresh(ticket)
-    # ✅ ADD THIS - Refresh workflow log to get ID
-    session.refresh(workflow_log)
 
     # Email
     emails = (
@@ -2006,8 +1941,11 @@ def update_ticket_assigned_to(
         "assigned_by": action_by_user.full_name if action_by_user else "Unknown User"
     }
 
-    send_ticket_update_assigned_to_email(
-        background_tasks, session, context, email_list)
+    send_ticket_update_assigned_to_email(session, context, email_list)
+    session.commit()
+    session.refresh(ticket)
+    # ✅ ADD THIS - Refresh workflow log to get ID
+    session.refresh(workflow_log)
 
     # Response
     updated_ticket = TicketOut.model_validate(
@@ -2087,26 +2025,16 @@ def post_ticket_comment(background_tasks: BackgroundTasks, session: Session, aut
 
     recipient_ids = list(set(recipient_ids))
 
-    notifications = []
-
-    for recipient_id in recipient_ids:
-        notification = Notification(
-            user_id=recipient_id,
-            type=NotificationType.alert,
-            title="New Comment on Ticket",
-            message=f"{current_user_details.full_name if current_user_details else 'User'} commented on ticket {ticket.ticket_no}: {data.comment[:50]}...",
-            posted_date=datetime.utcnow(),
-            priority=PriorityType(ticket.priority),
-            read=False,
-            is_deleted=False
-        )
-        notifications.append(notification)
+    NotificationService.bulk_publish(session, recipient_ids, {
+        "type": NotificationType.alert,
+        "title": "New Comment on Ticket",
+        "message": f"{current_user_details.full_name if current_user_details else 'User'} commented on ticket {ticket.ticket_no}: {data.comment[:50]}...",
+        "priority": PriorityType(ticket.priority),
+    })
 
-    objects_to_add = [comment] + notifications
+    objects_to_add = [comment]
 
     session.add_all(objects_to_add)
-    session.commit()
-    session.refresh(ticket)
 
     # Get assigned_to user details
     assigned_to_user = None
@@ -2132,8 +2060,9 @@ def post_ticket_comment(background_tasks: BackgroundTasks, session: Session, aut
         "comment": data.comment
     }
 
-    send_ticket_post_comment_email(
-        background_tasks, session, context, email_list)
+    send_ticket_post_comment_email(session, context, email_list)
+    session.commit()
+    session.refresh(ticket)
 
     return success_response(
         data=TicketWorkFlowOut(
@@ -2401,6 +2330,10 @@ def fetch_role_admin(session: Session, org_id):
     return data
 
 
+invalidate_on_change(Ticket, "ticket_priorities")
+
+
+@cached_reference("ticket_priorities")
 def tickets_filter_priority_lookup(db: Session, org_id: str) -> List[Dict]:
     """
     Get distinct priority values for filter dropdown
@@ -2419,6 +2352,10 @@ def tickets_filter_priority_lookup(db: Session, org_id: str) -> List[Dict]:
     return [{"id": r.id, "name": r.name} for r in rows]
 
 
+invalidate_on_change(Ticket, "ticket_statuses")
+
+
+@cached_reference("ticket_statuses")
 def tickets_filter_status_lookup(db: Session, org_id: str) -> List[Dict]:
     """
     Get distinct status values for filter dropdown
@@ -2522,21 +2459,13 @@ def update_ticket_vendor(background_tasks: BackgroundTasks, session: Session, au
 
     recipient_ids = list(set(recipient_ids))
 
-    notifications = []
-
-    for recipient_id in recipient_ids:
-        notification = Notification(
-            user_id=recipient_id,
-            type=NotificationType.alert,
-            title="Vendor Assigned to Ticket",  # Different title
-            # Different message
-            message=f"Vendor {vendor.name} has been assigned to ticket {ticket.ticket_no}: {ticket.title}",
-            posted_date=datetime.utcnow(),
-            priority=PriorityType(ticket.priority),
-            read=False,
-            is_deleted=False
-        )
-        notifications.append(notification)
+    NotificationService.bulk_publish(session, recipient_ids, {
+        "type": NotificationType.alert,
+        "title": "Vendor Assigned to Ticket",  # Different title
+        # Different message
+        "message": f"Vendor {vendor.name} has been assigned to ticket {ticket.ticket_no}: {ticket.title}",
+        "priority": PriorityType(ticket.priority),
+    })
 
     # Workflow Log - EXACTLY same pattern
     workflow_log = TicketWorkflow(
@@ -2548,12 +2477,9 @@ def update_ticket_vendor(background_tasks: BackgroundTasks, session: Session, au
         action_taken=f"Vendor {vendor.name} assigned by {action_by_user.full_name if action_by_user else 'Unknown User'}"
     )
 
-    objects_to_add = [workflow_log, vendor_assignment_log] + notifications
+    objects_to_add = [workflow_log, vendor_assignment_log]
 
     session.add_all(objects_to_add)
-    session.commit()
-    session.refresh(ticket)
-    session.refresh(workflow_log)
 
     # Email - EXACTLY same pattern
     emails = (
@@ -2569,8 +2495,10 @@ def update_ticket_vendor(background_tasks: BackgroundTasks, session: Session, au
         "assigned_by": action_by_user.full_name if action_by_user else "System User"
     }
 
-    send_ticket_update_vendor_email(
-        background_tasks, session, context, email_list)
+    send_ticket_update_vendor_email(session, context, email_list)
+    session.commit()
+    session.refresh(ticket)
+    session.refresh(workflow_log)
 
     # Response - EXACTLY same pattern
     updated_ticket = TicketOut.model_validate(
@@ -2603,11 +2531,10 @@ def update_ticket_vendor(background_tasks: BackgroundTasks, session: Session, au
     }
 
 
-def send_ticket_update_vendor_email(background_tasks, db, data, recipients):
+def send_ticket_update_vendor_email(db, data, recipients):
     email_helper = EmailHelper()
 
-    background_tasks.add_task(
-        email_helper.send_email,
+    email_helper.queue_email(
         db=db,
         template_code="ticket_update_vendor",  # Different template code
         recipients=recipients,
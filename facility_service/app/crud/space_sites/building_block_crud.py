@@ -8,7 +8,7 @@ from uuid import UUID
 from fastapi import HTTPException
 
 from shared.core.schemas import UserToken
-from shared.helpers.property_helper import get_allowed_buildings, get_allowed_sites
+from shared.helpers.property_helper import allowed_building_ids_query, get_allowed_sites
 from shared.utils.app_status_code import AppStatusCode
 from shared.helpers.json_response_helper import error_response
 from shared.utils.enums import UserAccountType
@@ -23,11 +23,7 @@ def get_buildings(db: Session, user: UserToken, params: BuildingRequest):
     allowed_building_ids = None
 
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_buildings = get_allowed_buildings(db, user)
-        allowed_building_ids = [b["building_id"] for b in allowed_buildings]
-
-        if not allowed_building_ids:
-            return {"buildings": [], "total": 0}
+        allowed_building_ids = allowed_building_ids_query(user)
 
     now = datetime.utcnow()
 
@@ -209,11 +205,7 @@ def get_building_lookup(db: Session, site_id: str, user: UserToken):
     allowed_building_ids = None
 
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_buildings = get_allowed_buildings(db, user)
-        allowed_building_ids = [b["building_id"] for b in allowed_buildings]
-
-        if not allowed_building_ids:
-            return {"buildings": [], "total": 0}
+        allowed_building_ids = allowed_building_ids_query(user)
 
     building_query = (
         db.query(Building.id, Building.name)
@@ -5,7 +5,7 @@ from typing import Dict, List, Optional
 from datetime import date, datetime, timedelta
 from fastapi import HTTPException
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import Integer, and_, exists, func, cast, literal, or_, case
+from sqlalchemy import Integer, and_, exists, func, cast, insert, literal, or_, case, select
 from sqlalchemy.dialects.postgresql import UUID
 
 from facility_service.app.enum.space_sites_enum import OwnerMaintenanceStatus
@@ -21,9 +21,11 @@ from ...models.space_sites.owner_maintenances import OwnerMaintenanceCharge
 from shared.core.schemas import Lookup, UserToken
 from ...models.space_sites.sites import Site
 from ...models.space_sites.spaces import Space
-from ...schemas.space_sites.owner_maintenances_schemas import OwnerMaintenanceBySpaceRequest, OwnerMaintenanceBySpaceResponse, OwnerMaintenanceCreate, OwnerMaintenanceListResponse, OwnerMaintenanceOut, OwnerMaintenanceRequest, OwnerMaintenanceUpdate
+from ...schemas.space_sites.owner_maintenances_schemas import OwnerMaintenanceBySpaceRequest, OwnerMaintenanceBySpaceResponse, OwnerMaintenanceCreate, OwnerMaintenanceGenerateResponse, OwnerMaintenanceListResponse, OwnerMaintenanceOut, OwnerMaintenanceRequest, OwnerMaintenanceUpdate
 import uuid
 
+GENERATION_CHUNK_SIZE = 1000
+
 
 def build_owner_maintenance_filters(org_id: UUID, params: OwnerMaintenanceRequest):
     """Build filters for owner maintenance queries"""
@@ -730,97 +732,134 @@ def get_owner_maintenances_by_space(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-def auto_generate_owner_maintenance(db: Session, input_date: date):
-
-    period_start, period_end = get_month_period(input_date)
-
-    owners = (
-        db.query(SpaceOwner)
+def _owners_to_bill(db: Session, org_id: UUID, period_start: date, period_end: date):
+    """
+    Approved owners of the org active in the period whose space has a
+    maintenance template, with the template, tax rate and site prefetched.
+    Owners already charged for their first day in the period are left out
+    with one anti-join.
+    """
+    actual_start = func.greatest(SpaceOwner.start_date, period_start)
+    already_charged = exists().where(
+        OwnerMaintenanceCharge.space_owner_id == SpaceOwner.id,
+        OwnerMaintenanceCharge.period_start == actual_start,
+        OwnerMaintenanceCharge.is_deleted == False
+    )
+    return (
+        db.query(
+            SpaceOwner.id.label("space_owner_id"),
+            SpaceOwner.start_date,
+            SpaceOwner.end_date,
+            Space.id.label("space_id"),
+            Space.area_sqft,
+            Space.beds,
+            Space.site_id,
+            Site.name.label("site_name"),
+            MaintenanceTemplate.amount.label("template_amount"),
+            MaintenanceTemplate.calculation_type,
+            TaxCode.rate.label("tax_rate"),
+        )
         .join(Space, Space.id == SpaceOwner.space_id)
+        .join(MaintenanceTemplate, MaintenanceTemplate.id == Space.maintenance_template_id)
+        .outerjoin(TaxCode, TaxCode.id == MaintenanceTemplate.tax_code_id)
+        .outerjoin(Site, Site.id == Space.site_id)
         .filter(
+            Space.org_id == org_id,
             SpaceOwner.status == OwnershipStatus.approved,
             SpaceOwner.start_date <= period_end,
             (SpaceOwner.end_date == None) | (
                 SpaceOwner.end_date >= period_start),
             SpaceOwner.is_active == True,
+            ~already_charged
         )
+        .order_by(Space.site_id, Space.id, SpaceOwner.id)
         .all()
     )
 
-    created_count = 0   # ⭐ track new records
 
-    for owner in owners:
-        actual_start = max(owner.start_date, period_start)
-        actual_end = period_end
+def auto_generate_owner_maintenance(db: Session, org_id: UUID, input_date: date, dry_run: bool = False):
+    """
+    Monthly maintenance charges for every approved owner of the org, from
+    prefetched templates and tax rates, numbered in one block and inserted
+    in chunks. With dry_run nothing is written and the totals per site are
+    returned as a preview.
+    """
+    period_start, period_end = get_month_period(input_date)
 
-        if owner.end_date:
-            actual_end = min(owner.end_date, period_end)
+    # Two runs for the org wait for each other here, so the second one's
+    # anti-join sees the first one's charges
+    if not dry_run:
+        lock_maintenance_nos(db, org_id)
 
+    charges = []
+    for owner in _owners_to_bill(db, org_id, period_start, period_end):
+        actual_start = max(owner.start_date, period_start)
+        actual_end = min(owner.end_date, period_end) if owner.end_date else period_end
         if actual_start > actual_end:
             continue
 
-        # ⭐ NOW check duplicate
-        exists = (
-            db.query(OwnerMaintenanceCharge.id)
-            .filter(
-                OwnerMaintenanceCharge.space_owner_id == owner.id,
-                OwnerMaintenanceCharge.period_start == actual_start,
-                OwnerMaintenanceCharge.is_deleted == False
-            )
-            .first()
-        )
-
-        if exists:
-            continue
-
-        space = owner.space
-        template = space.maintenance_template_id
-
-        if not template:
-            continue
-
-        maintenance_template = db.query(MaintenanceTemplate).get(template)
-
-        if not maintenance_template:
-            continue
-
-        # calculate amount
-        amount = calculate_maintenance_amount(
-            db=db,
-            space=owner.space,
-            template=maintenance_template,
+        amount = maintenance_amount(
+            template_amount=owner.template_amount,
+            calculation_type=owner.calculation_type,
+            area_sqft=owner.area_sqft,
+            beds=owner.beds,
+            tax_rate=owner.tax_rate,
             start_date=actual_start,
             end_date=actual_end
         )
+        charges.append((owner, {
+            "org_id": org_id,
+            "space_owner_id": owner.space_owner_id,
+            "space_id": owner.space_id,
+            "period_start": actual_start,
+            "period_end": actual_end,
+            "amount": round(amount["base_amount"], 2),
+            "tax_amount": round(amount["tax_amount"], 2),
+            "total_amount": round(amount["total_amount"], 2),
+            "due_date": period_end,
+        }))
+
+    sites = {}
+    for owner, charge in charges:
+        site = sites.setdefault(owner.site_id, {
+            "site_id": owner.site_id,
+            "site_name": owner.site_name,
+            "charges": 0,
+            "amount": Decimal("0.00"),
+            "tax_amount": Decimal("0.00"),
+            "total_amount": Decimal("0.00"),
+        })
+        site["charges"] += 1
+        for key in ("amount", "tax_amount", "total_amount"):
+            site[key] += charge[key]
+
+    if not dry_run:
+        # ⭐ If no new records created → raise error
+        if not charges:
+            return error_response(
+                status_code=str(AppStatusCode.REQUIRED_VALIDATION_ERROR),
+                message="Maintenance charges already generated for this period."
+            )
 
-        maintenance_no = generate_maintenance_no(db, space.org_id)
-
-        maintenance = OwnerMaintenanceCharge(
-            org_id=space.org_id,
-            maintenance_no=maintenance_no,
-            space_owner_id=owner.id,
-            space_id=space.id,
-            period_start=actual_start,
-            period_end=actual_end,
-            amount=round(amount.get("base_amount"), 2),
-            tax_amount=round(amount.get("tax_amount"), 2),
-            total_amount=round(amount.get("total_amount"), 2),
-            due_date=period_end
-        )
-
-        db.add(maintenance)
-        created_count += 1   # ⭐ increment
-
-    # ⭐ If no new records created → raise error
-    if created_count == 0:
-        return error_response(
-            status_code=str(AppStatusCode.REQUIRED_VALIDATION_ERROR),
-            message="Maintenance charges already generated for this period."
-        )
+        rows = [charge for _, charge in charges]
+        for row, maintenance_no in zip(rows, allocate_maintenance_nos(db, org_id, len(rows))):
+            row["maintenance_no"] = maintenance_no
 
-    db.commit()
+        for start in range(0, len(rows), GENERATION_CHUNK_SIZE):
+            db.execute(insert(OwnerMaintenanceCharge),
+                       rows[start:start + GENERATION_CHUNK_SIZE])
+        db.commit()
 
-    return {"created": created_count}
+    return OwnerMaintenanceGenerateResponse(
+        period_start=period_start,
+        period_end=period_end,
+        dry_run=dry_run,
+        created=0 if dry_run else len(charges),
+        amount=sum((site["amount"] for site in sites.values()), Decimal("0.00")),
+        tax_amount=sum((site["tax_amount"] for site in sites.values()), Decimal("0.00")),
+        total_amount=sum((site["total_amount"] for site in sites.values()), Decimal("0.00")),
+        sites=list(sites.values())
+    )
 
 
 def get_month_period(input_date: date):
@@ -883,6 +922,34 @@ def calculate_maintenance_amount(
             "total_amount": Decimal("0.00")
         }
 
+    tax_code = (db.query(TaxCode).filter(
+        TaxCode.id == template.tax_code_id).first())
+
+    return maintenance_amount(
+        template_amount=template.amount,
+        calculation_type=template.calculation_type,
+        area_sqft=space.area_sqft,
+        beds=space.beds,
+        tax_rate=tax_code.rate if tax_code else None,
+        start_date=start_date,
+        end_date=end_date
+    )
+
+
+def maintenance_amount(
+    template_amount,
+    calculation_type: str,
+    area_sqft,
+    beds,
+    tax_rate,
+    start_date: date,
+    end_date: date
+):
+    """
+    Prorated maintenance of one space for start_date..end_date, from values
+    already loaded, so batch generation needs no queries per space.
+    """
+
     # -----------------------------
     # Determine billing period
     # -----------------------------
@@ -904,16 +971,16 @@ def calculate_maintenance_amount(
     # Calculate monthly base amount
     # -----------------------------
 
-    base_amount = Decimal(template.amount)
+    base_amount = Decimal(template_amount)
 
-    if template.calculation_type == "flat":
+    if calculation_type == "flat":
         monthly_amount = base_amount
 
-    elif template.calculation_type == "per_sqft":
-        monthly_amount = base_amount * Decimal(space.area_sqft or 0)
+    elif calculation_type == "per_sqft":
+        monthly_amount = base_amount * Decimal(area_sqft or 0)
 
-    elif template.calculation_type == "per_bed":
-        monthly_amount = base_amount * Decimal(space.beds or 0)
+    elif calculation_type == "per_bed":
+        monthly_amount = base_amount * Decimal(beds or 0)
 
     else:
         monthly_amount = base_amount
@@ -931,12 +998,9 @@ def calculate_maintenance_amount(
     # -----------------------------
     # Apply tax AFTER proration
     # -----------------------------
-    tax_code = (db.query(TaxCode).filter(
-        TaxCode.id == template.tax_code_id).first())
-
-    total_amount, tax_amount = apply_tax(
+    total_amount, tax_amount = apply_tax_rate(
         prorated_base,
-        tax_code
+        tax_rate
     )
 
     return {
@@ -947,11 +1011,15 @@ def calculate_maintenance_amount(
 
 
 def apply_tax(amount: Decimal, tax_code: TaxCode | None) -> tuple[Decimal, Decimal]:
+    return apply_tax_rate(amount, tax_code.rate if tax_code else None)
+
 
-    if not tax_code:
+def apply_tax_rate(amount: Decimal, rate) -> tuple[Decimal, Decimal]:
+
+    if rate is None:
         return amount, Decimal("0.00")
 
-    tax_rate = Decimal(tax_code.rate) / Decimal("100")
+    tax_rate = Decimal(rate) / Decimal("100")
 
     tax_amount = amount * tax_rate
 
@@ -963,19 +1031,29 @@ def apply_tax(amount: Decimal, tax_code: TaxCode | None) -> tuple[Decimal, Decim
     )
 
 
-def generate_maintenance_no(db: Session, org_id: UUID):
+def lock_maintenance_nos(db: Session, org_id: UUID):
+    """Serialise maintenance number allocation per org until the transaction ends."""
+    db.execute(select(func.pg_advisory_xact_lock(
+        func.hashtext(f"maintenance_no:{org_id}"))))
 
-    last_row = db.query(OwnerMaintenanceCharge).filter(
+
+def allocate_maintenance_nos(db: Session, org_id: UUID, count: int) -> List[str]:
+    """A block of consecutive maintenance numbers for the org."""
+    if count <= 0:
+        return []
+
+    lock_maintenance_nos(db, org_id)
+
+    # Highest number rather than the latest row: a batch inserts many rows
+    # with the same created_at
+    last_no = db.query(
+        func.max(cast(func.replace(OwnerMaintenanceCharge.maintenance_no, "MNT-", ""), Integer))
+    ).filter(
         OwnerMaintenanceCharge.org_id == org_id
-    ).order_by(
-        OwnerMaintenanceCharge.created_at.desc()
-    ).with_for_update().first()
-
-    # then calculate the new maintenance_no in Python
-    if last_row:
-        last_no = int(last_row.maintenance_no.replace("MNT-", ""))
-        new_no = last_no + 1
-    else:
-        new_no = 1
+    ).scalar() or 0
+
+    return [f"MNT-{number}" for number in range(last_no + 1, last_no + 1 + count)]
 
-    return f"MNT-{new_no}"
+
+def generate_maintenance_no(db: Session, org_id: UUID):
+    return allocate_maintenance_nos(db, org_id, 1)[0]
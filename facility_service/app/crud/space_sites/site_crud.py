@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Dict, Optional
 
 from shared.core.schemas import UserToken
-from shared.helpers.property_helper import get_allowed_sites
+from shared.helpers.property_helper import allowed_site_ids_query
 from shared.utils.app_status_code import AppStatusCode
 from shared.helpers.json_response_helper import error_response
 from shared.utils.enums import UserAccountType
@@ -27,12 +27,7 @@ def get_sites(db: Session,  user: UserToken, params: SiteRequest):
     allowed_site_ids = None
 
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_sites = get_allowed_sites(db, user)
-        allowed_site_ids = [s["site_id"] for s in allowed_sites]
-
-        # Tenant has no access
-        if not allowed_site_ids:
-            return {"sites": [], "total": 0}
+        allowed_site_ids = allowed_site_ids_query(user)
     # --------------------------
     # SUBQUERY: total buildings
     # --------------------------
@@ -150,12 +145,7 @@ def get_site_lookup(db: Session, user: UserToken, params: Optional[SiteRequest]
     allowed_site_ids = None
 
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_sites = get_allowed_sites(db, user)
-        allowed_site_ids = [s["site_id"] for s in allowed_sites]
-
-        # Tenant has no access
-        if not allowed_site_ids:
-            return {"sites": [], "total": 0}
+        allowed_site_ids = allowed_site_ids_query(user)
 
     site_query = db.query(Site.id, Site.name).filter(
         Site.is_deleted == False, Site.status == "active")
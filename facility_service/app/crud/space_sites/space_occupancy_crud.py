@@ -3,7 +3,7 @@ from datetime import datetime, time, timezone, date
 import shutil
 from typing import List, Optional
 import uuid
-from sqlalchemy import func
+from sqlalchemy import func, tuple_
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, UploadFile, status
 from uuid import UUID
@@ -16,11 +16,13 @@ from facility_service.app.models.space_sites.space_inspections import Inspection
 from facility_service.app.models.space_sites.space_maintenances import SpaceMaintenance
 from facility_service.app.models.space_sites.space_settlements import SpaceSettlement
 from shared.core.schemas import UserToken
-from shared.helpers.user_helper import get_user_name
+from shared.helpers.user_helper import get_user_name, get_user_names
 from shared.utils.app_status_code import AppStatusCode
 from shared.utils.enums import OwnershipStatus, UserAccountType
 
 from ...models.space_sites.space_occupancy_events import OccupancyEventType, SpaceOccupancyEvent
+from ...models.space_sites.space_occupancy_state import SpaceOccupancyState
+from ...utils.occupancy_state import compute_occupancy, refresh_occupancy_state
 from ...models.space_sites.spaces import Space
 from shared.helpers.json_response_helper import error_response, success_response
 
@@ -264,183 +266,52 @@ def get_current_occupancy(db: Session, space_id: UUID):
 
 
 def get_current_occupancy_bulk(db: Session, auth_db: Session, space_ids: list[UUID]):
-    today = date.today()
-    result = {}
-
+    """
+    Status and move-in / move-out permissions per space from the snapshot
+    rows. Rows whose scheduled move-out date has come are recomputed.
+    """
     if not space_ids:
-        return result
-
-    # --------------------------------------------------
-    # 1️⃣ Latest active move-in per space
-    # --------------------------------------------------
-    move_ins = (
-        db.query(SpaceOccupancy)
-        .filter(
-            SpaceOccupancy.space_id.in_(space_ids),
-            SpaceOccupancy.request_type == RequestType.move_in,
-            SpaceOccupancy.status == OccupancyStatus.active
-        )
-        .order_by(SpaceOccupancy.space_id, SpaceOccupancy.move_in_date.desc())
-        .all()
-    )
-
-    latest_move_in = {}
-    for occ in move_ins:
-        if occ.space_id not in latest_move_in:
-            latest_move_in[occ.space_id] = occ
-
-    # --------------------------------------------------
-    # 2️⃣ Move-outs
-    # --------------------------------------------------
-    move_outs = (
-        db.query(SpaceOccupancy)
-        .filter(
-            SpaceOccupancy.space_id.in_(space_ids),
-            SpaceOccupancy.request_type == RequestType.move_out,
-            SpaceOccupancy.status.in_(
-                [OccupancyStatus.pending, OccupancyStatus.scheduled, OccupancyStatus.active])
-        )
-        .order_by(SpaceOccupancy.space_id, SpaceOccupancy.move_out_date.desc())
-        .all()
-    )
-
-    latest_move_out = {}
-    for occ in move_outs:
-        if occ.space_id not in latest_move_out:
-            latest_move_out[occ.space_id] = occ
-
-    # --------------------------------------------------
-    # 3️⃣ Handovers
-    # --------------------------------------------------
-    occupancy_ids = [m.id for m in latest_move_out.values()]
-    handovers = (
-        db.query(SpaceHandover)
-        .filter(SpaceHandover.occupancy_id.in_(occupancy_ids))
-        .order_by(SpaceHandover.occupancy_id, SpaceHandover.created_at.desc())
-        .all()
-    )
-
-    latest_handover = {}
-    for h in handovers:
-        if h.occupancy_id not in latest_handover:
-            latest_handover[h.occupancy_id] = h
-
-    # --------------------------------------------------
-    # 4️⃣ Inspections
-    # --------------------------------------------------
-    handover_ids = [h.id for h in latest_handover.values()]
-    inspections = (
-        db.query(SpaceInspection)
-        .filter(SpaceInspection.handover_id.in_(handover_ids))
-        .order_by(SpaceInspection.handover_id, SpaceInspection.created_at.desc())
-        .all()
-    )
-
-    latest_inspection = {}
-    for i in inspections:
-        if i.handover_id not in latest_inspection:
-            latest_inspection[i.handover_id] = i
-
-    # --------------------------------------------------
-    # 5️⃣ Maintenance
-    # --------------------------------------------------
-    inspection_ids = [i.id for i in latest_inspection.values()]
-    maintenances = (
-        db.query(SpaceMaintenance)
-        .filter(SpaceMaintenance.inspection_id.in_(inspection_ids))
-        .order_by(SpaceMaintenance.inspection_id, SpaceMaintenance.created_at.desc())
-        .all()
-    )
-
-    latest_maintenance = {}
-    for m in maintenances:
-        if m.inspection_id not in latest_maintenance:
-            latest_maintenance[m.inspection_id] = m
-
-    # --------------------------------------------------
-    # 6️⃣ Settlements
-    # --------------------------------------------------
-    occupancy_ids_for_settlement = [occ.id for occ in latest_move_in.values()]
-    settlements = (
-        db.query(SpaceSettlement)
-        .filter(SpaceSettlement.occupancy_id.in_(occupancy_ids_for_settlement))
-        .order_by(SpaceSettlement.occupancy_id, SpaceSettlement.created_at.desc())
-        .all()
-    )
-
-    latest_settlement = {}
-    for s in settlements:
-        if s.occupancy_id not in latest_settlement:
-            latest_settlement[s.occupancy_id] = s
+        return {}
 
-    # --------------------------------------------------
-    # 7️⃣ Existing requests
-    # --------------------------------------------------
-    existing_move_ins = {
-        r.space_id
-        for r in db.query(SpaceOccupancy.space_id)
-        .filter(
-            SpaceOccupancy.space_id.in_(space_ids),
-            SpaceOccupancy.request_type == RequestType.move_in,
-            SpaceOccupancy.status.in_(
-                [OccupancyStatus.pending, OccupancyStatus.active])
-        )
-    }
+    states = db.query(
+        SpaceOccupancyState.space_id, SpaceOccupancyState.status,
+        SpaceOccupancyState.move_out_date, SpaceOccupancyState.can_request_move_in,
+        SpaceOccupancyState.can_request_move_out
+    ).filter(SpaceOccupancyState.space_id.in_(space_ids)).all()
 
-    existing_move_outs = {
-        r.space_id
-        for r in db.query(SpaceOccupancy.space_id)
-        .filter(
-            SpaceOccupancy.space_id.in_(space_ids),
-            SpaceOccupancy.request_type == RequestType.move_out,
-            SpaceOccupancy.status.in_(
-                [OccupancyStatus.pending, OccupancyStatus.active])
-        )
-    }
+    today = date.today()
+    result, stale = {}, []
+    for s in states:
+        if s.status == "move_out_scheduled" and s.move_out_date and s.move_out_date <= today:
+            stale.append(s.space_id)
+            continue
+        result[s.space_id] = {
+            "status": s.status,
+            "can_request_move_in": s.can_request_move_in,
+            "can_request_move_out": s.can_request_move_out,
+        }
+    for space_id, values in compute_occupancy(db, stale).items():
+        result[space_id] = {
+            "status": values["status"],
+            "can_request_move_in": values["can_request_move_in"],
+            "can_request_move_out": values["can_request_move_out"],
+        }
 
-    # --------------------------------------------------
-    # 8️⃣ Build response per space
-    # --------------------------------------------------
+    # No row: the space never had an occupancy
     for space_id in space_ids:
-        occ = latest_move_in.get(space_id)
-        move_out = latest_move_out.get(space_id)
-        handover = latest_handover.get(move_out.id) if move_out else None
-        inspection = latest_inspection.get(handover.id) if handover else None
-        maintenance = latest_maintenance.get(
-            inspection.id) if inspection else None
-        settlement = latest_settlement.get(space_id)
-
-        # Determine status
-        if not occ:
-            status = "vacant"
-        elif not move_out:
-            status = "occupied"
-        elif move_out.move_out_date and move_out.move_out_date > today:
-            status = "move_out_scheduled"
-        elif not handover:
-            status = "handover_pending"
-        elif handover.status != HandoverStatus.completed:
-            status = "handover_in_progress"
-        elif not inspection:
-            status = "inspection_pending"
-        elif inspection.status != InspectionStatus.completed:
-            status = "inspection_scheduled"
-        elif maintenance and not maintenance.completed:
-            status = "maintenance_pending"
-        elif settlement and not settlement.settled:
-            status = "settlement_pending"
-        elif settlement and settlement.settled:
-            status = "completed"
-        else:
-            status = "recently_vacated"
+        result.setdefault(space_id, {
+            "status": "vacant",
+            "can_request_move_in": True,
+            "can_request_move_out": False,
+        })
+    return result
 
-        # Build result
-        result[space_id] = {
-            "status": status,
-            "can_request_move_in": space_id not in existing_move_ins or status in ["vacant", "completed"],
-            "can_request_move_out": status == "occupied" and space_id not in existing_move_outs,
-        }
 
+def _first_by(rows, key):
+    """Rows are ordered newest first; keep the first one per key."""
+    result = {}
+    for row in rows:
+        result.setdefault(getattr(row, key), row)
     return result
 
 
@@ -454,55 +325,65 @@ def get_occupancy_history(db: Session, space_id: UUID):
         .order_by(SpaceOccupancy.created_at.desc())
         .all()
     )
+    if not move_ins:
+        return []
 
-    results = []
-
-    for move_in in move_ins:
-        move_out = (
-            db.query(SpaceOccupancy)
-            .filter(
-                SpaceOccupancy.original_occupancy_id == move_in.id,
-                SpaceOccupancy.request_type == RequestType.move_out
-            )
-            .first()
+    # Each stage for all move-ins at once, then matched up in memory
+    move_outs = _first_by(
+        db.query(SpaceOccupancy)
+        .filter(
+            SpaceOccupancy.original_occupancy_id.in_([m.id for m in move_ins]),
+            SpaceOccupancy.request_type == RequestType.move_out
         )
+        .order_by(SpaceOccupancy.created_at.desc()),
+        "original_occupancy_id"
+    )
+    move_out_ids = [m.id for m in move_outs.values()]
 
-        handover = None
-        inspection = None
-        maintenance = None
-        settlement = None
-
-        if move_out:
-            handover = (
-                db.query(SpaceHandover)
-                .filter(SpaceHandover.occupancy_id == move_out.id)
-                .first()
-            )
+    handovers, inspections, maintenances, settlements = {}, {}, {}, {}
+    if move_out_ids:
+        handovers = _first_by(
+            db.query(SpaceHandover)
+            .filter(SpaceHandover.occupancy_id.in_(move_out_ids))
+            .order_by(SpaceHandover.created_at.desc()),
+            "occupancy_id"
+        )
+        settlements = _first_by(
+            db.query(SpaceSettlement)
+            .filter(SpaceSettlement.occupancy_id.in_(move_out_ids))
+            .order_by(SpaceSettlement.created_at.desc()),
+            "occupancy_id"
+        )
+    if handovers:
+        inspections = _first_by(
+            db.query(SpaceInspection)
+            .filter(SpaceInspection.handover_id.in_([h.id for h in handovers.values()]))
+            .order_by(SpaceInspection.created_at.desc()),
+            "handover_id"
+        )
+    if inspections:
+        maintenances = _first_by(
+            db.query(SpaceMaintenance)
+            .filter(SpaceMaintenance.inspection_id.in_([i.id for i in inspections.values()]))
+            .order_by(SpaceMaintenance.created_at.desc()),
+            "inspection_id"
+        )
 
-            if handover:
-                inspection = (
-                    db.query(SpaceInspection)
-                    .filter(SpaceInspection.handover_id == handover.id)
-                    .first()
-                )
+    names = get_user_names(m.occupant_user_id for m in move_ins)
 
-            if inspection:
-                maintenance = (
-                    db.query(SpaceMaintenance)
-                    .filter(SpaceMaintenance.inspection_id == inspection.id)
-                    .first()
-                )
+    results = []
 
-            settlement = (
-                db.query(SpaceSettlement)
-                .filter(SpaceSettlement.occupancy_id == move_out.id)
-                .first()
-            )
+    for move_in in move_ins:
+        move_out = move_outs.get(move_in.id)
+        handover = handovers.get(move_out.id) if move_out else None
+        inspection = inspections.get(handover.id) if handover else None
+        maintenance = maintenances.get(inspection.id) if inspection else None
+        settlement = settlements.get(move_out.id) if move_out else None
 
         results.append({
             "occupancy_id": str(move_in.id),
 
-            "occupant_name": get_user_name(move_in.occupant_user_id),
+            "occupant_name": names.get(move_in.occupant_user_id),
             "occupant_type": move_in.occupant_type,
 
             "move_in_date": move_in.move_in_date,
@@ -563,10 +444,12 @@ def get_upcoming_moveins(db: Session, space_id: UUID):
         .all()
     )
 
+    names = get_user_names(u.occupant_user_id for u in upcoming)
+
     upcoming_list = [
         {
             "occupant_type": u.occupant_type,
-            "occupant_name": get_user_name(u.occupant_user_id),
+            "occupant_name": names.get(u.occupant_user_id),
             "move_in_date": u.move_in_date,
             "move_out_date": u.move_out_date,
             "time_slot": u.time_slot,
@@ -581,101 +464,105 @@ def get_upcoming_moveins(db: Session, space_id: UUID):
     return upcoming_list
 
 
-def get_occupancy_timeline(
+def _timeline_events(
     db: Session,
     space_id: UUID,
-    user: UserToken
+    user: UserToken,
+    after: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[UUID] = None
 ):
-    events = (
+    """
+    A space's events in (date, id) order, with occupant names resolved in
+    one auth query. `after` / `after_id` / `limit` page through them: pass
+    the last returned event's date and id for the next page, so events
+    sharing that date are not skipped. `after` alone keeps everything
+    strictly later.
+    """
+    query = (
         db.query(SpaceOccupancyEvent)
         .filter(SpaceOccupancyEvent.space_id == space_id)
-        .order_by(SpaceOccupancyEvent.event_date.asc())
+        .order_by(SpaceOccupancyEvent.event_date.asc(), SpaceOccupancyEvent.id.asc())
     )
 
     if user.account_type in [UserAccountType.FLAT_OWNER, UserAccountType.TENANT]:
-        events = events.filter(
+        query = query.filter(
             SpaceOccupancyEvent.occupant_user_id == user.user_id)
-
-    timeline = []
-
-    for e in events:
-        occupant_name = get_user_name(
-            e.occupant_user_id
-        )
-
-        timeline.append({
+    if after and after_id:
+        query = query.filter(
+            tuple_(SpaceOccupancyEvent.event_date, SpaceOccupancyEvent.id) > tuple_(after, after_id))
+    elif after:
+        query = query.filter(SpaceOccupancyEvent.event_date > after)
+    if limit:
+        query = query.limit(limit)
+
+    events = query.all()
+    names = get_user_names(e.occupant_user_id for e in events)
+
+    return [
+        (e, {
+            "id": e.id,
             "event": e.event_type,
             "occupant_type": e.occupant_type,
             "occupant_user_id": e.occupant_user_id,
-            "occupant_name": occupant_name,
+            "occupant_name": names.get(e.occupant_user_id),
             "date": e.event_date,
             "notes": e.notes,
         })
-
-    return timeline
+        for e in events
+    ]
 
 
-def get_tenant_timeline(
+def get_occupancy_timeline(
     db: Session,
     space_id: UUID,
-    user: UserToken
+    user: UserToken,
+    after: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[UUID] = None
 ):
+    return [event_data for _, event_data in _timeline_events(db, space_id, user, after, limit, after_id)]
+
+
+MOVE_IN_EVENT_TYPES = {
+    OccupancyEventType.moved_in_requested,
+    OccupancyEventType.moved_in_scheduled,
+    OccupancyEventType.moved_in_rejected,
+    OccupancyEventType.moved_in
+}
+
+MOVE_OUT_EVENT_TYPES = {
+    OccupancyEventType.moved_out_requested,
+    OccupancyEventType.moved_out_scheduled,
+    OccupancyEventType.moved_out_rejected,
+    OccupancyEventType.moved_out,
+    OccupancyEventType.handover_awaited,
+    OccupancyEventType.handover_completed,
+    OccupancyEventType.inspection_requested,
+    OccupancyEventType.inspection_completed,
+    OccupancyEventType.maintenance_requested,
+    OccupancyEventType.maintenance_completed,
+    OccupancyEventType.settlement_pending,
+    OccupancyEventType.settlement_completed,
+}
 
-    events_query = (
-        db.query(SpaceOccupancyEvent)
-        .filter(SpaceOccupancyEvent.space_id == space_id)
-        .order_by(SpaceOccupancyEvent.event_date.asc())
-    )
-
-    if user.account_type in [UserAccountType.FLAT_OWNER, UserAccountType.TENANT]:
-        events_query = events_query.filter(
-            SpaceOccupancyEvent.occupant_user_id == user.user_id
-        )
-
-    events = events_query.all()
 
+def get_tenant_timeline(
+    db: Session,
+    space_id: UUID,
+    user: UserToken,
+    after: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[UUID] = None
+):
     move_in_events = []
     move_out_events = []
 
-    move_in_types = {
-        OccupancyEventType.moved_in_requested,
-        OccupancyEventType.moved_in_scheduled,
-        OccupancyEventType.moved_in_rejected,
-        OccupancyEventType.moved_in
-    }
-
-    move_out_types = {
-        OccupancyEventType.moved_out_requested,
-        OccupancyEventType.moved_out_scheduled,
-        OccupancyEventType.moved_out_rejected,
-        OccupancyEventType.moved_out,
-        OccupancyEventType.handover_awaited,
-        OccupancyEventType.handover_completed,
-        OccupancyEventType.inspection_requested,
-        OccupancyEventType.inspection_completed,
-        OccupancyEventType.maintenance_requested,
-        OccupancyEventType.maintenance_completed,
-        OccupancyEventType.settlement_pending,
-        OccupancyEventType.settlement_completed,
-    }
-
-    for e in events:
-
-        occupant_name = get_user_name(e.occupant_user_id)
-
-        event_data = {
-            "event": e.event_type,
-            "occupant_type": e.occupant_type,
-            "occupant_user_id": e.occupant_user_id,
-            "occupant_name": occupant_name,
-            "date": e.event_date,
-            "notes": e.notes,
-        }
-
-        if e.event_type in move_in_types:
+    for e, event_data in _timeline_events(db, space_id, user, after, limit, after_id):
+        if e.event_type in MOVE_IN_EVENT_TYPES:
             move_in_events.append(event_data)
 
-        elif e.event_type in move_out_types:
+        elif e.event_type in MOVE_OUT_EVENT_TYPES:
             move_out_events.append(event_data)
 
     return {
@@ -684,6 +571,32 @@ def get_tenant_timeline(
     }
 
 
+def get_occupancy_state(db: Session, space_id: UUID):
+    """Current status / occupant of a space from its snapshot row."""
+    state = db.query(SpaceOccupancyState).filter(
+        SpaceOccupancyState.space_id == space_id
+    ).first()
+    if not state:
+        return {"space_id": space_id, "status": "vacant"}
+
+    return {
+        "space_id": state.space_id,
+        "status": state.status,
+        "occupant_type": state.occupant_type,
+        "occupant_user_id": state.occupant_user_id,
+        "occupant_name": get_user_name(state.occupant_user_id) if state.occupant_user_id else None,
+        "since": state.since,
+        "move_in_id": state.move_in_id,
+        "move_in_date": state.move_in_date,
+        "move_out_id": state.move_out_id,
+        "move_out_date": state.move_out_date,
+        "can_request_move_in": state.can_request_move_in,
+        "can_request_move_out": state.can_request_move_out,
+        "last_event": state.last_event_type,
+        "last_event_at": state.last_event_at,
+    }
+
+
 def log_occupancy_event(
     db: Session,
     space_id: UUID,
@@ -701,9 +614,11 @@ def log_occupancy_event(
         occupant_user_id=occupant_user_id,
         source_id=source_id,
         lease_id=lease_id,
-        notes=notes
+        notes=notes,
+        event_date=datetime.now(timezone.utc)
     )
     db.add(event)
+    refresh_occupancy_state(db, [space_id], event_type, event.event_date)
     db.commit()
 
 # APPROVAL PAGE
@@ -955,8 +870,7 @@ def approve_move_in(db: Session, move_in_id: UUID):
 
     # Activate move-in
     move_in_request.status = occ_status
-    db.commit()
-    db.refresh(move_in_request)
+    db.flush()
 
     log_occupancy_event(
         db,
@@ -967,6 +881,7 @@ def approve_move_in(db: Session, move_in_id: UUID):
         source_id=move_in_request.source_id,
         lease_id=move_in_request.lease_id
     )
+    db.refresh(move_in_request)
 
     return move_in_request
 
@@ -983,8 +898,7 @@ def reject_move_in(db: Session, move_in_id: UUID, reason: str):
 
     move_in_request.status = OccupancyStatus.rejected
     move_in_request.rejection_reason = reason
-    db.commit()
-    db.refresh(move_in_request)
+    db.flush()
 
     log_occupancy_event(
         db,
@@ -995,6 +909,7 @@ def reject_move_in(db: Session, move_in_id: UUID, reason: str):
         source_id=move_in_request.source_id,
         lease_id=move_in_request.lease_id
     )
+    db.refresh(move_in_request)
 
     return move_in_request
 
@@ -1092,8 +1007,7 @@ def request_move_out(
     )
 
     db.add(move_out_request)
-    db.commit()
-    db.refresh(move_out_request)
+    db.flush()
 
     log_occupancy_event(
         db,
@@ -1104,6 +1018,7 @@ def request_move_out(
         source_id=move_out_request.source_id,
         lease_id=move_out_request.lease_id
     )
+    db.refresh(move_out_request)
 
     if current_user.account_type == UserAccountType.ORGANIZATION.value:
         approve_move_out(db, move_out_request.id, current_user.user_id)
@@ -1123,8 +1038,7 @@ def reject_move_out(db: Session, move_out_id: UUID, reason: str):
 
     move_out_request.status = OccupancyStatus.rejected
     move_out_request.rejection_reason = reason
-    db.commit()
-    db.refresh(move_out_request)
+    db.flush()
 
     log_occupancy_event(
         db,
@@ -1135,6 +1049,7 @@ def reject_move_out(db: Session, move_out_id: UUID, reason: str):
         source_id=move_out_request.source_id,
         lease_id=move_out_request.lease_id
     )
+    db.refresh(move_out_request)
 
     return move_out_request
 
@@ -1157,7 +1072,7 @@ def approve_move_out(db: Session, move_out_id: UUID, admin_user_id: UUID):
         occ_event = OccupancyEventType.moved_out_scheduled
 
     move_out.status = occ_status
-    db.commit()
+    db.flush()
 
     log_occupancy_event(
         db,
@@ -1182,8 +1097,7 @@ def start_handover_process(db: Session, move_out, admin_user_id):
     )
 
     db.add(handover)
-    db.commit()
-    db.refresh(handover)
+    db.flush()
 
     log_occupancy_event(
         db,
@@ -1194,6 +1108,7 @@ def start_handover_process(db: Session, move_out, admin_user_id):
         source_id=move_out.source_id,
         lease_id=move_out.lease_id
     )
+    db.refresh(handover)
 
     return handover
 
@@ -1297,8 +1212,7 @@ def complete_handover(
                     lease.status = "expired"
                     lease.end_date = datetime.utcnow().date()
 
-    db.commit()
-    db.refresh(handover)
+    db.flush()
 
     log_occupancy_event(
         db,
@@ -1309,6 +1223,7 @@ def complete_handover(
         source_id=move_out.source_id,
         lease_id=move_out.lease_id
     )
+    db.refresh(handover)
 
     return handover
 
@@ -1348,8 +1263,7 @@ def request_inspection(
         status="requested"
     )
     db.add(inspection)
-    db.commit()
-    db.refresh(inspection)
+    db.flush()
 
     log_occupancy_event(
         db,
@@ -1360,6 +1274,7 @@ def request_inspection(
         source_id=move_out.source_id,
         lease_id=move_out.lease_id
     )
+    db.refresh(inspection)
 
     return {"message": "Inspection requested successfully", "inspection_id": str(inspection.id)}
 
@@ -1409,8 +1324,7 @@ def complete_inspection(
     # Inspector
     # inspection.inspected_by_user_id = params.inspected_by_user_id
 
-    db.commit()
-    db.refresh(inspection)
+    db.flush()
 
     log_occupancy_event(
         db,
@@ -1421,6 +1335,7 @@ def complete_inspection(
         source_id=move_out.source_id,
         lease_id=move_out.lease_id
     )
+    db.refresh(inspection)
 
     return {
         "message": "Inspection completed successfully",
@@ -1581,8 +1496,7 @@ def complete_maintenance(
     maintenance.completed_by = user_id
     maintenance.completed_at = params.completed_at or datetime.utcnow()
 
-    db.commit()
-    db.refresh(maintenance)
+    db.flush()
 
     occupancy_id = get_occupancy_id_from_maintenance(
         db, maintenance_id)
@@ -1645,8 +1559,7 @@ def request_settlement(
     )
 
     db.add(settlement)
-    db.commit()
-    db.refresh(settlement)
+    db.flush()
 
     log_occupancy_event(
         db,
@@ -1657,6 +1570,7 @@ def request_settlement(
         source_id=move_out.source_id,
         lease_id=move_out.lease_id
     )
+    db.refresh(settlement)
 
     return settlement
 
@@ -1712,8 +1626,7 @@ def complete_settlement(
         if space:
             space.status = "available"
 
-    db.commit()
-    db.refresh(settlement)
+    db.flush()
 
     log_occupancy_event(
         db,
@@ -1724,6 +1637,7 @@ def complete_settlement(
         source_id=occupancy.source_id,
         lease_id=occupancy.lease_id
     )
+    db.refresh(settlement)
 
     return {
         "message": "Settlement completed successfully",
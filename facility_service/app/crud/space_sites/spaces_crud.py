@@ -24,7 +24,9 @@ from shared.models.users import Users
 
 from ...models.leasing_tenants.tenant_spaces import TenantSpace
 from shared.core.schemas import CommonQueryParams, UserToken
-from shared.helpers.property_helper import get_allowed_spaces
+from shared.helpers.bulk_import import BulkImport, ProgressCallback, name_key, nan_to_none, present
+from shared.helpers.property_helper import ACTIVE_TENANT_LINKS, allowed_space_ids_query
+from shared.helpers.search_helper import apply_search, search_filter
 from shared.utils.app_status_code import AppStatusCode
 from shared.helpers.json_response_helper import error_response, success_response
 from shared.utils.enums import UserAccountType
@@ -59,9 +61,9 @@ def build_space_filters(org_id: UUID, params: SpaceRequest):
     if params.status and params.status.lower() != "all":
         filters.append(Space.status == params.status)
 
-    if params.search:
-        search_term = f"%{params.search}%"
-        filters.append(Space.name.ilike(search_term))
+    search_condition = search_filter(params.search, Space.name)
+    if search_condition is not None:
+        filters.append(search_condition)
 
     return filters
 
@@ -76,16 +78,7 @@ def get_spaces_overview(db: Session, user: UserToken, params: SpaceRequest):
 
     allowed_space_ids = None
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_spaces = get_allowed_spaces(db, user)
-        allowed_space_ids = [s["space_id"] for s in allowed_spaces]
-
-        if not allowed_space_ids:
-            return {
-                "totalSpaces": 0,
-                "availableSpaces": 0,
-                "occupiedSpaces": 0,
-                "outOfServices": 0
-            }
+        allowed_space_ids = allowed_space_ids_query(user)
     counts = (
         db.query(
             func.count(Space.id).label("total_spaces"),
@@ -118,11 +111,7 @@ def get_spaces(db: Session, user: UserToken, params: SpaceRequest) -> SpaceListR
     if user.account_type.lower() == UserAccountType.TENANT.value or \
        user.account_type.lower() == UserAccountType.FLAT_OWNER.value:
 
-        allowed_spaces = get_allowed_spaces(db, user)
-        allowed_space_ids = [s["space_id"] for s in allowed_spaces]
-
-        if not allowed_space_ids:
-            return {"spaces": [], "total": 0}
+        allowed_space_ids = allowed_space_ids_query(user)
 
     base_query = get_space_query(db, user.org_id, params)
 
@@ -463,124 +452,146 @@ def update_space(db: Session, space: SpaceUpdate):
         )
 
 
-def bulk_update_spaces(db: Session, request: BulkSpaceRequest, org_id: UUID):
-    inserted, updated = 0, 0
-    rowHeaderIndex = 2
-    bulk_error_list = []
-
-    for s in request.spaces:
-        errors = []
-
-        # 1. Resolve Site ID
-        clean_site_name = s.siteName.strip() if s.siteName else ""
-        site_id = db.query(Site.id).filter(
-            func.lower(Site.name) == clean_site_name.lower(),
-            Site.is_deleted == False
-        ).scalar()
-
-        if not site_id:
-            errors.append(f"Site '{s.siteName}' doesn't exist.")
-
-        # 2. Resolve Building Block ID (Handling empty strings)
-        building_id = None
-        clean_building_name = getattr(s, 'buildingBlockName', None)
-        if clean_building_name and clean_building_name.strip() and site_id:
-            clean_building_name = clean_building_name.strip()           
-            
-            building_id = db.query(Building.id).filter(
-                func.lower(Building.name) == clean_building_name.lower(),
-                Building.site_id == site_id,
-                Building.is_deleted == False
-            ).scalar()
-
-            if not building_id:
-                errors.append(
-                    f"Building Block '{s.buildingBlockName}' doesn't exist in this site.")
-
-        # Stop processing this row if parent entities are missing
-        if errors:
-            bulk_error_list.append(BulkUploadError(
-                row=rowHeaderIndex, errors=errors))
-            rowHeaderIndex += 1
-            continue
-
-        # 3. Find Existing Space
-        obj = db.query(Space).filter(
-            Space.name == s.name,
-            Space.site_id == site_id,
-            Space.is_deleted == False
-        ).first()
+# Sheet columns that are not Space columns; view / furnished / star_rating go into attributes
+_SPACE_IMPORT_EXCLUDE = {"siteName", "buildingBlockName", "view", "furnished", "star_rating"}
+_SPACE_INSERT_COLUMNS = ("name", "category", "kind", "floor", "area_sqft", "beds", "baths", "status")
 
-        custom_attrs = {}
-        if s.view is not None:
-            custom_attrs["view"] = s.view
-        if s.furnished is not None:
-            custom_attrs["furnished"] = s.furnished
-        if s.star_rating is not None:
-            custom_attrs["star_rating"] = s.star_rating
-
-        # 4. Prepare Data Dump
-        space_data = s.model_dump(
-            exclude={
-                "siteName", "buildingBlockName", "floorName",
-                "view", "furnished", "star_rating",
-                "accessories", "parking_slot_ids", "building_block"
-            },
-            exclude_unset=True
-        )
 
-        space_data["site_id"] = site_id
+def bulk_update_spaces(
+    db: Session,
+    request: BulkSpaceRequest,
+    org_id: UUID,
+    progress: Optional[ProgressCallback] = None,
+    commit: bool = True
+):
+    """
+    Spaces are matched by (site, name): existing ones are updated with the
+    columns present in the sheet, the rest are inserted. Set-based, see
+    BulkImport.
+    With commit=False the caller commits.
+    """
+    if not request.spaces:
+        return {"inserted": 0, "updated": 0, "validations": []}
+
+    job = BulkImport(db, request.spaces, "spaces", progress)
+
+    # 1. Resolve sites and building blocks by name
+    job.frame["site_key"] = name_key(job.frame["siteName"])
+    job.frame["building_key"] = name_key(job.frame["buildingBlockName"])
+
+    sites = job.lookup(
+        [func.lower(Site.name).label("site_key"), Site.id.label("site_id")],
+        [func.lower(Site.name)],
+        job.frame[["site_key"]],
+        Site.org_id == org_id,
+        Site.is_deleted == False
+    ).drop_duplicates("site_key")
+    job.attach(sites, on=["site_key"])
+
+    wants_building = present(job.frame["buildingBlockName"]) & job.frame["site_id"].notna()
+    buildings = job.lookup(
+        [
+            Building.site_id.label("site_id"),
+            func.lower(Building.name).label("building_key"),
+            Building.id.label("building_id"),
+        ],
+        [Building.site_id, func.lower(Building.name)],
+        job.frame.loc[wants_building, ["site_id", "building_key"]],
+        Building.is_deleted == False
+    ).drop_duplicates(["site_id", "building_key"])
+    job.attach(buildings, on=["site_id", "building_key"])
+
+    frame = job.frame
+    job.fail(frame["site_id"].isna(),
+             frame["siteName"].map(lambda name: f"Site '{name}' doesn't exist."))
+    job.fail(wants_building & frame["building_id"].isna(),
+             frame["buildingBlockName"].map(lambda name: f"Building Block '{name}' doesn't exist in this site."))
+
+    # 2. Match existing spaces
+    valid = job.valid()
+    existing = job.lookup(
+        [
+            Space.site_id.label("site_id"),
+            Space.name.label("name"),
+            Space.id.label("space_id"),
+            Space.building_block_id.label("current_building_id"),
+            Space.attributes.label("current_attributes"),
+        ],
+        [Space.site_id, Space.name],
+        valid[["site_id", "name"]],
+        Space.is_deleted == False
+    ).drop_duplicates(["site_id", "name"])
+    job.attach(existing, on=["site_id", "name"])
+    frame = job.frame
+    is_new = frame["space_id"].isna()
+
+    # 3. Protections
+    moved = (
+        ~is_new
+        & frame["current_building_id"].notna()
+        & (frame["building_id"] != frame["current_building_id"])
+    )
+    moved_ids = frame.loc[moved, ["space_id"]]
+    occupied = set(job.lookup(
+        [TenantSpace.space_id.label("space_id")],
+        [TenantSpace.space_id],
+        moved_ids,
+        TenantSpace.is_deleted == False,
+        TenantSpace.status.in_(ACTIVE_TENANT_LINKS)
+    )["space_id"]) | set(job.lookup(
+        [Lease.space_id.label("space_id")],
+        [Lease.space_id],
+        moved_ids,
+        Lease.is_deleted == False,
+        func.lower(Lease.status) == "active"
+    )["space_id"])
+    job.fail(moved & frame["space_id"].isin(occupied),
+             "Cannot change building for a space with active tenants or leases.")
+    job.fail(is_new & ~present(frame["category"]), "Category is required for a new space.")
+    job.fail(is_new & ~present(frame["kind"]), "Kind is required for a new space.")
+
+    # 4. Write; a name repeated within the sheet keeps its last row
+    valid = job.valid().drop_duplicates(["site_id", "name"], keep="last")
+    updates, inserts = [], []
+    for row in valid[["idx", "site_id", "building_id", "space_id", "current_attributes"]].itertuples(index=False):
+        s = job.records[row.idx]
+        custom_attrs = {
+            key: getattr(s, key)
+            for key in ("view", "furnished", "star_rating")
+            if getattr(s, key) is not None
+        }
+        space_data = s.model_dump(exclude=_SPACE_IMPORT_EXCLUDE, exclude_unset=True)
+        if space_data.get("floor") is not None:
+            space_data["floor"] = str(space_data["floor"])
+        space_data["site_id"] = row.site_id
         space_data["org_id"] = org_id
-        space_data["building_block_id"] = building_id
-
-        if obj:
-            # UPDATE LOGIC & PROTECTIONS
-            building_changed = (
-                obj.building_block_id is not None
-                and building_id != obj.building_block_id
-            )
-
-            if building_changed:
-                has_tenants = db.query(TenantSpace).filter(
-                    TenantSpace.space_id == obj.id,
-                    TenantSpace.status == 'current',
-                    TenantSpace.is_deleted == False
-                ).first()
-
-                has_leases = db.query(Lease).filter(
-                    Lease.space_id == obj.id,
-                    Lease.is_deleted == False,
-                    func.lower(Lease.status) == 'active'
-                ).first()
-
-                if has_tenants or has_leases:
-                    errors.append(
-                        "Cannot change building for a space with active tenants or leases.")
-                    bulk_error_list.append(BulkUploadError(
-                        row=rowHeaderIndex, errors=errors))
-                    rowHeaderIndex += 1
-                    continue
-
-            existing_attrs = obj.attributes or {}
-            existing_attrs.update(custom_attrs)
-            space_data["attributes"] = existing_attrs
-
-            # Apply updates
-            for k, v in space_data.items():
-                setattr(obj, k, v)
-            updated += 1
+        space_data["building_block_id"] = nan_to_none(row.building_id)
 
+        space_id = nan_to_none(row.space_id)
+        if space_id:
+            attributes = dict(nan_to_none(row.current_attributes) or {})
+            attributes.update(custom_attrs)
+            updates.append({**space_data, "id": space_id, "attributes": attributes})
         else:
-            # INSERT LOGIC
-            space_data["attributes"] = custom_attrs
-            new_space = Space(**space_data)
-            db.add(new_space)
-            inserted += 1
+            data = {column: space_data.get(column) for column in _SPACE_INSERT_COLUMNS}
+            data["status"] = data["status"] or "available"
+            inserts.append({
+                **data,
+                "id": uuid.uuid4(),
+                "site_id": row.site_id,
+                "org_id": org_id,
+                "building_block_id": space_data["building_block_id"],
+                "attributes": custom_attrs,
+                "is_deleted": False,
+            })
 
-        rowHeaderIndex += 1
+    total = len(valid)
+    updated = job.update_by_id(Space, updates, total)
+    inserted = job.insert(Space, inserts, total)
 
-    db.commit()
-    return {"inserted": inserted, "updated": updated, "validations": bulk_error_list}
+    if commit:
+        db.commit()
+    return {"inserted": inserted, "updated": updated, "validations": job.errors(BulkUploadError)}
 
 
 def get_space_details_by_id(
@@ -755,11 +766,7 @@ def get_space_lookup(
     allowed_space_ids = None
 
     if user.account_type.lower() == UserAccountType.TENANT:
-        allowed_spaces = get_allowed_spaces(db, user)
-        allowed_space_ids = [s["space_id"] for s in allowed_spaces]
-
-        if not allowed_space_ids:
-            return {"spaces": [], "total": 0}
+        allowed_space_ids = allowed_space_ids_query(user)
 
     space_query = (
         db.query(
@@ -1375,9 +1382,7 @@ def get_pending_space_owner_requests(
             SpaceOwner.status == OwnershipStatus.pending
         )
     )
-    if params.search:
-        search_term = f"%{params.search}%"
-        base_query.filter(Space.name.ilike(search_term))
+    base_query = apply_search(base_query, params.search, Space.name)
 
     total = base_query.count()
 
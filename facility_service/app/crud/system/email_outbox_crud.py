@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from shared.models.email_outbox import EmailOutbox
+from shared.utils.enums import EmailOutboxStatus
+
+from ...schemas.system.email_outbox_schemas import EmailOutboxMetrics
+
+
+def get_email_outbox_metrics(db: Session) -> EmailOutboxMetrics:
+    now = datetime.now(timezone.utc)
+    last_hour = now - timedelta(hours=1)
+
+    by_status = dict(
+        db.query(EmailOutbox.status, func.count(EmailOutbox.id))
+        .group_by(EmailOutbox.status)
+        .all()
+    )
+
+    oldest_pending = (
+        db.query(func.min(EmailOutbox.created_at))
+        .filter(EmailOutbox.status.in_([
+            EmailOutboxStatus.pending.value,
+            EmailOutboxStatus.sending.value,
+        ]))
+        .scalar()
+    )
+
+    latency = func.extract("epoch", EmailOutbox.sent_at - EmailOutbox.created_at)
+    sent = (
+        db.query(
+            func.count(EmailOutbox.id).label("count"),
+            func.avg(latency).label("avg"),
+            func.percentile_cont(0.95).within_group(latency).label("p95"),
+        )
+        .filter(
+            EmailOutbox.status == EmailOutboxStatus.sent.value,
+            EmailOutbox.sent_at >= last_hour,
+        )
+        .one()
+    )
+
+    return EmailOutboxMetrics(
+        by_status={status.value: by_status.get(status.value, 0)
+                   for status in EmailOutboxStatus},
+        oldest_pending_seconds=round(
+            (now - oldest_pending).total_seconds(), 1) if oldest_pending else 0.0,
+        sent_last_hour=sent.count or 0,
+        sent_per_minute=round((sent.count or 0) / 60, 2),
+        delivery_latency_avg_seconds=round(float(sent.avg or 0), 2),
+        delivery_latency_p95_seconds=round(float(sent.p95 or 0), 2),
+    )
+
+
+def retry_dead_emails(db: Session, ids: Optional[List[UUID]] = None) -> int:
+    """Move dead-lettered emails back to pending with a fresh attempt budget."""
+    stmt = (
+        update(EmailOutbox)
+        .where(EmailOutbox.status == EmailOutboxStatus.dead.value)
+        .values(
+            status=EmailOutboxStatus.pending.value,
+            attempts=0,
+            next_attempt_at=func.now(),
+        )
+    )
+    if ids:
+        stmt = stmt.where(EmailOutbox.id.in_(ids))
+
+    requeued = db.execute(stmt).rowcount
+    db.commit()
+    return requeued
@@ -0,0 +1,176 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Callable, List, Type
+from uuid import UUID
+
+from fastapi import UploadFile, status
+from pydantic import BaseModel
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from shared.core.config import settings
+from shared.core.schemas import UserToken
+from shared.helpers.bulk_import import SHEET_EXTENSIONS
+from shared.helpers.json_response_helper import error_response
+from shared.utils.app_status_code import AppStatusCode
+from shared.utils.enums import ImportJobStatus, UserAccountType
+
+from ..energy_iot import meter_readings_crud, meters_crud
+from ..parking_access import parking_slot_crud
+from ..space_sites import spaces_crud
+from ...models.system.import_jobs import ImportJob, ImportJobError
+from ...schemas.energy_iot.meter_readings_schemas import BulkMeterReadingRequest, MeterReadingImport
+from ...schemas.energy_iot.meters_schemas import BulkMeterRequest, MeterImport
+from ...schemas.parking_access.parking_slot_schemas import BulkParkingSlotRequest, ParkingSlotImport
+from ...schemas.space_sites.spaces_schemas import BulkSpaceRequest, SpaceImport
+from ...schemas.system.import_jobs_schemas import ImportJobOut
+
+READ_CHUNK_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ImportHandler:
+    """
+    How one kind of upload is applied: `model` is the row schema of the
+    matching /bulk-upload endpoint, `apply(db, records, job)` runs that
+    endpoint's bulk function on a chunk of rows and returns its response
+    dict ({"inserted", "updated", "validations"}). It does not commit: the
+    worker commits the chunk together with the job's progress.
+    """
+    model: Type[BaseModel]
+    apply: Callable[[Session, List[BaseModel], ImportJob], dict]
+    admin_only: bool = False
+
+
+def _apply_meters(db: Session, records: List[MeterImport], job: ImportJob) -> dict:
+    for record in records:
+        record.org_id = job.org_id
+    return meters_crud.bulk_update_meters(
+        db, BulkMeterRequest(meters=records), org_id=job.org_id, commit=False)
+
+
+IMPORT_HANDLERS = {
+    "meter_readings": ImportHandler(
+        MeterReadingImport,
+        lambda db, records, job: meter_readings_crud.bulk_update_readings(
+            db, BulkMeterReadingRequest(readings=records), org_id=job.org_id, commit=False),
+    ),
+    "meters": ImportHandler(MeterImport, _apply_meters),
+    "spaces": ImportHandler(
+        SpaceImport,
+        lambda db, records, job: spaces_crud.bulk_update_spaces(
+            db, BulkSpaceRequest(spaces=records), job.org_id, commit=False),
+        admin_only=True,
+    ),
+    "parking_slots": ImportHandler(
+        ParkingSlotImport,
+        lambda db, records, job: parking_slot_crud.bulk_update_parking_slots(
+            db, BulkParkingSlotRequest(slots=records), job.org_id, commit=False),
+    ),
+}
+
+
+def import_job_snapshot(job: ImportJob) -> dict:
+    return ImportJobOut.model_validate(job).model_dump(mode="json")
+
+
+def submit_import_job(db: Session, kind: str, upload: UploadFile, user: UserToken) -> ImportJob:
+    """
+    Store the uploaded file as a pending job for the import job worker.
+    The file is read in chunks while hashing; a file already submitted for
+    this org and kind returns its existing job, and a failed one is queued
+    again from scratch.
+    """
+    handler = IMPORT_HANDLERS.get(kind)
+    if handler is None:
+        error_response(
+            message=f"Unsupported import type '{kind}'",
+            status_code=str(AppStatusCode.INVALID_INPUT)
+        )
+    if handler.admin_only and user.account_type.lower() != UserAccountType.ORGANIZATION.value:
+        error_response(message="Access forbidden: Admins only", http_status=403)
+
+    file_name = upload.filename or ""
+    if not file_name.lower().endswith(SHEET_EXTENSIONS):
+        error_response(
+            message="Only .csv and .xlsx files can be imported",
+            status_code=str(AppStatusCode.INVALID_INPUT)
+        )
+
+    digest = hashlib.sha256()
+    data = bytearray()
+    while chunk := upload.file.read(READ_CHUNK_BYTES):
+        data.extend(chunk)
+        if len(data) > settings.IMPORT_JOB_MAX_BYTES:
+            error_response(
+                message=f"File is larger than {settings.IMPORT_JOB_MAX_BYTES // (1024 * 1024)} MB",
+                http_status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+        digest.update(chunk)
+    file_hash = digest.hexdigest()
+
+    job_id = db.execute(
+        insert(ImportJob)
+        .values(
+            org_id=user.org_id,
+            created_by=user.user_id,
+            kind=kind,
+            file_name=file_name[:255],
+            file_hash=file_hash,
+            file_size=len(data),
+            file_data=bytes(data),
+        )
+        .on_conflict_do_nothing(index_elements=["org_id", "kind", "file_hash"])
+        .returning(ImportJob.id)
+    ).scalar()
+
+    if job_id is None:
+        job = db.query(ImportJob).filter(
+            ImportJob.org_id == user.org_id,
+            ImportJob.kind == kind,
+            ImportJob.file_hash == file_hash
+        ).one()
+        if job.status == ImportJobStatus.failed.value:
+            db.execute(delete(ImportJobError).where(ImportJobError.job_id == job.id))
+            job.status = ImportJobStatus.pending.value
+            job.created_by = user.user_id
+            job.attempts = 0
+            job.last_error = None
+            job.processed_rows = job.inserted = job.updated = job.error_rows = 0
+            job.started_at = job.finished_at = None
+        job_id = job.id
+
+    db.commit()
+    return get_import_job(db, user.org_id, job_id)
+
+
+def get_import_job(db: Session, org_id: UUID, job_id: UUID) -> ImportJob:
+    job = db.query(ImportJob).filter(
+        ImportJob.id == job_id,
+        ImportJob.org_id == org_id
+    ).first()
+    if not job:
+        error_response(message="Import job not found", http_status=404)
+    return job
+
+
+def get_import_jobs(db: Session, org_id: UUID, skip: int = 0, limit: int = 50) -> List[ImportJob]:
+    return (
+        db.query(ImportJob)
+        .filter(ImportJob.org_id == org_id)
+        .order_by(ImportJob.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_import_job_errors(db: Session, org_id: UUID, job_id: UUID, skip: int = 0, limit: int = 100):
+    get_import_job(db, org_id, job_id)
+    query = db.query(ImportJobError).filter(ImportJobError.job_id == job_id)
+    rows = query.order_by(ImportJobError.row).offset(skip).limit(limit).all()
+    return {
+        "errors": [{"row": r.row, "errors": r.errors} for r in rows],
+        "total": query.with_entities(func.count(ImportJobError.id)).scalar() or 0,
+    }
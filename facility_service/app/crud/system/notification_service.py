@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from ...models.system.notifications import Notification
+
+
+class NotificationService:
+
+    @staticmethod
+    def bulk_publish(db: Session, user_ids: Iterable, payload: Dict[str, Any]) -> int:
+        """
+        Insert the same notification for every user in one multi-row INSERT
+        (org-wide broadcasts, admin fan-out). `payload` holds the Notification
+        columns: type, title, message and optionally priority / is_email.
+        Runs in the caller's transaction; returns the number of rows added.
+        """
+        posted_date = datetime.utcnow()
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "posted_date": posted_date,
+                "read": False,
+                "is_deleted": False,
+                "is_email": False,
+                **payload,
+            }
+            for user_id in dict.fromkeys(user_ids)
+            if user_id
+        ]
+        if rows:
+            db.execute(insert(Notification), rows)
+        return len(rows)
@@ -4,7 +4,7 @@ from sqlalchemy import func
 from typing import Dict, List, Optional
 
 from ...schemas.system.notifications_schemas import NotificationOut
-from ...models.system.notifications import Notification
+from ...models.system.notifications import Notification, NotificationCounter
 from shared.core.schemas import CommonQueryParams, Lookup
 
 from ...schemas.access_control.role_management_schemas import (
@@ -34,13 +34,20 @@ def get_all_notifications(db: Session, user_id: str, params: CommonQueryParams):
 
 
 def get_notification_count(db: Session, user_id: str):
-    notification_count = db.query(func.count(Notification.id)).filter(
-        Notification.user_id == user_id,
-        Notification.read == False,
-        Notification.is_deleted == False
+    # Maintained by the triggers in utils/notification_stream.py
+    notification_count = db.query(NotificationCounter.unread_count).filter(
+        NotificationCounter.user_id == user_id
     ).scalar()
 
-    return notification_count
+    return notification_count or 0
+
+
+def get_notification_counts(db: Session, user_ids: List[str]) -> Dict[str, int]:
+    rows = db.query(NotificationCounter.user_id, NotificationCounter.unread_count).filter(
+        NotificationCounter.user_id.in_(user_ids)
+    ).all()
+
+    return {str(user_id): count for user_id, count in rows}
 
 
 def mark_notification_as_read(db: Session, notification_id: str):
@@ -2,8 +2,13 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 from ...models.system.system_settings import SystemSetting
 from ...schemas.system.system_settings_schema import SystemGeneralSettings, SystemIntegrationSettings, SystemSecuritySettings, SystemSettingsOut, SystemSettingsUpdate
+from shared.helpers.reference_cache import cached_reference, invalidate_on_change
 
 
+invalidate_on_change(SystemSetting, "system_settings")
+
+
+@cached_reference("system_settings")
 def get_system_settings(db: Session, org_id: UUID):
     setting = (
         db.query(SystemSetting)
@@ -96,6 +101,7 @@ def update_system_settings(db: Session, setting_id: UUID, update_data: SystemSet
     }
 
 
+@cached_reference("system_settings")
 def get_system_currency(db: Session, org_id: UUID) -> str | None:
     currency = (
         db.query(SystemSetting.currency)
@@ -104,3 +110,12 @@ def get_system_currency(db: Session, org_id: UUID) -> str | None:
     )
 
     return currency
+
+
+@cached_reference("system_settings")
+def get_api_rate_limit(db: Session, org_id: UUID) -> int | None:
+    return (
+        db.query(SystemSetting.api_rate_limit_per_hour)
+        .filter(SystemSetting.org_id == org_id)
+        .scalar()
+    )
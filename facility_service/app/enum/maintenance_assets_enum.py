@@ -16,6 +16,14 @@ class WorkOrderPriority(str, Enum):
     critical = "critical"
 
 
+class InventoryMovementType(str, Enum):
+
+    receipt = "receipt"
+    issue = "issue"
+    transfer = "transfer"
+    adjustment = "adjustment"
+
+
 class PmtemplateFrequency(str, Enum):
 
     weekly = "weekly"
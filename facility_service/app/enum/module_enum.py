@@ -6,4 +6,7 @@ class ModuleName(str, Enum):
     leases = "leases"
     tenants = "tenants"
     bills = "bills"
-    payments = "payments"
\ No newline at end of file
+    payments = "payments"
+    tickets = "tickets"
+    spaces = "spaces"
+    vendors = "vendors"
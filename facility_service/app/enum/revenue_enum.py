@@ -20,3 +20,10 @@ class InvoiceType(str, Enum):
     work_order = "work_order"
     owner_maintenance = "owner_maintenance"
     parking_pass = "parking_pass"
+
+
+class BillingRunStatus(str, Enum):
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
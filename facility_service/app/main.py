@@ -3,19 +3,19 @@ from facility_service.app.router.parking_access import parking_slots_router
 from facility_service.app.router.space_sites import maintenance_template_router
 from .router.space_sites import owner_maintenances_router
 from .router.leasing_tenants import lease_charge_code_router
-from shared.models import email_template
+from shared.models import email_outbox, email_template, org_membership
 from .router.system import notifiaction_settings_router
-from .router.system import notifications_router, system_settings_router
+from .router.system import email_outbox_router, import_jobs_router, notifications_router, system_settings_router
 from .router.procurement import contracts_router, vendor_router
 from .router.mobile_app import home_router, help_desk_router, user_profile_router
-from .router.common import export_router, master_router
+from .router.common import export_router, master_router, search_router
 from .router.service_ticket import tickets_router, ticket_category_router, ticket_dashboard_router, ticket_workload_router, sla_policy_router, ticket_work_order_router
 from .router.energy_iot import meter_readings_router, meters_router, consumption_report_router
 from .router.overview import analytics_router, dashboard_router
 from .router.hospitality import bookings_router, rate_plans_router, housekeeping_tasks_router
 from .router.parking_access import parking_zones_router, access_events_router, visitors_router, parking_pass_router
 from .router.maintenance_assets import (
-    asset_category_router, assets_router, inventory_items_router, inventory_stocks_router, pm_template_router, service_request_router, work_order_router)
+    asset_category_router, assets_router, inventory_items_router, inventory_movements_router, inventory_stocks_router, pm_template_router, service_request_router, work_order_router)
 from .router.crm import contact_router
 from .router.financials import (
     invoice_router, tax_codes_router, revenue_router, bills_router)
@@ -41,22 +41,31 @@ from .router.access_control import (
 )
 from shared.helpers.exception_handler import setup_exception_handlers
 from shared.wrappers.response_wrapper import JsonResponseMiddleware
+from shared.wrappers.rate_limit_middleware import RateLimitMiddleware
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from shared.core.database import facility_engine, Base
+from shared.core.database import FacilitySessionLocal, facility_engine, Base
+from shared.core.migrations import sync_columns, sync_indexes
+from .utils.notification_stream import install_notification_triggers, notification_hub
+from .utils.overlap_constraints import install_overlap_constraints
+from .utils.room_inventory import install_room_inventory_triggers
+from .utils.occupancy_state import install_occupancy_state
+from .utils.inventory_ledger import install_inventory_ledger
+from .utils.access_event_partitions import install_access_event_partitions
+from .crud.system.system_settings_crud import get_api_rate_limit
 
 from .models.energy_iot import meters, meter_readings
-from .models.parking_access import parking_zones, parking_pass, access_events, visitors, parking_slots
+from .models.parking_access import parking_zones, parking_pass, access_events, access_event_rollups, visitors, parking_slots
 from .models.crm import contacts, companies
-from .models.financials import invoices, bills, customer_advances, tax_codes, tax_reports
+from .models.financials import billing_runs, invoices, bills, customer_advances, tax_codes, tax_reports
 from .models.leasing_tenants import leases, lease_charges, tenant_spaces, tenants, lease_charge_code, lease_payment_term
 from .models.space_sites import (
     buildings, orgs, sites, space_filter_models, space_group_members, space_groups, space_owners, owner_maintenances,
-    user_sites, space_occupancies, space_occupancy_events, maintenance_templates, space_handover, space_inspections,
+    user_sites, space_occupancies, space_occupancy_events, space_occupancy_state, maintenance_templates, space_handover, space_inspections,
     space_maintenances, space_settlements
 )
-from .models.system import notifications, notification_settings, system_settings
-from .models.common import comments, attachments, staff_sites
+from .models.system import notifications, notification_settings, system_settings, import_jobs
+from .models.common import comments, attachments, staff_sites, search_documents
 from .models import (
     purchase_order_lines, purchase_orders
 )
@@ -67,6 +76,15 @@ app = FastAPI(title="Facility Service API")
 
 # Create all tablesss
 Base.metadata.create_all(bind=facility_engine)
+sync_columns(facility_engine, Base.metadata)
+install_access_event_partitions(facility_engine)
+install_overlap_constraints(facility_engine)
+install_room_inventory_triggers(facility_engine)
+sync_indexes(facility_engine, Base.metadata)
+install_notification_triggers(facility_engine)
+install_occupancy_state(facility_engine)
+install_inventory_ledger(facility_engine)
+app.add_event_handler("shutdown", notification_hub.close)
 
 origins = [
     "http://localhost:8080",
@@ -76,6 +94,15 @@ origins = [
     "https://facility.zentrixel.com"
 ]
 
+
+def _org_rate_limit(org_id: str):
+    with FacilitySessionLocal() as db:
+        return get_api_rate_limit(db, org_id)
+
+
+# Registered before CORS so 429 responses still carry CORS headers
+app.add_middleware(RateLimitMiddleware, limit_for_org=_org_rate_limit)
+
 app.add_middleware(
     CORSMiddleware,
     # or ["*"] to allow all origins (not recommended for productionS)
@@ -83,7 +110,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["Content-Disposition"]
+    expose_headers=["Content-Disposition", "RateLimit-Limit",
+                    "RateLimit-Remaining", "RateLimit-Reset", "Retry-After"]
 )
 
 # 🔥 FIXED: Add the middleware correctly
@@ -104,6 +132,7 @@ app.include_router(vendor_router.router)
 app.include_router(contracts_router.router)
 app.include_router(inventory_items_router.router)
 app.include_router(inventory_stocks_router.router)
+app.include_router(inventory_movements_router.router)
 app.include_router(purchase_orders_router.router)
 app.include_router(purchase_order_lines_router.router)
 app.include_router(commercial_partners_router.router)
@@ -159,6 +188,9 @@ app.include_router(owner_maintenances_router.router)
 app.include_router(space_occupancy_router.router)
 app.include_router(maintenance_template_router.router)
 app.include_router(parking_slots_router.router)
+app.include_router(search_router.router)
+app.include_router(email_outbox_router.router)
+app.include_router(import_jobs_router.router)
 
 
 @app.get("/api/health")
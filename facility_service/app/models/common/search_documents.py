@@ -0,0 +1,55 @@
+import uuid
+from sqlalchemy import Column, Computed, DateTime, Index, String, Text, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from shared.core.database import Base
+from shared.helpers.search_helper import trigram_index
+
+
+class SearchDocument(Base):
+    """
+    Denormalized search row per searchable entity (ticket, space, tenant,
+    lease, invoice, vendor). Kept in sync by the mapper hooks in
+    crud/common/search_crud.py and queried by /api/search.
+    """
+    __tablename__ = "search_documents"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    module = Column(String(32), nullable=False)  # ModuleName value
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    org_id = Column(UUID(as_uuid=True), nullable=False)
+    site_id = Column(UUID(as_uuid=True), nullable=True)
+    space_id = Column(UUID(as_uuid=True), nullable=True)
+
+    title = Column(String(255), nullable=False)
+    subtitle = Column(String(255))
+    body = Column(Text)
+    status = Column(String(32))
+
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple'::regconfig, "
+            "coalesce(title, '') || ' ' || coalesce(subtitle, '') || ' ' || coalesce(body, ''))",
+            persisted=True
+        )
+    )
+    updated_at = Column(DateTime(timezone=True),
+                        server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("module", "entity_id",
+                         name="uq_search_document_module_entity"),
+
+        # Org / site scoping
+        Index("ix_search_document_org_module", "org_id", "module"),
+        Index("ix_search_document_org_site", "org_id", "site_id"),
+
+        # Full text + fuzzy prefix / substring matching
+        Index(
+            "ix_search_document_vector",
+            "search_vector",
+            postgresql_using="gin"
+        ),
+        trigram_index("ix_search_document_title_trgm", "title"),
+        trigram_index("ix_search_document_subtitle_trgm", "subtitle"),
+    )
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Boolean, Column, String, Numeric, ForeignKey, UniqueConstraint, DateTime, func
+from sqlalchemy import Boolean, Column, Index, String, Numeric, ForeignKey, UniqueConstraint, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from shared.core.database import Base
@@ -33,6 +33,8 @@ class MeterReading(Base):
     )
     __table_args__ = (
         UniqueConstraint("meter_id", "ts", name="uq_meter_readings_meter_ts"),
+        # PM engine: readings received since a meter's last evaluation
+        Index("ix_meter_readings_meter_created", "meter_id", "created_at"),
     )
 
     # ✅ Relationship to Meter
@@ -3,6 +3,7 @@ from sqlalchemy import Boolean, Column, String, Numeric, ForeignKey, UniqueConst
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from shared.core.database import Base
+from shared.helpers.search_helper import trigram_index
 
 
 class Meter(Base):
@@ -28,6 +29,9 @@ class Meter(Base):
     __table_args__ = (
         UniqueConstraint("org_id", "site_id", "code",
                          name="uq_meters_org_site_code"),
+        # Trigram indexes for meter / reading search
+        trigram_index("ix_meter_code_trgm", "code"),
+        trigram_index("ix_meter_kind_trgm", "kind"),
     )
 
     # Optional relationships (only if you have these models)
@@ -0,0 +1,48 @@
+import uuid
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, Numeric, String, Text, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from shared.core.database import Base
+from ...enum.revenue_enum import BillingRunStatus
+
+
+class BillingRun(Base):
+    """
+    Run log of the monthly invoice generation, one row per org and billing
+    window. Charges are invoiced chunk by chunk with progress committed after
+    each, so running the same window again resumes where a failed run stopped.
+    """
+    __tablename__ = "billing_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    org_id = Column(UUID(as_uuid=True), ForeignKey("orgs.id"), nullable=False)
+    period_start = Column(Date, nullable=False)
+    period_end = Column(Date, nullable=False)
+    created_by = Column(UUID(as_uuid=True))
+
+    status = Column(String(16), nullable=False,
+                    default=BillingRunStatus.pending.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    # Refreshed after every chunk; a running row that stops moving is stale
+    locked_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+
+    # Totals over all attempts for the window
+    charges_staged = Column(Integer, nullable=False, default=0)
+    charges_skipped = Column(Integer, nullable=False, default=0)
+    invoices_created = Column(Integer, nullable=False, default=0)
+    amount_invoiced = Column(Numeric(14, 2), nullable=False, default=0)
+    advances_applied = Column(Integer, nullable=False, default=0)
+    emails_queued = Column(Integer, nullable=False, default=0)
+    # Invoices the last email pass could not queue; retried by the next one
+    emails_failed = Column(Integer, default=0)
+    last_email_error = Column(Text)
+
+    created_at = Column(DateTime(timezone=True),
+                        nullable=False, server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("uq_billing_runs_org_period", "org_id", "period_start", unique=True),
+    )
@@ -1,6 +1,6 @@
 import uuid
 from sqlalchemy import (
-    Boolean, Column, String, Date, Numeric, Text, ForeignKey, DateTime, func, UniqueConstraint
+    Boolean, Column, String, Date, Numeric, Text, ForeignKey, DateTime, func, UniqueConstraint, Index
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -35,6 +35,11 @@ class Invoice(Base):
     # Rename to avoid conflict
     # Column name in DB stays "metadata"
     meta: dict = Column("metadata", JSONB)
+    # Set on invoices generated by a billing run
+    billing_run_id: UUID = Column(
+        UUID(as_uuid=True), ForeignKey("billing_runs.id"))
+    # When the invoice email was written to the outbox
+    emailed_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True),
                         server_default=func.now(), onupdate=func.now())
@@ -43,6 +48,8 @@ class Invoice(Base):
         # unique constraint on org_id + invoice_no
         UniqueConstraint("org_id", "invoice_no",
                          name="uq_invoice_org_invoice_no"),
+        Index("ix_invoices_billing_run", "billing_run_id",
+              postgresql_where=billing_run_id.isnot(None)),
     )
 
     # Relationships
@@ -95,3 +102,7 @@ class PaymentAR(Base):
 
     # Relationship
     invoice = relationship("Invoice", back_populates="payments")
+
+    __table_args__ = (
+        Index("ix_payments_ar_org_paid_at", "org_id", "paid_at"),
+    )
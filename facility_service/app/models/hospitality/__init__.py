@@ -10,4 +10,5 @@ from .folios_payments import FolioPayment
 from .guests import Guest
 from .rate_plans import RatePlan
 from .rates import Rate
-from .housekeeping_tasks import HousekeepingTask
\ No newline at end of file
+from .housekeeping_tasks import HousekeepingTask
+from .room_inventory import RoomInventory
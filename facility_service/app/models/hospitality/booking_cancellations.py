@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text, ForeignKey, TIMESTAMP, Numeric, Boolean, JSON
+from sqlalchemy import Column, String, Text, ForeignKey, TIMESTAMP, Numeric, Boolean, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from shared.core.database import Base
@@ -20,6 +20,11 @@ class BookingCancellation(Base):
     policy_applied = Column(JSON)
     refund_processed = Column(Boolean, default=False)
 
+    __table_args__ = (
+        Index("ix_booking_cancellations_booking_cancelled_at",
+              "booking_id", "cancelled_at"),
+    )
+
     # relationships
     cancelled_by_guest = relationship(
         "Guest", back_populates="cancellations_made")
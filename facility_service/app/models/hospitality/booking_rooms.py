@@ -1,6 +1,6 @@
 import uuid
-from sqlalchemy import Column, String, Numeric, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Index, String, Numeric, JSON, ForeignKey, text
+from sqlalchemy.dialects.postgresql import DATERANGE, ExcludeConstraint, UUID
 
 from sqlalchemy.orm import relationship
 from shared.core.database import Base
@@ -8,6 +8,16 @@ from shared.core.database import Base
 
 class BookingRoom(Base):
     __tablename__ = "booking_rooms"
+    __table_args__ = (
+        # An allocated room can only be booked once per night
+        ExcludeConstraint(
+            ("space_id", "="), ("stay", "&&"),
+            name="excl_booking_rooms_space_stay",
+            using="gist",
+            where=text("status = 'allocated'"),
+        ),
+        Index("ix_booking_rooms_stay", "stay", postgresql_using="gist"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     booking_id = Column(UUID(as_uuid=True), ForeignKey("bookings.id"))
@@ -16,6 +26,9 @@ class BookingRoom(Base):
     price_per_night = Column(Numeric(12, 2), nullable=False)
     taxes = Column(JSON)
     status = Column(String(24), default="allocated")
+    # Nights [check_in, check_out) of the booking while it holds the room,
+    # NULL otherwise; kept in sync with bookings by trigger (see overlap_constraints)
+    stay = Column(DATERANGE)
 
     booking = relationship("Booking", back_populates="rooms")
     rate_plan = relationship("RatePlan", back_populates="booking_rooms")
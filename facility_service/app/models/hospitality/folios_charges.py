@@ -1,6 +1,6 @@
 # folio_charges.py
 import uuid
-from sqlalchemy import Column, String, Text, Date, Numeric, ForeignKey
+from sqlalchemy import Column, String, Text, Date, Numeric, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from shared.core.database import Base
@@ -18,4 +18,9 @@ class FolioCharge(Base):
     tax_pct = Column(Numeric(5, 2), default=0)
     metadata_json = Column(JSONB)   # renamed
 
+    __table_args__ = (
+        # Monthly revenue KPIs range-scan charges per folio by date
+        Index("ix_folio_charges_folio_date", "folio_id", "date"),
+    )
+
     folio = relationship("Folio", back_populates="charges")
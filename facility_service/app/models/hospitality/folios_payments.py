@@ -1,6 +1,6 @@
 # folio_payments.py
 import uuid
-from sqlalchemy import Column, String, TIMESTAMP, Numeric,  ForeignKey
+from sqlalchemy import Column, String, TIMESTAMP, Numeric,  ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from shared.core.database import Base
@@ -17,4 +17,8 @@ class FolioPayment(Base):
     paid_at = Column(TIMESTAMP)
     metadata_json = Column(JSONB)
 
+    __table_args__ = (
+        Index("ix_folio_payments_folio_paid_at", "folio_id", "paid_at"),
+    )
+
     folio = relationship("Folio", back_populates="payments")
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, ForeignKey, Date, Numeric, Integer, Boolean, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Date, Index, Numeric, Integer, Boolean, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from shared.core.database import Base
@@ -7,8 +7,11 @@ from shared.core.database import Base
 
 class Rate(Base):
     __tablename__ = "rates"
-    __table_args__ = (UniqueConstraint(
-        'rate_plan_id', 'space_group_id', 'date'),)
+    __table_args__ = (
+        UniqueConstraint('rate_plan_id', 'space_group_id', 'date'),
+        # Availability search: every plan's rates for a set of groups and dates
+        Index("ix_rates_group_date", "space_group_id", "date"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     rate_plan_id = Column(UUID(as_uuid=True), ForeignKey("rate_plans.id"))
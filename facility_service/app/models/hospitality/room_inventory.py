@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Date, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from shared.core.database import Base
+
+
+class RoomInventory(Base):
+    """Rooms of a space group sold per night, kept current by triggers (see room_inventory)."""
+    __tablename__ = "room_inventory"
+
+    space_group_id = Column(UUID(as_uuid=True), ForeignKey(
+        "space_groups.id", ondelete="CASCADE"), primary_key=True)
+    date = Column(Date, primary_key=True)
+    sold = Column(Integer, nullable=False, default=0)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Boolean, Column, DateTime, String, Date, Numeric, ForeignKey, func
+from sqlalchemy import Boolean, Column, DateTime, String, Date, Numeric, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from sqlalchemy.orm import relationship
@@ -8,6 +8,10 @@ from shared.core.database import Base
 
 class LeaseCharge(Base):
     __tablename__ = "lease_charges"
+    __table_args__ = (
+        # Rent charge sync reads a lease's charges by period
+        Index("ix_lease_charges_lease_period", "lease_id", "period_start"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     lease_id = Column(UUID(as_uuid=True), ForeignKey(
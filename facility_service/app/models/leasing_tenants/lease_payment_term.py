@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Date, Numeric, ForeignKey, DateTime
+from sqlalchemy import Column, String, Date, Numeric, ForeignKey, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -8,6 +8,9 @@ from shared.core.database import Base
 
 class LeasePaymentTerm(Base):
     __tablename__ = "lease_payment_terms"
+    __table_args__ = (
+        Index("ix_lease_payment_terms_lease_due", "lease_id", "due_date"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     lease_id = Column(UUID(as_uuid=True), ForeignKey(
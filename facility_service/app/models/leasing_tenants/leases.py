@@ -1,6 +1,6 @@
 import uuid
-from sqlalchemy import Boolean, Column, Enum, Sequence, String, Date, Numeric, ForeignKey, DateTime, UniqueConstraint, event, select
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import Boolean, Column, Computed, Enum, Index, Sequence, String, Date, Numeric, ForeignKey, DateTime, UniqueConstraint, event, select, text
+from sqlalchemy.dialects.postgresql import DATERANGE, ExcludeConstraint, JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from shared.core.database import Base
@@ -12,10 +12,23 @@ class RentPeriod(str, enum.Enum):
     annually = "annually"
 
 
+# Leases that still hold their space (same rule as validate_no_overlapping_lease)
+LEASE_HOLDS_SPACE = "NOT is_deleted AND status NOT IN ('expired', 'terminated', 'inactive')"
+
+
 class Lease(Base):
     __tablename__ = "leases"
     __table_args__ = (
         UniqueConstraint("org_id", "lease_number"),
+        # Two leases holding the same space may not share a day
+        ExcludeConstraint(
+            ("space_id", "="), ("period", "&&"),
+            name="excl_leases_space_period",
+            using="gist",
+            where=text(LEASE_HOLDS_SPACE),
+        ),
+        # "leases running on a date" (period @> date) for occupancy counters
+        Index("ix_leases_period", "period", postgresql_using="gist"),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -31,6 +44,12 @@ class Lease(Base):
         "tenants.id"), nullable=True)
     start_date = Column(Date, nullable=False)
     end_date = Column(Date, nullable=True)
+    # [start_date, end_date], open-ended while end_date is NULL; NULL if the dates are inverted
+    period = Column(DATERANGE, Computed(
+        "CASE WHEN end_date IS NULL OR end_date >= start_date "
+        "THEN daterange(start_date, end_date, '[]') END",
+        persisted=True
+    ))
     rent_period = Column(
         Enum(RentPeriod),
         nullable=False,
@@ -52,7 +71,10 @@ class Lease(Base):
     termination_date = Column(Date, nullable=True)
     created_at = Column(DateTime(timezone=True),
                         server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True),
+                        server_default=func.now(), onupdate=func.now())
+    # Last rent charge sync; incremental syncs pick leases changed after it
+    rent_synced_at = Column(DateTime(timezone=True), nullable=True)
     is_deleted = Column(Boolean, default=False, nullable=False)
     is_system = Column(Boolean, default=False, nullable=False)
 
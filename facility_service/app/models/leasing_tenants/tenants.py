@@ -5,11 +5,19 @@ from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from shared.core.database import Base
+from shared.helpers.search_helper import trigram_index
 
 
 class Tenant(Base):
     __tablename__ = "tenants"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Trigram indexes for tenant search
+        trigram_index("ix_tenant_name_trgm", "name"),
+        trigram_index("ix_tenant_legal_name_trgm", "legal_name"),
+        trigram_index("ix_tenant_email_trgm", "email"),
+        trigram_index("ix_tenant_phone_trgm", "phone"),
+        {'extend_existing': True},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), nullable=True)
@@ -0,0 +1,48 @@
+# app/models/inventory_movements.py
+import uuid
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Numeric, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from shared.core.database import Base
+
+
+class InventoryMovement(Base):
+    """
+    Append-only stock ledger. `qty` is signed (receipts positive, issues
+    negative); `qty_after` is the stock's on-hand quantity right after the
+    movement and `unit_cost` the cost it moved at, so sum(qty * unit_cost)
+    values the stock at any point.
+    """
+    __tablename__ = "inventory_movements"
+    __table_args__ = (
+        Index("ix_inventory_movements_stock_created", "stock_id", "created_at"),
+        Index("ix_inventory_movements_org_created", "org_id", "created_at"),
+        Index("ix_inventory_movements_work_order", "work_order_id"),
+        Index("ix_inventory_movements_po_line", "po_line_id"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    org_id = Column(UUID(as_uuid=True), nullable=False)
+    site_id = Column(UUID(as_uuid=True))
+    item_id = Column(UUID(as_uuid=True), ForeignKey(
+        "inventory_items.id", ondelete="CASCADE"), nullable=False)
+    stock_id = Column(UUID(as_uuid=True), ForeignKey(
+        "inventory_stocks.id", ondelete="CASCADE"), nullable=False)
+
+    # receipt | issue | transfer | adjustment
+    movement_type = Column(String(16), nullable=False)
+    qty = Column(Numeric(14, 3), nullable=False)
+    qty_after = Column(Numeric(14, 3), nullable=False)
+    unit_cost = Column(Numeric(14, 4))
+
+    work_order_id = Column(UUID(as_uuid=True), ForeignKey(
+        "work_orders.id", ondelete="SET NULL"), nullable=True)
+    po_line_id = Column(UUID(as_uuid=True), ForeignKey(
+        "purchase_order_lines.id", ondelete="SET NULL"), nullable=True)
+    # Both legs of a transfer share it
+    transfer_id = Column(UUID(as_uuid=True), nullable=True)
+
+    notes = Column(Text)
+    created_by = Column(UUID(as_uuid=True), nullable=True)
+    created_at = Column(DateTime(timezone=True),
+                        server_default=func.now(), nullable=False)
@@ -0,0 +1,25 @@
+# app/models/inventory_stock_snapshots.py
+from sqlalchemy import Column, Date, ForeignKey, Index, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+from shared.core.database import Base
+
+
+class InventoryStockSnapshot(Base):
+    """
+    Quantity and value of each stock at the end of `snapshot_date` (UTC),
+    written daily from the movement ledger. Stock-as-of-date reads start
+    from the latest snapshot and add only the movements after it.
+    """
+    __tablename__ = "inventory_stock_snapshots"
+    __table_args__ = (
+        Index("ix_inventory_stock_snapshots_org_date", "org_id", "snapshot_date"),
+    )
+
+    stock_id = Column(UUID(as_uuid=True), ForeignKey(
+        "inventory_stocks.id", ondelete="CASCADE"), primary_key=True)
+    snapshot_date = Column(Date, primary_key=True)
+    org_id = Column(UUID(as_uuid=True), nullable=False)
+    item_id = Column(UUID(as_uuid=True), nullable=False)
+    site_id = Column(UUID(as_uuid=True))
+    qty_on_hand = Column(Numeric(14, 3), nullable=False)
+    value = Column(Numeric(18, 4), nullable=False)
@@ -19,6 +19,8 @@ class InventoryStock(Base):
         nullable=False
     )
     qty_on_hand = Column(Numeric(14, 3), default=0)
+    # Moving average cost, updated with qty_on_hand by every receipt
+    avg_cost = Column(Numeric(14, 4))
     bin_location = Column(String(64))
 
     # ✅ Add soft delete columns
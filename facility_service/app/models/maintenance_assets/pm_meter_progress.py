@@ -0,0 +1,27 @@
+# app/models/maintenance_assets/pm_meter_progress.py
+from sqlalchemy import Column, DateTime, ForeignKey, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from shared.core.database import Base
+
+
+class PMMeterProgress(Base):
+    """
+    Usage a meter has accumulated towards a meter-based PM template's
+    threshold, and the last reading counted. The PM engine adds how far the
+    meter advanced past `last_reading` in readings received after
+    `last_reading_at`, and keeps the remainder once a work order is
+    generated.
+    """
+    __tablename__ = "pm_meter_progress"
+
+    template_id = Column(UUID(as_uuid=True), ForeignKey(
+        "pm_templates.id", ondelete="CASCADE"), primary_key=True)
+    meter_id = Column(UUID(as_uuid=True), ForeignKey(
+        "meters.id", ondelete="CASCADE"), primary_key=True)
+    usage = Column(Numeric(18, 6), nullable=False, default=0)
+    # Cumulative meter value usage was last counted from; null until a reading arrives
+    last_reading = Column(Numeric(18, 6))
+    last_reading_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True),
+                        server_default=func.now(), onupdate=func.now())
@@ -3,14 +3,40 @@
 from datetime import date, timedelta 
 from dateutil.relativedelta import relativedelta
 import uuid
-from sqlalchemy import Boolean, Column, DateTime, String, ForeignKey, JSON, Numeric, Date, func
+from sqlalchemy import Boolean, Column, DateTime, Index, String, ForeignKey, JSON, Numeric, Date, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from shared.core.database import Base
 
 
+def next_due_after(due: date, frequency: str):
+    """One frequency step after `due`; None for meter-only or unknown frequencies."""
+    if not due or not frequency:
+        return None
+
+    frequency_lower = frequency.lower()
+
+    if frequency_lower == 'weekly':
+        return due + timedelta(days=7)
+    elif frequency_lower == 'monthly':
+        return due + relativedelta(months=1)
+    elif frequency_lower in ('quarterly', 'quaterly'):
+        return due + relativedelta(months=3)
+    elif frequency_lower == 'annually':
+        return due + relativedelta(years=1)
+    else:
+        return None
+
+
 class PMTemplate(Base):
     __tablename__ = "pm_templates"
+    __table_args__ = (
+        # PM engine: active templates by the date their next work orders are due
+        Index(
+            "ix_pm_templates_next_due_date", "next_due_date",
+            postgresql_where=text("lower(status) = 'active' AND is_deleted = false")
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     org_id = Column(UUID(as_uuid=True), ForeignKey(
@@ -30,6 +56,10 @@ class PMTemplate(Base):
 
     # New Columns
     start_date = Column(Date, nullable=True)  # stores next PM due date
+    # Calendar PM: when the engine next generates work orders; advanced by
+    # the engine, reset from start_date when the schedule is edited
+    next_due_date = Column(Date, nullable=True)
+    last_generated_at = Column(DateTime(timezone=True), nullable=True)
     # active/inactive/etc.
     status = Column(String(32), nullable=False, default='active')
 
@@ -44,18 +74,6 @@ class PMTemplate(Base):
 #THIS IS FOR DUE_DATE CALCULATION
     @property
     def next_due(self):
-        if not self.start_date or not self.frequency:
-            return None
-        
-        frequency_lower = self.frequency.lower()
-        
-        if frequency_lower == 'weekly':
-            return self.start_date + timedelta(days=7)
-        elif frequency_lower == 'monthly':
-            return self.start_date + relativedelta(months=1)
-        elif frequency_lower == 'quarterly':
-            return self.start_date + relativedelta(months=3)
-        elif frequency_lower == 'annually':
-            return self.start_date + relativedelta(years=1)
-        else:
-            return None
\ No newline at end of file
+        if self.next_due_date:
+            return self.next_due_date
+        return next_due_after(self.start_date, self.frequency)
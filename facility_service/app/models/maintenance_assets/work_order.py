@@ -1,14 +1,28 @@
 # app/models/work_order.py
 import uuid
-from sqlalchemy import Boolean, Column, String, Text, ForeignKey, JSON, TIMESTAMP
+from sqlalchemy import Boolean, Column, Date, Index, Sequence, String, Text, ForeignKey, JSON, TIMESTAMP, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from shared.core.database import Base
 
+# Numbers for work orders generated from PM templates (PM-000001, ...)
+pm_work_order_seq = Sequence(
+    "pm_work_order_no_seq", start=1, increment=1, metadata=Base.metadata)
+
 
 class WorkOrder(Base):
     __tablename__ = "work_orders"
+    __table_args__ = (
+        # One generated work order per template, asset and due date, so a
+        # re-run or a second scheduler replica cannot duplicate it
+        Index(
+            "uq_work_orders_pm_template_asset_due",
+            "pm_template_id", "asset_id", "pm_due_date",
+            unique=True,
+            postgresql_where=text("pm_template_id IS NOT NULL")
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     org_id = Column(UUID(as_uuid=True), ForeignKey(
@@ -33,6 +47,10 @@ class WorkOrder(Base):
         "vendors.id", ondelete="SET NULL"), nullable=True)
     sla = Column(JSON, nullable=True)
     created_by = Column(UUID(as_uuid=True), nullable=True)  # plain UUID, no FK
+    # Set on work orders generated by the PM engine
+    pm_template_id = Column(UUID(as_uuid=True), ForeignKey(
+        "pm_templates.id", ondelete="SET NULL"), nullable=True)
+    pm_due_date = Column(Date, nullable=True)
     # ✅ Add soft delete column
     is_deleted = Column(Boolean, default=False, nullable=False)
     # ✅ Add deleted timestamp
@@ -0,0 +1,31 @@
+# app/models/access_event_rollups.py
+from sqlalchemy import Column, Date, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from shared.core.database import Base
+
+
+class AccessEventDaily(Base):
+    """
+    Event counts per site and UTC day, kept current by the ingest
+    endpoint. Outlives partition retention, so overview totals do too.
+    """
+    __tablename__ = "access_event_daily"
+
+    org_id = Column(UUID(as_uuid=True), primary_key=True)
+    site_id = Column(UUID(as_uuid=True), primary_key=True)
+    day = Column(Date, primary_key=True)
+    events = Column(Integer, nullable=False, default=0)
+    entries = Column(Integer, nullable=False, default=0)
+    exits = Column(Integer, nullable=False, default=0)
+
+
+class AccessEventIdentity(Base):
+    """
+    Every vehicle / card combination an org has seen at its gates, as
+    "<vehicle_no>-<card_id>", for the unique IDs card.
+    """
+    __tablename__ = "access_event_identities"
+
+    org_id = Column(UUID(as_uuid=True), primary_key=True)
+    identity = Column(String(90), primary_key=True)
+    first_seen_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, ForeignKey, DateTime
+from sqlalchemy import Column, String, ForeignKey, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -8,6 +8,12 @@ from shared.core.database import Base
 
 
 class AccessEvent(Base):
+    """
+    Gate events: append-only and range-partitioned by month on ts
+    (access_events_pYYYYMM plus access_events_default, see
+    utils/access_event_partitions). The partition key has to be part of
+    the primary key. Overview cards read access_event_daily instead.
+    """
     __tablename__ = "access_events"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -18,6 +24,14 @@ class AccessEvent(Base):
     gate = Column(String(64))
     vehicle_no = Column(String(20))
     card_id = Column(String(64))
-    ts = Column(DateTime(timezone=True),
+    ts = Column(DateTime(timezone=True), primary_key=True,
                 nullable=False, default=datetime.utcnow)
     direction = Column(String(8))  # "in" or "out"
+
+    __table_args__ = (
+        Index("ix_access_events_org_ts", "org_id", "ts"),
+        # Rows arrive in ts order, so a BRIN index serves time-range scans
+        # (analytics, retention) at a fraction of a btree's size
+        Index("ix_access_events_ts_brin", "ts", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (ts)"},
+    )
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Boolean, Column, String, DateTime, Enum, ForeignKey
+from sqlalchemy import Boolean, Column, String, DateTime, Enum, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 
 from shared.core.database import Base
@@ -28,3 +28,7 @@ class Visitor(Base):
     )
     vehicle_no = Column(String(20), nullable=True)
     is_expected = Column(Boolean, nullable=False, default=True)
+
+    __table_args__ = (
+        Index("ix_visitors_org_entry_time", "org_id", "entry_time"),
+    )
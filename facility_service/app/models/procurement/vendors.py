@@ -4,6 +4,7 @@ from sqlalchemy import Boolean, Column, DateTime, String, Numeric, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from shared.core.database import Base
+from shared.helpers.search_helper import trigram_index
 
 
 class Vendor(Base):
@@ -30,4 +31,10 @@ class Vendor(Base):
     work_orders = relationship("WorkOrder", back_populates="vendor")
     # In your Vendor model, add this relationship
     tickets = relationship("Ticket", back_populates="vendor")
+
+    __table_args__ = (
+        # Trigram indexes for vendor search
+        trigram_index("ix_vendor_name_trgm", "name"),
+        trigram_index("ix_vendor_gst_vat_id_trgm", "gst_vat_id"),
+    )
    
\ No newline at end of file
@@ -10,6 +10,7 @@ import uuid
 from ...enum.ticket_service_enum import TicketStatus
 from shared.core.database import Base
 from shared.core.database import Base  # adjust the import to your Base
+from shared.helpers.search_helper import trigram_index
 from datetime import date, datetime, timezone, timedelta
 from sqlalchemy import Sequence
 from sqlalchemy import event
@@ -155,6 +156,12 @@ class Ticket(Base):
             "created_at",
             postgresql_where=(status != 'closed')
         ),
+
+        # -------------------------------------------------------
+        # 8. Trigram indexes — search on ticket no / title
+        # -------------------------------------------------------
+        trigram_index("ix_ticket_ticket_no_trgm", "ticket_no"),
+        trigram_index("ix_ticket_title_trgm", "title"),
     )
 
     # -------------------------------
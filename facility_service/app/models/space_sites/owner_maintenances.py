@@ -52,23 +52,19 @@ class OwnerMaintenanceCharge(Base):  # Renamed class
     is_deleted = Column(Boolean, default=False, nullable=False)
 
     # Indexes
-    _table_args_ = (
+    __table_args__ = (
         UniqueConstraint(
             "org_id",
             "maintenance_no",
             name="uq_org_maintenance_no"
         ),
+        # Duplicate check of maintenance generation; soft-deleted charges
+        # may repeat a period, so it is not unique
         Index(
             "ix_owner_maintenance_owner_period",
             "space_owner_id",
             "period_start"
         ),
-        Index(
-            "uq_owner_maintenance_owner_period",
-            "space_owner_id",
-            "period_start",
-            unique=True
-        ),
     )
 
     # Relationships
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, ForeignKey, String, DateTime, func
+from sqlalchemy import Column, ForeignKey, Index, String, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -8,6 +8,10 @@ from shared.core.database import Base
 
 class SpaceGroupMember(Base):
     __tablename__ = "space_group_members"
+    __table_args__ = (
+        # Groups of a room, for the room_inventory triggers
+        Index("ix_space_group_members_space", "space_id"),
+    )
 
     group_id = Column(UUID(as_uuid=True), ForeignKey(
         "space_groups.id", ondelete="CASCADE"), primary_key=True)
@@ -2,7 +2,7 @@
 import uuid
 from enum import Enum as PyEnum
 from sqlalchemy import (
-    Column, Date, DateTime, Enum, ForeignKey, Text
+    Column, Date, DateTime, Enum, ForeignKey, Index, Text
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
@@ -41,6 +41,10 @@ class OccupancyEventType(str, PyEnum):
 
 class SpaceOccupancyEvent(Base):
     __tablename__ = "space_occupancy_events"
+    __table_args__ = (
+        # Timelines: a space's events in (date, id) keyset order
+        Index("ix_space_occupancy_events_space_date_id", "space_id", "event_date", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
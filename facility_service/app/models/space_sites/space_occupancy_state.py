@@ -0,0 +1,42 @@
+from sqlalchemy import Boolean, Column, Date, DateTime, Enum, ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from facility_service.app.models.space_sites.space_occupancies import OccupantType
+from facility_service.app.models.space_sites.space_occupancy_events import OccupancyEventType
+from shared.core.database import Base
+
+
+class SpaceOccupancyState(Base):
+    """
+    Current occupancy of a space, one row per space, so reads need not
+    walk the move-in / move-out stages. Rewritten in the same transaction
+    as every stage change (see utils.occupancy_state).
+    """
+    __tablename__ = "space_occupancy_state"
+    __table_args__ = (
+        Index("ix_space_occupancy_state_org_status", "org_id", "status"),
+    )
+
+    space_id = Column(UUID(as_uuid=True), ForeignKey(
+        "spaces.id", ondelete="CASCADE"), primary_key=True)
+    org_id = Column(UUID(as_uuid=True))
+
+    # vacant | occupied | move_out_scheduled | handover_pending | ... | completed
+    status = Column(String(32), nullable=False, default="vacant")
+    occupant_type = Column(Enum(OccupantType), nullable=True)
+    occupant_user_id = Column(UUID(as_uuid=True), nullable=True)
+    since = Column(DateTime(timezone=True))
+
+    move_in_id = Column(UUID(as_uuid=True), nullable=True)
+    move_in_date = Column(Date, nullable=True)
+    move_out_id = Column(UUID(as_uuid=True), nullable=True)
+    # move_out_scheduled turns into handover_pending on this date
+    move_out_date = Column(Date, nullable=True)
+    can_request_move_in = Column(Boolean)
+    can_request_move_out = Column(Boolean)
+
+    last_event_type = Column(Enum(OccupancyEventType))
+    last_event_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True),
+                        server_default=func.now(), onupdate=func.now())
@@ -6,6 +6,7 @@ from sqlalchemy.orm import relationship
 import uuid
 from facility_service.app.enum.space_sites_enum import SpaceCategory
 from shared.core.database import Base
+from shared.helpers.search_helper import trigram_index
 
 
 class Space(Base):
@@ -119,4 +120,7 @@ class Space(Base):
             "org_id",
             postgresql_where=(status == "out_of_service")
         ),
+
+        # 3) Trigram index for name search
+        trigram_index("ix_space_name_trgm", "name"),
     )
@@ -0,0 +1,68 @@
+import uuid
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, LargeBinary, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import deferred
+
+from shared.core.database import Base
+from shared.utils.enums import ImportJobStatus
+
+
+class ImportJob(Base):
+    """
+    A CSV / XLSX bulk upload applied in the background by the import job
+    worker. One job per (org, kind, file hash): re-submitting the same file
+    returns the existing job.
+    """
+    __tablename__ = "import_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    org_id = Column(UUID(as_uuid=True), nullable=False)
+    created_by = Column(UUID(as_uuid=True), nullable=False)
+    # meter_readings | meters | spaces | parking_slots
+    kind = Column(String(32), nullable=False)
+
+    file_name = Column(String(255), nullable=False)
+    file_hash = Column(String(64), nullable=False)  # sha256 hex
+    file_size = Column(Integer, nullable=False)
+    # Only the worker reads the file itself
+    file_data = deferred(Column(LargeBinary, nullable=False))
+
+    status = Column(String(16), nullable=False,
+                    default=ImportJobStatus.pending.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    locked_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+
+    # Progress, committed after every chunk
+    processed_rows = Column(Integer, nullable=False, default=0)
+    inserted = Column(Integer, nullable=False, default=0)
+    updated = Column(Integer, nullable=False, default=0)
+    error_rows = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(DateTime(timezone=True),
+                        nullable=False, server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("uq_import_jobs_file", "org_id", "kind", "file_hash", unique=True),
+        # Only unfinished jobs are scanned by the worker
+        Index("ix_import_jobs_queue", "created_at",
+              postgresql_where=text("status IN ('pending', 'running')")),
+        Index("ix_import_jobs_org_created", "org_id", "created_at"),
+    )
+
+
+class ImportJobError(Base):
+    """Per-row validation errors of an import job, in BulkUploadError shape."""
+    __tablename__ = "import_job_errors"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey(
+        "import_jobs.id", ondelete="CASCADE"), nullable=False)
+    row = Column(Integer, nullable=False)
+    errors = Column(JSONB, nullable=False)
+
+    __table_args__ = (
+        Index("ix_import_job_errors_job_row", "job_id", "row"),
+    )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum as PyEnum
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import Boolean, Column, String, Integer, Numeric, DateTime, ForeignKey, func, Enum
+from sqlalchemy import Boolean, Column, String, Integer, Numeric, DateTime, ForeignKey, Index, and_, func, Enum
 from sqlalchemy.dialects.postgresql import JSONB
 import uuid
 from shared.core.database import Base
@@ -38,3 +38,53 @@ class Notification(Base):
     is_deleted = Column(Boolean, default=False)
     # ✅ New column
     is_email = Column(Boolean, default=False, nullable=False)
+
+    __table_args__ = (
+        # Unread badge / unread list per user
+        Index(
+            "ix_notifications_user_unread",
+            "user_id",
+            posted_date.desc(),
+            postgresql_where=and_(read == False, is_deleted == False)
+        ),
+        # Paged notification list per user
+        Index(
+            "ix_notifications_user_posted",
+            "user_id",
+            "is_deleted",
+            posted_date.desc()
+        ),
+        # Retention: read or deleted rows by age
+        Index(
+            "ix_notifications_archivable",
+            "posted_date",
+            postgresql_where=(read == True) | (is_deleted == True)
+        ),
+    )
+
+
+class NotificationCounter(Base):
+    """Unread count per user, kept current by triggers on `notifications`."""
+    __tablename__ = "notification_counters"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    unread_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class NotificationArchive(Base):
+    """Old read / deleted notifications moved out by the retention job."""
+    __tablename__ = "notifications_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+
+    type = Column(Enum(NotificationType), nullable=False)
+    title = Column(String(255), nullable=False)
+    message = Column(String(500), nullable=False)
+    posted_date = Column(DateTime)
+    read = Column(Boolean)
+    priority = Column(Enum(PriorityType))
+    is_deleted = Column(Boolean)
+    is_email = Column(Boolean, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
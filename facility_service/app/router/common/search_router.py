@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from ...crud.common import search_crud as crud
+from ...schemas.common.search_schemas import GlobalSearchRequest, GlobalSearchResponse, SearchReindexResponse
+from shared.core.database import get_facility_db as get_db
+from shared.core.auth import allow_admin, validate_current_token
+from shared.core.schemas import UserToken
+
+router = APIRouter(
+    prefix="/api/search",
+    tags=["Search"],
+    dependencies=[Depends(validate_current_token)]
+)
+
+
+@router.get("", response_model=GlobalSearchResponse)
+def global_search(
+        params: GlobalSearchRequest = Depends(),
+        db: Session = Depends(get_db),
+        current_user: UserToken = Depends(validate_current_token)):
+    return crud.global_search(db, current_user, params)
+
+
+@router.post("/reindex", response_model=SearchReindexResponse)
+def reindex(
+        db: Session = Depends(get_db),
+        current_user: UserToken = Depends(allow_admin)):
+    return {"documents": crud.reindex_search_documents(db, current_user.org_id)}
@@ -7,6 +7,7 @@ from typing import List, Optional
 from ...schemas.energy_iot.consumption_report_schema import ConsumptionReportParams
 from shared.core.database import get_facility_db as get_db
 from shared.core.auth import validate_current_token, UserToken
+from shared.helpers.response_cache import cached_response
 from shared.core.schemas import Lookup
 from ...crud.energy_iot import consumption_reports_crud as crud
 
@@ -18,6 +19,7 @@ router = APIRouter(
 
 
 @router.get("/overview")
+@cached_response()
 def get_overview_consumption_reports(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -28,6 +30,7 @@ def get_overview_consumption_reports(
 
 
 @router.get("/weekly-trends")
+@cached_response()
 def get_weekly_consumption_trends(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -36,6 +39,7 @@ def get_weekly_consumption_trends(
 
 
 @router.get("/monthly-cost-analysis")
+@cached_response()
 def get_monthly_cost_analysis(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -44,6 +48,7 @@ def get_monthly_cost_analysis(
 
 
 @router.get("/all", response_model=List)
+@cached_response()
 def get_consumption_reports(
     params:ConsumptionReportParams = Depends(),
     db: Session = Depends(get_db),
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from shared.helpers.json_response_helper import success_response
@@ -10,6 +10,7 @@ from ...crud.energy_iot import meter_readings_crud as crud
 from shared.core.database import get_facility_db as get_db
 from shared.core.auth import validate_current_token  # for dependicies
 from shared.core.schemas import Lookup, UserToken
+from shared.helpers.reference_cache import etag_response
 from uuid import UUID
 
 router = APIRouter(
@@ -56,15 +57,17 @@ def delete_meter_reading(id: str, db: Session = Depends(get_db)):
 
 @router.get("/meter-reading-lookup", response_model=List[Lookup])
 def meter_reading_lookup_endpoint(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
-    return crud.meter_reading_lookup(db, current_user.org_id)
+    return etag_response(request, response, crud.meter_reading_lookup.entry(db, current_user.org_id))
 
 
 @router.post("/bulk-upload")
-async def bulk_update_meters(
+def bulk_update_meters(
         request: BulkMeterReadingRequest,
         db: Session = Depends(get_db),
         current_user: UserToken = Depends(validate_current_token)):
-    return crud.bulk_update_readings(db, request)
+    return crud.bulk_update_readings(db, request, org_id=current_user.org_id)
@@ -37,7 +37,7 @@ async def bulk_update_meters(
         current_user: UserToken = Depends(validate_current_token)):
     for r in request.meters:
         r.org_id = current_user.org_id
-    return crud.bulk_update_meters(db, request)
+    return crud.bulk_update_meters(db, request, org_id=current_user.org_id)
 
 
 @router.post("/", response_model=None)
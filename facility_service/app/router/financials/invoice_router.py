@@ -9,8 +9,8 @@ from sqlalchemy.orm import Session
 from facility_service.app.utils.invoice_generator import auto_generate_monthly_invoices
 from shared.helpers.json_response_helper import error_response, success_response
 from shared.utils.app_status_code import AppStatusCode
-from ...crud.financials import invoices_crud as crud
-from ...schemas.financials.invoices_schemas import AdvancePaymentCreate, AdvancePaymentOut, AdvancePaymentResponse, AutoInvoiceResponse, InvoiceCreate, InvoiceDetailRequest, InvoiceEmailRequest, InvoiceOut, InvoiceTotalsRequest, InvoiceTotalsResponse, InvoiceUpdate, InvoicesOverview, InvoicesRequest, InvoicesResponse, PaymentCreateWithInvoice, PaymentOut, PaymentResponse, UserInvoiceOut
+from ...crud.financials import billing_run_crud, invoices_crud as crud
+from ...schemas.financials.invoices_schemas import AdvancePaymentCreate, AdvancePaymentOut, AdvancePaymentResponse, AutoInvoiceResponse, BillingRunOut, InvoiceCreate, InvoiceDetailRequest, InvoiceEmailRequest, InvoiceOut, InvoiceTotalsRequest, InvoiceTotalsResponse, InvoiceUpdate, InvoicesOverview, InvoicesRequest, InvoicesResponse, PaymentCreateWithInvoice, PaymentOut, PaymentResponse, UserInvoiceOut
 from shared.core.database import get_auth_db, get_facility_db as get_db
 from shared.core.auth import validate_current_token
 from shared.core.schemas import AttachmentOut, DownloadAttachmentRequest, Lookup, UserToken
@@ -385,6 +385,8 @@ async def auto_generate_lease_charges_endpoint(
     background_tasks: BackgroundTasks,
     date: date = Query(
         ..., description="Any date in the month to generate lease charges for"),
+    send_email: bool = Query(
+        False, description="Queue the generated invoices' emails to the outbox"),
     db: Session = Depends(get_db),
     auth_db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -394,5 +396,14 @@ async def auto_generate_lease_charges_endpoint(
         db=db,
         org_id=current_user.org_id,
         target_date=date,
-        current_user=current_user
+        current_user=current_user,
+        send_email=send_email
     )
+
+
+@router.get("/billing-runs", response_model=List[BillingRunOut])
+def get_billing_runs_endpoint(
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return billing_run_crud.get_billing_runs(db, current_user.org_id)
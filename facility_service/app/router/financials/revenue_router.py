@@ -6,6 +6,7 @@ from ...schemas.financials.revenue_schemas import (
 )
 from shared.core.database import get_facility_db as get_db
 from shared.core.auth import validate_current_token, UserToken
+from shared.helpers.response_cache import cached_response
 from shared.core.schemas import Lookup
 from ...crud.financials import revenue_reports_crud as crud
 
@@ -34,6 +35,7 @@ def revenue_reports_filter_site_lookup(
 
 
 @router.get("/overview")
+@cached_response()
 def get_revenue_overview_endpoint(
     params: RevenueReportsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -42,6 +44,7 @@ def get_revenue_overview_endpoint(
     return crud.get_revenue_overview(db, current_user.org_id, params)
 
 @router.get("/revenue-trend")
+@cached_response()
 def get_revenue_trend_endpoint(
     params: RevenueReportsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -50,6 +53,7 @@ def get_revenue_trend_endpoint(
     return crud.get_revenue_trend(db, current_user.org_id, params)
 
 @router.get("/revenue-by-source")
+@cached_response()
 def get_revenue_by_source_endpoint(
     params: RevenueReportsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -58,6 +62,7 @@ def get_revenue_by_source_endpoint(
     return crud.get_revenue_by_source(db, current_user.org_id, params)
 
 @router.get("/revenue-outstanding")
+@cached_response()
 def get_outstanding_receivables_endpoint(
     params: RevenueReportsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -1,5 +1,5 @@
 from typing import List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from ...schemas.hospitality.bookings_schemas import (
@@ -11,10 +11,13 @@ from ...schemas.hospitality.bookings_schemas import (
     BookingOverview
 )
 from uuid import UUID
+from ...schemas.hospitality.availability_schemas import AvailabilityRequest, AvailabilityResponse
 from ...crud.hospitality import bookings_crud as crud
+from ...crud.hospitality import availability_crud
 from shared.core.database import get_facility_db as get_db
 from shared.core.auth import validate_current_token
 from shared.core.schemas import Lookup, UserToken
+from shared.helpers.reference_cache import etag_response
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
@@ -32,6 +35,16 @@ def get_bookings_endpoint(
     return crud.get_bookings(db, current_user.org_id, params)
 
 
+# ---------------- Availability Search ----------------
+@router.get("/availability", response_model=AvailabilityResponse)
+def search_availability_endpoint(
+    params: AvailabilityRequest = Depends(),
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return availability_crud.search_availability(db, current_user.org_id, params)
+
+
 @router.get("/overview", response_model=BookingOverview)
 def get_booking_overview(
     db: Session = Depends(get_db),
@@ -79,10 +92,12 @@ def delete_booking_route(
 
 @router.get("/filter-status-lookup", response_model=List[Lookup])
 def booking_filter_status_lookup_endpoint(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
-    return crud.booking_filter_status_lookup(db, current_user.org_id)
+    return etag_response(request, response, crud.booking_filter_status_lookup.entry(db, current_user.org_id))
 
 # ----------------channel Lookup by enum ----------------
 
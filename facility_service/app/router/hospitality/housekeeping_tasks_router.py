@@ -1,11 +1,12 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from shared.core.database import get_facility_db as get_db
 from shared.core.auth import validate_current_token
 from shared.core.schemas import Lookup, UserToken
+from shared.helpers.reference_cache import etag_response
 from ...schemas.hospitality.housekeeping_tasks_schemas import (
     HousekeepingTaskCreate,
     HousekeepingTaskUpdate,
@@ -68,10 +69,12 @@ def delete_housekeeping_task_endpoint(
 # ----------------filter(DB)  Status  ----------------
 @router.get("/filter-status-lookup", response_model=List[Lookup])
 def housekeeping_tasks_filter_status_lookup_endpoint(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
-    return crud.housekeeping_tasks_filter_status_lookup(db, current_user.org_id)
+    return etag_response(request, response, crud.housekeeping_tasks_filter_status_lookup.entry(db, current_user.org_id))
 
 # -------------------- Status Lookup --------------------
 
@@ -1,5 +1,5 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
 
@@ -8,6 +8,7 @@ from shared.core.database import get_facility_db as get_db
 from shared.core.auth import validate_current_token
 from shared.helpers.json_response_helper import error_response, success_response
 from shared.core.schemas import Lookup, UserToken
+from shared.helpers.reference_cache import etag_response
 from ...schemas.hospitality.rate_plans_schemas import (
     RatePlanCreate,
     RatePlanUpdate,
@@ -83,10 +84,12 @@ def delete_rate_plan_route(
 # ----------------filter(DB)  Status  ----------------
 @router.get("/filter-status-lookup", response_model=List[Lookup])
 def rate_plan_filter_status_lookup_endpoint(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
-    return crud.rate_plan_filter_status_lookup(db, current_user.org_id)
+    return etag_response(request, response, crud.rate_plan_filter_status_lookup.entry(db, current_user.org_id))
 
 # -------------------- Rate Plan Status Lookup --------------------
 
@@ -1,12 +1,13 @@
 from datetime import date
 from typing import Any, Dict, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from ...schemas.leasing_tenants.lease_charges_schemas import AutoLeaseChargeResponse, LeaseChargeCreate, LeaseChargeListResponse, LeaseChargeRequest, LeaseChargeUpdate, LeaseChargesOverview, LeaseRentAmountResponse, RentAmountRequest
 from ...crud.leasing_tenants import lease_charges_crud as crud
 from shared.core.database import get_facility_db as get_db
 from shared.core.auth import allow_admin, validate_current_token  # for dependicies
 from shared.core.schemas import Lookup, UserToken
+from shared.helpers.reference_cache import etag_response
 from uuid import UUID
 
 router = APIRouter(
@@ -22,6 +23,8 @@ router = APIRouter(
 def auto_generate_lease_charges_endpoint(
     date: date = Query(
         ..., description="Any date in the month to generate lease charges for"),
+    incremental: bool = Query(
+        False, description="Only sync leases changed since their last sync"),
     db: Session = Depends(get_db),
     auth_db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -30,7 +33,8 @@ def auto_generate_lease_charges_endpoint(
         db=db,
         auth_db=auth_db,
         input_date=date,
-        current_user=current_user
+        current_user=current_user,
+        incremental=incremental
     )
 
 
@@ -87,16 +91,20 @@ def get_month_lookup(
 
 @router.get("/charge-code-lookup", response_model=List[Lookup])
 def get_charge_code_lookup(
+        request: Request,
+        response: Response,
         db: Session = Depends(get_db),
         current_user: UserToken = Depends(validate_current_token)):
-    return crud.lease_charge_code_lookup(db, current_user.org_id)
+    return etag_response(request, response, crud.lease_charge_code_lookup.entry(db, current_user.org_id))
 
 
 @router.get("/tax-code-lookup", response_model=List[Lookup])
 def get_tax_code_lookup(
+        request: Request,
+        response: Response,
         db: Session = Depends(get_db),
         current_user: UserToken = Depends(validate_current_token)):
-    return crud.tax_code_lookup(db, current_user.org_id)
+    return etag_response(request, response, crud.tax_code_lookup.entry(db, current_user.org_id))
 
 
 @router.post("/lease-rent", response_model=LeaseRentAmountResponse)
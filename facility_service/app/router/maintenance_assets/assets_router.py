@@ -1,6 +1,6 @@
 # app/routers/maintenance_assets/assets_router.py
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from shared.helpers.json_response_helper import success_response
@@ -9,6 +9,7 @@ from ...crud.maintenance_assets import assets_crud as crud
 from shared.core.database import get_facility_db as get_db
 from shared.core.auth import validate_current_token
 from shared.core.schemas import Lookup, UserToken
+from shared.helpers.reference_cache import etag_response
 from uuid import UUID
 from ...schemas.maintenance_assets.asset_category_schemas import AssetCategoryOutFilter
 from ...schemas.maintenance_assets.assets_schemas import AssetStatusOut
@@ -68,8 +69,8 @@ def delete_asset(
 
 
 @router.get("/asset-lookup", response_model=list[Lookup])
-def asset_lookup(db: Session = Depends(get_db), current_user: UserToken = Depends(validate_current_token)):
-    return crud.asset_lookup(db, current_user.org_id)
+def asset_lookup(request: Request, response: Response, db: Session = Depends(get_db), current_user: UserToken = Depends(validate_current_token)):
+    return etag_response(request, response, crud.asset_lookup.entry(db, current_user.org_id))
 
 
 @router.get("/status-lookup", response_model=list[Lookup])
@@ -79,12 +80,14 @@ def status_lookup(db: Session = Depends(get_db), current_user: UserToken = Depen
 
 @router.get("/category-lookup", response_model=List[Lookup])
 def category_lookup(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
-    return crud.assets_category_lookup(db, current_user.org_id)
+    return etag_response(request, response, crud.assets_category_lookup.entry(db, current_user.org_id))
 
 
 @router.get("/filter-status-lookup", response_model=list[Lookup])
-def asset_filter_status_lookup_endpoint(db: Session = Depends(get_db), current_user: UserToken = Depends(validate_current_token)):
-    return crud.asset_filter_status_lookup(db, current_user.org_id)
+def asset_filter_status_lookup_endpoint(request: Request, response: Response, db: Session = Depends(get_db), current_user: UserToken = Depends(validate_current_token)):
+    return etag_response(request, response, crud.asset_filter_status_lookup.entry(db, current_user.org_id))
@@ -0,0 +1,67 @@
+# app/routers/inventory_movements.py
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from shared.core.database import get_facility_db as get_db
+from shared.core.schemas import UserToken
+from shared.core.auth import validate_current_token
+from ...schemas.maintenance_assets.inventory_movements_schemas import (
+    InventoryMovementCreate,
+    InventoryMovementListResponse,
+    InventoryMovementOut,
+    InventoryMovementRequest,
+    InventoryTransferCreate,
+    ReorderAlertOut,
+    StockAsOfOut,
+    StockAsOfRequest,
+)
+from ...crud.maintenance_assets import inventory_movements_crud as crud
+
+router = APIRouter(prefix="/api/inventory-movements",
+                   tags=["inventory_movements"], dependencies=[Depends(validate_current_token)])
+
+
+@router.get("/", response_model=InventoryMovementListResponse)
+def read_movements(
+    params: InventoryMovementRequest = Depends(),
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return crud.get_movements(db, current_user.org_id, params)
+
+
+@router.post("/", response_model=InventoryMovementOut)
+def create_movement(
+    movement: InventoryMovementCreate,
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return crud.record_movement(db, current_user.org_id, current_user.user_id, movement)
+
+
+@router.post("/transfer", response_model=List[InventoryMovementOut])
+def transfer_stock(
+    transfer: InventoryTransferCreate,
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return crud.transfer_stock(db, current_user.org_id, current_user.user_id, transfer)
+
+
+@router.get("/stock-as-of", response_model=List[StockAsOfOut])
+def stock_as_of(
+    params: StockAsOfRequest = Depends(),
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return crud.get_stock_as_of(db, current_user.org_id, params)
+
+
+@router.get("/reorder-alerts", response_model=List[ReorderAlertOut])
+def reorder_alerts(
+    site_id: Optional[UUID] = None,
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return crud.get_reorder_alerts(db, current_user.org_id, site_id)
@@ -13,8 +13,10 @@ from ...schemas.maintenance_assets.pm_templates_schemas import (
     PMTemplateOut,
     PMTemplateRequest,
     PMTemplateListResponse,
+    PMGenerationReport,
 )
 from ...crud.maintenance_assets import pm_template_crud as crud
+from ...crud.maintenance_assets import pm_generation_crud
 
 router = APIRouter(prefix="/api/pm_templates", tags=["PM Templates"])
 
@@ -62,6 +64,15 @@ def create_pm_template(
     return crud.create_pm_template(db, template)
 
 
+# ---------------- Generate due PM work orders ----------------
+@router.post("/generate", response_model=PMGenerationReport)
+def generate_pm_work_orders(
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return pm_generation_crud.generate_pm_work_orders(db, current_user.org_id)
+
+
 # ---------------- Delete PM Template (Soft Delete) ----------------
 @router.delete("/{template_id}")
 def delete_pm_template_soft(
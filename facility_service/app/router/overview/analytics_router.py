@@ -1,6 +1,6 @@
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from requests import Session
 
 from ...schemas.overview.analytics_schema import AnalyticsRequest
@@ -9,7 +9,9 @@ from ...schemas.overview.analytics_schema import AnalyticsRequest
 from ...crud.overview import analytics_crud
 from shared.core.database import get_facility_db as get_db
 from shared.core.auth import validate_current_token
+from shared.helpers.response_cache import cached_response
 from shared.core.schemas import UserToken
+from shared.helpers.reference_cache import etag_response
 
 # , dependencies=[Depends(validate_current_token)])
 router = APIRouter(prefix="/api/analytics", tags=["Analytics"])
@@ -29,17 +31,20 @@ def get_site_month_lookup(
 
 @router.get("/site-lookup", summary="Get site/property name lookup")
 def get_site_lookup(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
     """
     Returns a list of properties/sites (id and name) for the user's organization.
     """
-    return analytics_crud.site_name_filter_lookup(db, current_user.org_id)
+    return etag_response(request, response, analytics_crud.site_name_filter_lookup.entry(db, current_user.org_id))
 
 
 # ---------------- Advance Analytics ----------------
 @router.get("/advance-analytics")
+@cached_response()
 def advance_analytics(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -50,6 +55,7 @@ def advance_analytics(
 
 # ----------------revenue----------------
 @router.get("/revenue/revenue-trends-forecast")
+@cached_response()
 def revenue_analytics(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -59,6 +65,7 @@ def revenue_analytics(
 
 
 @router.get("/revenue/revenue-site-profitability")
+@cached_response()
 def site_profitability(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -68,6 +75,7 @@ def site_profitability(
 
 
 @router.get("/revenue/revenue-collection-performance")
+@cached_response()
 def collection_performance(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -79,6 +87,7 @@ def collection_performance(
 
 
 @router.get("/occupancy/occupancy-trends")
+@cached_response()
 def occupancy_analytics(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -88,6 +97,7 @@ def occupancy_analytics(
 
 
 @router.get("/occupancy/space-type-performance")
+@cached_response()
 def space_type_performance(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -97,6 +107,7 @@ def space_type_performance(
 
 
 @router.get("/occupancy/portfolio-distribution")
+@cached_response()
 def portfolio_distribution(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -108,6 +119,7 @@ def portfolio_distribution(
 
 
 @router.get("/financial/yoy-performance")
+@cached_response()
 def yoy_performance(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -117,6 +129,7 @@ def yoy_performance(
 
 
 @router.get("/financial/site-comparison")
+@cached_response()
 def site_comparison(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -127,6 +140,7 @@ def site_comparison(
 
 # ------------------------------operations-------------------
 @router.get("/operations/maintenance-efficiency")
+@cached_response()
 def maintenance_efficiency(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -136,6 +150,7 @@ def maintenance_efficiency(
 
 
 @router.get("/operations/energy-consumption")
+@cached_response()
 def energy_consumption(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -146,6 +161,7 @@ def energy_consumption(
 
 # ---------------------------tenant----------------------------
 @router.get("/tenant/tenant-satisfaction")
+@cached_response()
 def tenant_satisfaction(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -155,6 +171,7 @@ def tenant_satisfaction(
 
 
 @router.get("/tenant/tenant-retention")
+@cached_response()
 def tenant_retention(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -166,6 +183,7 @@ def tenant_retention(
 # -----------------access-----------------------------------
 
 @router.get("/access/daily-visitor-trends")
+@cached_response()
 def daily_visitor_trends(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -175,6 +193,7 @@ def daily_visitor_trends(
 
 
 @router.get("/access/hourly-access-pattern")
+@cached_response()
 def hourly_access_pattern(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -184,6 +203,7 @@ def hourly_access_pattern(
 
 
 @router.get("/portfolio/portfolio-heatmap")
+@cached_response()
 def portfolio_heatmap(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
@@ -193,6 +213,7 @@ def portfolio_heatmap(
 
 
 @router.get("/portfolio/performance-summary")
+@cached_response()
 def performance_summary(
     params: AnalyticsRequest = Depends(),
     db: Session = Depends(get_db),
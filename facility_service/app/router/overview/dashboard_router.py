@@ -5,8 +5,9 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 from shared.core.database import get_facility_db as get_db
 from shared.core.auth import validate_current_token
+from shared.helpers.response_cache import cached_response
 from ...schemas.overview.dasboard_schema import (
-    EnergyConsumptionTrendResponse, EnergyStatusResponse, MonthlyRevenueTrendResponse, OccupancyByFloorResponse, OverviewResponse, LeasingOverviewResponse, MaintenanceStatusResponse, AccessAndParkingResponse, FinancialSummaryResponse, PriorityItem, SpaceOccupancyResponse)
+    DashboardAllResponse, EnergyConsumptionTrendResponse, EnergyStatusResponse, MonthlyRevenueTrendResponse, OccupancyByFloorResponse, OverviewResponse, LeasingOverviewResponse, MaintenanceStatusResponse, AccessAndParkingResponse, FinancialSummaryResponse, PriorityItem, SpaceOccupancyResponse)
 from shared.core.schemas import UserToken
 
 
@@ -14,7 +15,17 @@ router = APIRouter(prefix="/api/dashboard",
                    tags=["Dashboard"], dependencies=[Depends(validate_current_token)])
 
 
+@router.get("/all", response_model=DashboardAllResponse)
+@cached_response()
+def get_dashboard_all(
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return dashboard_crud.get_dashboard_all(db, current_user.org_id)
+
+
 @router.get("/overview", response_model=OverviewResponse)
+@cached_response()
 def get_overview(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -28,6 +39,7 @@ def get_overview(
 
 
 @router.get("/leasing-overview", response_model=LeasingOverviewResponse)
+@cached_response()
 def leasing_overview(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -36,6 +48,7 @@ def leasing_overview(
 
 
 @router.get("/maintenance-status", response_model=MaintenanceStatusResponse)
+@cached_response()
 def maintenance_status(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -44,6 +57,7 @@ def maintenance_status(
 
 
 @router.get("/access-and-parking", response_model=AccessAndParkingResponse)
+@cached_response()
 def access_and_parking(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -52,6 +66,7 @@ def access_and_parking(
 
 
 @router.get("/financial-summary", response_model=FinancialSummaryResponse)
+@cached_response()
 def financial_summary(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -61,6 +76,7 @@ def financial_summary(
 
 # Router endpoint for charts
 @router.get("/monthly-revenue-trend", response_model=List[MonthlyRevenueTrendResponse])
+@cached_response()
 def get_monthly_revenue_trend(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -69,6 +85,7 @@ def get_monthly_revenue_trend(
 
 
 @router.get("/space-occupancy", response_model=SpaceOccupancyResponse)
+@cached_response()
 def get_space_occupancy(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -77,6 +94,7 @@ def get_space_occupancy(
 
 
 @router.get("/work-orders-priority", response_model=List[PriorityItem])
+@cached_response()
 def work_orders_priority(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -86,6 +104,7 @@ def work_orders_priority(
 
 
 @router.get("/energy-consumption-trend", response_model=List[EnergyConsumptionTrendResponse])
+@cached_response()
 def get_energy_consumption_trend(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -94,6 +113,7 @@ def get_energy_consumption_trend(
 
 
 @router.get("/occupancy-by-floor", response_model=List[OccupancyByFloorResponse])
+@cached_response()
 def get_occupancy_by_floor_endpoint(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -102,6 +122,7 @@ def get_occupancy_by_floor_endpoint(
 
 
 @router.get("/energy-status", response_model=EnergyStatusResponse)
+@cached_response()
 def energy_status(
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
@@ -2,7 +2,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from ...schemas.parking_access.access_event_schemas import AccessEventOverview, AccessEventRequest, AccessEventsResponse
+from ...schemas.parking_access.access_event_schemas import AccessEventIngestRequest, AccessEventIngestResponse, AccessEventOverview, AccessEventRequest, AccessEventsResponse
 from ...crud.parking_access import access_event_crud as crud
 from shared.core.database import get_facility_db as get_db
 from shared.core.auth import validate_current_token  # for dependicies
@@ -31,3 +31,12 @@ def get_access_event_overview(
         db: Session = Depends(get_db),
         current_user: UserToken = Depends(validate_current_token)):
     return crud.get_access_event_overview(db, current_user.org_id)
+
+
+@router.post("/ingest", response_model=AccessEventIngestResponse)
+def ingest_access_events(
+        payload: AccessEventIngestRequest,
+        db: Session = Depends(get_db),
+        current_user: UserToken = Depends(validate_current_token)):
+    """Batched events from gate controllers."""
+    return crud.ingest_access_events(db, current_user.org_id, payload.events)
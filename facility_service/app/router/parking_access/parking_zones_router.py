@@ -1,6 +1,6 @@
 from typing import List, Optional
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from shared.helpers.json_response_helper import success_response
@@ -9,6 +9,7 @@ from ...crud.parking_access import parking_zone_crud as crud
 from shared.core.database import get_facility_db as get_db
 from shared.core.auth import validate_current_token  # for dependencies
 from shared.core.schemas import Lookup, UserToken
+from shared.helpers.reference_cache import etag_response
 from uuid import UUID
 
 router = APIRouter(
@@ -65,7 +66,9 @@ def delete_parking_zone(
 
 @router.get("/lookup", response_model=List[Lookup])
 def parking_zone_lookup(
+        request: Request,
+        response: Response,
         site_id: str = Query(None),
         db: Session = Depends(get_db),
         current_user: UserToken = Depends(validate_current_token)):
-    return crud.parking_zone_lookup(db, current_user.org_id, site_id)
+    return etag_response(request, response, crud.parking_zone_lookup.entry(db, current_user.org_id, site_id))
@@ -1,10 +1,11 @@
 from uuid import UUID
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Query, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Query, UploadFile, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 
 
 from shared.core.schemas import Lookup, UserToken
+from shared.helpers.reference_cache import etag_response
 from ...crud.service_ticket import tickets_crud as crud
 from ...schemas.service_ticket.tickets_schemas import (
     TicketAdminRoleRequest, TicketAssignedToRequest, TicketCommentRequest, TicketCreate, TicketDetailsResponse, TicketFilterRequest,
@@ -147,6 +148,8 @@ def fetch_role_admin_route(
 # ----------------filter(DB) Priority ----------------
 @router.get("/filter-priority-lookup", response_model=List[Lookup])
 def tickets_filter_priority_lookup_endpoint(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
@@ -154,13 +157,15 @@ def tickets_filter_priority_lookup_endpoint(
     Get available priority values for ticket filtering
     Follows same pattern as housekeeping_tasks_filter_status_lookup_endpoint
     """
-    return crud.tickets_filter_priority_lookup(db, current_user.org_id)
+    return etag_response(request, response, crud.tickets_filter_priority_lookup.entry(db, current_user.org_id))
 
 # ----------------filter(DB) Status ----------------
 
 
 @router.get("/filter-status-lookup", response_model=List[Lookup])
 def tickets_filter_status_lookup_endpoint(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
@@ -168,7 +173,7 @@ def tickets_filter_status_lookup_endpoint(
     Get available status values for ticket filtering
     Follows same pattern as housekeeping_tasks_filter_status_lookup_endpoint
     """
-    return crud.tickets_filter_status_lookup(db, current_user.org_id)
+    return etag_response(request, response, crud.tickets_filter_status_lookup.entry(db, current_user.org_id))
 
 
 @router.get("/ticket-no-lookup", response_model=List[Lookup])
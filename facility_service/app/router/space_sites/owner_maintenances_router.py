@@ -4,7 +4,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from shared.core.database import get_auth_db, get_facility_db as get_db
-from ...schemas.space_sites.owner_maintenances_schemas import OwnerMaintenanceAmountRequest, OwnerMaintenanceBySpaceRequest, OwnerMaintenanceBySpaceResponse, OwnerMaintenanceCreate, OwnerMaintenanceDetailResponse, OwnerMaintenanceListResponse, OwnerMaintenanceRequest, OwnerMaintenanceUpdate
+from ...schemas.space_sites.owner_maintenances_schemas import OwnerMaintenanceAmountRequest, OwnerMaintenanceBySpaceRequest, OwnerMaintenanceBySpaceResponse, OwnerMaintenanceCreate, OwnerMaintenanceDetailResponse, OwnerMaintenanceGenerateResponse, OwnerMaintenanceListResponse, OwnerMaintenanceRequest, OwnerMaintenanceUpdate
 from ...crud.space_sites import owner_maintenances_crud as crud
 from shared.core.auth import validate_current_token
 from shared.core.schemas import Lookup, UserToken
@@ -17,17 +17,21 @@ router = APIRouter(
 )
 
 
-@router.post("/auto-generate-maintenance", response_model=None)
+@router.post("/auto-generate-maintenance", response_model=OwnerMaintenanceGenerateResponse)
 def auto_generate_maintenance(
     date: date = Query(...,
                        description="Any date of the month to generate maintenance for"),
+    dry_run: bool = Query(
+        False, description="Preview the totals per site without creating charges"),
     db: Session = Depends(get_db),
     auth_db: Session = Depends(get_auth_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
     return crud.auto_generate_owner_maintenance(
         db=db,
+        org_id=current_user.org_id,
         input_date=date,
+        dry_run=dry_run,
     )
 
 
@@ -26,6 +26,14 @@ def current_occupancy(
     return crud.get_current_occupancy(db, space_id)
 
 
+@router.get("/{space_id:uuid}/occupancy/state")
+def occupancy_state(
+    space_id: UUID,
+    db: Session = Depends(get_db)
+):
+    return crud.get_occupancy_state(db, space_id)
+
+
 @router.get("/{space_id:uuid}/occupancy/upcoming-movein")
 def upcoming_moveins(space_id: UUID, db: Session = Depends(get_db)):
     return crud.get_upcoming_moveins(db, space_id)
@@ -39,19 +47,25 @@ def occupancy_history(space_id: UUID, db: Session = Depends(get_db)):
 @router.post("/{space_id:uuid}/occupancy/timeline")
 def occupancy_timeline(
     space_id: UUID,
+    after: Optional[datetime] = Query(None, description="Date of the last event of the previous page"),
+    after_id: Optional[UUID] = Query(None, description="Id of the last event of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
-    return crud.get_occupancy_timeline(db, space_id, current_user)
+    return crud.get_occupancy_timeline(db, space_id, current_user, after, limit, after_id)
 
 
 @router.post("/tenant/timeline")
 def occupancy_timeline(
     params: MasterQueryParams,
+    after: Optional[datetime] = Query(None, description="Date of the last event of the previous page"),
+    after_id: Optional[UUID] = Query(None, description="Id of the last event of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
-    return crud.get_tenant_timeline(db, params.space_id, current_user)
+    return crud.get_tenant_timeline(db, params.space_id, current_user, after, limit, after_id)
 
 
 @router.get("/occupancy-requests")
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from ...crud.system import email_outbox_crud as crud
+from ...schemas.system.email_outbox_schemas import EmailOutboxMetrics, EmailOutboxRetryRequest, EmailOutboxRetryResponse
+from shared.core.database import get_facility_db as get_db
+from shared.core.auth import require_super_admin
+from shared.core.schemas import UserToken
+
+router = APIRouter(prefix="/api/email-outbox", tags=["email_outbox"])
+
+
+@router.get("/metrics", response_model=EmailOutboxMetrics)
+def email_outbox_metrics(
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(require_super_admin)
+):
+    return crud.get_email_outbox_metrics(db)
+
+
+@router.post("/retry-dead", response_model=EmailOutboxRetryResponse)
+def retry_dead_emails(
+    request: EmailOutboxRetryRequest,
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(require_super_admin)
+):
+    return {"requeued": crud.retry_dead_emails(db, request.ids)}
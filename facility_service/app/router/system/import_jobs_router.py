@@ -0,0 +1,89 @@
+from typing import List
+from uuid import UUID
+from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ...crud.system import import_jobs_crud as crud
+from ...schemas.system.import_jobs_schemas import ImportJobErrorsResponse, ImportJobOut
+from ...utils.import_job_stream import import_job_event_stream
+from ...utils.notification_stream import notification_hub
+from shared.core.auth import validate_current_token
+from shared.core.database import FacilitySessionLocal, get_facility_db as get_db
+from shared.core.schemas import UserToken
+
+router = APIRouter(prefix="/api/import-jobs",
+                   tags=["import_jobs"], dependencies=[Depends(validate_current_token)])
+
+
+@router.post("", response_model=ImportJobOut, status_code=202)
+def submit_import_job(
+    kind: str = Form(...),
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    """
+    Queue a CSV / XLSX file for background import. `kind` is one of
+    meter_readings, meters, spaces, parking_slots; the sheet headers are the
+    fields of the matching /bulk-upload rows. Submitting the same file
+    again returns the existing job.
+    """
+    return crud.submit_import_job(db, kind, file, current_user)
+
+
+@router.get("", response_model=List[ImportJobOut])
+def get_import_jobs(
+    skip: int = 0,
+    limit: int = 50,
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return crud.get_import_jobs(db, current_user.org_id, skip, limit)
+
+
+@router.get("/{job_id}", response_model=ImportJobOut)
+def get_import_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return crud.get_import_job(db, current_user.org_id, job_id)
+
+
+@router.get("/{job_id}/errors", response_model=ImportJobErrorsResponse)
+def get_import_job_errors(
+    job_id: UUID,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+    current_user: UserToken = Depends(validate_current_token)
+):
+    return crud.get_import_job_errors(db, current_user.org_id, job_id, skip, limit)
+
+
+def _load_job(org_id, job_id) -> dict:
+    db = FacilitySessionLocal()
+    try:
+        return crud.import_job_snapshot(crud.get_import_job(db, org_id, job_id))
+    finally:
+        db.close()
+
+
+@router.get("/{job_id}/stream")
+async def stream_import_job(
+    job_id: UUID,
+    current_user: UserToken = Depends(validate_current_token)
+):
+    """Server-sent `progress` events until the job completes (see import_job_stream)."""
+    # Fails with 404 before the stream starts
+    await run_in_threadpool(_load_job, current_user.org_id, job_id)
+    subscription = await notification_hub.subscribe(current_user.user_id)
+    return StreamingResponse(
+        import_job_event_stream(
+            subscription, job_id,
+            lambda: run_in_threadpool(_load_job, current_user.org_id, job_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,9 +1,12 @@
+from functools import partial
 from typing import List, Dict, Any
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from ...schemas.system.notifications_schemas import NotificationListResponse, NotificationOut
-from shared.core.database import get_facility_db as get_db
+from ...utils.notification_stream import BatchedLoader, notification_event_stream, notification_hub
+from shared.core.database import FacilitySessionLocal, get_facility_db as get_db
 from shared.core.schemas import CommonQueryParams, UserToken
 from ...crud.system import notifications_crud as crud
 from shared.core.auth import validate_current_token
@@ -30,6 +33,31 @@ def get_notification_count(
     return crud.get_notification_count(db, current_user.user_id)
 
 
+def _load_unread_counts(user_ids: List[str]) -> Dict[str, int]:
+    db = FacilitySessionLocal()
+    try:
+        return crud.get_notification_counts(db, user_ids)
+    finally:
+        db.close()
+
+
+unread_counts = BatchedLoader(_load_unread_counts)
+
+
+@router.get("/stream")
+async def stream_notifications(
+    current_user: UserToken = Depends(validate_current_token)
+):
+    """Server-sent events replacing `/count` polling (see notification_stream)."""
+    subscription = await notification_hub.subscribe(current_user.user_id)
+    return StreamingResponse(
+        notification_event_stream(
+            subscription, partial(unread_counts.load, current_user.user_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.put("/{notification_id}/read", response_model=None)
 def mark_notification_as_read(
     notification_id: str,
@@ -1,5 +1,5 @@
 # routers/system/system_settings_router.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from uuid import UUID
 from sqlalchemy.orm import Session
 
@@ -7,8 +7,9 @@ from ...crud.system import system_settings_crud as crud
 from ...schemas.system.system_settings_schema import (
     SystemSettingsOut, SystemSettingsUpdate)
 from shared.core.database import get_facility_db as get_db
-from shared.core.auth import validate_current_token
+from shared.core.auth import allow_admin, validate_current_token
 from shared.core.schemas import UserToken
+from shared.helpers.reference_cache import etag_response, reference_cache
 
 router = APIRouter(
     prefix="/api/system-settings",
@@ -18,14 +19,16 @@ router = APIRouter(
 
 @router.get("/system-settings", response_model=SystemSettingsOut)
 def get_system_settings(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: UserToken = Depends(validate_current_token)
 ):
-    data = crud.get_system_settings(db, current_user.org_id)
-    if not data:
+    entry = crud.get_system_settings.entry(db, current_user.org_id)
+    if not entry.value:
         raise HTTPException(
             status_code=404, detail="System settings not found")
-    return data
+    return etag_response(request, response, entry)
 
 
 @router.put("/system-settings/{setting_id}", response_model=SystemSettingsOut)
@@ -40,3 +43,10 @@ def update_system_settings(
         raise HTTPException(
             status_code=404, detail="System settings not found")
     return updated
+
+
+@router.get("/reference-cache/stats")
+def reference_cache_stats(
+    current_user: UserToken = Depends(allow_admin)
+):
+    return reference_cache.stats()
@@ -0,0 +1,40 @@
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+from shared.wrappers.empty_string_model_wrapper import EmptyStringModel
+
+
+class GlobalSearchRequest(EmptyStringModel):
+    search: Optional[str] = None
+    site_id: Optional[str] = None
+    # comma separated: tickets,spaces,tenants,leases,invoices,vendors (default: all)
+    modules: Optional[str] = None
+    limit_per_type: int = Field(default=5, ge=1, le=50)
+
+
+class SearchResultOut(BaseModel):
+    id: UUID
+    title: str
+    subtitle: Optional[str] = None
+    status: Optional[str] = None
+    site_id: Optional[UUID] = None
+    space_id: Optional[UUID] = None
+    rank: float
+
+    model_config = {"from_attributes": True}
+
+
+class SearchGroupOut(BaseModel):
+    module: str
+    has_more: bool
+    results: List[SearchResultOut]
+
+
+class GlobalSearchResponse(BaseModel):
+    search: str
+    groups: List[SearchGroupOut]
+
+
+class SearchReindexResponse(BaseModel):
+    documents: dict
@@ -77,4 +77,5 @@ class BulkUploadError(BaseModel):
 
 class BulkMeterResponse(BaseModel):
     inserted: Optional[int] = None
+    updated: Optional[int] = None
     validations: List[BulkUploadError] = None
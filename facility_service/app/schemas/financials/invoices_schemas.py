@@ -263,6 +263,35 @@ class InvoiceEmailRequest(BaseModel):
 
 class AutoInvoiceResponse(BaseModel):
     total_invoice_created: int
+    billing_run_id: Optional[UUID] = None
+    status: Optional[str] = None
+    charges_staged: int = 0
+    charges_skipped: int = 0
+    advances_applied: int = 0
+    amount_invoiced: float = 0
+
+
+class BillingRunOut(BaseModel):
+    id: UUID
+    org_id: UUID
+    period_start: date_type
+    period_end: date_type
+    status: str
+    attempts: int
+    last_error: Optional[str] = None
+    charges_staged: int
+    charges_skipped: int
+    invoices_created: int
+    amount_invoiced: float
+    advances_applied: int
+    emails_queued: int
+    emails_failed: Optional[int] = 0
+    last_email_error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
 
 
 class InvoiceCustomerDetail(BaseModel):
@@ -0,0 +1,49 @@
+from datetime import date
+from uuid import UUID
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+# ----------------- Request -----------------
+class AvailabilityRequest(BaseModel):
+    site_id: UUID
+    check_in: date
+    check_out: date
+    adults: int = 1
+    children: int = 0
+    rate_plan_id: Optional[UUID] = None
+
+
+# ----------------- Out -----------------
+class NightlyRate(BaseModel):
+    date: date
+    price: float
+    available: int
+
+
+class RatePlanAvailability(BaseModel):
+    rate_plan_id: UUID
+    name: str
+    meal_plan: Optional[str] = None
+    total_price: float
+    min_stay: Optional[int] = None
+    max_stay: Optional[int] = None
+    available: int
+    nights: List[NightlyRate]
+
+
+class SpaceGroupAvailability(BaseModel):
+    space_group_id: UUID
+    name: str
+    kind: Optional[str] = None
+    max_occupancy: Optional[int] = None
+    total_rooms: int
+    available_rooms: int
+    rate_plans: List[RatePlanAvailability]
+
+
+class AvailabilityResponse(BaseModel):
+    check_in: date
+    check_out: date
+    nights: int
+    space_groups: List[SpaceGroupAvailability]
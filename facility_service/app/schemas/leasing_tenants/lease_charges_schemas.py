@@ -117,5 +117,16 @@ class LeaseChargeAutoOut(BaseModel):
         from_attributes = True
 
 
+class LeaseRentSyncChange(BaseModel):
+    lease_id: UUID
+    created: int
+    updated: int
+    deleted: int
+
+
 class AutoLeaseChargeResponse(BaseModel):
     total_charge_created: int
+    total_leases_processed: int = 0
+    total_charge_updated: int = 0
+    total_charge_deleted: int = 0
+    changes: List[LeaseRentSyncChange] = []
@@ -0,0 +1,83 @@
+from datetime import date, datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from shared.core.schemas import CommonQueryParams
+from ...enum.maintenance_assets_enum import InventoryMovementType
+
+
+class InventoryMovementCreate(BaseModel):
+    stock_id: UUID
+    movement_type: InventoryMovementType
+    # Receipts and issues take a positive quantity; adjustments are signed
+    qty: float
+    unit_cost: Optional[float] = None
+    work_order_id: Optional[UUID] = None
+    po_line_id: Optional[UUID] = None
+    notes: Optional[str] = None
+
+
+class InventoryTransferCreate(BaseModel):
+    from_stock_id: UUID
+    to_stock_id: UUID
+    qty: float = Field(..., gt=0)
+    work_order_id: Optional[UUID] = None
+    notes: Optional[str] = None
+
+
+class InventoryMovementOut(BaseModel):
+    id: UUID
+    org_id: UUID
+    site_id: Optional[UUID] = None
+    item_id: UUID
+    stock_id: UUID
+    movement_type: str
+    qty: float
+    qty_after: float
+    unit_cost: Optional[float] = None
+    work_order_id: Optional[UUID] = None
+    po_line_id: Optional[UUID] = None
+    transfer_id: Optional[UUID] = None
+    notes: Optional[str] = None
+    created_by: Optional[UUID] = None
+    created_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class InventoryMovementRequest(CommonQueryParams):
+    stock_id: Optional[UUID] = None
+    item_id: Optional[UUID] = None
+    work_order_id: Optional[UUID] = None
+    movement_type: Optional[str] = None
+
+
+class InventoryMovementListResponse(BaseModel):
+    movements: List[InventoryMovementOut]
+    total: int
+
+
+class StockAsOfRequest(BaseModel):
+    as_of: date
+    site_id: Optional[UUID] = None
+    item_id: Optional[UUID] = None
+
+
+class StockAsOfOut(BaseModel):
+    stock_id: UUID
+    item_id: UUID
+    site_id: Optional[UUID] = None
+    qty_on_hand: float
+    value: float
+
+
+class ReorderAlertOut(BaseModel):
+    item_id: UUID
+    sku: Optional[str] = None
+    name: str
+    site_id: Optional[UUID] = None
+    qty_on_hand: float
+    reorder_level: float
+    shortfall: float
@@ -74,3 +74,31 @@ class PMTemplateOverviewResponse(BaseModel):
     model_config = {
         "from_attributes": True
     }
+
+
+class PMCalendarRunReport(BaseModel):
+    templates_due: int
+    templates_without_assets: int
+    work_orders_created: int
+
+
+class PMMeterRunReport(BaseModel):
+    templates_evaluated: int
+    meters_evaluated: int
+    thresholds_crossed: int
+    work_orders_created: int
+
+
+class PMGeneratedWorkOrder(BaseModel):
+    wo_no: str
+    pm_template_id: UUID
+    asset_id: UUID
+    site_id: UUID
+    due_date: date
+
+
+class PMGenerationReport(BaseModel):
+    run_at: datetime
+    calendar: PMCalendarRunReport
+    meter: PMMeterRunReport
+    work_orders: List[PMGeneratedWorkOrder]
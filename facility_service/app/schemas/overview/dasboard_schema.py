@@ -70,6 +70,8 @@ class SpaceOccupancyResponse(BaseModel):
     occupied: int
     available: int
     outOfService: int
+    moveOutScheduled: int = 0
+    inTurnover: int = 0
     occupancyRate: float
 
     class Config:
@@ -110,4 +112,17 @@ class PriorityItem(BaseModel):
     count: int
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class DashboardAllResponse(BaseModel):
+    overview: OverviewResponse
+    leasing_overview: LeasingOverviewResponse
+    maintenance_status: MaintenanceStatusResponse
+    access_and_parking: AccessAndParkingResponse
+    financial_summary: FinancialSummaryResponse
+    monthly_revenue_trend: List[MonthlyRevenueTrendResponse]
+    space_occupancy: SpaceOccupancyResponse
+    work_orders_priority: List[PriorityItem]
+    energy_consumption_trend: List[EnergyConsumptionTrendResponse]
+    occupancy_by_floor: List[OccupancyByFloorResponse]
+    energy_status: EnergyStatusResponse
@@ -1,6 +1,6 @@
 # app/schemas/asset.py
-from pydantic import BaseModel
-from typing import List, Optional, Dict
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional, Dict
 from uuid import UUID
 from datetime import date, datetime
 from shared.core.schemas import CommonQueryParams
@@ -16,11 +16,11 @@ class AccessEventOut(BaseModel):
     org_id: UUID
     site_id: UUID
     site_name: str
-    gate: str
+    gate: Optional[str] = None  # nullable column; older rows may lack it
     vehicle_no: Optional[str]
     card_id: Optional[str]  # <-- make it Optional
     ts: datetime
-    direction: str
+    direction: Optional[str] = None
 
     model_config = {"from_attributes": True}
 
@@ -39,3 +39,24 @@ class AccessEventOverview(BaseModel):
     totalUniqueIDs: int
 
     model_config = {"from_attributes": True}
+
+
+class AccessEventIngest(BaseModel):
+    # Controller-assigned; with ts it makes resending a batch harmless
+    id: Optional[UUID] = None
+    site_id: UUID
+    gate: str = Field(..., min_length=1, max_length=64)
+    vehicle_no: Optional[str] = Field(None, max_length=20)
+    card_id: Optional[str] = Field(None, max_length=64)
+    ts: Optional[datetime] = None  # server time (UTC) when missing
+    direction: Literal["in", "out"]
+
+
+class AccessEventIngestRequest(BaseModel):
+    events: List[AccessEventIngest] = Field(..., min_length=1, max_length=5000)
+
+
+class AccessEventIngestResponse(BaseModel):
+    received: int
+    inserted: int
+    duplicates: int
@@ -82,3 +82,24 @@ class OwnerMaintenanceAmountRequest(BaseModel):
     space_id: str
     start_date: Optional[date] = None
     end_date: Optional[date] = None
+
+
+class OwnerMaintenanceSiteTotal(BaseModel):
+    site_id: Optional[UUID] = None
+    site_name: Optional[str] = None
+    charges: int
+    amount: Decimal
+    tax_amount: Decimal
+    total_amount: Decimal
+
+
+class OwnerMaintenanceGenerateResponse(BaseModel):
+    """Result, or with dry_run the preview, of a maintenance generation run"""
+    period_start: date
+    period_end: date
+    dry_run: bool
+    created: int
+    amount: Decimal
+    tax_amount: Decimal
+    total_amount: Decimal
+    sites: List[OwnerMaintenanceSiteTotal]
@@ -0,0 +1,21 @@
+from typing import Dict, List, Optional
+from uuid import UUID
+from pydantic import BaseModel
+
+
+class EmailOutboxMetrics(BaseModel):
+    by_status: Dict[str, int]
+    oldest_pending_seconds: float
+    sent_last_hour: int
+    sent_per_minute: float
+    delivery_latency_avg_seconds: float
+    delivery_latency_p95_seconds: float
+
+
+class EmailOutboxRetryRequest(BaseModel):
+    # Empty: every dead-lettered email
+    ids: Optional[List[UUID]] = None
+
+
+class EmailOutboxRetryResponse(BaseModel):
+    requeued: int
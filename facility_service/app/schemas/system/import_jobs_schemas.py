@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel
+
+
+class ImportJobOut(BaseModel):
+    id: UUID
+    kind: str
+    file_name: str
+    file_size: int
+    status: str
+    attempts: int
+    processed_rows: int
+    inserted: int
+    updated: int
+    error_rows: int
+    last_error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class BulkUploadError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class ImportJobErrorsResponse(BaseModel):
+    errors: List[BulkUploadError]
+    total: int
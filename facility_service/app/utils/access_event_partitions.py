@@ -0,0 +1,234 @@
+"""
+Monthly partitions and rollups for `access_events`.
+
+Gate events are append-only and mostly read by recent time range, so the
+table is partitioned by month on ts: access_events_pYYYYMM holds one UTC
+month, access_events_default catches anything outside the partitions that
+exist. ensure_access_event_partitions keeps a few months created ahead
+(moving rows a new month claims out of the default partition), and
+drop_expired_access_event_partitions drops whole months past retention
+instead of deleting rows.
+
+Overview cards read access_event_daily and access_event_identities, which
+the ingest endpoint updates with every batch. rebuild_access_event_rollups
+recomputes them from the events for a range of days.
+
+install_access_event_partitions converts an existing unpartitioned table
+once, and fills the rollups when they are empty.
+"""
+import re
+from datetime import date, datetime, time, timezone
+from typing import Optional
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from shared.core.config import settings
+from ..models.parking_access.access_events import AccessEvent
+
+PARENT = "access_events"
+DEFAULT_PARTITION = "access_events_default"
+PARTITION_NAME = re.compile(r"^access_events_p(\d{4})(\d{2})$")
+# Before any real gate event; a full rebuild starts here
+EPOCH = date(1970, 1, 1)
+# Serializes install_access_event_partitions across processes
+INSTALL_LOCK_KEY = 0x61637465
+
+REBUILD_DAILY_SQL = """
+    INSERT INTO access_event_daily (org_id, site_id, day, events, entries, exits)
+    SELECT org_id, site_id, (ts AT TIME ZONE 'UTC')::date,
+           count(*),
+           count(*) FILTER (WHERE lower(direction) = 'in'),
+           count(*) FILTER (WHERE lower(direction) = 'out')
+    FROM access_events
+    WHERE ts >= :since
+    GROUP BY 1, 2, 3
+"""
+
+REBUILD_IDENTITIES_SQL = """
+    INSERT INTO access_event_identities (org_id, identity, first_seen_at)
+    SELECT org_id, coalesce(vehicle_no, '') || '-' || coalesce(card_id, ''), min(ts)
+    FROM access_events
+    WHERE ts >= :since
+    GROUP BY 1, 2
+    ON CONFLICT (org_id, identity) DO UPDATE
+    SET first_seen_at = LEAST(access_event_identities.first_seen_at,
+                              EXCLUDED.first_seen_at)
+"""
+
+
+def utc_day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_p{month:%Y%m}"
+
+
+def _partitions(db: Session) -> dict:
+    """Month partitions that exist, by first day of the month."""
+    names = db.execute(text("""
+        SELECT c.relname FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = CAST(:parent AS regclass)
+    """), {"parent": PARENT}).scalars()
+    months = {}
+    for name in names:
+        match = PARTITION_NAME.match(name)
+        if match:
+            months[date(int(match[1]), int(match[2]), 1)] = name
+    return months
+
+
+def _create_partition(db: Session, month: date):
+    """
+    Build the month as a plain table, move in the rows the default
+    partition holds for it, then attach: ATTACH only needs a share lock
+    on the parent, so ingest keeps running.
+    """
+    name = partition_name(month)
+    lower = utc_day_start(month)
+    upper = utc_day_start(month + relativedelta(months=1))
+
+    db.execute(text(
+        f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    db.execute(text(f"LOCK TABLE {DEFAULT_PARTITION} IN ACCESS EXCLUSIVE MODE"))
+    db.execute(text(f"""
+        WITH moved AS (
+            DELETE FROM {DEFAULT_PARTITION}
+            WHERE ts >= :lower AND ts < :upper
+            RETURNING *
+        )
+        INSERT INTO {name} SELECT * FROM moved
+    """), {"lower": lower, "upper": upper})
+    db.execute(text(
+        f"ALTER TABLE {PARENT} ATTACH PARTITION {name} "
+        f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"))
+
+
+def _ensure_partitions(db: Session, start: Optional[date], months_ahead: int) -> list:
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    month = (start or this_month).replace(day=1)
+    last = this_month + relativedelta(months=months_ahead)
+
+    db.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT} DEFAULT"))
+    existing = _partitions(db)
+
+    created = []
+    while month <= last:
+        if month not in existing:
+            _create_partition(db, month)
+            created.append(partition_name(month))
+        month += relativedelta(months=1)
+    return created
+
+
+def ensure_access_event_partitions(db: Session, start: Optional[date] = None,
+                                   months_ahead: Optional[int] = None) -> list:
+    """
+    Create the default partition and every month partition from `start`
+    (default: this month) to ACCESS_EVENT_PARTITIONS_AHEAD months ahead.
+    Returns the partitions created. Commits.
+    """
+    if months_ahead is None:
+        months_ahead = settings.ACCESS_EVENT_PARTITIONS_AHEAD
+    created = _ensure_partitions(db, start, months_ahead)
+    db.commit()
+    return created
+
+
+def drop_expired_access_event_partitions(db: Session,
+                                         retention_months: Optional[int] = None) -> list:
+    """
+    Drop month partitions that ended before the retention window, and the
+    default partition's rows that old. Rollups are kept. Commits.
+    """
+    if retention_months is None:
+        retention_months = settings.ACCESS_EVENT_RETENTION_MONTHS
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    cutoff = this_month - relativedelta(months=retention_months)
+
+    dropped = []
+    for month, name in sorted(_partitions(db).items()):
+        if month + relativedelta(months=1) > cutoff:
+            continue
+        db.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+        db.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+
+    db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE ts < :cutoff"),
+               {"cutoff": utc_day_start(cutoff)})
+    db.commit()
+    return dropped
+
+
+def rebuild_access_event_rollups(db: Session, since: date = EPOCH):
+    """
+    Recompute daily counts from `since` (UTC) and add identities first seen
+    since then. Ingest waits on the lock meanwhile, so no batch is counted
+    twice or lost. Commits.
+    """
+    params = {"since": utc_day_start(since)}
+    db.execute(text("LOCK TABLE access_event_daily IN SHARE ROW EXCLUSIVE MODE"))
+    db.execute(text("DELETE FROM access_event_daily WHERE day >= :day"), {"day": since})
+    db.execute(text(REBUILD_DAILY_SQL), params)
+    db.execute(text(REBUILD_IDENTITIES_SQL), params)
+    db.commit()
+
+
+def _is_partitioned(db: Session) -> bool:
+    return db.execute(text("""
+        SELECT EXISTS (
+            SELECT 1 FROM pg_partitioned_table
+            WHERE partrelid = CAST(:parent AS regclass)
+        )
+    """), {"parent": PARENT}).scalar()
+
+
+def _convert_to_partitioned(db: Session):
+    """
+    Swap a plain access_events table for the partitioned one: rename it
+    aside, create the new table with partitions back to its oldest event,
+    copy the rows over and drop the old table, in one transaction.
+    """
+    legacy = f"{PARENT}_unpartitioned"
+    db.execute(text(f"LOCK TABLE {PARENT} IN ACCESS EXCLUSIVE MODE"))
+    db.execute(text(f"ALTER TABLE {PARENT} RENAME TO {legacy}"))
+    # Index names are schema-wide; the new table needs them
+    db.execute(text(f"ALTER TABLE {legacy} DROP CONSTRAINT IF EXISTS {PARENT}_pkey"))
+    for index in AccessEvent.__table__.indexes:
+        db.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+    AccessEvent.__table__.create(db.connection())
+    oldest = db.execute(text(f"SELECT min(ts) FROM {legacy}")).scalar()
+    start = oldest.astimezone(timezone.utc).date() if oldest else None
+    _ensure_partitions(db, start, settings.ACCESS_EVENT_PARTITIONS_AHEAD)
+
+    columns = ", ".join(c.name for c in AccessEvent.__table__.columns)
+    db.execute(text(f"INSERT INTO {PARENT} ({columns}) SELECT {columns} FROM {legacy}"))
+    db.execute(text(f"DROP TABLE {legacy}"))
+
+
+def _install_lock(db: Session):
+    """Held until the transaction ends, so processes starting together go one by one."""
+    db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": INSTALL_LOCK_KEY})
+
+
+def install_access_event_partitions(engine: Engine):
+    with Session(engine) as db:
+        # Checked under the lock: another process may have just converted it
+        _install_lock(db)
+        if not _is_partitioned(db):
+            _convert_to_partitioned(db)
+        ensure_access_event_partitions(db)
+
+        _install_lock(db)
+        empty = db.execute(text("""
+            SELECT NOT EXISTS (SELECT 1 FROM access_event_daily)
+               AND EXISTS (SELECT 1 FROM access_events)
+        """)).scalar()
+        if empty:
+            rebuild_access_event_rollups(db)
@@ -0,0 +1,53 @@
+"""
+Server-sent progress for one import job.
+
+The import job worker publishes a snapshot of the job on the notification
+channel with every committed chunk, so a stream rides on the process's
+shared LISTEN connection (see notification_stream) instead of polling.
+"""
+import asyncio
+from typing import Awaitable, Callable
+
+from shared.core.config import settings
+from shared.utils.enums import ImportJobStatus
+
+from .notification_stream import Subscription, _sse, notification_hub
+
+FINISHED = {ImportJobStatus.completed.value, ImportJobStatus.failed.value}
+
+
+async def import_job_event_stream(subscription: Subscription, job_id, load_job: Callable[[], Awaitable[dict]]):
+    """
+    `progress` events carrying the job (as ImportJobOut) on connect and on
+    every update; the stream ends once the job is completed or failed.
+    """
+    heartbeat = settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS
+    try:
+        yield f"retry: {heartbeat * 1000}\n\n"
+        job = await load_job()
+        yield _sse("progress", job)
+
+        while job["status"] not in FINISHED:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                # Events go to the job's creator; anyone else watching
+                # catches up here, once per heartbeat
+                latest = await load_job()
+                if latest == job:
+                    yield ": ping\n\n"
+                    continue
+                job = latest
+                yield _sse("progress", job)
+                continue
+
+            if event["op"] == "resync":
+                subscription.lagged = False
+                job = await load_job()
+            elif event["op"] == "import_job" and event["job"]["id"] == str(job_id):
+                job = event["job"]
+            else:
+                continue
+            yield _sse("progress", job)
+    finally:
+        notification_hub.unsubscribe(subscription)
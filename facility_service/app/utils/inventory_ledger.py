@@ -0,0 +1,29 @@
+"""
+Opening balances for the inventory movement ledger.
+
+Stocks that existed before `inventory_movements` carry a quantity the
+ledger cannot explain. install_inventory_ledger gives each of them one
+opening adjustment at its current quantity and average cost, so ledger
+sums and snapshots match qty_on_hand from the start.
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+OPENING_BALANCES_SQL = """
+    INSERT INTO inventory_movements (
+        id, org_id, site_id, item_id, stock_id, movement_type,
+        qty, qty_after, unit_cost, notes, created_at
+    )
+    SELECT gen_random_uuid(), s.org_id, s.site_id, s.item_id, s.id, 'adjustment',
+           s.qty_on_hand, s.qty_on_hand, s.avg_cost, 'Opening balance', now()
+    FROM inventory_stocks s
+    WHERE COALESCE(s.qty_on_hand, 0) <> 0
+      AND NOT EXISTS (SELECT 1 FROM inventory_movements m WHERE m.stock_id = s.id)
+"""
+
+
+def install_inventory_ledger(engine: Engine):
+    with engine.begin() as conn:
+        # One replica at a time
+        conn.execute(text("LOCK TABLE inventory_movements IN SHARE ROW EXCLUSIVE MODE"))
+        conn.execute(text(OPENING_BALANCES_SQL))
@@ -7,20 +7,12 @@ from uuid import UUID
 from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
 
+from facility_service.app.crud.financials.billing_run_crud import queue_billing_run_emails, run_billing
 from facility_service.app.crud.financials.bills_crud import generate_bill_number
-from facility_service.app.crud.financials.invoices_crud import apply_advance_to_invoice, create_invoice, generate_invoice_number
 from facility_service.app.models.financials.bills import Bill, BillLine
-from facility_service.app.models.financials.invoices import Invoice, InvoiceLine
-from facility_service.app.models.parking_access.parking_pass import ParkingPass
 from facility_service.app.models.service_ticket.tickets_work_order import TicketWorkOrder
-from facility_service.app.models.space_sites.sites import Site
 from facility_service.app.schemas.financials.bills_schemas import AutoBillResponse
-from facility_service.app.schemas.financials.invoices_schemas import AutoInvoiceResponse, InvoiceCreate, InvoiceLineCreate
 
-from ..enum.revenue_enum import InvoiceType
-from ..models.leasing_tenants.lease_charges import LeaseCharge
-from ..models.leasing_tenants.leases import Lease
-from ..models.space_sites.owner_maintenances import OwnerMaintenanceCharge
 from shared.core.schemas import UserToken
 
 
@@ -35,224 +27,30 @@ async def auto_generate_monthly_invoices(
     db: Session,
     org_id: UUID,
     target_date: date,
-    current_user: UserToken
+    current_user: UserToken,
+    send_email: bool = False
 ):
     billing_start, billing_end = get_month_range(target_date)
     today = date.today()
     baseline_date = max(billing_start, today)
     cal_due_date = baseline_date + timedelta(days=7)
 
-    created = {
-        "invoices": [],
-    }
-
-    # =====================================================
-    # RENT (AR)
-    # =====================================================
-    rent_charges = db.query(LeaseCharge).join(Lease).filter(
-        LeaseCharge.period_start >= billing_start,
-        LeaseCharge.period_start <= billing_end,
-        LeaseCharge.charge_code == InvoiceType.rent.value,
-        LeaseCharge.invoice_id == None,
-        LeaseCharge.is_deleted == False,
-        Lease.org_id == org_id,
-        Lease.is_deleted == False,
-        Lease.status == "active"
-    ).all()
-
-    print("rent charges", len(rent_charges))
-
-    for charge in rent_charges:
-        lease = charge.lease
-
-        site_exists = db.query(Site).filter(Site.id == lease.site_id).first()
-        if not site_exists:
-            print(f"⚠️ Skipping Lease {lease.lease_number}: Site {lease.site_id} does not exist.")
-            continue # Skip to the next charge safely
-
-        #Also verify the tenant exists
-        if not lease.tenant_id:
-             print(f"⚠️ Skipping Lease {lease.lease_number}: No tenant assigned.")
-             continue
-
-        invoice = await create_ar_invoice(
-            background_tasks=background_tasks,
-            db=db,
-            org_id=org_id,
-            site_id=lease.site_id,
-            space_id=lease.space_id,
-            user_id=lease.tenant_id,
-            code=InvoiceType.rent.value,
-            item_id=charge.id,
-            description="Monthly Rent",
-            amount=charge.amount,
-            due_date=cal_due_date,
-            current_user=current_user
-        )
-
-        charge.invoice_id = invoice.id
-        created["invoices"].append(invoice.invoice_no)
-
-    # =====================================================
-    # OWNER MAINTENANCE (AR)
-    # =====================================================
-    maint = db.query(OwnerMaintenanceCharge).filter(
-        OwnerMaintenanceCharge.period_start >= billing_start,
-        OwnerMaintenanceCharge.period_start <= billing_end,
-        OwnerMaintenanceCharge.invoice_id == None,
-        OwnerMaintenanceCharge.org_id == org_id,
-        OwnerMaintenanceCharge.is_deleted == False
-    ).all()
-
-    for charge in maint:
-        space = charge.space
-
-        if not charge.space_owner or not charge.space_owner.owner_user_id:
-            print(f"⚠️ Skipping Maint Charge {charge.id}: No owner assigned to space.")
-            continue
-
-        invoice = await create_ar_invoice(
-            background_tasks=background_tasks,
-            db=db,
-            org_id=org_id,
-            user_id=charge.space_owner.owner_user_id,
-            site_id=space.site_id,
-            space_id=charge.space_id,
-            code=InvoiceType.owner_maintenance.value,
-            item_id=charge.id,
-            description="Owner Maintenance",
-            amount=charge.amount,
-            due_date=cal_due_date,
-            current_user=current_user
-        )
-
-        charge.invoice_id = invoice.id
-        created["invoices"].append(invoice.invoice_no)
-
-    # =====================================================
-    # WORK ORDERS
-    # =====================================================
-    work_orders = db.query(TicketWorkOrder).filter(
-        TicketWorkOrder.created_at >= billing_start,
-        TicketWorkOrder.created_at <= billing_end,
-        TicketWorkOrder.invoice_id == None,
-        TicketWorkOrder.org_id == org_id,
-        TicketWorkOrder.bill_to_type.in_(["tenant", "owner"])
-    ).all()
-
-    for wo in work_orders:
-        ticket = wo.ticket
-
-        if not ticket or not wo.bill_to_id:
-            print(f"⚠️ Skipping Work Order {wo.wo_no}: Missing ticket or bill_to_id.")
-            continue
-
-        # Vendor → AP Bill
-        if wo.bill_to_type in ["tenant", "owner"]:
-            invoice = await create_ar_invoice(
-                background_tasks=background_tasks,
-                db=db,
-                org_id=org_id,
-                user_id=wo.bill_to_id,
-                site_id=ticket.site_id,
-                space_id=ticket.space_id,
-                code=InvoiceType.work_order.value,
-                item_id=wo.id,
-                description=f"Work Order #{wo.wo_no}",
-                amount=wo.total_amount,
-                due_date=cal_due_date,
-                current_user=current_user
-            )
-
-            wo.invoice_id = invoice.id
-            created["invoices"].append(invoice.invoice_no)
-
-    # =====================================================
-    # PARKING PASS (AR)
-    # =====================================================
-    parking_passes = db.query(ParkingPass).filter(
-        ParkingPass.valid_from >= billing_start,
-        ParkingPass.valid_from <= billing_end,
-        ParkingPass.invoice_id == None,
-        ParkingPass.org_id == org_id
-    ).all()
-
-    for p in parking_passes:
-
-        invoice = await create_ar_invoice(
-            background_tasks=background_tasks,
-            db=db,
-            org_id=org_id,
-            user_id=p.partner_id,
-            site_id=p.site_id,
-            space_id=p.space_id,
-            code=InvoiceType.parking_pass.value,
-            item_id=p.id,
-            description="Parking Pass",
-            amount=p.charge_amount,
-            due_date=cal_due_date,
-            current_user=current_user
-        )
-
-        p.invoice_id = invoice.id
-        created["invoices"].append(invoice.invoice_no)
-
-    db.commit()
-
-    return AutoInvoiceResponse(
-        total_invoice_created=len(created["invoices"])
-    )
-
-
-async def create_ar_invoice(
-    background_tasks: BackgroundTasks,
-    db: Session,
-    org_id: UUID,
-    site_id: UUID,
-    space_id: UUID,
-    user_id: UUID,
-    code: str,
-    item_id: UUID,
-    description: str,
-    amount: float,
-    due_date: date,
-    current_user: UserToken
-):
-    tax_pct = 5  # or dynamic
-    sub = Decimal(amount)
-    tax = (sub * Decimal(tax_pct)) / Decimal(100)
-    grand = sub + tax
-
-    line = InvoiceLineCreate(
-        code=code,
-        item_id=item_id,
-        description=description,
-        amount=amount,
-        tax_pct=tax_pct
-    )
-
-    invoice = InvoiceCreate(
+    response = run_billing(
+        db=db,
         org_id=org_id,
-        user_id=user_id,
-        site_id=site_id,
-        space_id=space_id,
-        status="issued",
-        is_paid=False,
-        date=date.today(),
-        due_date=due_date,
-        totals={
-            "sub": float(round(sub, 2)),
-            "tax": float(round(tax, 2)),
-            "grand": float(round(grand, 2))
-        },
-        lines=[line],
-        send_email=False
+        period_start=billing_start,
+        period_end=billing_end,
+        due_date=cal_due_date,
+        current_user=current_user
     )
 
-    db_invoice = await create_invoice(
-        background_tasks, db, org_id, invoice, None, current_user)
+    # Emails go to the outbox after the run, not while invoicing; invoices
+    # of an earlier, failed attempt that were never emailed go out too
+    if send_email:
+        background_tasks.add_task(
+            queue_billing_run_emails, response.billing_run_id)
 
-    return db_invoice
+    return response
 
 
 def auto_generate_monthly_bills(
@@ -0,0 +1,414 @@
+"""
+Real-time notification push and unread counters.
+
+Statement-level triggers on `notifications` keep `notification_counters`
+current and publish every insert and every unread-count change with
+`pg_notify`. Each process keeps ONE dedicated LISTEN connection and fans
+the events out to its in-memory subscribers, so any replica can serve any
+user's stream and idle clients cost no database connections.
+"""
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from starlette.concurrency import run_in_threadpool
+
+from shared.core.config import settings
+from shared.core.database import facility_engine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "notification_events"
+RECONNECT_MAX_SECONDS = 30
+
+# 1 when a row counts towards its user's unread badge
+_UNREAD = "(NOT COALESCE(read, false) AND NOT COALESCE(is_deleted, false))::int"
+
+
+def _per_user_deltas(changes: str) -> str:
+    return (
+        f"SELECT user_id, SUM(delta)::int AS delta FROM ({changes}) AS changes "
+        "GROUP BY user_id HAVING SUM(delta) <> 0"
+    )
+
+
+def _upsert_counters(changes: str) -> str:
+    # Every user with unread rows has a counter (see the backfill), so a
+    # first-time insert never carries a negative delta
+    return f"""
+    INSERT INTO notification_counters AS c (user_id, unread_count, updated_at)
+    SELECT user_id, delta, now() FROM ({_per_user_deltas(changes)}) AS deltas
+    ON CONFLICT (user_id) DO UPDATE
+    SET unread_count = GREATEST(c.unread_count + EXCLUDED.unread_count, 0),
+        updated_at = now();"""
+
+
+_CHANGED_ROWS = {
+    "UPDATE": f"SELECT user_id, {_UNREAD} AS delta FROM new_rows "
+              f"UNION ALL SELECT user_id, -{_UNREAD} FROM old_rows",
+    "DELETE": f"SELECT user_id, -{_UNREAD} AS delta FROM old_rows",
+}
+
+# Statement-level triggers: one counter upsert per user per statement, so a
+# bulk insert or a read-all costs about the same as a single row.
+NOTIFY_FUNCTION_DDL = [
+    f"""
+CREATE OR REPLACE FUNCTION notifications_after_insert() RETURNS trigger AS $$
+BEGIN
+    {_upsert_counters(f"SELECT user_id, {_UNREAD} AS delta FROM new_rows")}
+
+    PERFORM pg_notify('{CHANNEL}', json_build_object(
+        'op', 'insert',
+        'id', id,
+        'user_id', user_id,
+        'delta', {_UNREAD},
+        'notification', CASE WHEN NOT COALESCE(is_deleted, false) THEN json_build_object(
+            'id', id,
+            'user_id', user_id,
+            'type', type,
+            'title', title,
+            'message', message,
+            'priority', priority,
+            'read', COALESCE(read, false),
+            'posted_date', posted_date
+        ) END
+    )::text)
+    FROM new_rows;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+] + [
+    f"""
+CREATE OR REPLACE FUNCTION notifications_after_{op.lower()}() RETURNS trigger AS $$
+BEGIN
+    {_upsert_counters(changes)}
+
+    PERFORM pg_notify('{CHANNEL}', json_build_object(
+        'op', '{op.lower()}', 'user_id', user_id, 'delta', delta)::text)
+    FROM ({_per_user_deltas(changes)}) AS deltas;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+    for op, changes in _CHANGED_ROWS.items()
+]
+
+NOTIFY_TRIGGER_DDL = [
+    # Row-level trigger from the first version of the stream
+    "DROP TRIGGER IF EXISTS trg_notifications_notify ON notifications",
+    "DROP FUNCTION IF EXISTS notify_notification_change()",
+] + [
+    statement
+    for op, transition in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    )
+    for statement in (
+        f"DROP TRIGGER IF EXISTS trg_notifications_{op.lower()} ON notifications",
+        f"""
+        CREATE TRIGGER trg_notifications_{op.lower()}
+        AFTER {op} ON notifications
+        REFERENCING {transition}
+        FOR EACH STATEMENT EXECUTE FUNCTION notifications_after_{op.lower()}()
+        """,
+    )
+]
+
+# First install only: seed counters under a lock so no write slips between
+# the count and the triggers going live. SHARE ROW EXCLUSIVE conflicts with
+# itself, so the trigger DDL that follows never waits on another installer.
+BACKFILL_COUNTERS_SQL = (
+    "LOCK TABLE notifications IN SHARE ROW EXCLUSIVE MODE",
+    f"""
+    INSERT INTO notification_counters (user_id, unread_count, updated_at)
+    SELECT user_id, count(*), now() FROM notifications
+    WHERE {_UNREAD} = 1
+    GROUP BY user_id
+    ON CONFLICT (user_id) DO NOTHING
+    """,
+)
+
+# Processes starting together install one at a time
+_INSTALL_LOCK_KEY = 0x6E6F7466
+
+
+def install_notification_triggers(engine: Engine):
+    """
+    Create / refresh the triggers on `notifications` that maintain
+    `notification_counters` and publish changes with pg_notify.
+    """
+    with engine.begin() as conn:
+        # Checked under the lock: another process may have just installed
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _INSTALL_LOCK_KEY})
+        first_install = conn.execute(text(
+            "SELECT NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_notifications_insert')"
+        )).scalar()
+        if first_install:
+            for statement in BACKFILL_COUNTERS_SQL:
+                conn.execute(text(statement))
+        for statement in NOTIFY_FUNCTION_DDL + NOTIFY_TRIGGER_DDL:
+            conn.execute(text(statement))
+
+
+class Subscription:
+    """One connected client. The queue is bounded; overflow marks it lagged."""
+
+    def __init__(self, user_id: str, maxsize: int):
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.lagged = False
+
+    def offer(self, event: dict):
+        if self.lagged:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow consumer: stop buffering, the stream sends a resync instead
+            self.lagged = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"op": "resync"})
+
+
+class NotificationHub:
+    """Per-process LISTEN connection and user -> subscriptions fan-out."""
+
+    def __init__(self, engine: Engine, queue_size: int):
+        self.engine = engine
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._conn = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._ping_task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # LISTEN connection
+    # ------------------------------------------------------------------
+    def _disconnect(self):
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            self._loop.remove_reader(conn.fileno())
+        except Exception:
+            pass
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _on_readable(self):
+        try:
+            self._conn.poll()
+        except Exception:
+            logger.exception("Notification hub connection lost")
+            self._disconnect()
+            self._schedule_reconnect()
+            return
+        self._dispatch_pending()
+
+    def _dispatch_pending(self):
+        if self._conn is None:
+            return
+        notifies = list(self._conn.notifies)
+        self._conn.notifies.clear()
+        for notify in notifies:
+            try:
+                event = json.loads(notify.payload)
+            except ValueError:
+                continue
+            for subscription in tuple(self._subscribers.get(event.get("user_id"), ())):
+                subscription.offer(event)
+
+    def _schedule_reconnect(self):
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = self._loop.create_task(self._reconnect())
+
+    async def _reconnect(self):
+        delay = 1
+        while self._subscribers and self._conn is None:
+            await asyncio.sleep(delay)
+            try:
+                self._attach(await self._loop.run_in_executor(None, self._open_listen_connection))
+            except Exception:
+                logger.exception("Notification hub reconnect failed")
+                delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+                continue
+            # Events may have been missed while disconnected
+            for subscriptions in self._subscribers.values():
+                for subscription in subscriptions:
+                    subscription.offer({"op": "resync"})
+
+    def _open_listen_connection(self):
+        raw = self.engine.raw_connection()
+        conn = raw.driver_connection
+        raw.detach()  # long-lived, keep it out of the pool
+        conn.rollback()
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(f"LISTEN {CHANNEL}")
+        return conn
+
+    def _attach(self, conn):
+        self._conn = conn
+        self._loop.add_reader(conn.fileno(), self._on_readable)
+        logger.info("Notification hub listening")
+
+    async def _ensure_listening(self):
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._connect_lock = asyncio.Lock()
+            self._ping_task = self._loop.create_task(self._ping_forever())
+
+        async with self._connect_lock:
+            if self._conn is not None:
+                return
+            if self._reconnect_task is not None and not self._reconnect_task.done():
+                return
+            self._attach(await self._loop.run_in_executor(None, self._open_listen_connection))
+
+    async def _ping_forever(self):
+        """Cheap round trip so a silently dropped LISTEN socket is noticed."""
+        while True:
+            await asyncio.sleep(settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS)
+            conn = self._conn
+            if conn is None:
+                continue
+            try:
+                await self._loop.run_in_executor(None, self._ping_blocking, conn)
+                # Notifies read by the ping never wake the reader
+                self._dispatch_pending()
+            except Exception:
+                logger.exception("Notification hub ping failed")
+                if conn is self._conn:
+                    self._disconnect()
+                    self._schedule_reconnect()
+
+    @staticmethod
+    def _ping_blocking(conn):
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+
+    # ------------------------------------------------------------------
+    # SUBSCRIPTIONS
+    # ------------------------------------------------------------------
+    async def subscribe(self, user_id) -> Subscription:
+        subscription = Subscription(str(user_id), self.queue_size)
+        self._subscribers[subscription.user_id].add(subscription)
+        try:
+            await self._ensure_listening()
+        except Exception:
+            self.unsubscribe(subscription)
+            raise
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscriptions = self._subscribers.get(subscription.user_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscribers[subscription.user_id]
+
+    def connection_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscribers.values())
+
+    def close(self):
+        for task in (self._reconnect_task, self._ping_task):
+            if task is not None:
+                task.cancel()
+        if self._loop is not None:
+            self._disconnect()
+
+
+class BatchedLoader:
+    """
+    Coalesces concurrent single-key loads into one `load_many(keys)` call
+    per event-loop tick, e.g. the initial unread count of every stream
+    opened in the same burst becomes a single GROUP BY query.
+    """
+
+    def __init__(self, load_many: Callable[[List[str]], Dict[str, int]]):
+        self.load_many = load_many
+        self._pending: Dict[str, List[asyncio.Future]] = defaultdict(list)
+        self._scheduled = False
+
+    async def load(self, key) -> int:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[str(key)].append(future)
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(lambda: loop.create_task(self._flush()))
+        return await future
+
+    async def _flush(self):
+        pending, self._pending = self._pending, defaultdict(list)
+        self._scheduled = False
+        try:
+            results = await run_in_threadpool(self.load_many, list(pending))
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for key, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(results.get(key, 0))
+
+
+notification_hub = NotificationHub(
+    facility_engine, queue_size=settings.NOTIFICATION_STREAM_QUEUE_SIZE)
+
+
+def _sse(event: str, data: dict, event_id=None) -> str:
+    lines = [f"id: {event_id}"] if event_id else []
+    lines += [f"event: {event}", f"data: {json.dumps(data, default=str)}"]
+    return "\n".join(lines) + "\n\n"
+
+
+async def notification_event_stream(subscription: Subscription, load_unread_count: Callable[[], Awaitable[int]]):
+    """
+    Server-sent events for one subscription:
+      `unread`       {"count": n} on connect, then {"delta": +/-n}
+      `notification` the new row, as it is inserted
+      `resync`       {"count": n} after overflow or a LISTEN reconnect;
+                     the client should refetch its list
+    Idle streams get a comment line every heartbeat so proxies keep them.
+    A client that stops reading blocks its own send, its queue fills up
+    and it is switched to a resync instead of buffering without bound.
+    """
+    heartbeat = settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS
+    try:
+        yield f"retry: {heartbeat * 1000}\n\n"
+        yield _sse("unread", {"count": await load_unread_count()})
+
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+
+            if event["op"] == "resync":
+                subscription.lagged = False
+                yield _sse("resync", {"count": await load_unread_count()})
+                continue
+
+            if event.get("notification"):
+                yield _sse("notification", event["notification"], event_id=event["id"])
+            if event.get("delta"):
+                yield _sse("unread", {"delta": event["delta"]})
+    finally:
+        notification_hub.unsubscribe(subscription)
@@ -0,0 +1,263 @@
+"""
+Current occupancy snapshot per space.
+
+`space_occupancy_state` holds where each space stands in the move-in /
+move-out cycle (status, occupant, open requests) so spaces lists, mobile
+home and dashboards read one row per space instead of walking occupancies,
+handovers, inspections, maintenance and settlements on every request.
+
+compute_occupancy is the status engine. refresh_occupancy_state runs it
+for the spaces a transaction touched and writes the result in the same
+transaction: log_occupancy_event calls it for every stage, the scheduler
+for the occupancies it activates or closes. install_occupancy_state builds
+the rows once for existing data.
+"""
+from datetime import date, datetime, timezone
+
+from sqlalchemy import literal, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..models.space_sites.space_handover import HandoverStatus, SpaceHandover
+from ..models.space_sites.space_inspections import InspectionStatus, SpaceInspection
+from ..models.space_sites.space_maintenances import SpaceMaintenance
+from ..models.space_sites.space_occupancies import OccupancyStatus, RequestType, SpaceOccupancy
+from ..models.space_sites.space_occupancy_events import SpaceOccupancyEvent
+from ..models.space_sites.space_occupancy_state import SpaceOccupancyState
+from ..models.space_sites.space_settlements import SpaceSettlement
+from ..models.space_sites.spaces import Space
+
+OPEN_REQUEST_STATUSES = [OccupancyStatus.pending, OccupancyStatus.active]
+
+
+def _latest(rows, key):
+    """Rows are ordered newest first; keep the first one per key."""
+    latest = {}
+    for row in rows:
+        latest.setdefault(getattr(row, key), row)
+    return latest
+
+
+def _status(occ, move_out, handover, inspection, maintenance, settlement, today):
+    if not occ:
+        return "vacant"
+    if not move_out:
+        return "occupied"
+    if move_out.move_out_date and move_out.move_out_date > today:
+        return "move_out_scheduled"
+    if not handover:
+        return "handover_pending"
+    if handover.status != HandoverStatus.completed:
+        return "handover_in_progress"
+    if not inspection:
+        return "inspection_pending"
+    if inspection.status != InspectionStatus.completed:
+        return "inspection_scheduled"
+    if maintenance and not maintenance.completed:
+        return "maintenance_pending"
+    if settlement and not settlement.settled:
+        return "settlement_pending"
+    if settlement and settlement.settled:
+        return "completed"
+    return "recently_vacated"
+
+
+def compute_occupancy(db: Session, space_ids) -> dict:
+    """
+    Occupancy of many spaces with one query per stage: the latest active
+    move-in, its open move-out and that move-out's handover, inspection,
+    maintenance and settlement decide the status.
+    """
+    space_ids = list(set(space_ids))
+    if not space_ids:
+        return {}
+    today = date.today()
+
+    latest_move_in = _latest(
+        db.query(
+            SpaceOccupancy.id, SpaceOccupancy.space_id, SpaceOccupancy.occupant_type,
+            SpaceOccupancy.occupant_user_id, SpaceOccupancy.move_in_date
+        ).filter(
+            SpaceOccupancy.space_id.in_(space_ids),
+            SpaceOccupancy.request_type == RequestType.move_in,
+            SpaceOccupancy.status == OccupancyStatus.active
+        ).order_by(SpaceOccupancy.space_id, SpaceOccupancy.move_in_date.desc()),
+        "space_id"
+    )
+
+    latest_move_out = _latest(
+        db.query(SpaceOccupancy.id, SpaceOccupancy.space_id, SpaceOccupancy.move_out_date).filter(
+            SpaceOccupancy.space_id.in_(space_ids),
+            SpaceOccupancy.request_type == RequestType.move_out,
+            SpaceOccupancy.status.in_(
+                [OccupancyStatus.pending, OccupancyStatus.scheduled, OccupancyStatus.active])
+        ).order_by(SpaceOccupancy.space_id, SpaceOccupancy.move_out_date.desc()),
+        "space_id"
+    )
+    move_out_ids = [m.id for m in latest_move_out.values()]
+
+    latest_handover = _latest(
+        db.query(SpaceHandover.id, SpaceHandover.occupancy_id, SpaceHandover.status)
+        .filter(SpaceHandover.occupancy_id.in_(move_out_ids))
+        .order_by(SpaceHandover.occupancy_id, SpaceHandover.created_at.desc()),
+        "occupancy_id"
+    )
+
+    latest_inspection = _latest(
+        db.query(SpaceInspection.id, SpaceInspection.handover_id, SpaceInspection.status)
+        .filter(SpaceInspection.handover_id.in_([h.id for h in latest_handover.values()]))
+        .order_by(SpaceInspection.handover_id, SpaceInspection.created_at.desc()),
+        "handover_id"
+    )
+
+    latest_maintenance = _latest(
+        db.query(SpaceMaintenance.inspection_id, SpaceMaintenance.completed)
+        .filter(SpaceMaintenance.inspection_id.in_([i.id for i in latest_inspection.values()]))
+        .order_by(SpaceMaintenance.inspection_id, SpaceMaintenance.created_at.desc()),
+        "inspection_id"
+    )
+
+    # Settlements hang off the move-out, or the move-in on older rows
+    latest_settlement = _latest(
+        db.query(SpaceSettlement.occupancy_id, SpaceSettlement.settled)
+        .filter(SpaceSettlement.occupancy_id.in_(
+            move_out_ids + [occ.id for occ in latest_move_in.values()]))
+        .order_by(SpaceSettlement.occupancy_id, SpaceSettlement.created_at.desc()),
+        "occupancy_id"
+    )
+
+    open_requests = {
+        (r.space_id, r.request_type)
+        for r in db.query(SpaceOccupancy.space_id, SpaceOccupancy.request_type).filter(
+            SpaceOccupancy.space_id.in_(space_ids),
+            SpaceOccupancy.status.in_(OPEN_REQUEST_STATUSES)
+        ).distinct()
+    }
+
+    result = {}
+    for space_id in space_ids:
+        occ = latest_move_in.get(space_id)
+        move_out = latest_move_out.get(space_id) if occ else None
+        handover = latest_handover.get(move_out.id) if move_out else None
+        inspection = latest_inspection.get(handover.id) if handover else None
+        maintenance = latest_maintenance.get(inspection.id) if inspection else None
+        settlement = None
+        if occ:
+            settlement = latest_settlement.get(move_out.id) if move_out else None
+            settlement = settlement or latest_settlement.get(occ.id)
+
+        status = _status(occ, move_out, handover, inspection, maintenance, settlement, today)
+        result[space_id] = {
+            "status": status,
+            "occupant_type": occ.occupant_type if occ else None,
+            "occupant_user_id": occ.occupant_user_id if occ else None,
+            "move_in_id": occ.id if occ else None,
+            "move_in_date": occ.move_in_date if occ else None,
+            "move_out_id": move_out.id if move_out else None,
+            "move_out_date": move_out.move_out_date if move_out else None,
+            "can_request_move_in": (
+                (space_id, RequestType.move_in) not in open_requests
+                or status in ("vacant", "completed")
+            ),
+            "can_request_move_out": (
+                status == "occupied"
+                and (space_id, RequestType.move_out) not in open_requests
+            ),
+        }
+    return result
+
+
+def lock_occupancy_state(db: Session, space_ids) -> dict:
+    """The spaces' snapshot rows, created vacant if missing, locked for this transaction."""
+    space_ids = sorted(set(space_ids))
+    db.execute(
+        insert(SpaceOccupancyState)
+        .from_select(
+            ["space_id", "org_id", "status"],
+            select(Space.id, Space.org_id, literal("vacant")).where(Space.id.in_(space_ids))
+        )
+        .on_conflict_do_nothing(index_elements=["space_id"])
+    )
+    # Fixed order, so two writers touching the same spaces cannot deadlock
+    states = (
+        db.query(SpaceOccupancyState)
+        .filter(SpaceOccupancyState.space_id.in_(space_ids))
+        .order_by(SpaceOccupancyState.space_id)
+        .with_for_update()
+        .populate_existing()
+        .all()
+    )
+    return {state.space_id: state for state in states}
+
+
+def refresh_occupancy_state(db: Session, space_ids, event_type=None, event_at=None):
+    """
+    Recompute the spaces' snapshot rows inside the caller's transaction;
+    the caller commits. `since` moves only when the status changes.
+    """
+    # Sessions do not autoflush; the engine must see the caller's changes
+    db.flush()
+    states = lock_occupancy_state(db, space_ids)
+    now = event_at or datetime.now(timezone.utc)
+    for space_id, values in compute_occupancy(db, states).items():
+        state = states[space_id]
+        if state.status != values["status"] or state.since is None:
+            state.since = now
+        for column, value in values.items():
+            setattr(state, column, value)
+        if event_type is not None:
+            state.last_event_type = event_type
+            state.last_event_at = now
+    return states
+
+
+def stale_occupancy_state(db: Session, org_id=None) -> list:
+    """Spaces shown as move_out_scheduled whose move-out date has come."""
+    query = db.query(SpaceOccupancyState.space_id).filter(
+        SpaceOccupancyState.status == "move_out_scheduled",
+        SpaceOccupancyState.move_out_date <= date.today()
+    )
+    if org_id:
+        query = query.filter(SpaceOccupancyState.org_id == org_id)
+    return [row.space_id for row in query]
+
+
+def install_occupancy_state(engine: Engine):
+    """
+    Build snapshot rows for spaces with occupancy history that have none
+    yet, or whose row predates the status engine (can_request_move_in is
+    only null there). Last events come from the event log.
+    """
+    with Session(engine) as db:
+        pending = select(SpaceOccupancy.space_id).union(
+            select(SpaceOccupancyEvent.space_id)
+        ).subquery()
+        space_ids = [
+            row.space_id for row in db.query(pending.c.space_id).outerjoin(
+                SpaceOccupancyState, SpaceOccupancyState.space_id == pending.c.space_id
+            ).filter(or_(
+                SpaceOccupancyState.space_id.is_(None),
+                SpaceOccupancyState.can_request_move_in.is_(None)
+            ))
+        ]
+        if not space_ids:
+            return
+
+        for start in range(0, len(space_ids), 1000):
+            chunk = space_ids[start:start + 1000]
+            last_events = {
+                e.space_id: e for e in db.query(
+                    SpaceOccupancyEvent.space_id, SpaceOccupancyEvent.event_type,
+                    SpaceOccupancyEvent.event_date
+                ).filter(SpaceOccupancyEvent.space_id.in_(chunk))
+                .distinct(SpaceOccupancyEvent.space_id)
+                .order_by(SpaceOccupancyEvent.space_id, SpaceOccupancyEvent.event_date.desc())
+            }
+            for space_id, state in refresh_occupancy_state(db, chunk).items():
+                event = last_events.get(space_id)
+                if event is not None:
+                    state.last_event_type = event.event_type
+                    state.last_event_at = event.event_date
+                    state.since = event.event_date
+            db.commit()
@@ -0,0 +1,129 @@
+"""
+Database-enforced overlap checks for leases and hotel room bookings.
+
+`leases.period` (generated) and `booking_rooms.stay` carry date ranges
+with GiST exclusion constraints on (space_id, range), so two concurrent
+writers cannot both slip past an application-side overlap query. A
+booking's dates live on `bookings`; triggers copy them onto its rooms.
+
+create_all() only builds these for brand new tables; this module brings
+existing databases up to date. Data that already overlaps keeps the
+constraint from being added: that is logged, and the application checks
+stay in place until the rows are fixed and the service restarted.
+"""
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import AddConstraint
+
+from shared.helpers.exception_handler import register_constraint_message
+
+from ..models.hospitality.booking_rooms import BookingRoom
+from ..models.leasing_tenants.leases import Lease
+
+logger = logging.getLogger(__name__)
+
+# Booking statuses that keep a room occupied (as counted by analytics)
+BOOKING_HOLDS_ROOM = ("reserved", "in_house", "checked_in")
+
+register_constraint_message(
+    "excl_leases_space_period", "Lease dates overlap with an existing lease.")
+register_constraint_message(
+    "excl_booking_rooms_space_stay", "Room is already booked for these dates.")
+
+
+def _stay(booking: str) -> str:
+    statuses = ", ".join(f"'{status}'" for status in BOOKING_HOLDS_ROOM)
+    return (
+        f"CASE WHEN {booking}.status IN ({statuses}) AND {booking}.check_out >= {booking}.check_in "
+        f"THEN daterange({booking}.check_in, {booking}.check_out, '[)') END"
+    )
+
+
+STAY_FUNCTION_DDL = [
+    f"""
+CREATE OR REPLACE FUNCTION booking_rooms_set_stay() RETURNS trigger AS $$
+BEGIN
+    NEW.stay := (SELECT {_stay("b")} FROM bookings b WHERE b.id = NEW.booking_id);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+""",
+    f"""
+CREATE OR REPLACE FUNCTION bookings_sync_room_stay() RETURNS trigger AS $$
+BEGIN
+    UPDATE booking_rooms br SET stay = {_stay("n")}
+    FROM new_rows n JOIN old_rows o ON o.id = n.id
+    WHERE br.booking_id = n.id
+      AND (n.check_in, n.check_out, n.status) IS DISTINCT FROM (o.check_in, o.check_out, o.status);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+""",
+]
+
+STAY_TRIGGER_DDL = [
+    "DROP TRIGGER IF EXISTS trg_booking_rooms_stay ON booking_rooms",
+    """
+    CREATE TRIGGER trg_booking_rooms_stay
+    BEFORE INSERT OR UPDATE OF booking_id, stay ON booking_rooms
+    FOR EACH ROW EXECUTE FUNCTION booking_rooms_set_stay()
+    """,
+    "DROP TRIGGER IF EXISTS trg_bookings_room_stay ON bookings",
+    """
+    CREATE TRIGGER trg_bookings_room_stay
+    AFTER UPDATE ON bookings
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bookings_sync_room_stay()
+    """,
+]
+
+_ADD_COLUMNS = {
+    ("leases", "period"): f"""
+        ALTER TABLE leases ADD COLUMN period daterange
+        GENERATED ALWAYS AS ({Lease.__table__.c.period.computed.sqltext}) STORED
+    """,
+    ("booking_rooms", "stay"): "ALTER TABLE booking_rooms ADD COLUMN stay daterange",
+}
+
+_BACKFILL_STAY_SQL = f"""
+    UPDATE booking_rooms br SET stay = {_stay("b")}
+    FROM bookings b WHERE b.id = br.booking_id
+"""
+
+
+def _exclusion_constraints():
+    for table in (Lease.__table__, BookingRoom.__table__):
+        for constraint in table.constraints:
+            if constraint.name and constraint.name.startswith("excl_"):
+                yield constraint
+
+
+def install_overlap_constraints(engine: Engine):
+    """Add the range columns, stay triggers and exclusion constraints where missing."""
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        for (table, column), ddl in _ADD_COLUMNS.items():
+            if column not in {c["name"] for c in inspector.get_columns(table)}:
+                conn.execute(text(ddl))
+                if table == "booking_rooms":
+                    conn.execute(text(_BACKFILL_STAY_SQL))
+        for statement in STAY_FUNCTION_DDL + STAY_TRIGGER_DDL:
+            conn.execute(text(statement))
+
+    for constraint in _exclusion_constraints():
+        with engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_constraint WHERE conname = :name"),
+                {"name": constraint.name}
+            ).scalar()
+            if exists:
+                continue
+            try:
+                with conn.begin_nested():
+                    conn.execute(AddConstraint(constraint))
+            except DBAPIError as e:
+                # Rows that already overlap, or btree_gist is not available
+                logger.warning(f"Overlap constraint {constraint.name} not installed: {e.orig}")
@@ -0,0 +1,108 @@
+"""
+Per-night room inventory for hotel space groups.
+
+`room_inventory` holds the rooms of each space group sold per night.
+Statement-level triggers keep it current from `booking_rooms.stay`
+(itself synced from the booking, see overlap_constraints), so creating,
+moving or cancelling a booking updates exactly the nights it touches, and
+from `space_group_members`, so moving a room between groups moves its
+booked nights with it. Availability search reads it instead of scanning
+bookings.
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from ..models.hospitality.room_inventory import RoomInventory
+
+
+def _booked_nights(rooms: str, members: str, sign: str) -> str:
+    """One row per night an allocated room is booked, for each group it belongs to."""
+    return (
+        f"SELECT m.group_id, night::date AS date, {sign}1 AS delta "
+        f"FROM {rooms} br JOIN {members} m ON m.space_id = br.space_id "
+        "CROSS JOIN generate_series(lower(br.stay), upper(br.stay) - 1, interval '1 day') AS night "
+        "WHERE br.status = 'allocated'"
+    )
+
+
+def _upsert_inventory(changes: str) -> str:
+    return f"""
+    INSERT INTO {RoomInventory.__tablename__} AS i (space_group_id, date, sold)
+    SELECT group_id, date, SUM(delta)::int FROM ({changes}) AS changes
+    -- Members removed by a group delete cascade: the group's rows go with it
+    WHERE EXISTS (SELECT 1 FROM space_groups g WHERE g.id = changes.group_id)
+    GROUP BY group_id, date HAVING SUM(delta) <> 0
+    ON CONFLICT (space_group_id, date) DO UPDATE
+    SET sold = GREATEST(i.sold + EXCLUDED.sold, 0);"""
+
+
+_CHANGED_ROWS = {
+    "booking_rooms": {
+        "INSERT": _booked_nights("new_rows", "space_group_members", "+"),
+        "UPDATE": _booked_nights("new_rows", "space_group_members", "+")
+        + " UNION ALL " + _booked_nights("old_rows", "space_group_members", "-"),
+        "DELETE": _booked_nights("old_rows", "space_group_members", "-"),
+    },
+    "space_group_members": {
+        "INSERT": _booked_nights("booking_rooms", "new_rows", "+"),
+        "UPDATE": _booked_nights("booking_rooms", "new_rows", "+")
+        + " UNION ALL " + _booked_nights("booking_rooms", "old_rows", "-"),
+        "DELETE": _booked_nights("booking_rooms", "old_rows", "-"),
+    },
+}
+
+INVENTORY_FUNCTION_DDL = [
+    f"""
+CREATE OR REPLACE FUNCTION {table}_room_inventory_{op.lower()}() RETURNS trigger AS $$
+BEGIN
+    {_upsert_inventory(changes)}
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+    for table, ops in _CHANGED_ROWS.items()
+    for op, changes in ops.items()
+]
+
+INVENTORY_TRIGGER_DDL = [
+    statement
+    for table in _CHANGED_ROWS
+    for op, transition in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    )
+    for statement in (
+        f"DROP TRIGGER IF EXISTS trg_{table}_room_inventory_{op.lower()} ON {table}",
+        f"""
+        CREATE TRIGGER trg_{table}_room_inventory_{op.lower()}
+        AFTER {op} ON {table}
+        REFERENCING {transition}
+        FOR EACH STATEMENT EXECUTE FUNCTION {table}_room_inventory_{op.lower()}()
+        """,
+    )
+]
+
+# First install only: count what is already booked under a lock so no
+# write slips between the count and the triggers going live
+BACKFILL_INVENTORY_SQL = (
+    "LOCK TABLE booking_rooms, space_group_members IN SHARE MODE",
+    f"DELETE FROM {RoomInventory.__tablename__}",
+    _upsert_inventory(_booked_nights("booking_rooms", "space_group_members", "+")),
+)
+
+
+def install_room_inventory_triggers(engine: Engine):
+    """
+    Create / refresh the triggers on `booking_rooms` and
+    `space_group_members` that maintain `room_inventory`.
+    """
+    with engine.begin() as conn:
+        first_install = conn.execute(text(
+            "SELECT NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_booking_rooms_room_inventory_insert')"
+        )).scalar()
+        if first_install:
+            for statement in BACKFILL_INVENTORY_SQL:
+                conn.execute(text(statement))
+        for statement in INVENTORY_FUNCTION_DDL + INVENTORY_TRIGGER_DDL:
+            conn.execute(text(statement))
@@ -0,0 +1,125 @@
+"""
+Trigram search benchmark.
+
+Builds a scratch table shaped like the search columns of tickets / users
+(1M rows by default), then times the `ILIKE '%term%'` predicates emitted by
+shared.helpers.search_helper before and after the GIN trigram index exists.
+
+    python -m facility_service.benchmarks.trigram_search_benchmark --rows 1000000
+
+The scratch table is dropped at the end; nothing else in the database is touched.
+"""
+import argparse
+import statistics
+import time
+
+from sqlalchemy import Column, MetaData, String, Table, Text, select, text
+
+from shared.core.database import facility_engine
+from shared.helpers.search_helper import search_filter, search_rank, trigram_index
+
+TABLE_NAME = "bench_trigram_search"
+SEARCH_TERMS = ["TKT-0004217", "leak", "john", "xyzzy-no-match"]
+
+metadata = MetaData()
+bench_table = Table(
+    TABLE_NAME,
+    metadata,
+    Column("ticket_no", String(20)),
+    Column("title", String(255)),
+    Column("full_name", String(200)),
+    Column("description", Text),
+    trigram_index("ix_bench_ticket_no_trgm", "ticket_no"),
+    trigram_index("ix_bench_title_trgm", "title"),
+    trigram_index("ix_bench_full_name_trgm", "full_name"),
+)
+
+
+def seed(conn, rows: int):
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    bench_table.drop(conn, checkfirst=True)
+    bench_table.create(conn)
+    # Baseline pass runs without the indexes; they are rebuilt after seeding
+    for index in bench_table.indexes:
+        index.drop(conn)
+    conn.execute(text(f"""
+        INSERT INTO {TABLE_NAME} (ticket_no, title, full_name, description)
+        SELECT
+            'TKT-' || lpad(g::text, 7, '0'),
+            (ARRAY['Water leak', 'AC not cooling', 'Lift stuck', 'Power outage',
+                   'Door lock broken', 'Pest control'])[1 + g % 6] || ' #' || g,
+            (ARRAY['John', 'Priya', 'Arjun', 'Meera', 'Rahul', 'Anita'])[1 + g % 6]
+                || ' ' || md5(g::text),
+            md5((g * 7)::text)
+        FROM generate_series(1, :rows) AS g
+    """), {"rows": rows})
+    conn.execute(text(f"ANALYZE {TABLE_NAME}"))
+
+
+def time_search(conn, term: str, ranked: bool, repeat: int):
+    columns = [bench_table.c.ticket_no,
+               bench_table.c.title, bench_table.c.full_name]
+    stmt = (
+        select(bench_table.c.ticket_no)
+        .where(search_filter(term, *columns))
+        .limit(20)
+    )
+    if ranked:
+        stmt = stmt.order_by(search_rank(term, *columns).desc())
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(stmt).fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    plan = conn.execute(
+        text("EXPLAIN " + str(stmt.compile(
+            conn, compile_kwargs={"literal_binds": True})))
+    ).scalars().all()
+    uses_index = any("Bitmap Index Scan" in line for line in plan)
+    return statistics.median(timings), uses_index
+
+
+def run(rows: int, repeat: int):
+    with facility_engine.begin() as conn:
+        print(f"Seeding {rows:,} rows into {TABLE_NAME} ...")
+        seed(conn, rows)
+
+    try:
+        results = {}
+        for phase in ("before", "after"):
+            with facility_engine.begin() as conn:
+                if phase == "after":
+                    started = time.perf_counter()
+                    for index in bench_table.indexes:
+                        index.create(conn)
+                    conn.execute(text(f"ANALYZE {TABLE_NAME}"))
+                    print(
+                        f"Built trigram indexes in {time.perf_counter() - started:.1f}s")
+
+                for term in SEARCH_TERMS:
+                    for ranked in (False, True):
+                        results[(phase, term, ranked)] = time_search(
+                            conn, term, ranked, repeat)
+
+        print(f"\n{'term':<18}{'ranked':<8}{'before ms':>12}{'after ms':>12}{'speedup':>10}  index")
+        for term in SEARCH_TERMS:
+            for ranked in (False, True):
+                before, _ = results[("before", term, ranked)]
+                after, uses_index = results[("after", term, ranked)]
+                print(
+                    f"{term:<18}{str(ranked):<8}{before:>12.1f}{after:>12.1f}"
+                    f"{before / after if after else 0:>9.1f}x  {'yes' if uses_index else 'no'}"
+                )
+    finally:
+        with facility_engine.begin() as conn:
+            bench_table.drop(conn, checkfirst=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
@@ -0,0 +1,90 @@
+"""
+Hold many idle notification streams against one facility worker.
+
+    python -m loadtests.notification_stream --url http://localhost:8002 \
+        --token <access token> --connections 10000 --hold 120
+
+Every connection reuses the same token (one user, worst case for the
+fan-out set). Raise the open-file limit first (`ulimit -n 20000`) on both
+ends. Reports how many streams connected, how long that took, how many
+heartbeats arrived, connection failures, and the time until each stream
+got its initial unread count.
+"""
+import argparse
+import asyncio
+import time
+
+import aiohttp
+
+
+async def hold_stream(session, url, headers, hold, stats, first_event_ms):
+    started = time.monotonic()
+    first_event = True
+    try:
+        async with session.get(url, headers=headers) as response:
+            if response.status != 200:
+                stats["failed"] += 1
+                return
+            stats["connected"] += 1
+            deadline = time.monotonic() + hold
+            while time.monotonic() < deadline:
+                try:
+                    line = await asyncio.wait_for(
+                        response.content.readline(), timeout=deadline - time.monotonic())
+                except asyncio.TimeoutError:
+                    break
+                if not line:
+                    stats["dropped"] += 1
+                    return
+                if line.startswith(b": ping"):
+                    stats["heartbeats"] += 1
+                elif line.startswith(b"event:"):
+                    stats["events"] += 1
+                    if first_event:
+                        first_event_ms.append((time.monotonic() - started) * 1000)
+                        first_event = False
+    except aiohttp.ClientError:
+        stats["failed"] += 1
+
+
+async def main(args):
+    url = f"{args.url.rstrip('/')}/api/notifications/stream"
+    headers = {"Authorization": f"Bearer {args.token}"}
+    stats = {"connected": 0, "failed": 0, "dropped": 0, "heartbeats": 0, "events": 0}
+    first_event_ms = []
+
+    connector = aiohttp.TCPConnector(limit=0)
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        started = time.monotonic()
+        tasks = []
+        for i in range(args.connections):
+            tasks.append(asyncio.create_task(
+                hold_stream(session, url, headers, args.hold, stats, first_event_ms)))
+            if args.ramp and i % args.ramp == 0:
+                await asyncio.sleep(0.1)
+
+        while stats["connected"] + stats["failed"] < args.connections:
+            await asyncio.sleep(1)
+            print(f"{time.monotonic() - started:6.1f}s {stats}")
+            if time.monotonic() - started > args.hold:
+                break
+        print(f"ramp-up finished in {time.monotonic() - started:.1f}s")
+
+        await asyncio.gather(*tasks)
+    print(f"final: {stats}")
+    if first_event_ms:
+        first_event_ms.sort()
+        print(f"initial unread count: {len(first_event_ms)} streams, "
+              f"p50 {first_event_ms[len(first_event_ms) // 2]:.0f}ms, "
+              f"p95 {first_event_ms[int(len(first_event_ms) * 0.95)]:.0f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8002")
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--hold", type=int, default=120, help="seconds to keep each stream open")
+    parser.add_argument("--ramp", type=int, default=500, help="pause 100ms after every N connects")
+    asyncio.run(main(parser.parse_args()))
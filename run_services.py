@@ -1,6 +1,10 @@
 import asyncio
 import uvicorn
 
+from shared.workers.email_outbox_worker import EmailOutboxWorker
+from shared.workers.import_job_worker import ImportJobWorker
+from shared.workers.org_membership_sync import OrgMembershipSyncWorker
+
 async def start_servers():
     # First app
     config1 = uvicorn.Config(
@@ -20,11 +24,27 @@ async def start_servers():
     )
     server2 = uvicorn.Server(config2)
 
-    # Run both servers concurrently
-    await asyncio.gather(
-        server1.serve(),
-        server2.serve(),
-    )
+    # Dev only: deployments run each worker as its own docker-compose service
+    # Email outbox worker (blocking loop, so it gets its own thread)
+    email_worker = EmailOutboxWorker()
+    # Keeps the facility org_membership projection in line with auth
+    membership_worker = OrgMembershipSyncWorker()
+    # Applies uploaded CSV / XLSX import jobs
+    import_worker = ImportJobWorker()
+
+    # Run both servers and the workers concurrently
+    try:
+        await asyncio.gather(
+            server1.serve(),
+            server2.serve(),
+            asyncio.to_thread(email_worker.run_forever),
+            asyncio.to_thread(membership_worker.run_forever),
+            asyncio.to_thread(import_worker.run_forever),
+        )
+    finally:
+        email_worker.stop()
+        membership_worker.stop()
+        import_worker.stop()
 
 if __name__ == "__main__":
     try:
@@ -37,6 +37,16 @@ class Settings(BaseSettings):
     # Add HRMS database configuration
     # HRMS_DB_NAME: str = os.getenv("HRMS_DB_NAME")
 
+    # Password hashing / login throttling
+    PASSWORD_BCRYPT_ROUNDS: int = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", 12))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+    PASSWORD_HASH_MAX_PENDING: int = int(
+        os.getenv("PASSWORD_HASH_MAX_PENDING", 32))
+    LOGIN_RATE_PER_IP_PER_MINUTE: int = int(
+        os.getenv("LOGIN_RATE_PER_IP_PER_MINUTE", 30))
+    LOGIN_RATE_PER_IDENTITY_PER_MINUTE: int = int(
+        os.getenv("LOGIN_RATE_PER_IDENTITY_PER_MINUTE", 5))
+
     # Email Configuration FOR TICKETS CHANGES
     SMTP_HOST: str | None = os.getenv("SMTP_HOST")
     SMTP_PORT: int = int(os.getenv("SMTP_PORT", 587))
@@ -45,6 +55,79 @@ class Settings(BaseSettings):
     SMTP_USE_SSL: bool = os.getenv("SMTP_USE_SSL", "False").lower() == "true"
     EMAIL_SENDER: str = os.getenv("EMAIL_SENDER", "noreply@sales-arm.com")
 
+    # Email outbox delivery worker
+    EMAIL_WORKER_BATCH_SIZE: int = int(os.getenv("EMAIL_WORKER_BATCH_SIZE", 50))
+    EMAIL_WORKER_CONCURRENCY: int = int(
+        os.getenv("EMAIL_WORKER_CONCURRENCY", 4))
+    EMAIL_WORKER_POLL_SECONDS: float = float(
+        os.getenv("EMAIL_WORKER_POLL_SECONDS", 2))
+    EMAIL_MAX_ATTEMPTS: int = int(os.getenv("EMAIL_MAX_ATTEMPTS", 6))
+    EMAIL_RETRY_BASE_SECONDS: int = int(
+        os.getenv("EMAIL_RETRY_BASE_SECONDS", 30))
+    EMAIL_DOMAIN_RATE_PER_MINUTE: int = int(
+        os.getenv("EMAIL_DOMAIN_RATE_PER_MINUTE", 120))
+    EMAIL_TEMPLATE_REVALIDATE_SECONDS: int = int(
+        os.getenv("EMAIL_TEMPLATE_REVALIDATE_SECONDS", 30))
+    EMAIL_OUTBOX_RETENTION_DAYS: int = int(
+        os.getenv("EMAIL_OUTBOX_RETENTION_DAYS", 30))
+
+    # Notification push stream (SSE)
+    NOTIFICATION_STREAM_HEARTBEAT_SECONDS: int = int(
+        os.getenv("NOTIFICATION_STREAM_HEARTBEAT_SECONDS", 20))
+    NOTIFICATION_STREAM_QUEUE_SIZE: int = int(
+        os.getenv("NOTIFICATION_STREAM_QUEUE_SIZE", 100))
+    NOTIFICATION_RETENTION_DAYS: int = int(
+        os.getenv("NOTIFICATION_RETENTION_DAYS", 90))
+    NOTIFICATION_ARCHIVE_BATCH_SIZE: int = int(
+        os.getenv("NOTIFICATION_ARCHIVE_BATCH_SIZE", 5000))
+
+    # Access events: monthly partitions created ahead / kept before dropping
+    ACCESS_EVENT_PARTITIONS_AHEAD: int = int(
+        os.getenv("ACCESS_EVENT_PARTITIONS_AHEAD", 3))
+    ACCESS_EVENT_RETENTION_MONTHS: int = int(
+        os.getenv("ACCESS_EVENT_RETENTION_MONTHS", 24))
+
+    # Excel bulk uploads: rows per lookup / write statement
+    BULK_IMPORT_CHUNK_SIZE: int = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", 1000))
+
+    # Background import jobs (CSV / XLSX uploads)
+    IMPORT_JOB_MAX_BYTES: int = int(
+        os.getenv("IMPORT_JOB_MAX_BYTES", 50 * 1024 * 1024))
+    IMPORT_JOB_CHUNK_ROWS: int = int(os.getenv("IMPORT_JOB_CHUNK_ROWS", 5000))
+    IMPORT_JOB_POLL_SECONDS: float = float(
+        os.getenv("IMPORT_JOB_POLL_SECONDS", 2))
+    IMPORT_JOB_MAX_ATTEMPTS: int = int(os.getenv("IMPORT_JOB_MAX_ATTEMPTS", 3))
+
+    # Reference-data (lookups / system settings) cache
+    REFERENCE_CACHE_TTL_SECONDS: int = int(
+        os.getenv("REFERENCE_CACHE_TTL_SECONDS", 300))
+    REFERENCE_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("REFERENCE_CACHE_MAX_ENTRIES", 5000))
+
+    # Dashboard / report response cache ("memory" or "redis")
+    RESPONSE_CACHE_BACKEND: str = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+    RESPONSE_CACHE_REDIS_URL: str | None = os.getenv("RESPONSE_CACHE_REDIS_URL")
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 2000))
+
+    # org_membership projection (auth -> facility)
+    ORG_MEMBERSHIP_SYNC_BATCH_SIZE: int = int(
+        os.getenv("ORG_MEMBERSHIP_SYNC_BATCH_SIZE", 500))
+    ORG_MEMBERSHIP_SYNC_POLL_SECONDS: float = float(
+        os.getenv("ORG_MEMBERSHIP_SYNC_POLL_SECONDS", 2))
+    ORG_MEMBERSHIP_RECONCILE_MINUTES: int = int(
+        os.getenv("ORG_MEMBERSHIP_RECONCILE_MINUTES", 60))
+
+    # Per-org API rate limit (limit itself comes from system settings)
+    RATE_LIMIT_ENABLED: bool = os.getenv(
+        "RATE_LIMIT_ENABLED", "True").lower() == "true"
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    RATE_LIMIT_REDIS_URL: str | None = os.getenv("RATE_LIMIT_REDIS_URL")
+    RATE_LIMIT_DEFAULT_PER_HOUR: int = int(
+        os.getenv("RATE_LIMIT_DEFAULT_PER_HOUR", 1000))
+    RATE_LIMIT_SETTINGS_TTL_SECONDS: int = int(
+        os.getenv("RATE_LIMIT_SETTINGS_TTL_SECONDS", 60))
+
     class Config:
         env_file = ".env"   # 👈 important
         env_file_encoding = "utf-8"
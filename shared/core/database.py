@@ -2,11 +2,16 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 # , HRMS_DATABASE_URL
 from shared.core.config import AUTH_DATABASE_URL, FACILITY_DATABASE_URL
+from shared.core.migrations import require_extensions
 
 # Separate bases
 AuthBase = declarative_base()
 Base = declarative_base()
 
+# pg_trgm backs the GIN trigram indexes used by search filters
+require_extensions(AuthBase.metadata, "pg_trgm")
+require_extensions(Base.metadata, "pg_trgm", "btree_gist")
+
 POOL_SIZE = 2
 MAX_OVERFLOW = 2
 
@@ -0,0 +1,97 @@
+from sqlalchemy import DDL, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex, MetaData
+
+# Processes starting together build missing indexes one at a time
+_SYNC_INDEXES_LOCK_KEY = 0x69647873
+
+
+def require_extensions(metadata: MetaData, *extensions: str):
+    """
+    Make sure the given Postgres extensions exist before create_all()
+    emits any table / index DDL that depends on them (e.g. gin_trgm_ops).
+    """
+    for extension in extensions:
+        event.listen(
+            metadata,
+            "before_create",
+            DDL(f'CREATE EXTENSION IF NOT EXISTS "{extension}"')
+        )
+
+
+def sync_indexes(engine: Engine, metadata: MetaData):
+    """
+    create_all() only emits indexes together with a brand new table, so
+    indexes added to __table_args__ of an existing table never reach the
+    database. Create whatever is declared on the models but still missing.
+
+    Builds run CONCURRENTLY on an autocommit connection so writes to large
+    tables go on meanwhile (partitioned tables don't support that and get a
+    plain CREATE INDEX). An invalid index left by an interrupted build is
+    dropped and built again. One process at a time, under an advisory lock.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _SYNC_INDEXES_LOCK_KEY})
+        try:
+            existing_tables = set(inspect(conn).get_table_names())
+            indexes = dict(conn.execute(text("""
+                SELECT c.relname, i.indisvalid FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE c.relnamespace = current_schema()::regnamespace
+            """)).all())
+            partitioned = set(conn.execute(text("""
+                SELECT c.relname FROM pg_partitioned_table p
+                JOIN pg_class c ON c.oid = p.partrelid
+            """)).scalars())
+
+            for table in metadata.sorted_tables:
+                if table.name not in existing_tables:
+                    continue
+
+                for index in table.indexes:
+                    valid = indexes.get(index.name)
+                    if valid:
+                        continue
+                    if valid is False:
+                        conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{index.name}"'))
+
+                    options = index.dialect_options["postgresql"]
+                    options["concurrently"] = table.name not in partitioned
+                    try:
+                        conn.execute(CreateIndex(index, if_not_exists=True))
+                    finally:
+                        options["concurrently"] = False
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _SYNC_INDEXES_LOCK_KEY})
+
+
+def sync_columns(engine: Engine, metadata: MetaData):
+    """
+    Same gap as sync_indexes for columns: add nullable columns declared on
+    the models but missing from existing tables. NOT NULL columns without a
+    server default still need a hand-written migration and are skipped.
+    """
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+
+        for table in metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+
+            existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                if not column.nullable and column.server_default is None:
+                    continue
+
+                column_type = column.type.compile(dialect=conn.dialect)
+                ddl = f'ALTER TABLE "{table.name}" ADD COLUMN IF NOT EXISTS "{column.name}" {column_type}'
+                if column.server_default is not None:
+                    default = column.server_default.arg
+                    default = default.text if hasattr(default, "text") else f"'{default}'"
+                    ddl += f" DEFAULT {default}"
+                if not column.nullable:
+                    ddl += " NOT NULL"
+                conn.execute(DDL(ddl))
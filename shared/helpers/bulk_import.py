@@ -0,0 +1,260 @@
+"""
+Set-based engine behind the Excel bulk-upload endpoints.
+
+Rows are loaded into a DataFrame once, validated with column-wise masks,
+foreign keys are resolved with one query per key type (chunked for large
+sheets) and changes are written in chunks with INSERT ... ON CONFLICT /
+bulk UPDATE by primary key, instead of a lookup + ORM add per row.
+
+`iter_sheet_rows` / `RecordParser` read uploaded CSV / XLSX files row by
+row for the background import jobs.
+"""
+import csv
+import io
+import logging
+import re
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, get_args
+
+import openpyxl
+import pandas as pd
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import literal_column, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from shared.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Row 1 of the sheet is the header, so the first record is row 2
+FIRST_DATA_ROW = 2
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def chunked(items: Sequence, size: int) -> Iterable[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def name_key(series: pd.Series) -> pd.Series:
+    """Case / whitespace insensitive lookup key for name columns."""
+    return series.fillna("").astype(str).str.strip().str.lower()
+
+
+def present(series: pd.Series) -> pd.Series:
+    """True where the cell holds a non-blank value."""
+    return series.notna() & (series.astype(str).str.strip() != "")
+
+
+def nan_to_none(value):
+    """Merged id columns come back as NaN where the lookup missed."""
+    return None if value is None or (isinstance(value, float) and pd.isna(value)) else value
+
+
+class BulkImport:
+    """
+    One upload in progress. `frame` holds a row per record with its sheet
+    `row` number and the record's position (`idx`); callers add key columns,
+    `fail()` rows, `lookup()` ids and finally write the `valid()` rows.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        records: List[BaseModel],
+        label: str,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = settings.BULK_IMPORT_CHUNK_SIZE,
+    ):
+        self.db = db
+        self.records = records
+        self.label = label
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self.frame = pd.DataFrame(
+            [r.model_dump() for r in records],
+            columns=list(type(records[0]).model_fields) if records else None,
+        )
+        self.frame["idx"] = range(len(records))
+        self.frame["row"] = self.frame["idx"] + FIRST_DATA_ROW
+        self._errors: Dict[int, List[str]] = defaultdict(list)
+        self._done = 0
+
+    # -- validation -----------------------------------------------------
+
+    def fail(self, mask: pd.Series, message):
+        """Record `message` (text, or a Series of texts) for each row where mask is True."""
+        mask = mask.fillna(False).astype(bool)
+        rows = self.frame.loc[mask, "row"]
+        messages = message.loc[mask] if isinstance(message, pd.Series) else [message] * len(rows)
+        for row, text in zip(rows, messages):
+            self._errors[row].append(text)
+
+    def valid(self) -> pd.DataFrame:
+        return self.frame[~self.frame["row"].isin(list(self._errors))]
+
+    def errors(self, error_model: Type[BaseModel]) -> List[BaseModel]:
+        return [error_model(row=row, errors=texts) for row, texts in sorted(self._errors.items())]
+
+    # -- lookups --------------------------------------------------------
+
+    def lookup(self, columns, key_columns, keys: pd.DataFrame, *filters) -> pd.DataFrame:
+        """
+        Select labelled `columns` for every distinct tuple of `keys`
+        (matched against `key_columns`, in the same order); one query per
+        chunk of keys. Result columns are named after the labels so they
+        merge straight back onto `frame`.
+        """
+        distinct = list(keys.drop_duplicates().itertuples(index=False, name=None))
+        rows = []
+        for part in chunked(distinct, self.chunk_size):
+            if len(key_columns) == 1:
+                condition = key_columns[0].in_([key[0] for key in part])
+            else:
+                condition = tuple_(*key_columns).in_(part)
+            rows.extend(self.db.execute(select(*columns).where(condition, *filters)).all())
+        return pd.DataFrame(rows, columns=[c.key for c in columns])
+
+    def attach(self, resolved: pd.DataFrame, on: List[str]):
+        """Left-join lookup results onto `frame`; unmatched rows get NaN."""
+        self.frame = self.frame.merge(resolved, on=on, how="left")
+
+    # -- writes ---------------------------------------------------------
+
+    def _advance(self, count: int, total: int):
+        self._done += count
+        if self.progress:
+            self.progress(self._done, total)
+        if total > self.chunk_size:
+            logger.info(f"{self.label}: {self._done}/{total} rows written")
+
+    def upsert(
+        self,
+        model,
+        rows: List[dict],
+        conflict_columns: List[str],
+        update_columns: List[str],
+        total: Optional[int] = None,
+    ) -> Tuple[int, int]:
+        """
+        INSERT ... ON CONFLICT (conflict_columns) DO UPDATE in chunks.
+        All rows must carry the same keys. Returns (inserted, updated),
+        told apart by xmax: 0 only on freshly inserted tuples.
+        """
+        inserted = updated = 0
+        total = total or len(rows)
+        for part in chunked(rows, self.chunk_size):
+            stmt = pg_insert(model).values(list(part))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={column: stmt.excluded[column] for column in update_columns},
+            ).returning(literal_column("xmax = 0"))
+            fresh = self.db.execute(stmt).scalars().all()
+            inserted += sum(1 for is_new in fresh if is_new)
+            updated += sum(1 for is_new in fresh if not is_new)
+            self._advance(len(part), total)
+        return inserted, updated
+
+    def insert(self, model, rows: List[dict], total: Optional[int] = None) -> int:
+        total = total or len(rows)
+        for part in chunked(rows, self.chunk_size):
+            self.db.execute(pg_insert(model).values(list(part)))
+            self._advance(len(part), total)
+        return len(rows)
+
+    def update_by_id(self, model, rows: List[dict], total: Optional[int] = None) -> int:
+        """Bulk UPDATE by primary key; rows may set different columns."""
+        total = total or len(rows)
+        for part in chunked(rows, self.chunk_size):
+            self.db.execute(update(model), list(part))
+            self._advance(len(part), total)
+        return len(rows)
+
+
+# -- file uploads -------------------------------------------------------
+
+SHEET_EXTENSIONS = (".csv", ".xlsx")
+
+
+def _cell(value):
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)  # Excel stores every number as a float
+    return value
+
+
+def iter_sheet_rows(data: bytes, file_name: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Yield (sheet row number, {header: value}) for every non-blank row after
+    the header, streaming: CSV through the csv module, XLSX through
+    openpyxl's read-only mode, so the parsed sheet is never held whole.
+    Blank cells are left out of the dict.
+    """
+    workbook = None
+    if file_name.lower().endswith(".csv"):
+        rows = csv.reader(io.TextIOWrapper(io.BytesIO(data), encoding="utf-8-sig", newline=""))
+    else:
+        workbook = openpyxl.load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+
+    header = None
+    try:
+        for number, values in enumerate(rows, start=1):
+            values = [_cell(value) for value in values]
+            if all(value is None for value in values):
+                continue
+            if header is None:
+                header = [str(value) if value is not None else "" for value in values]
+                continue
+            yield number, {
+                name: value for name, value in zip(header, values)
+                if name and value is not None
+            }
+    finally:
+        if workbook is not None:
+            workbook.close()
+
+
+def _header_key(name: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def _accepts(annotation, kind) -> bool:
+    return annotation is kind or kind in get_args(annotation)
+
+
+class RecordParser:
+    """
+    Builds import schema records from sheet rows. Headers match field
+    names ignoring case, spaces and punctuation ("Meter Code" -> meterCode);
+    numbers in text fields are kept as text (slot "12", code 1001).
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self.fields = {_header_key(name): name for name in model.model_fields}
+        self.text_fields = {
+            name for name, field in model.model_fields.items()
+            if _accepts(field.annotation, str) and not _accepts(field.annotation, int)
+        }
+
+    def parse(self, values: Dict[str, Any]) -> Tuple[Optional[BaseModel], List[str]]:
+        data = {}
+        for header, value in values.items():
+            field = self.fields.get(_header_key(header))
+            if field is None:
+                continue
+            if field in self.text_fields and not isinstance(value, str):
+                value = str(value)
+            data[field] = value
+        try:
+            return self.model(**data), []
+        except ValidationError as e:
+            return None, [
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            ]
@@ -1,10 +1,12 @@
 import logging
-import re
-from typing import List, Optional
+from collections import defaultdict
+from typing import List, Optional, Tuple
 from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 
-from shared.models.email_template import EmailTemplate
+from shared.helpers.email_template_registry import email_template_registry, strip_html_tags
+from shared.models.email_outbox import EmailOutbox
 from ..utils.email_client import EmailClient
 from ..core.config import settings
 
@@ -29,19 +31,48 @@ class EmailHelper:
                 status_code=500, detail=f"Email setup error: {e}")
 
     def _fetch_template(self, db: Session, template_code: str) -> str:
-        """Retrieve email template HTML from DB."""
-        template = (
-            db.query(EmailTemplate)
-            .filter(
-                EmailTemplate.template_code == template_code,
-                EmailTemplate.is_deleted == False,
+        """Retrieve email template HTML (cached, see EmailTemplateRegistry)."""
+        return email_template_registry.get(db, template_code).html
+
+    def render(self, db: Session, template_code: str, context: dict) -> Tuple[str, str]:
+        """Render a template into its HTML and plain-text bodies."""
+        return email_template_registry.render(db, template_code, context)
+
+    def render_many(self, db: Session, template_code: str, contexts: List[dict]) -> List[Tuple[str, str]]:
+        """Render one template for a batch of contexts."""
+        return email_template_registry.render_many(db, template_code, contexts)
+
+    def queue_email(
+        self,
+        db: Session,
+        template_code: str,
+        recipients: List[str],
+        subject: str,
+        context: dict,
+        attachments: Optional[List[str]] = None
+    ) -> List[EmailOutbox]:
+        """
+        Add the email to the outbox in the caller's transaction; it is sent
+        by the outbox worker once committed. One row per recipient domain.
+        """
+        by_domain = defaultdict(list)
+        for recipient in recipients:
+            if recipient:
+                by_domain[recipient.rsplit("@", 1)[-1].lower()].append(recipient)
+
+        rows = [
+            EmailOutbox(
+                template_code=template_code,
+                recipients=domain_recipients,
+                recipient_domain=domain,
+                subject=subject,
+                context=jsonable_encoder(context),
+                attachments=attachments or None,
             )
-            .first()
-        )
-        if not template:
-            raise HTTPException(
-                status_code=404, detail=f"Email template '{template_code}' not found")
-        return template.template_content
+            for domain, domain_recipients in by_domain.items()
+        ]
+        db.add_all(rows)
+        return rows
 
     def send_email(
         self,
@@ -54,9 +85,7 @@ class EmailHelper:
     ) -> bool:
         """Send email with template and context replacement."""
         try:
-            html_template = self._fetch_template(db, template_code)
-            html_body = html_template.format(**context)
-            text_body = self._strip_html_tags(html_body)
+            html_body, text_body = self.render(db, template_code, context)
 
             self.mailer.send_email(
                 sender=settings.EMAIL_SENDER,
@@ -81,4 +110,4 @@ class EmailHelper:
     @staticmethod
     def _strip_html_tags(html: str) -> str:
         """Basic HTML to plain text converter."""
-        return re.sub("<.*?>", "", html or "")
+        return strip_html_tags(html)
@@ -0,0 +1,160 @@
+import re
+import string
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from shared.core.config import settings
+from shared.models.email_template import EmailTemplate
+
+_TAG_RE = re.compile("<.*?>")
+_FORMATTER = string.Formatter()
+
+
+def strip_html_tags(html: str) -> str:
+    """Basic HTML to plain text converter."""
+    return _TAG_RE.sub("", html or "")
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    template_code: str
+    updated_at: Optional[datetime]
+    html: str
+    fields: FrozenSet[str]
+
+    @classmethod
+    def compile(cls, template: EmailTemplate) -> "CompiledTemplate":
+        html = template.template_content or ""
+        fields = frozenset(
+            re.split(r"[.\[]", field_name, maxsplit=1)[0]
+            for _, field_name, _, _ in _FORMATTER.parse(html)
+            if field_name
+        )
+        return cls(
+            template_code=template.template_code,
+            updated_at=template.updated_at,
+            html=html,
+            fields=fields,
+        )
+
+    def render(self, context: dict) -> Tuple[str, str]:
+        missing = self.fields.difference(context)
+        if missing:
+            raise KeyError(sorted(missing)[0])
+        html = self.html.format_map(context)
+        # Stripped after formatting so markup in context values stays out of the text part
+        return html, strip_html_tags(html)
+
+
+class _Entry:
+    __slots__ = ("template", "checked_at")
+
+    def __init__(self, template: CompiledTemplate):
+        self.template = template
+        self.checked_at = time.monotonic()
+
+
+class EmailTemplateRegistry:
+    """
+    Process-wide cache of compiled email templates.
+
+    An entry is trusted for EMAIL_TEMPLATE_REVALIDATE_SECONDS; after that a
+    single `updated_at` probe decides whether the content is reloaded.
+    Edits made through this process drop the entry straight away.
+    """
+
+    def __init__(self, revalidate_seconds: int):
+        self.revalidate_seconds = revalidate_seconds
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "loads": 0, "revalidations": 0}
+
+    def _load(self, db: Session, template_code: str) -> CompiledTemplate:
+        template = (
+            db.query(EmailTemplate)
+            .filter(
+                EmailTemplate.template_code == template_code,
+                EmailTemplate.is_deleted == False,
+            )
+            .first()
+        )
+        if not template:
+            raise HTTPException(
+                status_code=404, detail=f"Email template '{template_code}' not found")
+
+        compiled = CompiledTemplate.compile(template)
+        with self._lock:
+            self._entries[template_code] = _Entry(compiled)
+            self._stats["loads"] += 1
+        return compiled
+
+    def get(self, db: Session, template_code: str) -> CompiledTemplate:
+        with self._lock:
+            entry = self._entries.get(template_code)
+
+        if entry is None:
+            return self._load(db, template_code)
+
+        if time.monotonic() - entry.checked_at < self.revalidate_seconds:
+            with self._lock:
+                self._stats["hits"] += 1
+            return entry.template
+
+        updated_at = (
+            db.query(EmailTemplate.updated_at)
+            .filter(
+                EmailTemplate.template_code == template_code,
+                EmailTemplate.is_deleted == False,
+            )
+            .scalar()
+        )
+        with self._lock:
+            self._stats["revalidations"] += 1
+        if updated_at is None or updated_at != entry.template.updated_at:
+            return self._load(db, template_code)
+
+        entry.checked_at = time.monotonic()
+        return entry.template
+
+    def render(self, db: Session, template_code: str, context: dict) -> Tuple[str, str]:
+        return self.get(db, template_code).render(context)
+
+    def render_many(
+        self,
+        db: Session,
+        template_code: str,
+        contexts: Iterable[dict]
+    ) -> List[Tuple[str, str]]:
+        """Render one template for many contexts with a single lookup."""
+        template = self.get(db, template_code)
+        return [template.render(context) for context in contexts]
+
+    def invalidate(self, template_code: Optional[str] = None):
+        with self._lock:
+            if template_code is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(template_code, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), **self._stats}
+
+
+email_template_registry = EmailTemplateRegistry(
+    revalidate_seconds=settings.EMAIL_TEMPLATE_REVALIDATE_SECONDS,
+)
+
+
+@event.listens_for(EmailTemplate, "after_insert")
+@event.listens_for(EmailTemplate, "after_update")
+@event.listens_for(EmailTemplate, "after_delete")
+def _drop_changed_template(mapper, connection, target):
+    email_template_registry.invalidate(target.template_code)
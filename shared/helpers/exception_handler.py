@@ -1,10 +1,31 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy.exc import IntegrityError
 from shared.core.schemas import JsonOutResult
 from shared.utils.app_status_code import AppStatusCode
 import traceback
 
+EXCLUSION_VIOLATION = "23P01"
+
+# Constraint name -> message shown when the database rejects a write
+CONSTRAINT_MESSAGES = {}
+
+
+def register_constraint_message(constraint_name: str, message: str):
+    CONSTRAINT_MESSAGES[constraint_name] = message
+
+
+def _constraint_message(exc: IntegrityError):
+    orig = getattr(exc, "orig", None)
+    diag = getattr(orig, "diag", None)
+    name = getattr(diag, "constraint_name", None)
+    if name in CONSTRAINT_MESSAGES:
+        return CONSTRAINT_MESSAGES[name]
+    if getattr(orig, "pgcode", None) == EXCLUSION_VIOLATION:
+        return "This overlaps with an existing record."
+    return None
+
 
 def setup_exception_handlers(app: FastAPI):
 
@@ -34,6 +55,21 @@ def setup_exception_handlers(app: FastAPI):
         ).dict()
         return JSONResponse(content=wrapped, status_code=422)
 
+    # Overlap / constraint checks enforced by the database itself
+    @app.exception_handler(IntegrityError)
+    async def integrity_exception_handler(request: Request, exc: IntegrityError):
+        message = _constraint_message(exc)
+        if message is None:
+            return await generic_exception_handler(request, exc)
+
+        wrapped = JsonOutResult(
+            data=None,
+            status="Failed",
+            status_code=str(AppStatusCode.REQUIRED_VALIDATION_ERROR),
+            message=message
+        ).dict()
+        return JSONResponse(content=wrapped, status_code=400)
+
     # Catch all unhandled exceptions
     @app.exception_handler(Exception)
     async def generic_exception_handler(request: Request, exc: Exception):
@@ -0,0 +1,83 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from fastapi import status
+from passlib.context import CryptContext
+
+from shared.core.config import settings
+from shared.helpers.json_response_helper import error_response
+
+# Hashes below the configured cost are flagged by verify_and_update and
+# rewritten on the next successful login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+)
+
+# Verified when the user does not exist so response time does not leak it
+_DUMMY_HASH = pwd_context.hash("not-a-real-password")
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_and_update(password: str, password_hash: Optional[str]) -> Tuple[bool, Optional[str]]:
+    if not password_hash:
+        pwd_context.verify(password, _DUMMY_HASH)
+        return False, None
+    return pwd_context.verify_and_update(password, password_hash)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a small process pool so CPU-heavy checks neither hold
+    the GIL of the API worker nor a DB connection. Callers wait on the
+    result from their threadpool thread; once `max_pending` checks are in
+    flight further callers get a 503 instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self._pool
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            error_response(
+                message="Sign-in is busy, please retry shortly",
+                http_status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        try:
+            return self._executor().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password)
+
+    def verify(self, password: str, password_hash: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """Returns (valid, new_hash); new_hash is set when the cost changed."""
+        return self._run(_verify_and_update, password, password_hash)
+
+    def shutdown(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
@@ -1,190 +1,205 @@
+from typing import Optional
 
-from requests import Session
-from sqlalchemy.orm import joinedload
-from facility_service.app.models.common.staff_sites import StaffSite
+from sqlalchemy import Select, select, union
+from sqlalchemy.orm import Session
 from facility_service.app.models.leasing_tenants.leases import Lease
+from facility_service.app.models.leasing_tenants.tenant_spaces import TenantSpace
 from facility_service.app.models.leasing_tenants.tenants import Tenant
 from facility_service.app.models.space_sites.buildings import Building
 from facility_service.app.models.space_sites.sites import Site
+from facility_service.app.models.space_sites.space_owners import SpaceOwner
 from facility_service.app.models.space_sites.spaces import Space
 from shared.core.schemas import UserToken
-from shared.utils.enums import UserAccountType
-
-def get_allowed_sites(db: Session, user: UserToken):
-    results = []
+from shared.helpers.reference_cache import cached_reference, invalidate_on_change
+from shared.utils.enums import OwnershipStatus, UserAccountType
+
+# Per-user scope rows are cached; any change to the rows that grant access
+# drops them. TenantSpace and Tenant carry no org_id, so those invalidate
+# the namespace for every org.
+invalidate_on_change(TenantSpace, "user_scope")
+invalidate_on_change(Tenant, "user_scope")
+invalidate_on_change(SpaceOwner, "user_scope", org_attr="owner_org_id")
+invalidate_on_change(Lease, "user_scope")
+
+# Tenant-space links that still grant access to the space
+ACTIVE_TENANT_LINKS = (OwnershipStatus.approved, OwnershipStatus.leased)
+
+
+def _scoped_space_sources(user: UserToken):
+    """
+    (all space ids, primary space ids) granting access to a tenant or owner,
+    as SQL selects; None for account types that see the whole org.
+    """
     account_type = user.account_type.lower()
 
     if account_type == UserAccountType.TENANT:
-        tenant = (
-            db.query(Tenant)
-            .options(
-                joinedload(Tenant.space).joinedload(Space.site),
-                joinedload(Tenant.leases)
-                .joinedload(Lease.space)
-                .joinedload(Space.site),
-            )
-            .filter(Tenant.user_id == user.user_id)
-            .first()
+        tenant_ids = select(Tenant.id).where(
+            Tenant.user_id == user.user_id,
+            Tenant.is_deleted == False
+        )
+        linked = select(TenantSpace.space_id).where(
+            TenantSpace.tenant_id.in_(tenant_ids),
+            TenantSpace.is_deleted == False,
+            TenantSpace.status.in_(ACTIVE_TENANT_LINKS)
         )
+        leased = select(Lease.space_id).where(
+            Lease.tenant_id.in_(tenant_ids),
+            Lease.is_deleted == False
+        )
+        return union(linked, leased), linked
 
-        if not tenant:
-            return {"sites": []}
-
-        seen_site_ids = set()
-
-        # Registered space site
-        if tenant.space and tenant.space.site:
-            site = tenant.space.site
-            results.append({
-                "site_id": site.id,
-                "site_name": site.name,
-                "is_primary": True
-            })
-            seen_site_ids.add(site.id)
-
-        #  Leased space sites
-        for lease in tenant.leases:
-            space = lease.space
-            if space and space.site and space.site.id not in seen_site_ids:
-                results.append({
-                    "site_id": space.site.id,
-                    "site_name": space.site.name,
-                    "is_primary": False
-                })
-                seen_site_ids.add(space.site.id)
-
-    else:
-        sites = (
-            db.query(Site)
-            .filter(Site.org_id == user.org_id)
-            .all()
+    if account_type == UserAccountType.FLAT_OWNER:
+        owned = select(SpaceOwner.space_id).where(
+            SpaceOwner.owner_user_id == user.user_id,
+            SpaceOwner.is_active == True,
+            SpaceOwner.status == OwnershipStatus.approved
         )
-        results = [
-            {"site_id": s.id, "site_name": s.name, "is_primary": True}
-            for s in sites
-        ]
+        return owned, owned
+
+    return None
+
+
+def allowed_space_ids_query(user: UserToken) -> Optional[Select]:
+    """
+    Space ids a tenant / owner may see as a subquery, to compose straight
+    into list queries (`Lease.space_id.in_(...)`). None means the user is
+    limited by org only and callers keep their usual org filter.
+    """
+    sources = _scoped_space_sources(user)
+    if sources is None:
+        return None
+
+    space_ids, _ = sources
+    return select(Space.id).where(
+        Space.id.in_(space_ids),
+        Space.org_id == user.org_id,
+        Space.is_deleted == False
+    )
+
+
+def allowed_site_ids_query(user: UserToken) -> Optional[Select]:
+    space_ids = allowed_space_ids_query(user)
+    if space_ids is None:
+        return None
+    return select(Space.site_id).where(Space.id.in_(space_ids)).distinct()
+
+
+def allowed_building_ids_query(user: UserToken) -> Optional[Select]:
+    space_ids = allowed_space_ids_query(user)
+    if space_ids is None:
+        return None
+    return (
+        select(Space.building_block_id)
+        .where(Space.id.in_(space_ids), Space.building_block_id.isnot(None))
+        .distinct()
+    )
+
+
+@cached_reference("user_scope")
+def _scoped_spaces(db: Session, org_id, user_id: str, account_type: str):
+    user = UserToken(user_id=user_id, session_id="", org_id=org_id, account_type=account_type)
+    space_ids, primary_ids = _scoped_space_sources(user)
+
+    rows = (
+        db.query(
+            Space.id,
+            Space.name,
+            Space.site_id,
+            Site.name.label("site_name"),
+            Space.building_block_id,
+            Building.name.label("building_name"),
+            Space.id.in_(primary_ids).label("is_primary")
+        )
+        .join(Site, Site.id == Space.site_id)
+        .outerjoin(Building, Building.id == Space.building_block_id)
+        .filter(Space.id.in_(allowed_space_ids_query(user)))
+        .order_by(Space.id.in_(primary_ids).desc(), Space.name)
+        .all()
+    )
+    return [dict(row._mapping) for row in rows]
 
-    return results
 
+def _user_spaces(db: Session, user: UserToken):
+    return _scoped_spaces(db, user.org_id, str(user.user_id), user.account_type.lower())
 
-def get_allowed_spaces(db: Session, user: UserToken):
-    results = []
-    account_type = user.account_type.lower()
 
-    if account_type == UserAccountType.TENANT:
-        tenant = (
-            db.query(Tenant)
-            .options(
-                joinedload(Tenant.space).joinedload(Space.site),
-                joinedload(Tenant.space).joinedload(Space.building),
-                joinedload(Tenant.leases)
-                .joinedload(Lease.space)
-                .joinedload(Space.site),
-                joinedload(Tenant.leases)
-                .joinedload(Lease.space)
-                .joinedload(Space.building),
-            )
-            .filter(Tenant.user_id == user.user_id)
-            .first()
-        )
+def _unique_by(rows, key: str):
+    seen = set()
+    for row in rows:
+        if row[key] is not None and row[key] not in seen:
+            seen.add(row[key])
+            yield row
+
 
-        if not tenant:
-            return {"spaces": []}
-
-        seen_space_ids = set()
-
-        #  Registered space
-        if tenant.space:
-            results.append({
-                "space_id": tenant.space.id,
-                "space_name": tenant.space.name,
-                "site_id": tenant.space.site_id,
-                "building_name": tenant.space.building.name if tenant.space.building else None,
-                "is_primary": True
-            })
-            seen_space_ids.add(tenant.space.id)
-
-        #  Leased spaces
-        for lease in tenant.leases:
-            space = lease.space
-            if space and space.id not in seen_space_ids:
-                results.append({
-                    "space_id": space.id,
-                    "space_name": space.name,
-                    "site_id": space.site_id,
-                    "building_name": space.building.name if space.building else None,
-                    "is_primary": False
-                })
-                seen_space_ids.add(space.id)
-
-    else:
-        # Non-tenant logic stays same (org/admin)
-        spaces = db.query(Space).all()
-        results = [
+def get_allowed_sites(db: Session, user: UserToken):
+    if _scoped_space_sources(user) is not None:
+        return [
+            {"site_id": s["site_id"], "site_name": s["site_name"], "is_primary": s["is_primary"]}
+            for s in _unique_by(_user_spaces(db, user), "site_id")
+        ]
+
+    sites = (
+        db.query(Site.id, Site.name)
+        .filter(Site.org_id == user.org_id)
+        .all()
+    )
+    return [
+        {"site_id": s.id, "site_name": s.name, "is_primary": True}
+        for s in sites
+    ]
+
+
+def get_allowed_spaces(db: Session, user: UserToken):
+    if _scoped_space_sources(user) is not None:
+        return [
             {
-                "space_id": s.id,
-                "space_name": s.name,
-                "site_id": s.site_id,
-                "is_primary": True
+                "space_id": s["id"],
+                "space_name": s["name"],
+                "site_id": s["site_id"],
+                "building_name": s["building_name"],
+                "is_primary": s["is_primary"]
             }
-            for s in spaces
+            for s in _user_spaces(db, user)
         ]
 
-    return results
+    spaces = (
+        db.query(Space.id, Space.name, Space.site_id)
+        .filter(Space.org_id == user.org_id, Space.is_deleted == False)
+        .all()
+    )
+    return [
+        {
+            "space_id": s.id,
+            "space_name": s.name,
+            "site_id": s.site_id,
+            "is_primary": True
+        }
+        for s in spaces
+    ]
 
 
 def get_allowed_buildings(db: Session, user: UserToken):
-    results = []
-    account_type = user.account_type.lower()
-
-    if account_type == UserAccountType.TENANT:
-        tenant = (
-            db.query(Tenant)
-            .options(
-                joinedload(Tenant.space).joinedload(Space.building),
-                joinedload(Tenant.leases)
-                .joinedload(Lease.space)
-                .joinedload(Space.building),
-            )
-            .filter(Tenant.user_id == user.user_id)
-            .first()
-        )
-
-        if not tenant:
-            return {"buildings": []}
-
-        seen_building_ids = set()
-
-        #  Registered space building
-        if tenant.space and tenant.space.building:
-            building = tenant.space.building
-            results.append({
-                "building_id": building.id,
-                "building_name": building.name,
-                "is_primary": True
-            })
-            seen_building_ids.add(building.id)
-
-        # Leased space buildings
-        for lease in tenant.leases:
-            space = lease.space
-            if space and space.building and space.building.id not in seen_building_ids:
-                results.append({
-                    "building_id": space.building.id,
-                    "building_name": space.building.name,
-                    "is_primary": False
-                })
-                seen_building_ids.add(space.building.id)
-
-    else:
-        buildings = db.query(Building).all()
-        results = [
+    if _scoped_space_sources(user) is not None:
+        return [
             {
-                "building_id": b.id,
-                "building_name": b.name,
-                "is_primary": True
+                "building_id": s["building_block_id"],
+                "building_name": s["building_name"],
+                "is_primary": s["is_primary"]
             }
-            for b in buildings
+            for s in _unique_by(_user_spaces(db, user), "building_block_id")
         ]
 
-    return results
+    buildings = (
+        db.query(Building.id, Building.name)
+        .join(Site, Site.id == Building.site_id)
+        .filter(Site.org_id == user.org_id, Building.is_deleted == False)
+        .all()
+    )
+    return [
+        {
+            "building_id": b.id,
+            "building_name": b.name,
+            "is_primary": True
+        }
+        for b in buildings
+    ]
@@ -0,0 +1,206 @@
+import functools
+import hashlib
+import inspect
+import json
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+from cachetools import TTLCache
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from shared.core.config import settings
+
+PENDING_INVALIDATIONS = "reference_cache_pending"
+GLOBAL_SCOPE = "*"
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    value: Any
+    etag: str
+
+
+def _json_default(value: Any):
+    if hasattr(value, "_mapping"):  # SQLAlchemy Row
+        return dict(value._mapping)
+    if hasattr(value, "model_dump"):  # pydantic model
+        return value.model_dump()
+    return str(value)
+
+
+def compute_etag(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, default=_json_default)
+    return f'W/"{hashlib.sha1(payload.encode("utf-8")).hexdigest()}"'
+
+
+class ReferenceDataCache:
+    """
+    Per-org cache for slowly changing reference data (lookups, settings).
+
+    Keys carry a per (namespace, org) version; invalidation only bumps the
+    version so stale entries become unreachable and age out through the
+    TTL / LRU bounds of the underlying TTLCache.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._versions: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._lock = threading.RLock()
+        self._stats = defaultdict(lambda: {
+            "hits": 0, "misses": 0, "invalidations": 0
+        })
+
+    def _key(self, namespace: str, org_id, args_key: tuple):
+        org = str(org_id) if org_id else GLOBAL_SCOPE
+        return (
+            namespace,
+            org,
+            self._versions[(namespace, GLOBAL_SCOPE)],
+            self._versions[(namespace, org)],
+            args_key,
+        )
+
+    def get_or_load(self, namespace: str, org_id, args_key: tuple, loader: Callable[[], Any]) -> CacheEntry:
+        with self._lock:
+            key = self._key(namespace, org_id, args_key)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._stats[namespace]["hits"] += 1
+                return entry
+            self._stats[namespace]["misses"] += 1
+
+        # Load outside the lock; a concurrent miss just loads twice
+        value = loader()
+        entry = CacheEntry(value=value, etag=compute_etag(value))
+
+        with self._lock:
+            # Skip the store if an invalidation raced with the load
+            if key == self._key(namespace, org_id, args_key):
+                self._entries[key] = entry
+        return entry
+
+    def invalidate(self, namespace: str, org_id=None):
+        org = str(org_id) if org_id else GLOBAL_SCOPE
+        with self._lock:
+            self._versions[(namespace, org)] += 1
+            self._stats[namespace]["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._stats.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            namespaces = {}
+            total_hits = total_misses = 0
+            for namespace, counters in self._stats.items():
+                lookups = counters["hits"] + counters["misses"]
+                namespaces[namespace] = {
+                    **counters,
+                    "hit_rate": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+                }
+                total_hits += counters["hits"]
+                total_misses += counters["misses"]
+
+            total = total_hits + total_misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._entries.maxsize,
+                "ttl_seconds": self._entries.ttl,
+                "hits": total_hits,
+                "misses": total_misses,
+                "hit_rate": round(total_hits / total, 4) if total else 0.0,
+                "namespaces": namespaces,
+            }
+
+
+reference_cache = ReferenceDataCache(
+    maxsize=settings.REFERENCE_CACHE_MAX_ENTRIES,
+    ttl=settings.REFERENCE_CACHE_TTL_SECONDS,
+)
+
+
+def cached_reference(namespace: str):
+    """
+    Cache a `(db, org_id, ...)` lookup per org. Every argument other than
+    the session takes part in the key. The wrapped function keeps its
+    signature; `.entry(...)` returns the CacheEntry (value + ETag) instead.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def load_entry(*args, **kwargs) -> CacheEntry:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop("db", None)
+            org_id = arguments.pop("org_id", None)
+            args_key = (func.__module__, func.__qualname__) + tuple(
+                (name, str(value)) for name, value in sorted(arguments.items())
+            )
+
+            def loader():
+                value = func(*args, **kwargs)
+                # Materialize query results so nothing lazy is cached
+                return list(value) if isinstance(value, (list, tuple)) else value
+
+            return reference_cache.get_or_load(namespace, org_id, args_key, loader)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return load_entry(*args, **kwargs).value
+
+        wrapper.entry = load_entry
+        return wrapper
+
+    return decorator
+
+
+def invalidate_on_change(model, *namespaces: str, org_attr: str = "org_id"):
+    """
+    Invalidate the given namespaces for the row's org whenever a `model`
+    row is inserted, updated or deleted. The bump happens once the session
+    commits, so a concurrent reader cannot re-cache pre-commit data.
+    """
+    def record_change(mapper, connection, target):
+        org_id = getattr(target, org_attr, None)
+        session = object_session(target)
+        if session is None:
+            for namespace in namespaces:
+                reference_cache.invalidate(namespace, org_id)
+            return
+
+        pending = session.info.setdefault(PENDING_INVALIDATIONS, set())
+        for namespace in namespaces:
+            pending.add((namespace, str(org_id) if org_id else None))
+
+    for event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, event_name, record_change)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _apply_pending_invalidations(session):
+    # Rolled back changes are invalidated too; that only costs a reload
+    for namespace, org_id in session.info.pop(PENDING_INVALIDATIONS, ()):
+        reference_cache.invalidate(namespace, org_id)
+
+
+def etag_response(request: Request, response: Response, entry: CacheEntry):
+    """
+    Return 304 when the client's If-None-Match still matches; otherwise
+    tag the outgoing response and hand back the value for response_model.
+    """
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+
+    if entry.etag and entry.etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return entry.value
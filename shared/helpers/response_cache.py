@@ -0,0 +1,215 @@
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from cachetools import LRUCache
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from shared.core.config import settings
+from shared.core.schemas import UserToken
+from shared.helpers.reference_cache import compute_etag
+from shared.utils.enums import UserAccountType
+
+try:
+    import redis
+except ImportError:  # redis is optional, the in-process cache is the default
+    redis = None
+
+# Account types whose responses depend on their own spaces, not just the org
+USER_SCOPED_ACCOUNT_TYPES = {
+    UserAccountType.TENANT.value,
+    UserAccountType.FLAT_OWNER.value,
+}
+
+SINGLE_FLIGHT_WAIT_SECONDS = 60
+
+
+class MemoryResponseBackend:
+    """In-process LRU store; also the stand-in used when Redis is absent."""
+
+    def __init__(self, maxsize: int):
+        self._entries = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._entries.get(key)
+        if record and record["stale_until"] <= time.time():
+            return None
+        return record
+
+    def set(self, key: str, record: Dict[str, Any], ttl: int):
+        with self._lock:
+            self._entries[key] = record
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisResponseBackend:
+    """Shared store so every worker process serves the same computed response."""
+
+    def __init__(self, url: str):
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            payload = self._client.get(key)
+        except redis.RedisError as e:
+            print(f"Response cache read failed: {e}")
+            return None
+        return json.loads(payload) if payload else None
+
+    def set(self, key: str, record: Dict[str, Any], ttl: int):
+        try:
+            self._client.set(key, json.dumps(record), ex=max(ttl, 1))
+        except redis.RedisError as e:
+            print(f"Response cache write failed: {e}")
+
+    def clear(self):
+        for key in self._client.scan_iter("resp:*"):
+            self._client.delete(key)
+
+
+def build_backend():
+    if settings.RESPONSE_CACHE_BACKEND.lower() == "redis":
+        if redis is not None and settings.RESPONSE_CACHE_REDIS_URL:
+            return RedisResponseBackend(settings.RESPONSE_CACHE_REDIS_URL)
+        print("Redis response cache unavailable, using in-process cache")
+    return MemoryResponseBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.record = None
+        self.error = None
+
+
+class ResponseCache:
+    """
+    Stores computed responses with a fresh and a stale window and makes
+    sure only one request per process computes a given key at a time.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._inflight: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def _join_flight(self, key: str):
+        with self._lock:
+            flight = self._inflight.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._inflight[key] = _Flight()
+            return flight, True
+
+    def _lead_flight(self, key: str, flight: _Flight, compute: Callable[[], Dict[str, Any]]):
+        try:
+            flight.record = compute()
+            return flight.record
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def load(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        now = time.time()
+        record = self.backend.get(key)
+
+        if record and now < record["fresh_until"]:
+            return record
+
+        flight, leader = self._join_flight(key)
+
+        if record:
+            # Stale: one request refreshes, the others keep serving the old copy
+            return self._lead_flight(key, flight, compute) if leader else record
+
+        if leader:
+            return self._lead_flight(key, flight, compute)
+
+        flight.done.wait(SINGLE_FLIGHT_WAIT_SECONDS)
+        if flight.error is not None:
+            raise flight.error
+        return flight.record or compute()
+
+
+response_cache = ResponseCache(build_backend())
+
+
+def _cache_key(request: Request, user: Optional[UserToken], per_user: bool) -> str:
+    org = str(user.org_id) if user and user.org_id else "-"
+    scope = "org"
+    if user and (per_user or user.account_type.lower() in USER_SCOPED_ACCOUNT_TYPES):
+        scope = f"user:{user.user_id}"
+
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(query.encode("utf-8")).hexdigest()
+    return f"resp:{request.url.path}:{org}:{scope}:{digest}"
+
+
+def cached_response(max_age: int = 30, stale_while_revalidate: int = 120, per_user: bool = False):
+    """
+    Cache a sync GET route per route, org, query string and user scope.
+
+    Responses carry a weak ETag plus `Cache-Control: max-age / stale-while-
+    revalidate`; If-None-Match hits answer 304. Within the stale window one
+    request recomputes while concurrent ones get the previous copy, and
+    concurrent misses on the same key share a single computation.
+    Place it below the `@router.get(...)` decorator.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, _cache_request: Request, _cache_response: Response, **kwargs):
+            kwargs.update(zip(signature.parameters, args))
+            user = next(
+                (v for v in kwargs.values() if isinstance(v, UserToken)), None)
+            key = _cache_key(_cache_request, user, per_user)
+
+            def compute():
+                value = jsonable_encoder(func(**kwargs))
+                now = time.time()
+                record = {
+                    "value": value,
+                    "etag": compute_etag(value),
+                    "fresh_until": now + max_age,
+                    "stale_until": now + max_age + stale_while_revalidate,
+                }
+                response_cache.backend.set(
+                    key, record, max_age + stale_while_revalidate)
+                return record
+
+            record = response_cache.load(key, compute)
+
+            remaining = max(int(record["fresh_until"] - time.time()), 0)
+            headers = {
+                "ETag": record["etag"],
+                "Cache-Control": f"private, max-age={remaining}, stale-while-revalidate={stale_while_revalidate}",
+            }
+            if record["etag"] in _cache_request.headers.get("if-none-match", ""):
+                return Response(status_code=304, headers=headers)
+
+            _cache_response.headers.update(headers)
+            return record["value"]
+
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("_cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter("_cache_response", inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ])
+        return wrapper
+
+    return decorator
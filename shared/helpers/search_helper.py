@@ -0,0 +1,77 @@
+from typing import Optional
+
+from sqlalchemy import Index, func, or_
+
+LIKE_ESCAPE = "\\"
+
+
+def normalize_search(term: Optional[str]) -> Optional[str]:
+    if term is None:
+        return None
+    term = term.strip()
+    return term or None
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """GIN trigram index that serves `ILIKE '%term%'` and similarity() lookups."""
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"}
+    )
+
+
+def search_filter(term: Optional[str], *columns):
+    """
+    Substring match over the given columns.
+
+    Emits plain `col ILIKE '%term%'` on the raw column (no lower()/cast
+    wrappers) so the planner can use the trigram index on each column and
+    BitmapOr them, instead of falling back to a sequential scan.
+    Returns None when there is nothing to search for.
+    """
+    term = normalize_search(term)
+    if not term:
+        return None
+
+    pattern = f"%{escape_like(term)}%"
+    return or_(*[
+        column.ilike(pattern, escape=LIKE_ESCAPE)
+        for column in columns
+    ])
+
+
+def search_rank(term: str, *columns):
+    """Trigram similarity of the best matching column, for ORDER BY ... DESC."""
+    term = normalize_search(term) or ""
+    scores = [func.similarity(column, term) for column in columns]
+    if len(scores) == 1:
+        return func.coalesce(scores[0], 0)
+    # greatest() ignores NULL columns in Postgres
+    return func.coalesce(func.greatest(*scores), 0)
+
+
+def apply_search(query, term: Optional[str], *columns, ranked: bool = False):
+    """
+    Filter a query by search term; optionally order the matches by relevance.
+    With ranked=True call this before any other order_by() so those act as
+    tie-breakers.
+    """
+    condition = search_filter(term, *columns)
+    if condition is None:
+        return query
+
+    query = query.filter(condition)
+    if ranked:
+        query = query.order_by(search_rank(term, *columns).desc())
+    return query
@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Optional
+
+from cachetools import TTLCache
+from fastapi import Request, status
+
+from shared.core.config import settings
+from shared.helpers.json_response_helper import error_response
+from shared.utils.app_status_code import AppStatusCode
+
+
+class TokenBucketLimiter:
+    """
+    In-process token buckets keyed by any string (IP, username, ...).
+
+    Each key refills at `rate_per_minute` up to `burst` tokens. Idle keys
+    fall out of the bounded TTL cache, which is the same as a full bucket.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None, max_keys: int = 100_000):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(burst if burst is not None else max(rate_per_minute, 1))
+        idle_ttl = self.capacity / self.rate if self.rate else 3600
+        self._buckets = TTLCache(maxsize=max_keys, ttl=max(idle_ttl, 1))
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, tokens: float = 1.0) -> float:
+        """Take tokens; returns 0 when allowed, else seconds until they are available."""
+        now = time.monotonic()
+        with self._lock:
+            available, updated = self._buckets.get(key, (self.capacity, now))
+            available = min(self.capacity, available + (now - updated) * self.rate)
+            if available >= tokens:
+                self._buckets[key] = (available - tokens, now)
+                return 0.0
+            self._buckets[key] = (available, now)
+        return (tokens - available) / self.rate if self.rate else 60.0
+
+
+def client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+class LoginThrottle:
+    """Per-IP and per-identity (username / email / mobile) limits for sign-in."""
+
+    def __init__(self, per_ip_per_minute: int, per_identity_per_minute: int):
+        self.by_ip = TokenBucketLimiter(per_ip_per_minute)
+        self.by_identity = TokenBucketLimiter(per_identity_per_minute)
+
+    def check(self, request: Request, identity: Optional[str]):
+        wait = self.by_ip.acquire(client_ip(request))
+        if not wait and identity:
+            wait = self.by_identity.acquire(identity.strip().lower())
+        if wait:
+            error_response(
+                message=f"Too many attempts. Try again in {int(wait) + 1} seconds",
+                status_code=str(AppStatusCode.OPERATION_FAILED),
+                http_status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
+
+login_throttle = LoginThrottle(
+    per_ip_per_minute=settings.LOGIN_RATE_PER_IP_PER_MINUTE,
+    per_identity_per_minute=settings.LOGIN_RATE_PER_IDENTITY_PER_MINUTE,
+)
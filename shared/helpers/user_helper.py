@@ -34,3 +34,20 @@ def get_users_bulk(user_ids):
         return {u.id: u for u in users}
     finally:
         auth_db.close()
+
+
+def get_user_names(user_ids):
+    """Full names for many users with one auth query: {user_id: full_name}."""
+    user_ids = {user_id for user_id in user_ids if user_id}
+    if not user_ids:
+        return {}
+    auth_db = AuthSessionLocal()
+    try:
+        rows = (
+            auth_db.query(Users.id, Users.full_name)
+            .filter(Users.id.in_(user_ids))
+            .all()
+        )
+        return {r.id: r.full_name for r in rows}
+    finally:
+        auth_db.close()
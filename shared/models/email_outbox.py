@@ -0,0 +1,42 @@
+import uuid
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+
+from shared.core.database import Base
+from shared.utils.enums import EmailOutboxStatus
+
+
+class EmailOutbox(Base):
+    """
+    Emails written in the same transaction as the business change and
+    delivered afterwards by the email outbox worker.
+    """
+    __tablename__ = "email_outbox"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    template_code = Column(String(100), nullable=False)
+    recipients = Column(ARRAY(String), nullable=False)
+    # All recipients of a row share one domain, for per-domain rate limits
+    recipient_domain = Column(String(255), nullable=False)
+    subject = Column(String(500), nullable=False)
+    context = Column(JSONB, nullable=False, default=dict)
+    attachments = Column(ARRAY(String))
+
+    status = Column(String(16), nullable=False,
+                    default=EmailOutboxStatus.pending.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True),
+                             nullable=False, server_default=func.now())
+    locked_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+
+    created_at = Column(DateTime(timezone=True),
+                        nullable=False, server_default=func.now())
+    sent_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        # Only undelivered rows are scanned by the worker
+        Index("ix_email_outbox_due", "next_attempt_at",
+              postgresql_where=text("status IN ('pending', 'sending')")),
+        Index("ix_email_outbox_status_created", "status", "created_at"),
+    )
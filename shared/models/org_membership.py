@@ -0,0 +1,42 @@
+from sqlalchemy import Boolean, Column, DateTime, Index, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import expression
+
+from shared.core.database import Base
+
+
+class OrgMembership(Base):
+    """
+    Read-only copy of auth `user_organizations` joined with the user's
+    display fields, so facility queries can join on membership instead of
+    shipping id lists between the two databases. Written only by the
+    org membership sync worker; never update it from request code.
+    """
+    __tablename__ = "org_membership"
+
+    # Same id as user_organizations.id
+    user_org_id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    org_id = Column(UUID(as_uuid=True))
+    account_type = Column(String(32), nullable=False)
+    status = Column(String(16), nullable=False)
+    is_default = Column(Boolean, nullable=False, default=False)
+    is_deleted = Column(Boolean, nullable=False, default=False)
+
+    full_name = Column(String(200))
+    email = Column(String(200))
+    phone = Column(String(20))
+    user_status = Column(String(16))
+    user_is_deleted = Column(Boolean, nullable=False, default=False)
+
+    synced_at = Column(DateTime(timezone=True), nullable=False,
+                       server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_org_membership_org_type",
+            "org_id", "account_type", "user_id",
+            postgresql_where=expression.false() == is_deleted,
+        ),
+        Index("ix_org_membership_user", "user_id"),
+    )
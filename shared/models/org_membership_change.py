@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger, Column, DateTime, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from shared.core.database import AuthBase
+
+
+class OrgMembershipChange(AuthBase):
+    """
+    Change log written by triggers on `user_organizations` and `users`;
+    one row per touched user, consumed by the org membership sync worker.
+    """
+    __tablename__ = "org_membership_changes"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    changed_at = Column(DateTime(timezone=True), nullable=False,
+                        server_default=func.now())
@@ -2,6 +2,7 @@ import uuid
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import TIMESTAMP, Boolean, Column, Index, Integer, MetaData, String, Table, Text, func, text
 from ..core.database import AuthBase
+from ..helpers.search_helper import trigram_index
 from sqlalchemy.orm import relationship
 
 
@@ -21,6 +22,9 @@ class Users(AuthBase):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     full_name = Column(String(200), nullable=False)
 
+    username = Column(String(100), nullable=True)
+    # bcrypt hash; hashed / verified through shared.helpers.password_hasher
+    password_hash = Column(String(255), nullable=True)
     email = Column(String(200), nullable=True)
     phone = Column(String(20), nullable=True)
     picture_url = Column(Text, nullable=True)
@@ -50,13 +54,23 @@ class Users(AuthBase):
             unique=True,
             postgresql_where=(is_deleted == False)
         ),
+        Index(
+            "uq_users_username_active",
+            "username",
+            unique=True,
+            postgresql_where=(is_deleted == False)
+        ),
         Index(
             "uq_single_super_admin",
             "is_super_admin",
             unique=True,
             postgresql_where=(is_super_admin == True)
-        )
+        ),
 
+        # Trigram indexes for user search / type-ahead
+        trigram_index("ix_users_full_name_trgm", "full_name"),
+        trigram_index("ix_users_email_trgm", "email"),
+        trigram_index("ix_users_phone_trgm", "phone"),
     )
 
 
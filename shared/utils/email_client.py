@@ -1,5 +1,6 @@
 import smtplib
 import logging
+import threading
 import time
 import os
 from typing import List, Optional
@@ -36,17 +37,26 @@ class EmailClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
+    def _open(self) -> smtplib.SMTP:
+        """Open and authenticate an SMTP session."""
+        if self.use_ssl:
+            server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port)
+        else:
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+            server.ehlo()
+            if server.has_extn("starttls"):
+                server.starttls()
+                server.ehlo()
+        if self.username:
+            server.login(self.username, self.password)
+        return server
+
     @contextmanager
     def _connection(self):
         """Context-managed SMTP connection."""
         server = None
         try:
-            if self.use_ssl:
-                server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port)
-            else:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-                server.starttls()
-            server.login(self.username, self.password)
+            server = self._open()
             yield server
         finally:
             if server:
@@ -125,3 +135,61 @@ class EmailClient:
 
         logging.error("❌ Failed to send email after all retry attempts.")
         return False
+
+
+class PooledEmailClient(EmailClient):
+    """
+    Keeps one authenticated SMTP session per thread open across messages,
+    so a worker thread pays connect + STARTTLS + login once, not per email.
+    Retries are left to the caller.
+    """
+
+    def __init__(self, *args, max_messages_per_session: int = 100, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_messages_per_session = max_messages_per_session
+        self._local = threading.local()
+        self._sessions = set()
+        self._lock = threading.Lock()
+
+    def _session(self) -> smtplib.SMTP:
+        server = getattr(self._local, "server", None)
+        if server is not None and self._local.sent >= self.max_messages_per_session:
+            self._reset()
+            server = None
+        if server is None:
+            server = self._local.server = self._open()
+            self._local.sent = 0
+            with self._lock:
+                self._sessions.add(server)
+        return server
+
+    @staticmethod
+    def _quit(server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _reset(self):
+        server = getattr(self._local, "server", None)
+        self._local.server = None
+        if server is not None:
+            with self._lock:
+                self._sessions.discard(server)
+            self._quit(server)
+
+    def deliver(self, sender: str, recipients: List[str], msg: MIMEMultipart):
+        """Send over the thread's session, reconnecting once if it went stale."""
+        try:
+            self._session().sendmail(sender, recipients, msg.as_string())
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            self._reset()
+            self._session().sendmail(sender, recipients, msg.as_string())
+        self._local.sent += 1
+
+    def close(self):
+        """Quit every open session; call once the sending threads are done."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, set()
+        for server in sessions:
+            self._quit(server)
@@ -21,3 +21,17 @@ class OwnershipStatus(Enum):
     # - ADDITIONAL FOR TENANT
     leased = "leased"
     ended = "ended"
+
+
+class EmailOutboxStatus(str, Enum):
+    pending = "pending"
+    sending = "sending"
+    sent = "sent"
+    dead = "dead"
+
+
+class ImportJobStatus(str, Enum):
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
@@ -0,0 +1,349 @@
+"""
+Email outbox delivery worker.
+
+Drains `email_outbox` in batches over pooled SMTP sessions, with per-domain
+rate limits, exponential backoff and dead-lettering. Template context can
+hold OTPs and passwords, so it is cleared once a row is sent; dead rows
+keep it so they can be retried. Finished rows are purged after
+EMAIL_OUTBOX_RETENTION_DAYS. Run it as its own process:
+
+    python -m shared.workers.email_outbox_worker
+"""
+import logging
+import random
+import signal
+import smtplib
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.orm import Session
+
+from shared.core.config import settings
+from shared.core.database import FacilitySessionLocal
+from shared.helpers.email_helper import EmailHelper
+from shared.models.email_outbox import EmailOutbox
+from shared.utils.email_client import PooledEmailClient
+from shared.utils.enums import EmailOutboxStatus
+
+logger = logging.getLogger(__name__)
+
+# A row left in "sending" this long belongs to a worker that died
+STALE_LOCK = timedelta(minutes=10)
+METRICS_LOG_SECONDS = 60
+PURGE_INTERVAL_SECONDS = 3600
+PURGE_BATCH_SIZE = 5000
+FINISHED_STATUSES = [EmailOutboxStatus.sent.value, EmailOutboxStatus.dead.value]
+
+
+class PermanentDeliveryError(Exception):
+    """Retrying will not help (bad template, rejected recipients)."""
+
+
+class DomainRateLimiter:
+    """Token bucket per recipient domain."""
+
+    def __init__(self, per_minute: int):
+        self.rate = per_minute / 60.0
+        self.capacity = max(per_minute, 1)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def acquire(self, domain: str) -> float:
+        """Take a token; returns 0 on success, else seconds until one is free."""
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(domain, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+        if tokens >= 1:
+            self._buckets[domain] = (tokens - 1, now)
+            return 0.0
+        self._buckets[domain] = (tokens, now)
+        return (1 - tokens) / self.rate if self.rate else 60.0
+
+
+class DeliveryMetrics:
+    """Throughput and latency counters, logged periodically by the worker."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.sent = 0
+        self.retried = 0
+        self.dead = 0
+        self.throttled = 0
+        self.send_ms = deque(maxlen=1000)
+        self.queue_lag_s = deque(maxlen=1000)
+        self._lock = threading.Lock()
+
+    def record_sent(self, send_ms: float, created_at: Optional[datetime]):
+        with self._lock:
+            self.sent += 1
+            self.send_ms.append(send_ms)
+            if created_at:
+                self.queue_lag_s.append(
+                    (datetime.now(timezone.utc) - created_at).total_seconds())
+
+    def record(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @staticmethod
+    def _percentile(values, pct: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))], 2)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            elapsed = max(time.monotonic() - self.started, 1e-6)
+            return {
+                "sent": self.sent,
+                "retried": self.retried,
+                "dead": self.dead,
+                "throttled": self.throttled,
+                "sent_per_second": round(self.sent / elapsed, 3),
+                "send_ms_p50": self._percentile(self.send_ms, 0.50),
+                "send_ms_p95": self._percentile(self.send_ms, 0.95),
+                "queue_lag_s_p95": self._percentile(self.queue_lag_s, 0.95),
+            }
+
+
+class EmailOutboxWorker:
+
+    def __init__(
+        self,
+        session_factory=FacilitySessionLocal,
+        mailer: Optional[PooledEmailClient] = None,
+        batch_size: int = settings.EMAIL_WORKER_BATCH_SIZE,
+        concurrency: int = settings.EMAIL_WORKER_CONCURRENCY,
+        max_attempts: int = settings.EMAIL_MAX_ATTEMPTS,
+        retry_base_seconds: int = settings.EMAIL_RETRY_BASE_SECONDS,
+        domain_rate_per_minute: int = settings.EMAIL_DOMAIN_RATE_PER_MINUTE,
+    ):
+        self.session_factory = session_factory
+        self.mailer = mailer or PooledEmailClient(
+            smtp_host=settings.SMTP_HOST,
+            smtp_port=settings.SMTP_PORT,
+            username=settings.SMTP_USERNAME,
+            password=settings.SMTP_PASSWORD,
+            use_ssl=settings.SMTP_USE_SSL,
+        )
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.rate_limiter = DomainRateLimiter(domain_rate_per_minute)
+        self.email_helper = EmailHelper()
+        self.metrics = DeliveryMetrics()
+        self.executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="email-outbox")
+        self.stop_event = threading.Event()
+
+    # ------------------------------------------------------------------
+    # CLAIM
+    # ------------------------------------------------------------------
+    def _claim_batch(self, db: Session) -> List[EmailOutbox]:
+        now = datetime.now(timezone.utc)
+        rows = db.execute(
+            select(EmailOutbox)
+            .where(or_(
+                and_(EmailOutbox.status == EmailOutboxStatus.pending.value,
+                     EmailOutbox.next_attempt_at <= now),
+                and_(EmailOutbox.status == EmailOutboxStatus.sending.value,
+                     EmailOutbox.locked_at < now - STALE_LOCK),
+            ))
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        ).scalars().all()
+
+        for row in rows:
+            row.status = EmailOutboxStatus.sending.value
+            row.locked_at = now
+        db.commit()
+        return rows
+
+    # ------------------------------------------------------------------
+    # DELIVER
+    # ------------------------------------------------------------------
+    def _send(self, recipients, subject, html_body, text_body, attachments):
+        msg = self.mailer._build_message(
+            settings.EMAIL_SENDER, recipients, subject, text_body, html_body, attachments)
+        started = time.perf_counter()
+        try:
+            self.mailer.deliver(settings.EMAIL_SENDER, recipients, msg)
+        except smtplib.SMTPRecipientsRefused as e:
+            raise PermanentDeliveryError(str(e.recipients)) from e
+        except smtplib.SMTPResponseException as e:
+            if 500 <= e.smtp_code < 600 and not isinstance(e, smtplib.SMTPAuthenticationError):
+                raise PermanentDeliveryError(f"{e.smtp_code} {e.smtp_error!r}") from e
+            raise
+        return (time.perf_counter() - started) * 1000
+
+    def _backoff(self, attempts: int) -> timedelta:
+        delay = self.retry_base_seconds * (2 ** (attempts - 1))
+        return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+    def run_once(self) -> int:
+        """Claim and deliver one batch; returns the number of rows claimed."""
+        # Claimed rows stay loaded across the claim commit
+        db = self.session_factory(expire_on_commit=False)
+        try:
+            rows = self._claim_batch(db)
+            if not rows:
+                return 0
+
+            now = datetime.now(timezone.utc)
+            by_template = defaultdict(list)
+            for row in rows:
+                wait = self.rate_limiter.acquire(row.recipient_domain)
+                if wait:
+                    # Over the domain's budget: put it back without an attempt
+                    self.metrics.record("throttled")
+                    row.status = EmailOutboxStatus.pending.value
+                    row.next_attempt_at = now + timedelta(seconds=wait)
+                    continue
+                by_template[row.template_code].append(row)
+
+            futures = {}
+            for template_code, template_rows in by_template.items():
+                for row, (html_body, text_body) in self._render(db, template_code, template_rows):
+                    futures[row] = self.executor.submit(
+                        self._send, list(row.recipients), row.subject,
+                        html_body, text_body, row.attachments)
+
+            for row, future in futures.items():
+                row.attempts += 1
+                try:
+                    send_ms = future.result()
+                except PermanentDeliveryError as e:
+                    self._dead_letter(row, str(e))
+                except Exception as e:
+                    self._retry_later(row, f"{type(e).__name__}: {e}")
+                else:
+                    row.status = EmailOutboxStatus.sent.value
+                    row.sent_at = datetime.now(timezone.utc)
+                    row.last_error = None
+                    row.context = {}
+                    self.metrics.record_sent(send_ms, row.created_at)
+
+            db.commit()
+            return len(rows)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _render(self, db: Session, template_code: str, rows: List[EmailOutbox]):
+        """
+        Render a batch's rows of one template together; if that fails,
+        render them one by one so only the bad rows are dead-lettered.
+        """
+        contexts = [row.context or {} for row in rows]
+        try:
+            return list(zip(rows, self.email_helper.render_many(db, template_code, contexts)))
+        except Exception:
+            pass
+
+        rendered = []
+        for row, context in zip(rows, contexts):
+            try:
+                rendered.append((row, self.email_helper.render(db, template_code, context)))
+            except Exception as e:
+                self._dead_letter(row, f"Template render failed: {e}")
+        return rendered
+
+    def _retry_later(self, row: EmailOutbox, error: str):
+        row.last_error = error
+        if row.attempts >= self.max_attempts:
+            self._dead_letter(row, error)
+            return
+        self.metrics.record("retried")
+        row.status = EmailOutboxStatus.pending.value
+        row.next_attempt_at = datetime.now(
+            timezone.utc) + self._backoff(row.attempts)
+
+    def _dead_letter(self, row: EmailOutbox, error: str):
+        logger.error(f"Email {row.id} dead-lettered: {error}")
+        self.metrics.record("dead")
+        row.status = EmailOutboxStatus.dead.value
+        row.last_error = error
+
+    def purge_finished(self) -> int:
+        """
+        Delete sent and dead rows past EMAIL_OUTBOX_RETENTION_DAYS, one
+        batch per transaction, and clear any context still left on sent
+        rows. Returns the number of rows deleted.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(
+            days=settings.EMAIL_OUTBOX_RETENTION_DAYS)
+        purged = 0
+        with self.session_factory() as db:
+            db.query(EmailOutbox).filter(
+                EmailOutbox.status == EmailOutboxStatus.sent.value,
+                EmailOutbox.context != {},
+            ).update({EmailOutbox.context: {}}, synchronize_session=False)
+            db.commit()
+
+            while True:
+                expired = select(EmailOutbox.id).where(
+                    EmailOutbox.status.in_(FINISHED_STATUSES),
+                    EmailOutbox.created_at < cutoff,
+                ).limit(PURGE_BATCH_SIZE)
+                deleted = db.execute(
+                    delete(EmailOutbox).where(EmailOutbox.id.in_(expired))
+                ).rowcount
+                db.commit()
+                purged += deleted
+                if deleted < PURGE_BATCH_SIZE:
+                    break
+        return purged
+
+    # ------------------------------------------------------------------
+    # LOOP
+    # ------------------------------------------------------------------
+    def run_forever(self):
+        logger.info("Email outbox worker started")
+        last_report = time.monotonic()
+        last_purge = None
+        try:
+            while not self.stop_event.is_set():
+                if last_purge is None or time.monotonic() - last_purge >= PURGE_INTERVAL_SECONDS:
+                    try:
+                        purged = self.purge_finished()
+                        if purged:
+                            logger.info(f"Email outbox purged {purged} finished rows")
+                    except Exception:
+                        logger.exception("Email outbox purge failed")
+                    last_purge = time.monotonic()
+
+                try:
+                    claimed = self.run_once()
+                except Exception:
+                    logger.exception("Email outbox batch failed")
+                    claimed = 0
+
+                if time.monotonic() - last_report >= METRICS_LOG_SECONDS:
+                    logger.info(f"Email outbox metrics: {self.metrics.snapshot()}")
+                    last_report = time.monotonic()
+
+                # A full batch means there is likely more waiting
+                if claimed < self.batch_size:
+                    self.stop_event.wait(settings.EMAIL_WORKER_POLL_SECONDS)
+        finally:
+            self.executor.shutdown(wait=True)
+            self.mailer.close()
+            logger.info(f"Email outbox worker stopped: {self.metrics.snapshot()}")
+
+    def stop(self, *_):
+        self.stop_event.set()
+
+
+if __name__ == "__main__":
+    worker = EmailOutboxWorker()
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run_forever()
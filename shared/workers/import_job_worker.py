@@ -0,0 +1,187 @@
+"""
+Background import job worker.
+
+Claims pending `import_jobs`, streams the stored CSV / XLSX row by row and
+applies it in chunks through the same set-based bulk functions as the
+/bulk-upload endpoints. Each chunk's data, progress and per-row errors
+are committed in one transaction and published on the notification
+channel, so clients can poll the job or follow its stream. A job interrupted by a crash is picked
+up again after STALE_LOCK and resumes after its last committed chunk.
+Run it as its own process:
+
+    python -m shared.workers.import_job_worker
+"""
+import json
+import logging
+import signal
+import threading
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Optional
+
+from sqlalchemy import and_, insert, or_, select, text
+from sqlalchemy.orm import Session
+
+from facility_service.app.crud.system.import_jobs_crud import IMPORT_HANDLERS, import_job_snapshot
+from facility_service.app.models.system.import_jobs import ImportJob, ImportJobError
+from facility_service.app.utils.notification_stream import CHANNEL
+from shared.core.config import settings
+from shared.core.database import FacilitySessionLocal
+from shared.helpers.bulk_import import FIRST_DATA_ROW, RecordParser, iter_sheet_rows
+from shared.utils.enums import ImportJobStatus
+
+logger = logging.getLogger(__name__)
+
+# A job left "running" this long without a committed chunk belongs to a worker that died
+STALE_LOCK = timedelta(minutes=10)
+
+
+class ImportJobWorker:
+
+    def __init__(
+        self,
+        session_factory=FacilitySessionLocal,
+        chunk_rows: int = settings.IMPORT_JOB_CHUNK_ROWS,
+        poll_seconds: float = settings.IMPORT_JOB_POLL_SECONDS,
+        max_attempts: int = settings.IMPORT_JOB_MAX_ATTEMPTS,
+    ):
+        self.session_factory = session_factory
+        self.chunk_rows = chunk_rows
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self.stop_event = threading.Event()
+
+    def _claim(self, db: Session) -> Optional[ImportJob]:
+        now = datetime.now(timezone.utc)
+        job = db.execute(
+            select(ImportJob)
+            .where(or_(
+                ImportJob.status == ImportJobStatus.pending.value,
+                and_(ImportJob.status == ImportJobStatus.running.value,
+                     ImportJob.locked_at < now - STALE_LOCK),
+            ))
+            .order_by(ImportJob.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ).scalar_one_or_none()
+        if job is None:
+            return None
+
+        job.status = ImportJobStatus.running.value
+        job.locked_at = now
+        job.attempts += 1
+        job.started_at = job.started_at or now
+        self._publish(db, job)
+        db.commit()
+        return job
+
+    @staticmethod
+    def _publish(db: Session, job: ImportJob):
+        """Delivered on commit, together with the progress it describes."""
+        db.flush()
+        db.execute(text("SELECT pg_notify(:channel, :payload)"), {
+            "channel": CHANNEL,
+            "payload": json.dumps({
+                "op": "import_job",
+                "user_id": str(job.created_by),
+                "job": import_job_snapshot(job),
+            }),
+        })
+
+    def _apply_chunk(self, db: Session, job: ImportJob, parser: RecordParser, handler, chunk) -> int:
+        records, record_rows, errors = [], [], []
+        for number, values in chunk:
+            record, row_errors = parser.parse(values)
+            if row_errors:
+                errors.append((number, row_errors))
+            else:
+                records.append(record)
+                record_rows.append(number)
+
+        # Handlers only write; the chunk and its progress commit together,
+        # so a resumed job never applies a chunk twice
+        result = handler.apply(db, records, job) if records else {}
+        for validation in result.get("validations") or []:
+            errors.append((record_rows[validation.row - FIRST_DATA_ROW], validation.errors))
+
+        if errors:
+            db.execute(insert(ImportJobError), [
+                {"job_id": job.id, "row": row, "errors": row_errors}
+                for row, row_errors in sorted(errors)
+            ])
+        job.processed_rows += len(chunk)
+        job.inserted += result.get("inserted") or 0
+        job.updated += result.get("updated") or 0
+        job.error_rows += len(errors)
+        job.locked_at = datetime.now(timezone.utc)
+        self._publish(db, job)
+        db.commit()
+        return len(chunk)
+
+    def run_job(self, db: Session, job: ImportJob):
+        handler = IMPORT_HANDLERS[job.kind]
+        parser = RecordParser(handler.model)
+        rows = iter_sheet_rows(job.file_data, job.file_name)
+        # Chunks committed by an earlier attempt are not applied again
+        rows = islice(rows, job.processed_rows, None)
+
+        while not self.stop_event.is_set():
+            chunk = list(islice(rows, self.chunk_rows))
+            if not chunk:
+                break
+            self._apply_chunk(db, job, parser, handler, chunk)
+            logger.info(f"Import job {job.id}: {job.processed_rows} rows processed")
+        else:
+            # Stopping: hand the job back, the next worker resumes it
+            job.status = ImportJobStatus.pending.value
+            self._publish(db, job)
+            db.commit()
+            return
+
+        job.status = ImportJobStatus.completed.value
+        job.finished_at = datetime.now(timezone.utc)
+        self._publish(db, job)
+        db.commit()
+
+    def run_once(self) -> bool:
+        """Claim and run one job; returns False when the queue is empty."""
+        with self.session_factory() as db:
+            job = self._claim(db)
+            if job is None:
+                return False
+            try:
+                self.run_job(db, job)
+            except Exception as e:
+                logger.exception(f"Import job {job.id} failed")
+                db.rollback()
+                job.last_error = str(e)[:2000]
+                if job.attempts >= self.max_attempts:
+                    job.status = ImportJobStatus.failed.value
+                    job.finished_at = datetime.now(timezone.utc)
+                else:
+                    job.status = ImportJobStatus.pending.value
+                self._publish(db, job)
+                db.commit()
+            return True
+
+    def run_forever(self):
+        logger.info("Import job worker started")
+        while not self.stop_event.is_set():
+            try:
+                busy = self.run_once()
+            except Exception:
+                logger.exception("Import job worker iteration failed")
+                busy = False
+            if not busy:
+                self.stop_event.wait(self.poll_seconds)
+        logger.info("Import job worker stopped")
+
+    def stop(self, *_):
+        self.stop_event.set()
+
+
+if __name__ == "__main__":
+    worker = ImportJobWorker()
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run_forever()
@@ -0,0 +1,254 @@
+"""
+Org membership projection sync.
+
+Triggers on the auth `user_organizations` and `users` tables log every
+touched user into `org_membership_changes`. This worker drains that log and
+re-projects those users' memberships into the facility `org_membership`
+table, and periodically reconciles the whole projection against the auth
+DB to repair anything the log missed. Run it as its own process:
+
+    python -m shared.workers.org_membership_sync
+"""
+import logging
+import signal
+import threading
+import time
+
+from sqlalchemy import Column, MetaData, Table, delete, insert, text
+from sqlalchemy.engine import Engine
+
+from shared.core.config import settings
+from shared.core.database import AuthSessionLocal, FacilitySessionLocal
+from shared.models.org_membership import OrgMembership
+
+logger = logging.getLogger(__name__)
+
+# Distinct users of the changed rows, appended to the change log
+_LOG_USERS = "INSERT INTO org_membership_changes (user_id) SELECT DISTINCT user_id FROM ({rows}) AS changed"
+
+CHANGE_FUNCTION_DDL = [
+    f"""
+CREATE OR REPLACE FUNCTION user_organizations_log_change() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {_LOG_USERS.format(rows="SELECT user_id FROM new_rows")};
+    ELSIF TG_OP = 'UPDATE' THEN
+        {_LOG_USERS.format(rows="SELECT user_id FROM new_rows UNION ALL SELECT user_id FROM old_rows")};
+    ELSE
+        {_LOG_USERS.format(rows="SELECT user_id FROM old_rows")};
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+""",
+    # Only the fields copied into the projection matter
+    f"""
+CREATE OR REPLACE FUNCTION users_log_membership_change() RETURNS trigger AS $$
+BEGIN
+    {_LOG_USERS.format(rows='''
+        SELECT n.id AS user_id FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE (n.full_name, n.email, n.phone, n.status, n.is_deleted)
+              IS DISTINCT FROM (o.full_name, o.email, o.phone, o.status, o.is_deleted)
+          AND EXISTS (SELECT 1 FROM user_organizations uo WHERE uo.user_id = n.id)''')};
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+""",
+]
+
+CHANGE_TRIGGER_DDL = [
+    statement
+    for op, transition in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    )
+    for statement in (
+        f"DROP TRIGGER IF EXISTS trg_user_organizations_{op.lower()} ON user_organizations",
+        f"""
+        CREATE TRIGGER trg_user_organizations_{op.lower()}
+        AFTER {op} ON user_organizations
+        REFERENCING {transition}
+        FOR EACH STATEMENT EXECUTE FUNCTION user_organizations_log_change()
+        """,
+    )
+] + [
+    "DROP TRIGGER IF EXISTS trg_users_membership_update ON users",
+    """
+    CREATE TRIGGER trg_users_membership_update
+    AFTER UPDATE ON users
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION users_log_membership_change()
+    """,
+]
+
+# Auth-side source of the projection; {where} narrows it for incremental syncs
+MEMBERSHIP_SQL = """
+    SELECT uo.id AS user_org_id, uo.user_id, uo.org_id::uuid AS org_id,
+           uo.account_type::text AS account_type, uo.status,
+           uo.is_default, uo.is_deleted,
+           u.full_name, u.email, u.phone, u.status AS user_status,
+           COALESCE(u.is_deleted, false) AS user_is_deleted
+    FROM user_organizations uo
+    JOIN users u ON u.id = uo.user_id
+    {where}
+"""
+
+_COLUMNS = [c.name for c in OrgMembership.__table__.columns if c.name != "synced_at"]
+
+_STAGE = Table(
+    "org_membership_stage",
+    MetaData(),
+    *(Column(c.name, c.type) for c in OrgMembership.__table__.columns if c.name != "synced_at"),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+_MERGE_STAGE_SQL = f"""
+    INSERT INTO org_membership ({", ".join(_COLUMNS)}, synced_at)
+    SELECT {", ".join(_COLUMNS)}, now() FROM org_membership_stage
+    ON CONFLICT (user_org_id) DO UPDATE
+    SET {", ".join(f"{c} = EXCLUDED.{c}" for c in _COLUMNS if c != "user_org_id")},
+        synced_at = now()
+    WHERE ({", ".join(f"org_membership.{c}" for c in _COLUMNS)})
+          IS DISTINCT FROM ({", ".join(f"EXCLUDED.{c}" for c in _COLUMNS)})
+"""
+
+_DROP_MISSING_SQL = """
+    DELETE FROM org_membership m
+    WHERE NOT EXISTS (
+        SELECT 1 FROM org_membership_stage s WHERE s.user_org_id = m.user_org_id
+    )
+"""
+
+# Only one reconcile at a time across workers
+_RECONCILE_LOCK_KEY = 0x6F72676D
+
+
+def install_org_membership_triggers(engine: Engine):
+    """Create / refresh the auth-side triggers feeding `org_membership_changes`."""
+    with engine.begin() as conn:
+        for statement in CHANGE_FUNCTION_DDL + CHANGE_TRIGGER_DDL:
+            conn.execute(text(statement))
+
+
+class OrgMembershipSyncWorker:
+
+    def __init__(
+        self,
+        auth_session_factory=AuthSessionLocal,
+        facility_session_factory=FacilitySessionLocal,
+        batch_size: int = settings.ORG_MEMBERSHIP_SYNC_BATCH_SIZE,
+        poll_seconds: float = settings.ORG_MEMBERSHIP_SYNC_POLL_SECONDS,
+        reconcile_minutes: int = settings.ORG_MEMBERSHIP_RECONCILE_MINUTES,
+    ):
+        self.auth_session_factory = auth_session_factory
+        self.facility_session_factory = facility_session_factory
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.reconcile_seconds = reconcile_minutes * 60
+        self.stop_event = threading.Event()
+
+    def sync_changes(self) -> int:
+        """
+        Apply one batch of logged changes; returns the number of log rows
+        consumed. The log rows are deleted only after the facility side
+        committed, so a crash in between just re-applies the same users.
+        """
+        with self.auth_session_factory() as auth_db, self.facility_session_factory() as facility_db:
+            changes = auth_db.execute(text("""
+                SELECT id, user_id FROM org_membership_changes
+                ORDER BY id
+                LIMIT :batch_size
+                FOR UPDATE SKIP LOCKED
+            """), {"batch_size": self.batch_size}).all()
+            if not changes:
+                return 0
+
+            user_ids = list({row.user_id for row in changes})
+            rows = auth_db.execute(
+                text(MEMBERSHIP_SQL.format(where="WHERE uo.user_id = ANY(:user_ids)")),
+                {"user_ids": user_ids},
+            ).mappings().all()
+
+            facility_db.execute(delete(OrgMembership).where(OrgMembership.user_id.in_(user_ids)))
+            if rows:
+                facility_db.execute(insert(OrgMembership), [dict(row) for row in rows])
+            facility_db.commit()
+
+            auth_db.execute(
+                text("DELETE FROM org_membership_changes WHERE id = ANY(:ids)"),
+                {"ids": [row.id for row in changes]},
+            )
+            auth_db.commit()
+            return len(changes)
+
+    def reconcile(self) -> dict:
+        """
+        Compare the full projection with the auth DB and fix any drift.
+        Changes that land while it runs are still in the log and are
+        re-applied by the next sync_changes, so a stale read here heals.
+        """
+        started = time.monotonic()
+        with self.auth_session_factory() as auth_db, self.facility_session_factory() as facility_db:
+            got_lock = facility_db.execute(
+                text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _RECONCILE_LOCK_KEY}
+            ).scalar()
+            if not got_lock:
+                return {"skipped": True}
+
+            _STAGE.create(bind=facility_db.connection())
+            result = auth_db.connection().execution_options(stream_results=True).execute(
+                text(MEMBERSHIP_SQL.format(where=""))
+            )
+            source_rows = 0
+            for batch in result.mappings().partitions(self.batch_size):
+                facility_db.execute(insert(_STAGE), [dict(row) for row in batch])
+                source_rows += len(batch)
+            auth_db.rollback()
+
+            upserted = facility_db.execute(text(_MERGE_STAGE_SQL)).rowcount
+            removed = facility_db.execute(text(_DROP_MISSING_SQL)).rowcount
+            facility_db.commit()
+
+        stats = {
+            "source_rows": source_rows,
+            "upserted": upserted,
+            "removed": removed,
+            "seconds": round(time.monotonic() - started, 2),
+        }
+        if upserted or removed:
+            logger.warning(f"Org membership projection drift repaired: {stats}")
+        return stats
+
+    def run_forever(self):
+        logger.info("Org membership sync worker started")
+        last_reconcile = 0.0
+        while not self.stop_event.is_set():
+            if time.monotonic() - last_reconcile >= self.reconcile_seconds:
+                try:
+                    logger.info(f"Org membership reconcile: {self.reconcile()}")
+                except Exception:
+                    logger.exception("Org membership reconcile failed")
+                last_reconcile = time.monotonic()
+
+            try:
+                applied = self.sync_changes()
+            except Exception:
+                logger.exception("Org membership sync batch failed")
+                applied = 0
+
+            # A full batch means there is likely more waiting
+            if applied < self.batch_size:
+                self.stop_event.wait(self.poll_seconds)
+        logger.info("Org membership sync worker stopped")
+
+    def stop(self, *_):
+        self.stop_event.set()
+
+
+if __name__ == "__main__":
+    worker = OrgMembershipSyncWorker()
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run_forever()
@@ -0,0 +1,183 @@
+import logging
+import math
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from cachetools import TTLCache
+from jose import JWTError, jwt
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from shared.core.config import settings
+from shared.core.schemas import JsonOutResult
+
+try:
+    import redis
+    import redis.asyncio as aioredis
+except ImportError:  # redis is optional, the in-process counters are the default
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 3600
+EXEMPT_PATH_PREFIXES = ("/openapi", "/docs", "/redoc", "/api/health")
+
+# GCRA in Redis: one key per client holding its theoretical arrival time
+_GCRA_LUA = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + interval
+if new_tat - window > now then
+    return {0, tostring(tat)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(window * 1000))
+return {1, tostring(new_tat)}
+"""
+
+
+class MemoryRateLimitBackend:
+    """Per-process GCRA state; enough for a single node."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self._tats = TTLCache(maxsize=max_keys, ttl=WINDOW_SECONDS)
+        self._lock = threading.Lock()
+
+    async def hit(self, key: str, interval: float, now: float) -> Tuple[bool, float]:
+        with self._lock:
+            tat = max(self._tats.get(key, now), now)
+            new_tat = tat + interval
+            if new_tat - WINDOW_SECONDS > now:
+                return False, tat
+            self._tats[key] = new_tat
+            return True, new_tat
+
+
+class RedisRateLimitBackend:
+    """
+    Shared GCRA state so the limit holds across replicas. Uses the asyncio
+    client so a slow Redis never blocks the event loop.
+    """
+
+    def __init__(self, url: str):
+        self._client = aioredis.Redis.from_url(url)
+        self._script = self._client.register_script(_GCRA_LUA)
+        self._fallback = MemoryRateLimitBackend()
+
+    async def hit(self, key: str, interval: float, now: float) -> Tuple[bool, float]:
+        try:
+            allowed, tat = await self._script(
+                keys=[f"ratelimit:{key}"], args=[now, interval, WINDOW_SECONDS])
+            return bool(int(allowed)), float(tat)
+        except redis.RedisError as e:
+            logger.warning(f"Rate limit backend unavailable, limiting per process: {e}")
+            return await self._fallback.hit(key, interval, now)
+
+
+def build_backend():
+    if settings.RATE_LIMIT_BACKEND.lower() == "redis":
+        if redis is not None and settings.RATE_LIMIT_REDIS_URL:
+            return RedisRateLimitBackend(settings.RATE_LIMIT_REDIS_URL)
+        logger.warning("Redis rate limit backend unavailable, using in-process counters")
+    return MemoryRateLimitBackend()
+
+
+def _token_identity(scope: Scope) -> Optional[Tuple[str, str]]:
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            try:
+                payload = jwt.decode(
+                    token, settings.JWT_SECRET, algorithms=settings.JWT_ALGORITHM)
+            except JWTError:
+                return None  # the auth dependency rejects it
+            user_id = payload.get("user_id")
+            if not user_id:
+                return None
+            return str(payload.get("org_id") or "-"), str(user_id)
+    return None
+
+
+class RateLimitMiddleware:
+    """
+    GCRA limit of `api_rate_limit_per_hour` (per org, from system settings)
+    for each user of that org, keyed by the token's org_id and user_id.
+    Adds RateLimit-Limit / -Remaining / -Reset headers; over the limit it
+    answers 429 with Retry-After. Unauthenticated requests pass through.
+
+    `limit_for_org(org_id)` is a sync callable returning the hourly limit
+    (or None for the default); results are kept for
+    RATE_LIMIT_SETTINGS_TTL_SECONDS so the DB is only asked on a miss.
+    """
+
+    def __init__(self, app: ASGIApp, limit_for_org: Callable[[str], Optional[int]], backend=None):
+        self.app = app
+        self.limit_for_org = limit_for_org
+        self.backend = backend or build_backend()
+        self._limits = TTLCache(maxsize=10_000, ttl=settings.RATE_LIMIT_SETTINGS_TTL_SECONDS)
+
+    async def _limit(self, org_id: str) -> int:
+        limit = self._limits.get(org_id)
+        if limit is None:
+            try:
+                limit = await run_in_threadpool(self.limit_for_org, org_id) if org_id != "-" else None
+            except Exception as e:
+                logger.warning(f"Rate limit lookup failed for org {org_id}: {e}")
+                limit = None
+            limit = limit or settings.RATE_LIMIT_DEFAULT_PER_HOUR
+            self._limits[org_id] = limit
+        return limit
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or not settings.RATE_LIMIT_ENABLED
+            or scope.get("method") == "OPTIONS"
+            or scope["path"].startswith(EXEMPT_PATH_PREFIXES)
+        ):
+            return await self.app(scope, receive, send)
+
+        identity = _token_identity(scope)
+        if identity is None:
+            return await self.app(scope, receive, send)
+
+        org_id, user_id = identity
+        limit = await self._limit(org_id)
+        interval = WINDOW_SECONDS / limit
+        now = time.time()
+        allowed, tat = await self.backend.hit(f"{org_id}:{user_id}", interval, now)
+
+        remaining = max(int((now + WINDOW_SECONDS - tat) // interval), 0) if allowed else 0
+        headers = {
+            "RateLimit-Limit": str(limit),
+            "RateLimit-Remaining": str(remaining),
+            "RateLimit-Reset": str(max(math.ceil(tat - now), 0)),
+        }
+
+        if not allowed:
+            retry_after = max(math.ceil(tat + interval - WINDOW_SECONDS - now), 1)
+            response = JSONResponse(
+                status_code=429,
+                content=JsonOutResult(
+                    data="",
+                    status="Failed",
+                    status_code="429",
+                    message="API rate limit exceeded",
+                ).model_dump(exclude_none=False),
+                headers={**headers, "Retry-After": str(retry_after)},
+            )
+            return await response(scope, receive, send)
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -51,11 +51,16 @@ class JsonResponseMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             content_type = response.headers.get("content-type", "")
 
+            # 304 Not Modified must go out without a body
+            if response.status_code == 304:
+                return response
+
             # 🚫 DO NOT TOUCH binary responses
             if (
                 isinstance(response, StreamingResponse)
                 or content_type.startswith("application/pdf")
                 or content_type.startswith("application/octet-stream")
+                or content_type.startswith("text/event-stream")
             ):
                 return response
         except Exception as e: